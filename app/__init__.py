@@ -2,6 +2,12 @@
 애플리케이션 모듈 초기화
 """
 
-from .main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name):
+    # FastAPI 애플리케이션은 실제로 필요할 때만 import (CLI 모드 시작 시간 단축)
+    if name == "app":
+        from .main import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,5 +3,7 @@ API 라우터 초기화
 """
 
 from .patents import router as patents_router
+from .admin import router as admin_router
+from .watch import router as watch_router
 
-__all__ = ["patents_router"]
+__all__ = ["patents_router", "admin_router", "watch_router"]
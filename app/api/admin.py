@@ -0,0 +1,99 @@
+"""
+관리 API 라우터
+"""
+
+import os
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi.responses import FileResponse
+from app.models.schemas import APIResponse
+from app.core.config import settings
+from app.core import profiling
+from app.services.status_refresh import status_refresher
+
+router = APIRouter(prefix="/admin", tags=["관리"])
+
+
+def get_profiles_dir() -> str:
+    """프로파일 저장 디렉토리"""
+    return os.path.join(settings.output_dir, "profiles")
+
+
+@router.get("/profiles", response_model=APIResponse)
+async def list_profiles():
+    """
+    저장된 프로파일 목록 조회
+    
+    Returns:
+        프로파일 파일 목록 (최신순)
+    """
+    profiles = profiling.list_profiles(get_profiles_dir())
+    return APIResponse(
+        success=True,
+        message=f"{len(profiles)}개의 프로파일 파일이 있습니다.",
+        data={"directory": get_profiles_dir(), "profiles": profiles}
+    )
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str):
+    """
+    프로파일 파일 다운로드
+    
+    Args:
+        name: 파일 이름 (.prof: pstats 덤프, .txt: 누적 시간 기준 요약)
+    
+    Returns:
+        프로파일 파일
+    """
+    path = profiling.resolve_profile_path(get_profiles_dir(), name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일 파일을 찾을 수 없습니다.")
+    
+    media_type = "text/plain" if name.endswith(".txt") else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
+@router.post("/status-refresh", response_model=APIResponse)
+async def start_status_refresh(
+    background_tasks: BackgroundTasks,
+    max_requests: Optional[int] = Query(None, ge=1, description="최대 KIPRIS 검색 요청 수"),
+    holder_code: Optional[List[str]] = Query(None, description="이 등록권자 코드만 갱신")
+):
+    """
+    저장된 특허 등록상태 갱신 시작 (백그라운드)
+    
+    Args:
+        background_tasks: 백그라운드 작업
+        max_requests: 최대 KIPRIS 검색 요청 수 (기본값: 설정값)
+        holder_code: 갱신할 등록권자 코드 목록
+    
+    Returns:
+        갱신 시작 결과
+    """
+    if not settings.use_patent_store:
+        raise HTTPException(status_code=400, detail="특허 저장소를 사용하지 않도록 설정되어 있습니다.")
+    if status_refresher.running:
+        raise HTTPException(status_code=409, detail="등록상태 갱신이 이미 실행 중입니다.")
+    
+    background_tasks.add_task(profiling.wrap(status_refresher.run), max_requests, holder_code)
+    return APIResponse(
+        success=True,
+        message="등록상태 갱신을 시작했습니다. GET /admin/status-refresh로 결과를 확인하세요.",
+        data={"max_requests": max_requests or settings.status_refresh_max_requests, "holder_codes": holder_code}
+    )
+
+
+@router.get("/status-refresh", response_model=APIResponse)
+async def get_status_refresh():
+    """
+    등록상태 갱신 상태 조회
+    
+    Returns:
+        실행 여부와 마지막 갱신 보고서 (등록상태 전환별 건수 포함)
+    """
+    return APIResponse(
+        success=True,
+        message="등록상태 갱신이 실행 중입니다." if status_refresher.running else "등록상태 갱신 상태입니다.",
+        data={"running": status_refresher.running, "last_report": status_refresher.last_report}
+    )
@@ -2,25 +2,127 @@
 특허 검색 API 라우터
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import List
+import base64
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional, Set
 from app.models.schemas import (
     SearchRequest, SearchResponse, ProcessRequest, ProcessStatus, 
-    ProcessResult, APIResponse, PatentBasicInfo
+    ProcessResultPage, APIResponse, PatentBasicInfo, PatentDetailInfo,
+    BatchProcessRequest, BatchStatus
 )
-from app.services import patent_processor, task_manager
+from app.services import (
+    patent_processor, task_manager, response_cache, patent_store, ingredient_tagger, entity_index, holder_directory
+)
+from app.services.response_cache import CacheEntry
 from app.core.config import settings
+from app.core.portfolio import build_report, format_report
+from app.core.responses import FastJSONResponse
+from app.core import profiling
+
+router = APIRouter(prefix="/patents", tags=["특허 검색"], default_response_class=FastJSONResponse)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """
+    필드 선택 파라미터 파싱
+    
+    Args:
+        fields: 쉼표로 구분된 PatentDetailInfo 필드명 (예: "basic_info,ipc_codes")
+        
+    Returns:
+        포함할 필드 집합 (전체 필드이면 None)
+    """
+    if not fields:
+        return None
+    
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = selected - set(PatentDetailInfo.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+        )
+    
+    return selected or None
+
 
-router = APIRouter(prefix="/patents", tags=["특허 검색"])
+def _encode_cursor(offset: int) -> str:
+    """결과 목록 위치를 불투명한 커서 문자열로 변환"""
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str]) -> int:
+    """커서 문자열을 결과 목록 위치로 변환"""
+    if not cursor:
+        return 0
+    
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, offset = base64.urlsafe_b64decode(padded.encode()).decode().split(":", 1)
+        if prefix != "o" or int(offset) < 0:
+            raise ValueError(cursor)
+        return int(offset)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _is_not_modified(request: Request, entry: CacheEntry) -> bool:
+    """조건부 요청(If-None-Match / If-Modified-Since)이 캐시 항목과 일치하는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().lstrip("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or entry.etag in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(entry.last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    
+    return False
+
+
+def _cached_response(request: Request, entry: CacheEntry, cache_state: str) -> Response:
+    """
+    캐시 항목으로 HTTP 응답 생성 (조건부 요청이면 본문 없이 304)
+    
+    Args:
+        request: HTTP 요청
+        entry: 캐시 항목
+        cache_state: 캐시 상태 (fresh, stale, miss)
+        
+    Returns:
+        HTTP 응답
+    """
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        "Cache-Control": (
+            f"max-age={max(0, int(response_cache.ttl - entry.age()))}, "
+            f"stale-while-revalidate={int(response_cache.stale_ttl)}"
+        ),
+        "X-Cache": cache_state.upper()
+    }
+    
+    if _is_not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=entry.body, media_type="application/json", headers=headers)
 
 
 @router.post("/search", response_model=SearchResponse)
-async def search_patents(request: SearchRequest):
+async def search_patents(request: SearchRequest, http_request: Request):
     """
-    특허 검색
+    특허 검색 (정규화된 요청 기준으로 응답 캐시, ETag/304 지원)
     
     Args:
         request: 검색 요청
+        http_request: HTTP 요청 (조건부 요청 헤더 확인용)
         
     Returns:
         검색 결과
@@ -29,61 +131,99 @@ async def search_patents(request: SearchRequest):
         # 기본값 설정
         search_keyword = request.search_keyword or settings.search_keyword
         right_holder = request.right_holder or settings.right_holder
-        right_holder_code = request.right_holder_code or settings.right_holder_code
         max_patents = request.max_patents or settings.max_patents
         
-        # 특허 검색
-        patents = patent_processor.search_and_extract_patents(
-            search_keyword=search_keyword,
-            right_holder=right_holder,
-            right_holder_code=right_holder_code,
-            max_patents=max_patents
-        )
+        # 등록권자명만 주어지면 등록권자 디렉터리에서 코드 찾기 (KIPRIS 요청 없음)
+        try:
+            right_holder_code = holder_directory.resolve_code(request.right_holder, request.right_holder_code)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
         
-        if not patents:
-            raise HTTPException(status_code=404, detail="검색된 특허가 없습니다.")
+        cache_key = response_cache.make_key("search", {
+            "search_keyword": search_keyword.strip(),
+            "right_holder_code": right_holder_code.strip(),
+            "max_patents": max_patents,
+            "page_no": request.page_no
+        })
         
-        return SearchResponse(
-            total_count=len(patents),
-            current_page=request.page_no,
-            patents=patents
-        )
+        async def compute() -> bytes:
+            # 특허 검색
+            patents = await run_in_threadpool(
+                profiling.wrap(patent_processor.search_and_extract_patents),
+                search_keyword=search_keyword,
+                right_holder=right_holder,
+                right_holder_code=right_holder_code,
+                max_patents=max_patents
+            )
+            
+            if not patents:
+                raise HTTPException(status_code=404, detail="검색된 특허가 없습니다.")
+            
+            return SearchResponse(
+                total_count=len(patents),
+                current_page=request.page_no,
+                patents=patents
+            ).model_dump_json().encode("utf-8")
         
+        entry, cache_state = await response_cache.get_or_compute(cache_key, compute)
+        return _cached_response(http_request, entry, cache_state)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색 실패: {str(e)}")
 
 
-@router.get("/search/{application_number}")
-async def get_patent_detail(application_number: str):
+@router.get("/search/{application_number}", response_model=PatentDetailInfo)
+async def get_patent_detail(application_number: str, http_request: Request):
     """
-    특허 상세 정보 조회
+    특허 상세 정보 조회 (출원번호 기준으로 응답 캐시, ETag/304 지원)
     
     Args:
         application_number: 출원번호
+        http_request: HTTP 요청 (조건부 요청 헤더 확인용)
         
     Returns:
         특허 상세 정보
     """
     try:
-        from app.services.kipris_api import kipris_api
-        
-        # 기본 정보 생성 (실제로는 검색에서 가져와야 함)
-        basic_info = PatentBasicInfo(
-            application_number=application_number,
-            invention_title="상세 조회",
-            applicant_name="",
-            register_status="",
-        )
+        cache_key = response_cache.make_key("detail", {
+            "application_number": application_number.strip()
+        })
         
-        # 상세 정보 처리
-        detail_info = patent_processor.process_patent_details(
-            patent_info=basic_info,
-            include_claims=True,
-            include_pdf=False
-        )
+        async def compute() -> bytes:
+            # 검색 결과로 저장된 기본 정보 사용 (저장되지 않은 특허는 출원번호만 있는 기본 정보)
+            basic_info = None
+            if settings.use_patent_store:
+                stored = await run_in_threadpool(patent_store.get_basic_infos, [application_number])
+                basic_info = stored.get(application_number)
+            if basic_info is None:
+                basic_info = PatentBasicInfo(
+                    application_number=application_number,
+                    invention_title="상세 조회",
+                    applicant_name="",
+                    register_status="",
+                )
+            
+            # 상세 정보 처리
+            detail_info = await run_in_threadpool(
+                profiling.wrap(patent_processor.process_patent_details),
+                patent_info=basic_info,
+                include_claims=True,
+                include_pdf=False
+            )
+            
+            # KIPRIS 상세 조회가 실패하면 빈 상세 정보가 오므로 캐시하지 않고 오류로 응답
+            if not (detail_info.claims or detail_info.ipc_codes or detail_info.inventors):
+                raise HTTPException(status_code=502, detail="KIPRIS 상세 정보 조회에 실패했습니다.")
+            
+            return detail_info.model_dump_json().encode("utf-8")
         
-        return detail_info
+        entry, cache_state = await response_cache.get_or_compute(cache_key, compute)
+        return _cached_response(http_request, entry, cache_state)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"상세 정보 조회 실패: {str(e)}")
 
@@ -104,8 +244,25 @@ async def start_patent_processing(
         태스크 ID를 포함한 응답
     """
     try:
-        # 태스크 생성
-        task_id = task_manager.create_task(request)
+        # 등록권자명만 주어지면 등록권자 디렉터리에서 찾은 코드로 처리
+        request = task_manager.resolve_holder(request)
+        
+        # 태스크 생성 (동일한 요청은 기존 태스크에 연결하거나 최근 결과 재사용)
+        task_id, dedup = task_manager.submit_task(request)
+        
+        if dedup == "attached":
+            return APIResponse(
+                success=True,
+                message="동일한 요청이 이미 처리 중입니다. 기존 태스크에 연결합니다.",
+                data={"task_id": task_id, "dedup": dedup}
+            )
+        
+        if dedup == "cached":
+            return APIResponse(
+                success=True,
+                message="최근에 완료된 동일한 요청의 결과를 재사용합니다.",
+                data={"task_id": task_id, "dedup": dedup}
+            )
         
         # 백그라운드에서 처리 시작
         background_tasks.add_task(
@@ -117,13 +274,95 @@ async def start_patent_processing(
         return APIResponse(
             success=True,
             message="특허 처리가 시작되었습니다.",
-            data={"task_id": task_id}
+            data={"task_id": task_id, "dedup": dedup}
         )
         
+    except ValueError as e:
+        # 등록권자 디렉터리에 없는 등록권자명
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"처리 시작 실패: {str(e)}")
 
 
+@router.post("/process/batch", response_model=APIResponse)
+async def start_batch_processing(
+    request: BatchProcessRequest,
+    background_tasks: BackgroundTasks
+):
+    """
+    여러 등록권자 배치 처리 시작 (비동기)
+    
+    모든 검색 조건은 하나의 KIPRIS 요청 속도 예산을 공유하며,
+    여러 검색 조건에 중복된 특허는 한 번만 조회한다.
+    
+    Args:
+        request: 배치 처리 요청
+        background_tasks: 백그라운드 태스크
+        
+    Returns:
+        배치 ID와 검색 조건별 태스크 ID를 포함한 응답
+    """
+    try:
+        batch_id = task_manager.create_batch(request)
+        
+        background_tasks.add_task(task_manager.start_background_batch, batch_id)
+        
+        return APIResponse(
+            success=True,
+            message=f"{len(request.queries)}개 검색 조건의 배치 처리가 시작되었습니다.",
+            data={"batch_id": batch_id, "task_ids": task_manager.batch_tasks[batch_id]}
+        )
+        
+    except ValueError as e:
+        # 등록권자 디렉터리에 없는 등록권자명
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"배치 처리 시작 실패: {str(e)}")
+
+
+@router.get("/process/batch/{batch_id}/status", response_model=BatchStatus)
+async def get_batch_status(batch_id: str):
+    """
+    배치 처리 상태 조회 (검색 조건별 상태와 전체 집계)
+    
+    Args:
+        batch_id: 배치 ID
+        
+    Returns:
+        배치 처리 상태
+    """
+    status = task_manager.get_batch_status(batch_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="배치를 찾을 수 없습니다.")
+    
+    return status
+
+
+@router.delete("/process/batch/{batch_id}", response_model=APIResponse)
+async def cancel_batch_processing(batch_id: str):
+    """
+    배치 처리 취소
+    
+    Args:
+        batch_id: 배치 ID
+        
+    Returns:
+        취소 요청 결과
+    """
+    status = task_manager.get_batch_status(batch_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="배치를 찾을 수 없습니다.")
+    
+    if not task_manager.cancel_batch(batch_id):
+        raise HTTPException(status_code=409, detail=f"이미 종료된 배치입니다. (상태: {status.status})")
+    
+    return APIResponse(
+        success=True,
+        message="배치 취소를 요청했습니다. 처리된 부분 결과는 보존됩니다.",
+        data={"batch_id": batch_id}
+    )
+
+
 @router.get("/process/{task_id}/status", response_model=ProcessStatus)
 async def get_processing_status(task_id: str):
     """
@@ -142,22 +381,108 @@ async def get_processing_status(task_id: str):
     return status
 
 
-@router.get("/process/{task_id}/result", response_model=ProcessResult)
-async def get_processing_result(task_id: str):
+@router.delete("/process/{task_id}", response_model=APIResponse)
+async def cancel_patent_processing(task_id: str):
+    """
+    처리 취소
+    
+    Args:
+        task_id: 태스크 ID
+        
+    Returns:
+        취소 요청 결과
+    """
+    status = task_manager.get_task_status(task_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다.")
+    
+    if not task_manager.cancel_task(task_id):
+        raise HTTPException(status_code=409, detail=f"이미 종료된 태스크입니다. (상태: {status.status})")
+    
+    return APIResponse(
+        success=True,
+        message="태스크 취소를 요청했습니다. 처리된 부분 결과는 보존됩니다.",
+        data={"task_id": task_id}
+    )
+
+
+@router.get("/process/{task_id}/result", response_model=ProcessResultPage)
+async def get_processing_result(
+    task_id: str,
+    limit: Optional[int] = Query(None, description="페이지당 특허 수 (없으면 전체)", gt=0, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    fields: Optional[str] = Query(None, description="포함할 필드 (예: basic_info,ipc_codes)")
+):
     """
     처리 결과 조회
     
     Args:
         task_id: 태스크 ID
+        limit: 페이지당 특허 수
+        cursor: 페이지 커서
+        fields: 포함할 특허 필드 목록
+        
+    Returns:
+        처리 결과 페이지
+    """
+    result = task_manager.get_task_result(task_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다.")
+    
+    include = _parse_fields(fields)
+    offset = _decode_cursor(cursor)
+    total_count = len(result.patents)
+    end = total_count if limit is None else min(offset + limit, total_count)
+    
+    patents = [
+        patent.model_dump(mode="json", include=include)
+        for patent in result.patents[offset:end]
+    ]
+    
+    # 이미 검증된 결과이므로 재검증 없이 구성하고 직접 직렬화
+    page = ProcessResultPage.model_construct(
+        task_id=result.task_id,
+        patents=patents,
+        total_count=total_count,
+        next_cursor=_encode_cursor(end) if end < total_count else None,
+        claims_saved=result.claims_saved,
+        pdfs_downloaded=result.pdfs_downloaded,
+        summary_report_path=result.summary_report_path,
+        output_directory=result.output_directory
+    )
+    return FastJSONResponse(page)
+
+
+@router.get("/process/{task_id}/result/stream")
+async def stream_processing_result(
+    task_id: str,
+    cursor: Optional[str] = Query(None, description="스트리밍 시작 커서"),
+    fields: Optional[str] = Query(None, description="포함할 필드 (예: basic_info,ipc_codes)")
+):
+    """
+    처리 결과 NDJSON 스트리밍 (한 줄에 특허 하나)
+    
+    Args:
+        task_id: 태스크 ID
+        cursor: 시작 커서
+        fields: 포함할 특허 필드 목록
         
     Returns:
-        처리 결과
+        application/x-ndjson 스트리밍 응답
     """
     result = task_manager.get_task_result(task_id)
     if not result:
         raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다.")
     
-    return result
+    include = _parse_fields(fields)
+    offset = _decode_cursor(cursor)
+    patents = result.patents[offset:]
+    
+    def iter_patents():
+        for patent in patents:
+            yield patent.model_dump_json(include=include).encode("utf-8") + b"\n"
+    
+    return StreamingResponse(iter_patents(), media_type="application/x-ndjson")
 
 
 @router.get("/download/pdf/{application_number}")
@@ -186,3 +511,281 @@ async def get_pdf_download_url(application_number: str):
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF URL 조회 실패: {str(e)}")
+
+
+def _require_patent_store() -> None:
+    """특허 저장소를 사용하도록 설정되어 있는지 확인"""
+    if not settings.use_patent_store:
+        raise HTTPException(status_code=400, detail="특허 저장소를 사용하지 않도록 설정되어 있습니다.")
+
+
+def _require_ingredient_index() -> None:
+    """성분 사전과 특허 저장소가 설정되어 있는지 확인"""
+    if not ingredient_tagger.enabled:
+        raise HTTPException(status_code=400, detail="성분 사전이 설정되지 않았습니다. (analysis_settings.ingredient_dictionary)")
+    _require_patent_store()
+
+
+@router.get("/ingredients", response_model=APIResponse)
+async def list_ingredients(limit: int = Query(50, ge=1, le=1000, description="최대 성분 수")):
+    """
+    저장된 특허에 많이 나온 성분 목록
+    
+    Args:
+        limit: 최대 성분 수
+        
+    Returns:
+        성분별 특허 수 (많은 순)
+    """
+    _require_ingredient_index()
+    counts = await run_in_threadpool(patent_store.ingredient_counts, limit)
+    return APIResponse(
+        success=True,
+        message=f"{len(counts)}개 성분",
+        data={
+            "dictionary_version": ingredient_tagger.version,
+            "ingredients": [{"ingredient": ingredient, "patents": patents} for ingredient, patents in counts]
+        }
+    )
+
+
+@router.get("/ingredients/{name}", response_model=APIResponse)
+async def get_ingredient_patents(name: str):
+    """
+    성분이 청구항에 나온 특허 조회 (동의어로 조회 가능)
+    
+    Args:
+        name: 성분 이름 (INCI명, 한글 성분명, 동의어)
+        
+    Returns:
+        성분 대표명과 특허 목록 (성분이 나온 청구항 번호 포함)
+    """
+    _require_ingredient_index()
+    ingredient = ingredient_tagger.resolve(name)
+    if ingredient is None:
+        raise HTTPException(status_code=404, detail="성분 사전에 없는 성분입니다.")
+    
+    patents = await run_in_threadpool(patent_store.ingredient_patents, ingredient)
+    return APIResponse(
+        success=True,
+        message=f"{ingredient}: {len(patents)}건",
+        data={"ingredient": ingredient, "patents": patents}
+    )
+
+
+@router.get("/holders", response_model=APIResponse)
+async def lookup_holders(
+    name: str = Query(..., min_length=1, description="등록권자명 (회사 형태 표기, 공백, 오타 허용)"),
+    limit: int = Query(5, ge=1, le=50, description="최대 결과 수")
+):
+    """
+    등록권자명으로 등록권자 코드 찾기 (이전 검색 결과로 만든 등록권자 디렉터리, KIPRIS 요청 없음)
+    
+    Args:
+        name: 등록권자명
+        limit: 최대 결과 수
+        
+    Returns:
+        비슷한 순 등록권자 목록 (등록권자 코드, 코드별 특허 수, 유사도)
+    """
+    started = time.perf_counter()
+    matches = holder_directory.lookup(name, limit)
+    took_ms = (time.perf_counter() - started) * 1000
+    if not matches:
+        raise HTTPException(status_code=404, detail="등록권자 디렉터리에 없는 등록권자입니다.")
+    return APIResponse(
+        success=True,
+        message=f"등록권자 {len(matches)}곳",
+        data={"name": name, "took_ms": round(took_ms, 3), "holders": matches}
+    )
+
+
+@router.get("/inventors/{name}", response_model=APIResponse)
+async def get_inventor_patents(name: str):
+    """
+    발명자의 특허 조회 (등록권자와 관계없이 처리한 모든 특허)
+    
+    Args:
+        name: 발명자 이름 (공백 차이, 함께 적힌 적이 있는 한자/영문 표기 허용)
+        
+    Returns:
+        발명자 대표 키, 특허에 적힌 이름들, 등록권자별 특허 수, 특허 목록
+    """
+    _require_patent_store()
+    result = await run_in_threadpool(entity_index.patents, "inventor", name)
+    if result is None:
+        raise HTTPException(status_code=404, detail="발명자 색인에 없는 이름입니다.")
+    return APIResponse(success=True, message=f"{name}: {len(result['patents'])}건", data=result)
+
+
+@router.get("/inventors/{name}/graph", response_model=APIResponse)
+async def get_coinventor_graph(name: str, limit: int = Query(20, ge=1, le=200, description="최대 공동 발명자 수")):
+    """
+    공동 발명자 그래프 조회
+    
+    Args:
+        name: 발명자 이름
+        limit: 최대 공동 발명자 수 (공동 특허 수 많은 순)
+        
+    Returns:
+        nodes(발명자별 공동 특허 수), edges(발명자 쌍별 공동 특허 수)
+    """
+    _require_patent_store()
+    graph = await run_in_threadpool(entity_index.graph, "inventor", name, limit)
+    if graph is None:
+        raise HTTPException(status_code=404, detail="발명자 색인에 없는 이름입니다.")
+    return APIResponse(success=True, message=f"공동 발명자 {len(graph['nodes']) - 1}명", data=graph)
+
+
+@router.get("/applicants/{name}", response_model=APIResponse)
+async def get_applicant_patents(name: str):
+    """
+    출원인의 특허 조회 ("(주)", "주식회사" 등 회사 형태 표기 차이 허용)
+    
+    Args:
+        name: 출원인 이름
+        
+    Returns:
+        출원인 대표 키, 특허에 적힌 이름들, 등록권자별 특허 수, 특허 목록
+    """
+    _require_patent_store()
+    result = await run_in_threadpool(entity_index.patents, "applicant", name)
+    if result is None:
+        raise HTTPException(status_code=404, detail="출원인 색인에 없는 이름입니다.")
+    return APIResponse(success=True, message=f"{name}: {len(result['patents'])}건", data=result)
+
+
+@router.get("/analytics/ipc", response_model=APIResponse)
+async def get_ipc_analytics(
+    level: str = Query("subclass", description="집계 단계 (section, class, subclass, group, subgroup)"),
+    prefix: Optional[str] = Query(None, description="IPC 접두어 (예: A61Q, A61Q 19/*, A61K 8/97)"),
+    holder_code: Optional[str] = Query(None, description="등록권자 코드"),
+    by: Optional[str] = Query(None, description="코드별 특허 수를 다시 나눌 기준 (year, holder)"),
+    limit: int = Query(20, ge=1, le=500, description="특허 수 상위 코드 수")
+):
+    """
+    처리한 특허의 IPC 분류별 특허 수 집계
+    
+    Args:
+        level: 집계 단계
+        prefix: 이 접두어에 속한 코드만 집계
+        holder_code: 이 등록권자의 특허만 집계
+        by: 연도별(year) 또는 등록권자별(holder) 분포
+        limit: 특허 수 상위 코드 수
+        
+    Returns:
+        단계별 코드의 특허 수 (많은 순)
+    """
+    from app.services.ipc_index import ipc_index
+    
+    started = time.perf_counter()
+    try:
+        rollup = await run_in_threadpool(
+            ipc_index.rollup, level, prefix, None, holder_code, by, limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    took_ms = (time.perf_counter() - started) * 1000
+    
+    rollup["took_ms"] = round(took_ms, 2)
+    return APIResponse(
+        success=True,
+        message=f"IPC {level} 집계: 특허 {rollup['patents']}건",
+        data=rollup
+    )
+
+
+@router.get("/analytics/{holder_code}", response_model=APIResponse)
+async def get_portfolio_analytics(
+    holder_code: str,
+    top: int = Query(20, ge=1, le=500, description="IPC/성분 분포의 상위 값 수"),
+    format: str = Query("json", description="응답 형식 (json, text)")
+):
+    """
+    등록권자의 포트폴리오 집계 (등록상태, 출원연도, IPC, 성분, 청구항 수 분포)
+    
+    특허를 저장할 때마다 갱신되는 등록권자별 집계를 읽으므로 저장 특허 수와 무관하게 응답한다.
+    
+    Args:
+        holder_code: 등록권자 코드
+        top: IPC/성분 분포의 상위 값 수
+        format: json이면 APIResponse, text면 요약 보고서와 같은 형식의 텍스트
+        
+    Returns:
+        분포별 특허 수와 청구항 수 평균
+    """
+    _require_patent_store()
+    if format not in ("json", "text"):
+        raise HTTPException(status_code=400, detail="응답 형식은 json 또는 text만 사용할 수 있습니다.")
+    
+    started = time.perf_counter()
+    counts = await run_in_threadpool(patent_store.holder_facets, holder_code)
+    if not counts:
+        raise HTTPException(status_code=404, detail=f"저장된 특허가 없는 등록권자 코드입니다: {holder_code}")
+    report = build_report(counts, top)
+    took_ms = (time.perf_counter() - started) * 1000
+    
+    if format == "text":
+        lines = [f"등록권자 코드: {holder_code}"] + format_report(report)
+        return Response(content="\n".join(lines), media_type="text/plain; charset=utf-8")
+    
+    report["right_holder_code"] = holder_code
+    report["took_ms"] = round(took_ms, 2)
+    return APIResponse(
+        success=True,
+        message=f"{holder_code} 포트폴리오: 특허 {report['patents']}건",
+        data=report
+    )
+
+
+@router.get("/{application_number}/similar", response_model=APIResponse)
+async def get_similar_patents(
+    application_number: str,
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수")
+):
+    """
+    청구항/초록 내용이 비슷한 특허 조회
+    
+    Args:
+        application_number: 기준 출원번호 (청구항이 색인된 특허)
+        limit: 최대 결과 수
+        
+    Returns:
+        유사도 순 특허 목록 (코사인 유사도, 저장된 기본 정보 포함)
+    """
+    from app.services.patent_clusterer import patent_clusterer
+    from app.services.similarity_index import similarity_index
+    
+    if not settings.similarity_enabled:
+        raise HTTPException(status_code=400, detail="유사 특허 검색을 사용하지 않도록 설정되어 있습니다.")
+    
+    started = time.perf_counter()
+    try:
+        matches = await run_in_threadpool(similarity_index.similar, application_number, limit)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if matches is None:
+        raise HTTPException(status_code=404, detail="유사 특허 색인에 없는 특허입니다. 청구항을 포함하여 처리한 특허만 조회할 수 있습니다.")
+    took_ms = (time.perf_counter() - started) * 1000
+    
+    basic_infos = {}
+    if settings.use_patent_store:
+        basic_infos = await run_in_threadpool(patent_store.get_basic_infos, [key for key, _ in matches])
+    
+    results = []
+    for key, score in matches:
+        basic_info = basic_infos.get(key)
+        results.append({
+            "application_number": key,
+            "score": round(score, 4),
+            "invention_title": basic_info.invention_title if basic_info else None,
+            "applicant_name": basic_info.applicant_name if basic_info else None,
+            "register_status": basic_info.register_status if basic_info else None,
+            "cluster_id": patent_clusterer.cluster_of(key) if settings.clustering_enabled else None
+        })
+    
+    return APIResponse(
+        success=True,
+        message=f"유사 특허 {len(results)}건",
+        data={"application_number": application_number, "took_ms": round(took_ms, 2), "patents": results}
+    )
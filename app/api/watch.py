@@ -0,0 +1,168 @@
+"""
+신규 특허 구독 API 라우터
+"""
+
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from app.models.schemas import APIResponse, WatchRequest, WatchSubscription
+from app.services.watch_manager import watch_manager
+from app.core import profiling
+
+router = APIRouter(prefix="/watch", tags=["구독"])
+
+# SSE 연결 유지용 주석 전송 간격 (초)
+KEEPALIVE_SECONDS = 15.0
+
+
+@router.post("/subscriptions", response_model=APIResponse)
+async def create_subscription(request: WatchRequest):
+    """
+    신규 특허 구독 등록
+    
+    Args:
+        request: 구독 요청 (검색 키워드, 등록권자 코드, 확인 주기, 알림 대상)
+    
+    Returns:
+        등록된 구독
+    """
+    try:
+        subscription = watch_manager.add_subscription(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return APIResponse(
+        success=True,
+        message="구독이 등록되었습니다. 첫 확인에서 현재 상태를 기준점으로 저장합니다.",
+        data=json.loads(subscription.model_dump_json())
+    )
+
+
+@router.get("/subscriptions", response_model=APIResponse)
+async def list_subscriptions():
+    """
+    구독 목록 조회
+    
+    Returns:
+        구독 목록 (확인 횟수, KIPRIS 요청 수, 알린 이벤트 수 포함)
+    """
+    subscriptions = watch_manager.list_subscriptions()
+    return APIResponse(
+        success=True,
+        message=f"{len(subscriptions)}개의 구독이 있습니다.",
+        data={"subscriptions": [
+            json.loads(subscription.model_dump_json(exclude={"known_statuses"})) for subscription in subscriptions
+        ]}
+    )
+
+
+@router.get("/subscriptions/{subscription_id}", response_model=WatchSubscription)
+async def get_subscription(subscription_id: str):
+    """
+    구독 조회
+    
+    Args:
+        subscription_id: 구독 ID
+    
+    Returns:
+        구독 상태
+    """
+    subscription = watch_manager.get_subscription(subscription_id)
+    if subscription is None:
+        raise HTTPException(status_code=404, detail="구독을 찾을 수 없습니다.")
+    
+    return subscription
+
+
+@router.delete("/subscriptions/{subscription_id}", response_model=APIResponse)
+async def delete_subscription(subscription_id: str):
+    """
+    구독 삭제
+    
+    Args:
+        subscription_id: 구독 ID
+    
+    Returns:
+        삭제 결과
+    """
+    if not watch_manager.remove_subscription(subscription_id):
+        raise HTTPException(status_code=404, detail="구독을 찾을 수 없습니다.")
+    
+    return APIResponse(
+        success=True,
+        message="구독이 삭제되었습니다.",
+        data={"subscription_id": subscription_id}
+    )
+
+
+@router.post("/subscriptions/{subscription_id}/poll", response_model=APIResponse)
+async def poll_subscription(subscription_id: str):
+    """
+    구독 즉시 확인 (확인 주기와 관계없이)
+    
+    Args:
+        subscription_id: 구독 ID
+    
+    Returns:
+        새로 감지한 이벤트 목록
+    """
+    if watch_manager.get_subscription(subscription_id) is None:
+        raise HTTPException(status_code=404, detail="구독을 찾을 수 없습니다.")
+    
+    try:
+        events = await run_in_threadpool(profiling.wrap(watch_manager.poll_subscription), subscription_id)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"구독 확인 실패: {str(e)}")
+    
+    return APIResponse(
+        success=True,
+        message=f"{len(events)}건의 변경을 감지했습니다.",
+        data={"events": [json.loads(event.model_dump_json()) for event in events]}
+    )
+
+
+@router.get("/stream")
+async def stream_events(
+    http_request: Request,
+    subscription_id: Optional[str] = Query(None, description="이 구독의 이벤트만 받기")
+):
+    """
+    구독 이벤트 SSE 스트림 (text/event-stream)
+    
+    알림 대상에 sse가 포함된 구독의 이벤트를 감지되는 대로 전달한다.
+    
+    Args:
+        http_request: HTTP 요청 (연결 종료 확인용)
+        subscription_id: 구독 ID 필터
+    
+    Returns:
+        SSE 스트리밍 응답
+    """
+    queue = watch_manager.listen()
+    
+    async def iter_events():
+        try:
+            # 연결 직후 주석을 보내 응답 헤더가 바로 전달되도록 함
+            yield b": connected\n\n"
+            while not await http_request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                
+                if subscription_id and payload.get("subscription_id") != subscription_id:
+                    continue
+                data = json.dumps(payload, ensure_ascii=False)
+                yield f"event: {payload.get('event_type', 'message')}\ndata: {data}\n\n".encode("utf-8")
+        finally:
+            watch_manager.unlisten(queue)
+    
+    return StreamingResponse(
+        iter_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,134 @@
+"""
+Aho–Corasick 다중 패턴 문자열 검색 모듈
+"""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def is_word_char(char: str) -> bool:
+    """영문/숫자 단어 문자 여부 (한글은 조사가 바로 붙으므로 단어 경계를 보지 않음)"""
+    return char.isascii() and (char.isalnum() or char == "_")
+
+
+class AhoCorasick:
+    """
+    여러 패턴을 하나의 오토마톤으로 묶어 텍스트를 한 번만 훑으며 모두 찾는 검색기
+    
+    패턴 수와 관계없이 검색 시간은 텍스트 길이 + 일치 수에 비례한다. 상태는 정수 번호이며,
+    전이는 상태별 dict, 출력은 실패 링크를 따라 미리 합쳐 둔 패턴 번호 튜플로 저장하므로
+    인스턴스를 그대로 pickle로 저장/로드할 수 있다.
+    """
+    
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 검색할 패턴 목록 (패턴 번호는 목록 순서)
+        """
+        self.patterns: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]
+        
+        for pattern in patterns:
+            self.add(pattern)
+        self.build()
+    
+    def add(self, pattern: str) -> None:
+        """트라이에 패턴 추가 (build 전에만 호출)"""
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        if not pattern:
+            return
+        
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = next_state
+        self.output[state] += (pattern_id,)
+    
+    def build(self) -> None:
+        """너비 우선으로 실패 링크를 계산하고 출력을 합침"""
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                if self.output[self.fail[next_state]]:
+                    self.output[next_state] += self.output[self.fail[next_state]]
+    
+    def __len__(self) -> int:
+        return len(self.patterns)
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트에서 모든 패턴 일치 찾기 (겹치는 일치 포함)
+        
+        Args:
+            text: 검색할 텍스트
+        
+        Yields:
+            (끝 위치(포함하지 않음), 패턴 번호)
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for pattern_id in output[state]:
+                    yield index + 1, pattern_id
+    
+    def find_all(self, text: str, word_boundary: bool = True, longest: bool = True) -> List[Tuple[int, int, int]]:
+        """
+        텍스트에서 패턴 일치 목록
+        
+        Args:
+            text: 검색할 텍스트
+            word_boundary: 영문/숫자로 시작하거나 끝나는 패턴은 앞뒤가 영문/숫자가 아닐 때만 인정
+                ("oil"이 "toil"에서 잡히지 않도록)
+            longest: 더 긴 일치 안에 완전히 포함된 일치는 제외
+                ("glycerin"이 "polyglycerin"에서 따로 잡히지 않도록)
+        
+        Returns:
+            (시작 위치, 끝 위치, 패턴 번호) 목록 (시작 위치순)
+        """
+        matches = []
+        length = len(text)
+        for end, pattern_id in self.iter_matches(text):
+            start = end - len(self.patterns[pattern_id])
+            if word_boundary:
+                if start > 0 and is_word_char(text[start]) and is_word_char(text[start - 1]):
+                    continue
+                if end < length and is_word_char(text[end - 1]) and is_word_char(text[end]):
+                    continue
+            matches.append((start, end, pattern_id))
+        
+        if not longest or len(matches) < 2:
+            matches.sort()
+            return matches
+        
+        # 시작 위치순(같으면 긴 것 먼저)으로 훑으며 앞선 일치 범위 안에 들어가는 일치 제외
+        matches.sort(key=lambda match: (match[0], -match[1]))
+        kept = []
+        covered_end = -1
+        for match in matches:
+            if match[1] <= covered_end and not (kept and kept[-1][:2] == match[:2]):
+                continue
+            kept.append(match)
+            covered_end = max(covered_end, match[1])
+        return kept
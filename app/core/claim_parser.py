@@ -0,0 +1,88 @@
+"""
+청구항 인용 관계 파싱 모듈
+"""
+
+import re
+from typing import List
+
+# 인용 구절: "제1항", "청구항 1"로 시작하고 ",", "및", "또는", "내지", "~"로 이어지는 청구항 번호 목록
+# ("제1항 내지 제3항 중 어느 한 항", "청구항 1 또는 2", "제1항, 제3항 및 제5항")
+CLAIM_ITEM = r"(?:제\s*\d+\s*항|청구항\s*\d+(?:\s*항)?)"
+REFERENCE_PATTERN = re.compile(
+    CLAIM_ITEM
+    + r"(?:\s*(?:,|및|또는|내지|~)\s*(?:"
+    + CLAIM_ITEM
+    + r"|\d+(?:\s*항)?(?![\d.]|\s*(?:중량|%|개|종|wt))))*"
+)
+REFERENCE_TOKEN_PATTERN = re.compile(r"(\d+)|(내지|~)")
+
+# "삭제", "(삭제)", "청구항 3 삭제" 등 삭제된 청구항
+DELETED_PATTERN = re.compile(r"^\s*(?:청구항\s*\d+\s*)?[(\[]?\s*삭\s*제\s*[)\]]?\s*\.?\s*$")
+
+
+def is_deleted(claim: str) -> bool:
+    """삭제된 청구항인지 확인"""
+    return DELETED_PATTERN.match(claim) is not None
+
+
+def claim_references(claim: str, claim_no: int) -> List[int]:
+    """
+    청구항이 인용하는 앞선 청구항 번호
+    
+    Args:
+        claim: 청구항 텍스트
+        claim_no: 청구항 번호 (1부터, 이 번호 이상을 가리키는 인용은 무시하여 관계가 항상 DAG가 되게 함)
+    
+    Returns:
+        정렬된 청구항 번호 목록 (독립항이면 빈 목록)
+    """
+    references = set()
+    for match in REFERENCE_PATTERN.finditer(claim):
+        previous = None
+        in_range = False
+        for number, connector in REFERENCE_TOKEN_PATTERN.findall(match.group()):
+            if connector:
+                in_range = previous is not None
+                continue
+            number = int(number)
+            if in_range and previous < number:
+                references.update(range(previous + 1, min(number, claim_no - 1) + 1))
+            elif 0 < number < claim_no:
+                references.add(number)
+            previous = number
+            in_range = False
+    return sorted(references)
+
+
+def parse_claim_dependencies(claims: List[str]) -> List[List[int]]:
+    """
+    청구항 목록의 인용 관계
+    
+    Args:
+        claims: 청구항 목록 (목록 순서가 청구항 번호)
+    
+    Returns:
+        청구항별 인용하는 앞선 청구항 번호 목록 (독립항/삭제된 청구항은 빈 목록)
+    """
+    return [
+        [] if is_deleted(claim) else claim_references(claim, claim_no)
+        for claim_no, claim in enumerate(claims, start=1)
+    ]
+
+
+def independent_claims(claims: List[str], dependencies: List[List[int]]) -> List[int]:
+    """
+    독립항 번호
+    
+    Args:
+        claims: 청구항 목록
+        dependencies: parse_claim_dependencies 결과
+    
+    Returns:
+        인용하는 청구항이 없고 삭제되지 않은 청구항 번호 목록 (1부터)
+    """
+    return [
+        claim_no
+        for claim_no, (claim, references) in enumerate(zip(claims, dependencies), start=1)
+        if not references and not is_deleted(claim)
+    ]
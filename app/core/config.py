@@ -6,6 +6,7 @@ import json
 import os
 from typing import Optional
 from pydantic_settings import BaseSettings
+from app.core.lazy import LazyProxy
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,9 @@ class Settings(BaseSettings):
     service_key: str = "Qr1mK=WFuP/9i8ZIhJyRH=R2VpyxBo4fyA0pX6V72UE="
     base_url: str = "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice"
     timeout: int = 30
+    max_retries: int = 2
+    retry_backoff: float = 0.5
+    pool_size: int = 10
     
     # 검색 설정
     search_keyword: str = "조성물"
@@ -29,6 +33,35 @@ class Settings(BaseSettings):
     save_search_results: bool = True
     save_claims: bool = True
     download_pdfs: bool = True
+    save_traces: bool = True
+    use_patent_store: bool = True
+    
+    # 태스크 설정
+    dedup_window_seconds: int = 600
+    batch_concurrency: int = 4
+    status_refresh_interval_hours: float = 24.0
+    status_refresh_max_requests: int = 50
+    
+    # 캐시 설정
+    cache_ttl_seconds: int = 300
+    cache_stale_seconds: int = 600
+    cache_max_entries: int = 512
+    
+    # 구독 설정
+    watch_enabled: bool = True
+    watch_interval_seconds: int = 3600
+    watch_page_size: int = 20
+    watch_max_pages: int = 5
+    
+    # 분석 설정
+    ingredient_dictionary: str = ""
+    clustering_enabled: bool = True
+    cluster_threshold: float = 0.85
+    similarity_enabled: bool = True
+    similarity_terms_per_patent: int = 256
+    similarity_compact_every: int = 2000
+    similarity_independent_claims_only: bool = True
+    holder_match_threshold: float = 0.6
     
     # FastAPI 설정
     app_name: str = "화장품 특허 검색 API"
@@ -36,6 +69,8 @@ class Settings(BaseSettings):
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8000
+    compression_min_size: int = 1024
+    compression_level: int = 6
     
     class Config:
         env_file = ".env"
@@ -61,6 +96,9 @@ class ConfigManager:
                 self.settings.service_key = api_settings.get('service_key', self.settings.service_key)
                 self.settings.base_url = api_settings.get('base_url', self.settings.base_url)
                 self.settings.timeout = api_settings.get('timeout', self.settings.timeout)
+                self.settings.max_retries = api_settings.get('max_retries', self.settings.max_retries)
+                self.settings.retry_backoff = api_settings.get('retry_backoff_seconds', self.settings.retry_backoff)
+                self.settings.pool_size = api_settings.get('connection_pool_size', self.settings.pool_size)
                 
                 # 검색 설정
                 search_settings = config_data.get('search_settings', {})
@@ -77,12 +115,47 @@ class ConfigManager:
                 self.settings.save_search_results = output_settings.get('save_search_results', self.settings.save_search_results)
                 self.settings.save_claims = output_settings.get('save_claims', self.settings.save_claims)
                 self.settings.download_pdfs = output_settings.get('download_pdfs', self.settings.download_pdfs)
+                self.settings.save_traces = output_settings.get('save_traces', self.settings.save_traces)
+                self.settings.use_patent_store = output_settings.get('use_patent_store', self.settings.use_patent_store)
+                
+                # 태스크 설정
+                task_settings = config_data.get('task_settings', {})
+                self.settings.dedup_window_seconds = task_settings.get('dedup_window_seconds', self.settings.dedup_window_seconds)
+                self.settings.batch_concurrency = task_settings.get('batch_concurrency', self.settings.batch_concurrency)
+                self.settings.status_refresh_interval_hours = task_settings.get('status_refresh_interval_hours', self.settings.status_refresh_interval_hours)
+                self.settings.status_refresh_max_requests = task_settings.get('status_refresh_max_requests', self.settings.status_refresh_max_requests)
+                
+                # 캐시 설정
+                cache_settings = config_data.get('cache_settings', {})
+                self.settings.cache_ttl_seconds = cache_settings.get('ttl_seconds', self.settings.cache_ttl_seconds)
+                self.settings.cache_stale_seconds = cache_settings.get('stale_seconds', self.settings.cache_stale_seconds)
+                self.settings.cache_max_entries = cache_settings.get('max_entries', self.settings.cache_max_entries)
+                
+                # 구독 설정
+                watch_settings = config_data.get('watch_settings', {})
+                self.settings.watch_enabled = watch_settings.get('enabled', self.settings.watch_enabled)
+                self.settings.watch_interval_seconds = watch_settings.get('interval_seconds', self.settings.watch_interval_seconds)
+                self.settings.watch_page_size = watch_settings.get('page_size', self.settings.watch_page_size)
+                self.settings.watch_max_pages = watch_settings.get('max_pages', self.settings.watch_max_pages)
+                
+                # 분석 설정
+                analysis_settings = config_data.get('analysis_settings', {})
+                self.settings.ingredient_dictionary = analysis_settings.get('ingredient_dictionary', self.settings.ingredient_dictionary)
+                self.settings.clustering_enabled = analysis_settings.get('clustering_enabled', self.settings.clustering_enabled)
+                self.settings.cluster_threshold = analysis_settings.get('cluster_threshold', self.settings.cluster_threshold)
+                self.settings.similarity_enabled = analysis_settings.get('similarity_enabled', self.settings.similarity_enabled)
+                self.settings.similarity_terms_per_patent = analysis_settings.get('similarity_terms_per_patent', self.settings.similarity_terms_per_patent)
+                self.settings.similarity_compact_every = analysis_settings.get('similarity_compact_every', self.settings.similarity_compact_every)
+                self.settings.similarity_independent_claims_only = analysis_settings.get('similarity_independent_claims_only', self.settings.similarity_independent_claims_only)
+                self.settings.holder_match_threshold = analysis_settings.get('holder_match_threshold', self.settings.holder_match_threshold)
                 
                 # FastAPI 설정
                 app_settings = config_data.get('app_settings', {})
                 self.settings.debug = app_settings.get('debug', self.settings.debug)
                 self.settings.host = app_settings.get('host', self.settings.host)
                 self.settings.port = app_settings.get('port', self.settings.port)
+                self.settings.compression_min_size = app_settings.get('compression_min_size', self.settings.compression_min_size)
+                self.settings.compression_level = app_settings.get('compression_level', self.settings.compression_level)
                 
                 print(f"설정 파일 '{self.config_file}' 로드 완료")
             else:
@@ -99,7 +172,10 @@ class ConfigManager:
             "api_settings": {
                 "service_key": "",
                 "base_url": "http://plus.kipris.or.kr/kipo-api/kipi/patUtiModInfoSearchSevice",
-                "timeout": 30
+                "timeout": 30,
+                "max_retries": 2,
+                "retry_backoff_seconds": 0.5,
+                "connection_pool_size": 10
             },
             "search_settings": {
                 "search_keyword": "조성물",
@@ -113,12 +189,43 @@ class ConfigManager:
                 "output_directory": "patent_results",
                 "save_search_results": True,
                 "save_claims": True,
-                "download_pdfs": True
+                "download_pdfs": True,
+                "save_traces": True,
+                "use_patent_store": True
+            },
+            "task_settings": {
+                "dedup_window_seconds": 600,
+                "batch_concurrency": 4,
+                "status_refresh_interval_hours": 24,
+                "status_refresh_max_requests": 50
+            },
+            "cache_settings": {
+                "ttl_seconds": 300,
+                "stale_seconds": 600,
+                "max_entries": 512
+            },
+            "watch_settings": {
+                "enabled": True,
+                "interval_seconds": 3600,
+                "page_size": 20,
+                "max_pages": 5
+            },
+            "analysis_settings": {
+                "ingredient_dictionary": "",
+                "clustering_enabled": True,
+                "cluster_threshold": 0.85,
+                "similarity_enabled": True,
+                "similarity_terms_per_patent": 256,
+                "similarity_compact_every": 2000,
+                "similarity_independent_claims_only": True,
+                "holder_match_threshold": 0.6
             },
             "app_settings": {
                 "debug": False,
                 "host": "0.0.0.0",
-                "port": 8000
+                "port": 8000,
+                "compression_min_size": 1024,
+                "compression_level": 6
             }
         }
         
@@ -134,6 +241,6 @@ class ConfigManager:
         return self.settings
 
 
-# 전역 설정 인스턴스
-config_manager = ConfigManager()
-settings = config_manager.get_settings()
+# 전역 설정 인스턴스 (처음 사용할 때 설정 파일 로드)
+config_manager = LazyProxy(ConfigManager)
+settings = LazyProxy(lambda: config_manager.get_settings())
@@ -0,0 +1,137 @@
+"""
+IPC(국제특허분류) 코드 정규화 / 접두어 트라이 모듈
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 분류 단계 (섹션 A, 클래스 A61, 서브클래스 A61K, 메인그룹 A61K 8, 서브그룹 A61K 8/97)
+LEVELS = ("section", "class", "subclass", "group", "subgroup")
+
+# 트라이에서 코드 끝을 나타내는 문자 (완전한 코드 질의가 더 긴 서브그룹과 일치하지 않도록)
+CODE_END = "$"
+
+# "A61K 8/97", "A61K8/97", "A61K 008/970", "A61K-8/97 (2006.01)" 등
+IPC_PATTERN = re.compile(r"^([A-H])\s*(\d{2})\s*([A-Z])\s*[-\s]*0*(\d{1,4})\s*/\s*(\d{1,6})")
+# 접두어 질의: "A", "A61", "A61Q", "A61Q*", "A61Q 19", "A61Q 19/*", "A61Q 19/0*", "A61Q 19/02"
+PREFIX_PATTERN = re.compile(r"^([A-H])(?:\s*(\d{2})(?:\s*([A-Z])(?:[-\s]*0*(\d{1,4})(?:\s*/\s*(\d{0,6}))?)?)?)?\s*(\*)?$")
+
+
+def normalize_subgroup(subgroup: str) -> str:
+    """서브그룹 번호 정규화 (끝의 0 제거, 최소 두 자리: "970" → "97", "0" → "00")"""
+    return (subgroup.rstrip("0") or "0").ljust(2, "0")
+
+
+def normalize_ipc(code: str) -> Optional[str]:
+    """
+    IPC 코드를 "A61K 8/97" 형식으로 정규화
+    
+    Args:
+        code: KIPRIS ipcNumber 값
+    
+    Returns:
+        정규화한 코드 (형식이 맞지 않으면 None)
+    """
+    match = IPC_PATTERN.match(code.strip().upper())
+    if match is None:
+        return None
+    section, class_no, subclass, group, subgroup = match.groups()
+    return f"{section}{class_no}{subclass} {int(group)}/{normalize_subgroup(subgroup)}"
+
+
+def ipc_levels(code: str) -> Tuple[str, str, str, str, str]:
+    """
+    정규화한 코드의 단계별 코드
+    
+    Args:
+        code: normalize_ipc로 정규화한 코드
+    
+    Returns:
+        (섹션, 클래스, 서브클래스, 메인그룹, 서브그룹) 예: ("A", "A61", "A61K", "A61K 8", "A61K 8/97")
+    """
+    group = code.split("/", 1)[0]
+    return code[:1], code[:3], code[:4], group, code
+
+
+def ipc_prefix(pattern: str) -> str:
+    """
+    IPC 접두어 질의를 정규화한 코드의 문자열 접두어로 변환
+    
+    "A61Q 19"와 "A61Q 19/*"는 메인그룹 19만("A61Q 19/"), "A61Q 1"은 메인그룹 1만 가리키도록
+    단계 경계까지 맞추고, 서브그룹 자리의 "*"는 그 앞 숫자로 시작하는 서브그룹을 모두 가리킨다.
+    "*" 없는 완전한 코드는 그 코드만 가리킨다 (CODE_END로 끝남).
+    
+    Args:
+        pattern: 접두어 질의 (예: "A61Q 19/*")
+    
+    Returns:
+        문자열 접두어 (예: "A61Q 19/")
+    
+    Raises:
+        ValueError: IPC 접두어 형식이 아닌 경우
+    """
+    match = PREFIX_PATTERN.match(pattern.strip().upper())
+    if match is None:
+        raise ValueError(f"IPC 코드 형식이 아닙니다: {pattern}")
+    section, class_no, subclass, group, subgroup, wildcard = match.groups()
+    
+    if class_no is None:
+        return section
+    if subclass is None:
+        return f"{section}{class_no}"
+    if group is None:
+        return f"{section}{class_no}{subclass} "
+    if not subgroup:
+        return f"{section}{class_no}{subclass} {int(group)}/"
+    if wildcard:
+        return f"{section}{class_no}{subclass} {int(group)}/{subgroup}"
+    return f"{section}{class_no}{subclass} {int(group)}/{normalize_subgroup(subgroup)}{CODE_END}"
+
+
+class IPCTrie:
+    """
+    정규화한 IPC 코드(+ CODE_END)의 문자 단위 접두어 트라이
+    
+    노드마다 그 아래에 있는 코드 번호 목록을 함께 저장하므로 접두어 질의는 접두어 길이만큼만 내려가면 된다.
+    """
+    
+    def __init__(self):
+        self.children: List[Dict[str, int]] = [{}]
+        self.codes: List[List[int]] = [[]]
+    
+    def add(self, code: str, code_id: int) -> None:
+        """
+        코드 추가
+        
+        Args:
+            code: 정규화한 코드
+            code_id: 코드 번호
+        """
+        node = 0
+        self.codes[node].append(code_id)
+        for char in code + CODE_END:
+            next_node = self.children[node].get(char)
+            if next_node is None:
+                next_node = len(self.children)
+                self.children[node][char] = next_node
+                self.children.append({})
+                self.codes.append([])
+            node = next_node
+            self.codes[node].append(code_id)
+    
+    def search(self, prefix: str) -> List[int]:
+        """
+        접두어로 시작하는 코드 번호 목록
+        
+        Args:
+            prefix: ipc_prefix로 변환한 문자열 접두어
+        
+        Returns:
+            코드 번호 목록 (추가한 순서)
+        """
+        node = 0
+        for char in prefix:
+            node = self.children[node].get(char)
+            if node is None:
+                return []
+        return self.codes[node]
@@ -0,0 +1,55 @@
+"""
+지연 초기화 유틸리티
+"""
+
+import threading
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """
+    첫 속성 접근 시점에 대상 객체를 생성하는 프록시
+    
+    모듈 수준 전역 인스턴스를 import 시점이 아니라 실제로 사용할 때 만들기 위해 사용한다.
+    속성 조회/설정은 모두 생성된 객체로 전달된다.
+    """
+    
+    __slots__ = ("_factory", "_instance", "_lock")
+    
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Args:
+            factory: 대상 객체를 생성하는 함수
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.RLock())
+    
+    def _resolve(self) -> Any:
+        """대상 객체 반환 (없으면 생성)"""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    instance = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+    
+    def is_initialized(self) -> bool:
+        """대상 객체 생성 여부"""
+        return object.__getattribute__(self, "_instance") is not None
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+    
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+    
+    def __repr__(self) -> str:
+        if not self.is_initialized():
+            return f"<LazyProxy (초기화 전) {object.__getattribute__(self, '_factory')!r}>"
+        return repr(self._resolve())
@@ -0,0 +1,347 @@
+"""
+Prometheus 형식 메트릭 모듈
+
+외부 의존성 없이 카운터/게이지/히스토그램을 제공하고 텍스트 노출 형식(0.0.4)으로 출력한다.
+값 갱신은 레이블 튜플을 키로 하는 dict 연산 한 번이므로 호출 경로에 부담이 적다.
+"""
+
+import asyncio
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def escape_label(value: str) -> str:
+    """레이블 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    """레이블을 {name="value",...} 형식으로 변환"""
+    parts = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def format_value(value: float) -> str:
+    """메트릭 값 문자열 변환"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """메트릭 기본 클래스"""
+    
+    metric_type = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+    
+    def label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+    
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """텍스트 노출 형식의 샘플 줄 목록"""
+    
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}"
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+    
+    metric_type = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def get(self, **labels: str) -> float:
+        return self.values.get(self.label_values(labels), 0)
+    
+    def snapshot(self) -> Dict[str, float]:
+        """레이블 값(여러 개면 ","로 연결)별 현재 값"""
+        with self.lock:
+            return {",".join(key): value for key, value in self.values.items()}
+    
+    def samples(self) -> List[str]:
+        with self.lock:
+            items = list(self.values.items())
+        return [
+            f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Metric):
+    """설정값 게이지 (callback을 주면 출력 시점에 값을 계산)"""
+    
+    metric_type = "gauge"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+        self.callback = callback
+    
+    def set(self, value: float, **labels: str) -> None:
+        with self.lock:
+            self.values[self.label_values(labels)] = value
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+    
+    def samples(self) -> List[str]:
+        if self.callback is not None:
+            try:
+                items = list(self.callback().items())
+            except Exception as e:
+                print(f"메트릭 계산 실패 ({self.name}): {e}")
+                items = []
+        else:
+            with self.lock:
+                items = list(self.values.items())
+        return [
+            f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(Metric):
+    """누적 버킷 히스토그램"""
+    
+    metric_type = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 개수..., +Inf 개수], 합계
+        self.counts: Dict[LabelValues, List[int]] = {}
+        self.sums: Dict[LabelValues, float] = {}
+    
+    def observe(self, value: float, **labels: str) -> None:
+        key = self.label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            counts = self.counts.get(key)
+            if counts is None:
+                counts = self.counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self.sums[key] = self.sums.get(key, 0.0) + value
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """레이블 값(여러 개면 ","로 연결)별 관측 수와 합계"""
+        with self.lock:
+            return {
+                ",".join(key): {"count": sum(counts), "sum": round(self.sums[key], 6)}
+                for key, counts in self.counts.items()
+            }
+    
+    def samples(self) -> List[str]:
+        with self.lock:
+            items = [(key, list(counts), self.sums[key]) for key, counts in self.counts.items()]
+        
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = format_labels(self.labelnames, key, f'le="{format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class RateMeter:
+    """최근 구간의 초당 발생 횟수 계산기"""
+    
+    def __init__(self, window_seconds: float = 60.0, max_events: int = 100000):
+        self.window_seconds = window_seconds
+        self.events: deque = deque(maxlen=max_events)
+        self.lock = threading.Lock()
+    
+    def mark(self, count: int = 1) -> None:
+        with self.lock:
+            self.events.append((time.monotonic(), count))
+    
+    def rate(self) -> float:
+        now = time.monotonic()
+        with self.lock:
+            while self.events and now - self.events[0][0] > self.window_seconds:
+                self.events.popleft()
+            total = sum(count for _, count in self.events)
+        return total / self.window_seconds
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력"""
+    
+    def __init__(self):
+        self.metrics: List[Metric] = []
+    
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+    
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """
+    이벤트 루프 지연 측정 (예정된 깨어남 시각과 실제 시각의 차이)
+    
+    Args:
+        interval: 측정 주기 (초)
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - scheduled)
+        event_loop_lag.set(lag)
+        event_loop_lag_histogram.observe(lag)
+
+
+def cache_hit_ratios() -> Dict[LabelValues, float]:
+    """캐시별 적중률 계산 (cache_requests_total 기준)"""
+    totals: Dict[str, float] = {}
+    hits: Dict[str, float] = {}
+    with cache_requests.lock:
+        items = list(cache_requests.values.items())
+    
+    for (cache, result), value in items:
+        totals[cache] = totals.get(cache, 0) + value
+        if result != "miss":
+            hits[cache] = hits.get(cache, 0) + value
+    
+    return {(cache,): hits.get(cache, 0) / total for cache, total in totals.items() if total}
+
+
+# 전역 메트릭 레지스트리와 메트릭 정의
+registry = MetricsRegistry()
+
+kipris_request_duration = registry.register(Histogram(
+    "kipris_request_duration_seconds",
+    "KIPRIS 요청 지연 시간 (초)",
+    ["endpoint"]
+))
+kipris_request_errors = registry.register(Counter(
+    "kipris_request_errors_total",
+    "KIPRIS 요청 오류 수",
+    ["endpoint"]
+))
+kipris_request_retries = registry.register(Counter(
+    "kipris_request_retries_total",
+    "KIPRIS 요청 재시도 수",
+    ["endpoint"]
+))
+cache_requests = registry.register(Counter(
+    "cache_requests_total",
+    "캐시 조회 수 (result: hit, stale, miss)",
+    ["cache", "result"]
+))
+cache_hit_ratio = registry.register(Gauge(
+    "cache_hit_ratio",
+    "캐시 적중률 (stale 포함)",
+    ["cache"],
+    callback=lambda: cache_hit_ratios()
+))
+patent_store_lookups = registry.register(Counter(
+    "patent_store_lookups_total",
+    "특허 저장소 조회 수 (kind: detail, pdf / result: hit, miss)",
+    ["kind", "result"]
+))
+patent_status_changes = registry.register(Counter(
+    "patent_status_changes_total",
+    "등록상태 갱신에서 바뀐 특허 수 (previous: 이전 등록상태 / current: 새 등록상태)",
+    ["previous", "current"]
+))
+watch_polls = registry.register(Counter(
+    "watch_polls_total",
+    "구독 확인 수 (result: unchanged, changed, error)",
+    ["result"]
+))
+watch_events = registry.register(Counter(
+    "watch_events_total",
+    "구독 알림 이벤트 수 (type: new, changed)",
+    ["type"]
+))
+tasks_finished = registry.register(Counter(
+    "tasks_finished_total",
+    "종료된 태스크 수",
+    ["status"]
+))
+patents_processed = registry.register(Counter(
+    "patents_processed_total",
+    "처리된 특허 수"
+))
+patents_rate_meter = RateMeter()
+patents_processed_rate = registry.register(Gauge(
+    "patents_processed_per_second",
+    "최근 60초간 초당 처리된 특허 수",
+    callback=lambda: {(): patents_rate_meter.rate()}
+))
+bytes_downloaded = registry.register(Counter(
+    "bytes_downloaded_total",
+    "KIPRIS에서 내려받은 바이트 수",
+    ["endpoint"]
+))
+bytes_written = registry.register(Counter(
+    "bytes_written_total",
+    "파일로 기록한 바이트 수",
+    ["kind"]
+))
+event_loop_lag = registry.register(Gauge(
+    "event_loop_lag_seconds",
+    "최근 측정된 이벤트 루프 지연 (초)"
+))
+event_loop_lag_histogram = registry.register(Histogram(
+    "event_loop_lag_distribution_seconds",
+    "이벤트 루프 지연 분포 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+))
@@ -0,0 +1,162 @@
+"""
+ASGI 미들웨어 모듈
+"""
+
+import zlib
+from typing import List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Content-Encoding별 zlib wbits (gzip: 헤더 포함 31, deflate: zlib 형식 15)
+COMPRESSION_WBITS = {"gzip": 31, "deflate": 15}
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 압축 방식 선택
+    
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+    
+    Returns:
+        "gzip", "deflate" 또는 None (품질 값이 같으면 gzip 우선)
+    """
+    qualities = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip()
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            qualities[token] = quality
+    
+    best: Optional[Tuple[float, int, str]] = None
+    for candidate in COMPRESSION_WBITS:
+        # 명시되지 않은 방식은 "*"의 품질 값을 따름
+        quality = qualities.get(candidate, qualities.get("*", 0.0))
+        if quality <= 0:
+            continue
+        preference = 1 if candidate == "gzip" else 0
+        if best is None or (quality, preference) > best[:2]:
+            best = (quality, preference, candidate)
+    
+    return best[2] if best else None
+
+
+class CompressionMiddleware:
+    """
+    gzip/deflate 응답 압축 미들웨어
+    
+    클라이언트가 지원하는 방식 중 하나를 골라 minimum_size 이상인 응답만 압축한다.
+    스트리밍 응답은 청크마다 Z_SYNC_FLUSH로 내보내 NDJSON 한 줄씩 바로 전달되도록 한다.
+    """
+    
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        responder = CompressionResponder(self.app, encoding, self.minimum_size, self.compresslevel)
+        await responder(scope, receive, send)
+
+
+class CompressionResponder:
+    """요청 하나의 응답을 압축하여 전송"""
+    
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int, compresslevel: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.send: Optional[Send] = None
+        self.start_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+    
+    def new_compressor(self):
+        return zlib.compressobj(self.compresslevel, zlib.DEFLATED, COMPRESSION_WBITS[self.encoding])
+    
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+        
+        if message_type == "http.response.start":
+            # 본문 크기를 알 때까지 시작 메시지를 보류
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+            )
+            return
+        
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.start_message)
+            await self.send(message)
+            return
+        
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            self.compressor = self.new_compressor()
+            
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.flush()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            
+            # 스트리밍 응답은 길이를 미리 알 수 없음
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self.send(self.start_message)
+        
+        chunks: List[bytes] = [self.compressor.compress(body)]
+        if more_body:
+            chunks.append(self.compressor.flush(zlib.Z_SYNC_FLUSH))
+        else:
+            chunks.append(self.compressor.flush())
+        
+        await self.send({
+            "type": "http.response.body",
+            "body": b"".join(chunks),
+            "more_body": more_body
+        })
@@ -0,0 +1,231 @@
+"""
+MinHash / LSH 근사 중복 탐지 모듈 (NumPy 벡터 연산)
+"""
+
+from typing import Dict, List, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 해시 계산용 상수 (2^61 - 1 메르센 소수, 64비트 곱셈 해시 상수)
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MIX_MULTIPLIER = np.uint64(0xFF51AFD7ED558CCD)
+WINDOW_BASE = 0x100000001B3
+HASH_MASK = np.uint64(0xFFFFFFFF)
+
+
+def ngram_hashes(text: str, size: int) -> np.ndarray:
+    """
+    문자 size-gram의 64비트 해시 (등장 순서, 중복 포함)
+    
+    한국어는 띄어쓰기와 조사 차이가 많으므로 단어 대신 공백을 없앤 문자 n-gram을 사용한다.
+    모든 창의 다항식 해시를 한 번의 행렬 곱으로 계산한다.
+    
+    Args:
+        text: 텍스트
+        size: n-gram 길이 (문자 수, 텍스트가 더 짧으면 텍스트 전체)
+    
+    Returns:
+        uint64 해시 배열
+    """
+    text = "".join(text.lower().split())
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+    
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    size = min(size, len(codes))
+    powers = np.array([pow(WINDOW_BASE, size - 1 - i, 1 << 64) for i in range(size)], dtype=np.uint64)
+    
+    # uint64 곱셈/덧셈은 2^64로 나눈 나머지로 계산됨
+    hashes = (sliding_window_view(codes, size) * powers).sum(axis=1, dtype=np.uint64)
+    hashes ^= hashes >> np.uint64(33)
+    hashes *= MIX_MULTIPLIER
+    hashes ^= hashes >> np.uint64(33)
+    return hashes
+
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """
+    문자 size-gram 셔글의 32비트 해시 (중복 제거)
+    
+    Args:
+        text: 텍스트
+        size: 셔글 길이 (문자 수)
+    
+    Returns:
+        정렬된 uint32 해시 배열
+    """
+    return np.unique((ngram_hashes(text, size) & HASH_MASK).astype(np.uint32))
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    LSH 밴드 수와 밴드당 행 수 선택
+    
+    후보가 되는 유사도 (1/b)^(1/r)이 기준 유사도보다 조금 낮도록 골라 근사 중복을 놓치지 않게 하고,
+    거짓 후보는 서명 비교로 걸러낸다.
+    
+    Args:
+        num_perm: 서명 길이
+        threshold: 같은 묶음으로 볼 최소 자카드 유사도
+    
+    Returns:
+        (밴드 수, 밴드당 행 수)
+    """
+    target = max(0.05, threshold - 0.1)
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - target)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """
+    셔글 해시 집합의 MinHash 서명 계산기
+    
+    h_i(x) = (a_i * x + b_i) mod (2^61 - 1)을 num_perm개 동시에 계산하고 최솟값을 취한다.
+    a_i, b_i, x가 모두 2^32 미만이므로 uint64에서 넘치지 않는다.
+    """
+    
+    def __init__(self, num_perm: int = 128, seed: int = 1, chunk_size: int = 4096):
+        """
+        Args:
+            num_perm: 서명 길이 (해시 함수 수)
+            seed: 해시 함수 난수 시드 (저장된 서명과 비교하려면 같아야 함)
+            chunk_size: 한 번에 계산할 셔글 수 (메모리 사용량 = num_perm × chunk_size × 8바이트)
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.chunk_size = chunk_size
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+    
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        MinHash 서명
+        
+        Args:
+            hashes: 셔글 해시 배열
+        
+        Returns:
+            uint32 서명 (셔글이 없으면 모두 최댓값)
+        """
+        signature = np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64)
+        values = hashes.astype(np.uint64)
+        for start in range(0, len(values), self.chunk_size):
+            chunk = values[None, start:start + self.chunk_size]
+            np.minimum(signature, ((self.a * chunk + self.b) % MERSENNE_PRIME).min(axis=1), out=signature)
+        return (signature & HASH_MASK).astype(np.uint32)
+
+
+class LSHIndex:
+    """
+    MinHash 서명 LSH 색인
+    
+    서명을 밴드로 나눠 밴드별 버킷에 넣고, 한 밴드라도 같은 버킷에 들어간 서명만 후보로 비교하므로
+    새 서명 하나를 찾는 비용은 전체 서명 수가 아니라 후보 수에 비례한다.
+    """
+    
+    def __init__(self, num_perm: int, threshold: float):
+        """
+        Args:
+            num_perm: 서명 길이
+            threshold: 같은 묶음으로 볼 최소 자카드 유사도
+        """
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        self.buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self.keys: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def contains(self, key: str) -> bool:
+        """색인에 있는 키인지 확인"""
+        return key in self.positions
+    
+    def band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """밴드별 버킷 키"""
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+    
+    def query(self, signature: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        기준 유사도 이상인 색인 항목
+        
+        Args:
+            signature: MinHash 서명
+        
+        Returns:
+            (키, 추정 자카드 유사도) 목록
+        """
+        candidates = set()
+        for band, band_key in enumerate(self.band_keys(signature)):
+            candidates.update(self.buckets[band].get(band_key, ()))
+        if not candidates:
+            return []
+        
+        rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarity = (self.signatures[rows] == signature).mean(axis=1)
+        matched = similarity >= self.threshold
+        return [(self.keys[row], float(score)) for row, score in zip(rows[matched], similarity[matched])]
+    
+    def add(self, key: str, signature: np.ndarray) -> None:
+        """
+        서명 추가 (이미 있는 키는 무시)
+        
+        Args:
+            key: 키 (출원번호)
+            signature: MinHash 서명
+        """
+        if key in self.positions:
+            return
+        
+        # 서명 배열은 두 배씩 늘려 추가 비용을 상각
+        if self.size == len(self.signatures):
+            grown = np.empty((max(1024, self.size * 2), self.num_perm), dtype=np.uint32)
+            grown[:self.size] = self.signatures[:self.size]
+            self.signatures = grown
+        
+        row = self.size
+        self.signatures[row] = signature
+        self.keys.append(key)
+        self.positions[key] = row
+        self.size += 1
+        for band, band_key in enumerate(self.band_keys(signature)):
+            self.buckets[band].setdefault(band_key, []).append(row)
+    
+    def add_many(self, keys: List[str], signatures: np.ndarray) -> None:
+        """
+        서명 여러 개를 한 번에 추가 (저장된 색인 로드용, 새 키만 전달해야 함)
+        
+        Args:
+            keys: 키 목록
+            signatures: (키 수, num_perm) uint32 서명 배열
+        """
+        if not keys:
+            return
+        
+        start = self.size
+        count = len(keys)
+        if start + count > len(self.signatures):
+            grown = np.empty((max(1024, start + count, self.size * 2), self.num_perm), dtype=np.uint32)
+            grown[:start] = self.signatures[:start]
+            self.signatures = grown
+        self.signatures[start:start + count] = signatures
+        self.keys.extend(keys)
+        self.positions.update(zip(keys, range(start, start + count)))
+        self.size += count
+        
+        # 밴드 열을 고정 길이 바이트(void) 배열로 보아 행별 버킷 키를 한 번에 생성
+        for band in range(self.bands):
+            block = np.ascontiguousarray(signatures[:, band * self.rows:(band + 1) * self.rows])
+            buckets = self.buckets[band]
+            for row, band_key in enumerate(block.view(f"V{self.rows * 4}").ravel().tolist(), start):
+                buckets.setdefault(band_key, []).append(row)
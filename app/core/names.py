@@ -0,0 +1,122 @@
+"""
+발명자 / 출원인 이름 정규화 모듈
+"""
+
+import re
+import unicodedata
+from typing import List, Set, Tuple
+
+# 출원인 이름의 회사 형태 표기 ("(주)", "주식회사", "Co., Ltd." 등)
+CORPORATE_PATTERN = re.compile(
+    r"\((?:주|유|재|사)\)|주식\s*회사|유한\s*(?:책임\s*)?회사|재단\s*법인|사단\s*법인|학교\s*법인|"
+    r"\b(?:co\.?\s*,?\s*ltd|corporation|corp|inc|ltd|llc|gmbh|s\.?\s*a|ag|k\.?\s*k)\b\.?",
+    re.IGNORECASE
+)
+# 괄호 안의 다른 표기 ("홍길동(洪吉童)", "코스맥스 주식회사(COSMAX INC.)")
+ALIAS_PATTERN = re.compile(r"\(([^()]*)\)")
+# 이름 비교에서 무시하는 문자 (공백, 구두점)
+IGNORED_PATTERN = re.compile(r"[\s.,·・'\"`\-_/&]+")
+# 한글 음절
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+# 한글 음절 → 초성/중성/종성 자모 (U+AC00부터 초성 588개, 중성 28개 단위)
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+# 한 필드에 여러 이름이 들어 있을 때의 구분자
+SEPARATOR_PATTERN = re.compile(r"\s*[|;]\s*")
+
+
+def strip_corporate(name: str) -> str:
+    """회사 형태 표기 제거 (표기만 있는 이름은 그대로)"""
+    stripped = CORPORATE_PATTERN.sub(" ", name)
+    return stripped if IGNORED_PATTERN.sub("", stripped) else name
+
+
+def name_key(name: str, corporate: bool = False) -> str:
+    """
+    이름 비교용 키 (NFKC 정규화 후 대소문자/공백/구두점 차이 제거)
+    
+    NFKC 정규화로 전각 문자, "㈜" 같은 합자, CJK 호환 한자가 통합 한자로 바뀐다.
+    
+    Args:
+        name: 이름
+        corporate: 회사 형태 표기("주식회사", "(주)" 등)를 뺄지 여부 (출원인 이름)
+    
+    Returns:
+        키 (비교할 문자가 없으면 빈 문자열)
+    """
+    name = unicodedata.normalize("NFKC", name)
+    if corporate:
+        name = strip_corporate(name)
+    return IGNORED_PATTERN.sub("", name).lower()
+
+
+def name_variants(name: str, corporate: bool = False) -> Tuple[str, List[str]]:
+    """
+    이름의 대표 키와 다른 표기의 키
+    
+    "홍길동(洪吉童)"처럼 괄호 안에 다른 표기(한자, 영문)가 있으면 괄호 밖 이름과 괄호 안 표기를
+    각각 키로 만들고, 한글이 들어 있는 첫 키를 대표 키로 삼는다 ("洪吉童(홍길동)"도 "홍길동").
+    
+    Args:
+        name: KIPRIS 발명자/출원인 이름
+        corporate: 회사 형태 표기를 뺄지 여부
+    
+    Returns:
+        (대표 키, 다른 표기 키 목록) (대표 키가 빈 문자열이면 비교할 이름이 없는 것)
+    """
+    name = unicodedata.normalize("NFKC", name)
+    if corporate:
+        # "(주)"는 다른 표기가 아니므로 괄호를 나누기 전에 제거
+        name = strip_corporate(name)
+    
+    keys = []
+    for variant in [ALIAS_PATTERN.sub(" ", name)] + ALIAS_PATTERN.findall(name):
+        key = name_key(variant, corporate)
+        if key and key not in keys:
+            keys.append(key)
+    if not keys:
+        return "", []
+    
+    primary = next((key for key in keys if HANGUL_PATTERN.search(key)), keys[0])
+    return primary, [key for key in keys if key != primary]
+
+
+def split_names(value: str) -> List[str]:
+    """한 필드에 "|" 또는 ";"로 이어진 이름 목록"""
+    return [name for name in SEPARATOR_PATTERN.split(value.strip()) if name]
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해 ("맥" → "맥", 한글이 아닌 문자는 그대로)
+    
+    음절 단위로 비교하면 "맥"과 "멕"이 전혀 다른 문자가 되지만 자모로 나누면 세 자모 중 하나만 다르다.
+    """
+    chars = []
+    for char in text:
+        offset = ord(char) - SYLLABLE_BASE
+        if 0 <= offset < SYLLABLE_COUNT:
+            chars.append(chr(0x1100 + offset // 588))
+            chars.append(chr(0x1161 + offset % 588 // 28))
+            if offset % 28:
+                chars.append(chr(0x11A7 + offset % 28))
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def jamo_ngrams(key: str, size: int = 3) -> Set[str]:
+    """
+    이름 키의 자모 n-gram 집합 (앞뒤에 경계 문자를 붙여 첫/끝 자모도 n-gram에 들어가게 함)
+    
+    Args:
+        key: name_key로 만든 키
+        size: n-gram 길이 (자모 수)
+    
+    Returns:
+        n-gram 집합 (키가 짧으면 키 전체 하나)
+    """
+    text = f"^{decompose_jamo(key)}$"
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
@@ -0,0 +1,188 @@
+"""
+등록권자 포트폴리오 집계 모듈
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.core.ipc import ipc_levels, normalize_ipc
+
+# 연도를 알 수 없는 특허의 집계 값
+UNKNOWN = "unknown"
+
+# 청구항 수 구간 (구간 상한, 마지막 구간은 상한 없음)
+CLAIM_BUCKETS = (5, 10, 20, 50)
+INDEPENDENT_BUCKETS = (1, 2, 3, 4)
+
+# 특허 하나가 여러 값에 들어갈 수 있는 분포 (상위 값만 보고서에 포함)
+TOP_DIMENSIONS = ("ipc_subclass", "ipc_group", "ingredient")
+# 보고서의 분포 순서와 제목
+DIMENSION_TITLES = {
+    "status": "등록상태별 분포",
+    "year": "출원연도별 분포",
+    "claim_count": "청구항 수 분포",
+    "independent_claim_count": "독립항 수 분포",
+    "ipc_subclass": "IPC 서브클래스",
+    "ipc_group": "IPC 메인그룹",
+    "ingredient": "청구항 성분"
+}
+
+# 특허 하나의 집계 기여분: (분포, 값) → 더할 값
+Facets = Dict[Tuple[str, str], int]
+
+
+def application_year(application_number: str) -> int:
+    """출원번호(10-YYYY-NNNNNNN)의 출원 연도 (알 수 없으면 0)"""
+    digits = application_number.replace("-", "")
+    if len(digits) == 13 and digits.isdigit():
+        year = int(digits[2:6])
+        if 1940 <= year <= 2100:
+            return year
+    return 0
+
+
+def bucket_label(count: int, bounds: Tuple[int, ...]) -> str:
+    """구간 이름 (bounds=(5, 10): 3 → "1-5", 7 → "6-10", 11 → "11+", 상한과 하한이 같으면 숫자 하나)"""
+    lower = 1
+    for upper in bounds:
+        if count <= upper:
+            return str(upper) if lower == upper else f"{lower}-{upper}"
+        lower = upper + 1
+    return f"{lower}+"
+
+
+def bucket_order(bounds: Tuple[int, ...]) -> List[str]:
+    """구간 이름 목록 (작은 구간부터)"""
+    labels = []
+    lower = 1
+    for upper in bounds:
+        labels.append(str(upper) if lower == upper else f"{lower}-{upper}")
+        lower = upper + 1
+    labels.append(f"{lower}+")
+    return labels
+
+
+def patent_facets(
+    application_number: str,
+    register_status: str,
+    ipc_codes: Iterable[str] = (),
+    ingredients: Iterable[str] = (),
+    claim_count: Optional[int] = None,
+    independent_count: Optional[int] = None
+) -> Facets:
+    """
+    특허 하나의 집계 기여분
+    
+    같은 분포에 같은 값이 여러 번 나와도 특허 하나로 센다. 합계(totals)는 평균 계산용이다.
+    
+    Args:
+        application_number: 출원번호
+        register_status: 등록상태
+        ipc_codes: KIPRIS IPC 코드 목록
+        ingredients: 청구항에 나온 성분 대표명 목록
+        claim_count: 청구항 수 (청구항을 조회하지 않았으면 None)
+        independent_count: 독립항 수
+    
+    Returns:
+        (분포, 값) → 더할 값
+    """
+    year = application_year(application_number)
+    facets: Facets = {
+        ("totals", "patents"): 1,
+        ("status", register_status.strip() or UNKNOWN): 1,
+        ("year", str(year) if year else UNKNOWN): 1
+    }
+    
+    codes = {code for code in (normalize_ipc(raw) for raw in ipc_codes if raw) if code is not None}
+    for code in codes:
+        levels = ipc_levels(code)
+        facets[("ipc_subclass", levels[2])] = 1
+        facets[("ipc_group", levels[3])] = 1
+    for ingredient in ingredients:
+        facets[("ingredient", ingredient)] = 1
+    
+    if claim_count:
+        facets[("totals", "claims_patents")] = 1
+        facets[("totals", "claims")] = claim_count
+        facets[("totals", "independent_claims")] = independent_count or 0
+        facets[("claim_count", bucket_label(claim_count, CLAIM_BUCKETS))] = 1
+        if independent_count:
+            facets[("independent_claim_count", bucket_label(independent_count, INDEPENDENT_BUCKETS))] = 1
+    return facets
+
+
+def add_facets(counts: Facets, facets: Facets, sign: int = 1) -> None:
+    """집계에 기여분 더하기 (sign=-1이면 빼기)"""
+    for key, value in facets.items():
+        counts[key] = counts.get(key, 0) + sign * value
+
+
+def build_report(counts: Facets, top: int = 20) -> Dict[str, object]:
+    """
+    집계로 보고서 데이터 생성 (API 응답과 텍스트 보고서가 같은 데이터를 사용)
+    
+    Args:
+        counts: (분포, 값) → 특허 수 (totals는 합계)
+        top: IPC/성분 분포의 상위 값 수
+    
+    Returns:
+        patents, claims(청구항 수 평균), 분포별 {값: 특허 수}
+    """
+    totals = {value: count for (dimension, value), count in counts.items() if dimension == "totals"}
+    claims_patents = totals.get("claims_patents", 0)
+    
+    distributions: Dict[str, Dict[str, int]] = {dimension: {} for dimension in DIMENSION_TITLES}
+    for (dimension, value), count in counts.items():
+        if dimension in distributions and count > 0:
+            distributions[dimension][value] = count
+    
+    report: Dict[str, object] = {
+        "patents": totals.get("patents", 0),
+        "claims": {
+            "patents_with_claims": claims_patents,
+            "mean_claims": round(totals.get("claims", 0) / claims_patents, 2) if claims_patents else None,
+            "mean_independent_claims": round(totals.get("independent_claims", 0) / claims_patents, 2) if claims_patents else None
+        }
+    }
+    for dimension, values in distributions.items():
+        if dimension == "year":
+            items = sorted(values.items())
+        elif dimension == "claim_count":
+            items = [(label, values[label]) for label in bucket_order(CLAIM_BUCKETS) if label in values]
+        elif dimension == "independent_claim_count":
+            items = [(label, values[label]) for label in bucket_order(INDEPENDENT_BUCKETS) if label in values]
+        else:
+            items = sorted(values.items(), key=lambda item: (-item[1], item[0]))
+            if dimension in TOP_DIMENSIONS:
+                items = items[:top]
+        report[dimension] = dict(items)
+    return report
+
+
+def format_report(report: Dict[str, object]) -> List[str]:
+    """
+    보고서 데이터를 텍스트 보고서 줄로 변환
+    
+    Args:
+        report: build_report 결과
+    
+    Returns:
+        줄 목록 (줄바꿈 없음, 분포 사이에 빈 줄)
+    """
+    lines = [f"특허 수: {report['patents']}건"]
+    claims = report["claims"]
+    if claims["patents_with_claims"]:
+        lines.append(
+            f"청구항 수 평균: {claims['mean_claims']}개 (독립항 {claims['mean_independent_claims']}개, "
+            f"청구항 조회 특허 {claims['patents_with_claims']}건)"
+        )
+    lines.append("")
+    
+    for dimension, title in DIMENSION_TITLES.items():
+        values = report.get(dimension)
+        if not values:
+            continue
+        lines.append(f"{title}:")
+        lines.append("-" * 40)
+        for value, count in values.items():
+            lines.append(f"{value}: {count}건")
+        lines.append("")
+    return lines
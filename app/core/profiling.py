@@ -0,0 +1,234 @@
+"""
+요청/태스크 단위 프로파일링 모듈
+
+X-Profile 헤더 또는 ProcessRequest.profile 플래그로 켠 경우에만 cProfile을 실행한다.
+프로파일링이 꺼져 있으면 contextvar 조회 한 번 외에는 아무 일도 하지 않는다.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_EXTENSIONS = (".prof", ".txt")
+
+# 현재 요청/태스크의 프로파일링 세션 (없으면 프로파일링하지 않음)
+current_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+
+# 스레드별 프로파일러 실행 여부 (한 스레드에서 프로파일러가 겹치지 않도록)
+_thread_state = threading.local()
+
+
+class ProfileSession:
+    """
+    하나의 요청/태스크에 대한 프로파일 수집기
+    
+    이벤트 루프 스레드와 스레드 풀에서 각각 수집한 cProfile 결과를 하나의 pstats로 합친다.
+    """
+    
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 덤프 파일 이름 (확장자 제외)
+        """
+        self.name = name
+        self.lock = threading.Lock()
+        self.stats: Optional[pstats.Stats] = None
+    
+    def merge(self, profiler: cProfile.Profile) -> None:
+        """프로파일러 결과 병합"""
+        with self.lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profiler)
+            else:
+                self.stats.add(profiler)
+    
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """현재 스레드에서 블록 실행 구간 프로파일링"""
+        if getattr(_thread_state, "active", False):
+            # 이미 바깥 프로파일러가 이 스레드를 수집 중
+            yield
+            return
+        
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일링 도구가 실행 중이면 수집하지 않음
+            yield
+            return
+        
+        _thread_state.active = True
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _thread_state.active = False
+            self.merge(profiler)
+    
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """함수 호출 프로파일링"""
+        with self.profile():
+            return func(*args, **kwargs)
+    
+    def dump(self, directory: str) -> Optional[str]:
+        """
+        pstats 덤프(.prof)와 누적 시간 기준 요약(.txt) 저장
+        
+        Args:
+            directory: 저장 디렉토리
+        
+        Returns:
+            .prof 파일 경로 (수집된 프로파일이 없으면 None)
+        """
+        with self.lock:
+            stats = self.stats
+            if stats is None:
+                return None
+            
+            os.makedirs(directory, exist_ok=True)
+            prof_path = os.path.join(directory, f"{self.name}.prof")
+            stats.dump_stats(prof_path)
+            
+            buffer = io.StringIO()
+            stats.stream = buffer
+            stats.sort_stats("cumulative").print_stats(50)
+        
+        with open(os.path.join(directory, f"{self.name}.txt"), "w", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+        
+        print(f"프로파일 저장: {prof_path}")
+        return prof_path
+
+
+def new_profile_name(kind: str, identifier: Optional[str] = None) -> str:
+    """
+    프로파일 덤프 이름 생성
+    
+    Args:
+        kind: 구분 ("request", "task")
+        identifier: 태스크 ID 등 식별자 (없으면 임의 생성)
+    
+    Returns:
+        덤프 이름
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{kind}_{timestamp}_{identifier or uuid.uuid4().hex[:8]}"
+
+
+def wrap(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    현재 세션이 있으면 프로파일링하도록 함수 감싸기 (스레드 풀에 넘기기 전에 호출)
+    
+    Args:
+        func: 실행할 함수
+    
+    Returns:
+        세션이 없으면 func 그대로, 있으면 프로파일링하는 함수
+    """
+    session = current_session.get()
+    if session is None:
+        return func
+    return functools.partial(session.run, func)
+
+
+def list_profiles(directory: str) -> List[Dict[str, Any]]:
+    """
+    저장된 프로파일 목록 조회 (최신순)
+    
+    Args:
+        directory: 프로파일 디렉토리
+    
+    Returns:
+        파일 이름, 크기, 생성 시간 목록
+    """
+    if not os.path.isdir(directory):
+        return []
+    
+    profiles = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(PROFILE_EXTENSIONS):
+            stat = entry.stat()
+            profiles.append({
+                "name": entry.name,
+                "size": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+    
+    profiles.sort(key=lambda item: item["created_at"], reverse=True)
+    return profiles
+
+
+def resolve_profile_path(directory: str, name: str) -> Optional[str]:
+    """
+    다운로드할 프로파일 파일 경로 확인 (디렉토리 밖 경로는 거부)
+    
+    Args:
+        directory: 프로파일 디렉토리
+        name: 파일 이름
+    
+    Returns:
+        파일 경로 (없거나 허용되지 않는 이름이면 None)
+    """
+    if os.path.basename(name) != name or not name.endswith(PROFILE_EXTENSIONS):
+        return None
+    
+    path = os.path.join(directory, name)
+    return path if os.path.isfile(path) else None
+
+
+class ProfilingMiddleware:
+    """
+    X-Profile 헤더가 있는 요청 프로파일링 미들웨어
+    
+    요청 처리 동안 이벤트 루프 스레드를 수집하고, wrap()으로 감싼 스레드 풀 작업도
+    같은 세션에 합친다. 이벤트 루프 스레드 수집에는 같은 시간에 실행된 다른
+    코루틴도 포함될 수 있다. 응답의 X-Profile-Id 헤더로 덤프 이름을 알려준다.
+    """
+    
+    def __init__(self, app: ASGIApp, directory_getter: Callable[[], str]):
+        """
+        Args:
+            app: ASGI 앱
+            directory_getter: 프로파일 저장 디렉토리를 반환하는 함수
+        """
+        self.app = app
+        self.directory_getter = directory_getter
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        flag = Headers(scope=scope).get(PROFILE_HEADER)
+        if not flag or flag.lower() in ("0", "false", "off"):
+            await self.app(scope, receive, send)
+            return
+        
+        session = ProfileSession(new_profile_name("request"))
+        
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = session.name
+            await send(message)
+        
+        token = current_session.set(session)
+        try:
+            with session.profile():
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            current_session.reset(token)
+            session.dump(self.directory_getter())
@@ -0,0 +1,118 @@
+"""
+CLI 진행 상황 표시 모듈
+"""
+
+import sys
+import time
+from typing import Dict, Optional, TextIO
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """초를 HH:MM:SS / MM:SS 형식으로 변환"""
+    if seconds is None:
+        return "--:--"
+    
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class ProgressDisplay:
+    """
+    한 줄 진행 상황 표시기 (진행률, 처리 속도, 남은 시간)
+    
+    터미널이면 같은 줄을 덮어쓰고, 파일/파이프로 출력할 때는 log_interval마다 한 줄씩 출력한다.
+    """
+    
+    def __init__(
+        self,
+        total: int,
+        stream: Optional[TextIO] = None,
+        width: int = 24,
+        min_interval: float = 0.2,
+        log_interval: float = 5.0
+    ):
+        """
+        Args:
+            total: 전체 작업 수
+            stream: 출력 스트림 (기본값: sys.stdout)
+            width: 진행 막대 길이
+            min_interval: 터미널 갱신 최소 간격 (초)
+            log_interval: 터미널이 아닐 때 출력 간격 (초)
+        """
+        self.total = max(0, total)
+        self.stream = stream or sys.stdout
+        self.width = width
+        self.is_tty = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.min_interval = min_interval if self.is_tty else log_interval
+        self.start_time = time.monotonic()
+        self.last_render = 0.0
+        self.rendered_done = -1
+        self.done = 0
+        self.extra: Dict[str, object] = {}
+    
+    def elapsed(self) -> float:
+        """시작 후 경과 시간 (초)"""
+        return time.monotonic() - self.start_time
+    
+    def rate(self) -> float:
+        """초당 처리 수"""
+        elapsed = self.elapsed()
+        return self.done / elapsed if elapsed > 0 else 0.0
+    
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초)"""
+        rate = self.rate()
+        if rate <= 0:
+            return None
+        return (self.total - self.done) / rate
+    
+    def render(self) -> str:
+        """진행 상황 한 줄 생성"""
+        ratio = self.done / self.total if self.total else 1.0
+        filled = int(self.width * ratio)
+        bar = "#" * filled + "-" * (self.width - filled)
+        parts = [
+            f"[{bar}] {self.done}/{self.total} ({ratio * 100:.0f}%)",
+            f"{self.rate():.1f}건/s",
+            f"경과 {format_duration(self.elapsed())}",
+            f"남은 시간 {format_duration(self.eta())}"
+        ]
+        parts.extend(f"{name} {value}" for name, value in self.extra.items())
+        return " | ".join(parts)
+    
+    def update(self, done: Optional[int] = None, force: bool = False, **extra: object) -> None:
+        """
+        진행 상황 갱신
+        
+        Args:
+            done: 완료된 작업 수 (없으면 1 증가)
+            force: 갱신 간격과 관계없이 출력
+            **extra: 함께 표시할 값 (예: 실패=2)
+        """
+        self.done = self.done + 1 if done is None else done
+        self.extra.update(extra)
+        
+        now = time.monotonic()
+        if not force and now - self.last_render < self.min_interval and self.done < self.total:
+            return
+        self.last_render = now
+        self.rendered_done = self.done
+        
+        line = self.render()
+        if self.is_tty:
+            self.stream.write("\r\033[K" + line)
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+    
+    def close(self) -> None:
+        """마지막 상태 출력 후 줄바꿈"""
+        if self.is_tty or self.rendered_done != self.done:
+            self.update(self.done, force=True)
+        if self.is_tty:
+            self.stream.write("\n")
+            self.stream.flush()
@@ -0,0 +1,55 @@
+"""
+고성능 JSON 응답 모듈
+"""
+
+import json
+from typing import Any
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈 사용
+    orjson = None
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    JSON 직렬화 (orjson이 설치되어 있으면 사용)
+    
+    Args:
+        content: JSON으로 변환 가능한 값
+    
+    Returns:
+        UTF-8 JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=str
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    직렬화 비용을 줄인 JSON 응답
+    
+    - bytes: 이미 직렬화된 본문으로 보고 그대로 전송
+    - pydantic 모델: pydantic-core의 model_dump_json으로 한 번에 직렬화
+    - 그 외: orjson(없으면 json)으로 직렬화
+    
+    엔드포인트에서 이 응답을 직접 반환하면 FastAPI의 response_model 재검증과
+    dict 변환 단계를 건너뛴다.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return dumps_json(content)
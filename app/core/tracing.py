@@ -0,0 +1,225 @@
+"""
+단계별 트레이싱 모듈
+
+KIPRIS 요청, XML 파싱, 추출, 모델 생성, 파일 쓰기, 보고서 생성 구간을 span으로 기록한다.
+span은 현재 요청/태스크의 Trace(contextvar)에 모이며, 단계별 합계는 ProcessStatus와
+Server-Timing 헤더에, 전체 span은 Chrome Trace Event 형식 JSON(chrome://tracing, Perfetto)으로 내보낸다.
+Trace가 없으면 span은 contextvar 조회 한 번만 하고 끝난다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 현재 요청/태스크의 Trace (없으면 기록하지 않음)
+current_trace: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+
+# 현재 열려 있는 span (하위 span 시간을 상위 span의 단계 시간에서 빼기 위해 사용)
+current_span: ContextVar[Optional["Span"]] = ContextVar("span", default=None)
+
+
+class Span:
+    """열려 있는 span"""
+    
+    __slots__ = ("name", "start", "child_time")
+    
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.child_time = 0.0
+
+
+class Trace:
+    """
+    하나의 요청/태스크에서 기록한 span 모음
+    
+    단계별 시간은 하위 span을 제외한 시간(self time)으로 합산하므로 단계 합계가
+    전체 시간을 넘지 않는다.
+    """
+    
+    def __init__(self, name: str, max_events: int = 100000):
+        """
+        Args:
+            name: Trace 이름 (파일 이름에 사용)
+            max_events: 보관할 최대 span 수 (초과하면 단계별 합계만 갱신)
+        """
+        self.name = name
+        self.max_events = max_events
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        self.events: List[Dict[str, Any]] = []
+        self.stage_seconds: Dict[str, float] = {}
+        self.stage_counts: Dict[str, int] = {}
+    
+    def record(self, name: str, start: float, duration: float, self_time: float, args: Dict[str, Any]) -> None:
+        """완료된 span 기록"""
+        with self.lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + self_time
+            self.stage_counts[name] = self.stage_counts.get(name, 0) + 1
+            if len(self.events) < self.max_events:
+                event = {
+                    "name": name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": round((start - self.origin) * 1e6, 1),
+                    "dur": round(duration * 1e6, 1),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident()
+                }
+                if args:
+                    event["args"] = args
+                self.events.append(event)
+    
+    def stage_timings(self) -> Dict[str, float]:
+        """
+        단계별 누적 시간
+        
+        Returns:
+            {단계 이름: 초} (시간이 긴 순서)
+        """
+        with self.lock:
+            items = sorted(self.stage_seconds.items(), key=lambda item: item[1], reverse=True)
+        return {name: round(seconds, 6) for name, seconds in items}
+    
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Server-Timing 헤더 값 생성
+        
+        Args:
+            total: 전체 처리 시간 (초)
+        
+        Returns:
+            "stage;dur=ms, ..." 형식 문자열
+        """
+        with self.lock:
+            items = sorted(self.stage_seconds.items(), key=lambda item: item[1], reverse=True)
+            counts = dict(self.stage_counts)
+        
+        entries = [
+            f'{name};dur={seconds * 1000:.1f};desc="{counts[name]} calls"'
+            for name, seconds in items
+        ]
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+    
+    def export(self, directory: str) -> str:
+        """
+        Chrome Trace Event 형식 JSON 파일 저장
+        
+        Args:
+            directory: 저장 디렉토리
+        
+        Returns:
+            저장한 파일 경로
+        """
+        with self.lock:
+            events = list(self.events)
+        
+        # 스레드 이름 메타데이터 (뷰어에서 스레드 구분용)
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for tid in sorted({event["tid"] for event in events}):
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": thread_names.get(tid, str(tid))}
+            })
+        
+        os.makedirs(directory, exist_ok=True)
+        trace_path = os.path.join(directory, f"{self.name}.json")
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": {"trace": self.name, "stage_seconds": self.stage_timings()}
+            }, f, ensure_ascii=False)
+        
+        print(f"트레이스 저장: {trace_path}")
+        return trace_path
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """
+    단계 구간 기록
+    
+    Args:
+        name: 단계 이름 (예: "kipris_http", "xml_parse", "extract", "model_build", "file_write", "report")
+        **args: 트레이스 뷰어에 표시할 추가 정보
+    """
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+    
+    parent = current_span.get()
+    current = Span(name, time.perf_counter())
+    token = current_span.set(current)
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - current.start
+        current_span.reset(token)
+        if parent is not None:
+            parent.child_time += duration
+        trace.record(name, current.start, duration, duration - current.child_time, args)
+
+
+def traced(name: str, **args: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    함수 전체를 span으로 기록하는 데코레이터
+    
+    Args:
+        name: 단계 이름
+        **args: 트레이스 뷰어에 표시할 추가 정보
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*func_args: Any, **func_kwargs: Any) -> Any:
+            if current_trace.get() is None:
+                return func(*func_args, **func_kwargs)
+            with span(name, **args):
+                return func(*func_args, **func_kwargs)
+        return wrapper
+    return decorator
+
+
+class ServerTimingMiddleware:
+    """
+    요청마다 Trace를 만들고 응답에 Server-Timing 헤더를 추가하는 미들웨어
+    
+    헤더는 응답 시작 시점까지 끝난 단계만 포함한다 (스트리밍 본문 생성 시간은 제외).
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        trace = Trace("request")
+        start = time.perf_counter()
+        
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Server-Timing"] = trace.server_timing(time.perf_counter() - start)
+            await send(message)
+        
+        token = current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_trace.reset(token)
@@ -2,10 +2,17 @@
 FastAPI 메인 애플리케이션
 """
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import patents_router
+from fastapi.responses import PlainTextResponse
+from app.api import patents_router, admin_router, watch_router
+from app.api.admin import get_profiles_dir
 from app.core.config import settings
+from app.core import metrics
+from app.core.middleware import CompressionMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.core.tracing import ServerTimingMiddleware
 from app.models.schemas import HealthCheck
 
 # FastAPI 애플리케이션 생성
@@ -25,8 +32,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 설정 (gzip/deflate, 최소 크기 이상만 압축)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    compresslevel=settings.compression_level
+)
+
+# 단계별 처리 시간 미들웨어 설정 (Server-Timing 헤더)
+app.add_middleware(ServerTimingMiddleware)
+
+# 요청 프로파일링 미들웨어 설정 (X-Profile 헤더가 있는 요청만 수집)
+app.add_middleware(ProfilingMiddleware, directory_getter=get_profiles_dir)
+
 # 라우터 등록
 app.include_router(patents_router)
+app.include_router(admin_router)
+app.include_router(watch_router)
 
 
 @app.get("/", response_model=HealthCheck)
@@ -47,6 +69,63 @@ async def health_check():
     )
 
 
+@app.on_event("startup")
+async def start_event_loop_monitor():
+    """이벤트 루프 지연 측정 시작"""
+    app.state.event_loop_monitor = asyncio.create_task(metrics.monitor_event_loop_lag())
+
+
+@app.on_event("shutdown")
+async def stop_event_loop_monitor():
+    """이벤트 루프 지연 측정 중지"""
+    monitor = getattr(app.state, "event_loop_monitor", None)
+    if monitor is not None:
+        monitor.cancel()
+
+
+@app.on_event("startup")
+async def start_watch_scheduler():
+    """신규 특허 구독 스케줄러 시작"""
+    if settings.watch_enabled:
+        from app.services.watch_manager import watch_manager
+        app.state.watch_scheduler = asyncio.create_task(watch_manager.run_scheduler())
+
+
+@app.on_event("shutdown")
+async def stop_watch_scheduler():
+    """신규 특허 구독 스케줄러 중지"""
+    scheduler = getattr(app.state, "watch_scheduler", None)
+    if scheduler is not None:
+        scheduler.cancel()
+
+
+@app.on_event("startup")
+async def start_status_refresh_scheduler():
+    """저장된 특허 등록상태 갱신 스케줄러 시작"""
+    if settings.use_patent_store and settings.status_refresh_interval_hours > 0:
+        from app.services.status_refresh import status_refresher
+        app.state.status_refresh_scheduler = asyncio.create_task(
+            status_refresher.run_scheduler(settings.status_refresh_interval_hours)
+        )
+
+
+@app.on_event("shutdown")
+async def stop_status_refresh_scheduler():
+    """저장된 특허 등록상태 갱신 스케줄러 중지"""
+    scheduler = getattr(app.state, "status_refresh_scheduler", None)
+    if scheduler is not None:
+        scheduler.cancel()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 형식 메트릭 조회"""
+    return PlainTextResponse(
+        metrics.registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/settings")
 async def get_settings():
     """현재 설정 조회"""
@@ -8,8 +8,12 @@ from .schemas import (
     SearchRequest,
     SearchResponse,
     ProcessRequest,
+    BatchQuery,
+    BatchProcessRequest,
+    BatchStatus,
     ProcessStatus,
     ProcessResult,
+    ProcessResultPage,
     APIResponse,
     HealthCheck
 )
@@ -20,8 +24,12 @@ __all__ = [
     "SearchRequest",
     "SearchResponse",
     "ProcessRequest",
+    "BatchQuery",
+    "BatchProcessRequest",
+    "BatchStatus",
     "ProcessStatus",
     "ProcessResult",
+    "ProcessResultPage",
     "APIResponse",
     "HealthCheck"
 ]
@@ -3,7 +3,7 @@
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -22,8 +22,12 @@ class PatentDetailInfo(BaseModel):
     """특허 상세 정보"""
     basic_info: PatentBasicInfo
     claims: List[str] = Field(default_factory=list, description="청구항 목록")
+    claim_dependencies: List[List[int]] = Field(default_factory=list, description="청구항별 인용하는 앞선 청구항 번호 (1부터, 독립항은 빈 목록)")
+    independent_claims: List[int] = Field(default_factory=list, description="독립항 번호 (1부터)")
     ipc_codes: List[str] = Field(default_factory=list, description="IPC 코드")
     inventors: List[str] = Field(default_factory=list, description="발명자 목록")
+    ingredients: List[str] = Field(default_factory=list, description="청구항에 나온 성분 (성분 사전의 대표명)")
+    cluster_id: Optional[str] = Field(None, description="유사 특허 묶음 ID (묶음에서 가장 작은 출원번호)")
     pdf_url: Optional[str] = Field(None, description="PDF 다운로드 URL")
 
 
@@ -54,18 +58,57 @@ class ProcessRequest(BaseModel):
     max_patents: Optional[int] = Field(None, description="최대 특리 수", gt=0, le=500)
     save_claims: bool = Field(True, description="청구항 저장 여부")
     download_pdfs: bool = Field(False, description="PDF 다운로드 여부")
+    deadline_seconds: Optional[float] = Field(None, description="처리 제한 시간 (초, 초과하면 부분 결과와 함께 취소)", gt=0)
+    profile: bool = Field(False, description="cProfile 프로파일링 여부 (output_dir/profiles에 저장)")
+
+
+class BatchQuery(BaseModel):
+    """배치 처리의 개별 검색 조건"""
+    search_keyword: Optional[str] = Field(None, description="검색 키워드")
+    right_holder: Optional[str] = Field(None, description="등록권자명")
+    right_holder_code: Optional[str] = Field(None, description="등록권자 코드")
+    max_patents: Optional[int] = Field(None, description="최대 특허 수", gt=0, le=500)
+
+
+class BatchProcessRequest(BaseModel):
+    """배치 처리 요청 (여러 등록권자를 하나의 요청 속도 예산으로 처리)"""
+    queries: List[BatchQuery] = Field(..., description="검색 조건 목록", min_length=1, max_length=500)
+    save_claims: bool = Field(True, description="청구항 저장 여부")
+    download_pdfs: bool = Field(False, description="PDF 다운로드 여부")
+    deadline_seconds: Optional[float] = Field(None, description="검색 조건별 처리 제한 시간 (초)", gt=0)
 
 
 class ProcessStatus(BaseModel):
     """처리 상태"""
     task_id: str = Field(..., description="작업 ID")
-    status: str = Field(..., description="상태: pending, processing, completed, failed")
+    status: str = Field(..., description="상태: pending, processing, completed, failed, cancelled")
     progress: int = Field(0, description="진행률 (0-100)")
     total_patents: int = Field(0, description="총 특허 수")
     processed_patents: int = Field(0, description="처리된 특허 수")
     message: str = Field("", description="메시지")
     start_time: Optional[datetime] = Field(None, description="시작 시간")
     end_time: Optional[datetime] = Field(None, description="종료 시간")
+    profile_path: Optional[str] = Field(None, description="프로파일 덤프 경로 (profile 요청 시)")
+    stage_timings: Dict[str, float] = Field(default_factory=dict, description="단계별 누적 처리 시간 (초, 하위 단계 제외)")
+    trace_path: Optional[str] = Field(None, description="Chrome Trace Event 형식 트레이스 파일 경로")
+
+
+class BatchStatus(BaseModel):
+    """배치 처리 상태"""
+    batch_id: str = Field(..., description="배치 ID")
+    status: str = Field(..., description="상태: pending, processing, completed, cancelled")
+    progress: int = Field(0, description="전체 진행률 (0-100)")
+    total_queries: int = Field(0, description="검색 조건 수")
+    completed_queries: int = Field(0, description="종료된 검색 조건 수")
+    total_patents: int = Field(0, description="검색 조건별 특허 수 합계")
+    unique_patents: int = Field(0, description="중복을 제외한 특허 수")
+    duplicate_patents: int = Field(0, description="여러 검색 조건에서 중복되어 재사용된 특허 수")
+    processed_patents: int = Field(0, description="처리된 특허 수 합계")
+    message: str = Field("", description="메시지")
+    start_time: Optional[datetime] = Field(None, description="시작 시간")
+    end_time: Optional[datetime] = Field(None, description="종료 시간")
+    tasks: List[ProcessStatus] = Field(default_factory=list, description="검색 조건별 처리 상태")
+    report_path: Optional[str] = Field(None, description="배치 종합 보고서 경로 (같은 이름의 .json 파일도 생성)")
 
 
 class ProcessResult(BaseModel):
@@ -78,6 +121,56 @@ class ProcessResult(BaseModel):
     output_directory: str = Field(..., description="결과 저장 디렉토리")
 
 
+class ProcessResultPage(BaseModel):
+    """처리 결과 페이지 (커서 페이지네이션 / 필드 선택)"""
+    task_id: str = Field(..., description="작업 ID")
+    patents: List[Dict[str, Any]] = Field(..., description="처리된 특허 목록 (선택된 필드만 포함)")
+    total_count: int = Field(..., description="전체 특허 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지이면 없음)")
+    claims_saved: int = Field(0, description="저장된 청구항 수")
+    pdfs_downloaded: int = Field(0, description="다운로드된 PDF 수")
+    summary_report_path: Optional[str] = Field(None, description="요약 보고서 경로")
+    output_directory: str = Field(..., description="결과 저장 디렉토리")
+
+
+class WatchRequest(BaseModel):
+    """신규 특허 구독 요청"""
+    search_keyword: Optional[str] = Field(None, description="검색 키워드")
+    right_holder: Optional[str] = Field(None, description="등록권자명")
+    right_holder_code: str = Field(..., description="등록권자 코드", min_length=1)
+    interval_seconds: Optional[int] = Field(None, description="확인 주기 (초, 없으면 설정값)", ge=60)
+    sinks: List[str] = Field(default_factory=lambda: ["file", "sse"], description="알림 대상: file, webhook, sse")
+    webhook_url: Optional[str] = Field(None, description="webhook 알림을 받을 URL")
+
+
+class WatchSubscription(BaseModel):
+    """신규 특허 구독"""
+    subscription_id: str = Field(..., description="구독 ID")
+    search_keyword: Optional[str] = Field(None, description="검색 키워드")
+    right_holder: Optional[str] = Field(None, description="등록권자명")
+    right_holder_code: str = Field(..., description="등록권자 코드")
+    interval_seconds: int = Field(..., description="확인 주기 (초)")
+    sinks: List[str] = Field(default_factory=list, description="알림 대상")
+    webhook_url: Optional[str] = Field(None, description="webhook URL")
+    created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
+    last_checked: Optional[datetime] = Field(None, description="마지막 확인 시간")
+    last_seen_application_number: Optional[str] = Field(None, description="마지막 확인 시 첫 페이지 맨 위 출원번호")
+    known_statuses: Dict[str, str] = Field(default_factory=dict, description="마지막 확인 범위의 출원번호별 등록상태")
+    polls: int = Field(0, description="확인 횟수")
+    kipris_requests: int = Field(0, description="확인에 사용한 KIPRIS 요청 수")
+    events_emitted: int = Field(0, description="알린 이벤트 수")
+    last_error: Optional[str] = Field(None, description="마지막 확인 오류")
+
+
+class WatchEvent(BaseModel):
+    """구독 알림 이벤트"""
+    subscription_id: str = Field(..., description="구독 ID")
+    event_type: str = Field(..., description="이벤트 종류: new, changed")
+    patent: PatentBasicInfo = Field(..., description="특허 기본 정보")
+    previous_status: Optional[str] = Field(None, description="이전 등록상태 (changed 이벤트)")
+    detected_at: datetime = Field(default_factory=datetime.now, description="감지 시간")
+
+
 class APIResponse(BaseModel):
     """API 응답 기본 형식"""
     success: bool = Field(..., description="성공 여부")
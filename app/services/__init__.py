@@ -5,6 +5,16 @@
 from .kipris_api import kipris_api, KiprisAPIService
 from .patent_processor import patent_processor, PatentProcessor
 from .task_manager import task_manager, TaskManager
+from .rate_limiter import rate_limiter, RateLimiter
+from .response_cache import response_cache, ResponseCache
+from .patent_store import patent_store, PatentStore
+from .watch_manager import watch_manager, WatchManager
+from .status_refresh import status_refresher, StatusRefresher
+from .ingredient_tagger import ingredient_tagger, IngredientTagger
+# NumPy를 쓰는 서비스(patent_clusterer, similarity_index, ipc_index)는 시작 시간을 줄이기 위해
+# 여기서 import하지 않으므로 app.services.<모듈>에서 직접 import
+from .entity_index import entity_index, EntityIndex
+from .holder_directory import holder_directory, HolderDirectory
 
 __all__ = [
     "kipris_api",
@@ -12,5 +22,21 @@ __all__ = [
     "patent_processor", 
     "PatentProcessor",
     "task_manager",
-    "TaskManager"
+    "TaskManager",
+    "rate_limiter",
+    "RateLimiter",
+    "response_cache",
+    "ResponseCache",
+    "patent_store",
+    "PatentStore",
+    "watch_manager",
+    "WatchManager",
+    "status_refresher",
+    "StatusRefresher",
+    "ingredient_tagger",
+    "IngredientTagger",
+    "entity_index",
+    "EntityIndex",
+    "holder_directory",
+    "HolderDirectory"
 ]
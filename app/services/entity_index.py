@@ -0,0 +1,150 @@
+"""
+발명자 / 출원인 색인 서비스
+"""
+
+from typing import Dict, List, Optional, Tuple
+from app.core.lazy import LazyProxy
+from app.core.names import HANGUL_PATTERN, name_variants, split_names
+from app.models.schemas import PatentDetailInfo
+from app.services.patent_store import patent_store
+
+# 색인하는 이름 종류
+KINDS = ("inventor", "applicant")
+
+
+class EntityIndex:
+    """
+    정규화한 발명자/출원인 이름 → 출원번호 역색인 (특허 저장소의 entity_postings 테이블)
+    
+    이름은 공백/구두점/대소문자 차이와 출원인의 회사 형태 표기("주식회사", "(주)")를 없앤 키로 저장하고,
+    "홍길동(洪吉童)"처럼 함께 적힌 한자/영문 표기는 다른 표기로 대표 키에 연결하여 "洪吉童"으로도 찾을 수 있게 한다.
+    처리 중 상세 정보를 저장할 때마다 그 특허의 포스팅만 교체하므로 다시 수집하지 않아도 된다.
+    """
+    
+    def entities(self, applicant_name: str, inventors: List[str]) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str, str]]]:
+        """
+        특허의 포스팅과 다른 표기
+        
+        Args:
+            applicant_name: 출원인명 ("|" 또는 ";"로 여러 명)
+            inventors: 발명자 이름 목록
+        
+        Returns:
+            ((종류, 대표 키, 원래 이름) 목록, (종류, 다른 표기 키, 대표 키) 목록)
+        """
+        postings = []
+        aliases = []
+        for kind, names in (("applicant", split_names(applicant_name)), ("inventor", inventors)):
+            for display in names:
+                key, variants = name_variants(display, corporate=kind == "applicant")
+                if not key:
+                    continue
+                # 한자/영문으로만 적힌 이름은 이전에 연결된 한글 표기로 저장
+                if not HANGUL_PATTERN.search(key):
+                    key = patent_store.entity_alias(kind, key) or key
+                postings.append((kind, key, display.strip()))
+                aliases.extend((kind, variant, key) for variant in variants)
+        return postings, aliases
+    
+    def add(self, detail_info: PatentDetailInfo) -> None:
+        """
+        처리한 특허의 발명자/출원인 포스팅 저장
+        
+        Args:
+            detail_info: 특허 상세 정보 (특허 저장소에 저장된 특허)
+        """
+        postings, aliases = self.entities(detail_info.basic_info.applicant_name, detail_info.inventors)
+        patent_store.put_entities(detail_info.basic_info.application_number, postings, aliases)
+    
+    def rebuild_store(self) -> int:
+        """
+        특허 저장소의 특허 중 포스팅을 만들지 않은 특허 색인 (이 기능 전에 저장된 특허, 검색만 한 특허)
+        
+        Returns:
+            색인한 특허 수
+        """
+        indexed = 0
+        for application_number, applicant_name, inventors in patent_store.iter_unindexed_entities():
+            postings, aliases = self.entities(applicant_name, inventors)
+            patent_store.put_entities(application_number, postings, aliases)
+            indexed += 1
+        return indexed
+    
+    def resolve(self, kind: str, name: str) -> Optional[str]:
+        """
+        이름(다른 표기 포함)의 대표 키
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            name: 이름
+        
+        Returns:
+            대표 키 (색인에 없으면 None)
+        """
+        key, variants = name_variants(name, corporate=kind == "applicant")
+        for candidate in [key] + variants:
+            if not candidate:
+                continue
+            if patent_store.entity_count(kind, candidate):
+                return candidate
+            resolved = patent_store.entity_alias(kind, candidate)
+            if resolved is not None:
+                return resolved
+        return None
+    
+    def patents(self, kind: str, name: str) -> Optional[Dict[str, object]]:
+        """
+        발명자/출원인의 특허 목록
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            name: 이름
+        
+        Returns:
+            대표 키, 특허에 적힌 이름들, 특허 목록, 등록권자 코드별 특허 수 (색인에 없으면 None)
+        """
+        key = self.resolve(kind, name)
+        if key is None:
+            return None
+        
+        patents = patent_store.entity_patents(kind, key)
+        holders: Dict[str, int] = {}
+        for item in patents:
+            if item["right_holder_code"]:
+                holders[item["right_holder_code"]] = holders.get(item["right_holder_code"], 0) + 1
+        return {
+            "key": key,
+            "names": sorted({item["name"] for item in patents}),
+            "right_holders": holders,
+            "patents": patents
+        }
+    
+    def graph(self, kind: str, name: str, limit: int = 20) -> Optional[Dict[str, object]]:
+        """
+        공동 발명자(공동 출원인) 그래프: 기준 이름과 함께 나온 상위 이름들, 그 사이의 공동 특허 수
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            name: 이름
+            limit: 최대 이웃 수
+        
+        Returns:
+            nodes(기준 이름은 전체 특허 수, 이웃은 기준 이름과의 공동 특허 수), edges(이름 쌍별 공동 특허 수) (색인에 없으면 None)
+        """
+        key = self.resolve(kind, name)
+        if key is None:
+            return None
+        
+        neighbors = patent_store.co_entities(kind, key, limit)
+        nodes = [{"key": key, "name": name, "patents": patent_store.entity_count(kind, key)}]
+        nodes.extend({"key": other, "name": display, "patents": patents} for other, display, patents in neighbors)
+        edges = patent_store.entity_edges(kind, [node["key"] for node in nodes])
+        return {
+            "key": key,
+            "nodes": nodes,
+            "edges": [{"source": source, "target": target, "patents": patents} for source, target, patents in edges]
+        }
+
+
+# 전역 발명자/출원인 색인 인스턴스
+entity_index = LazyProxy(EntityIndex)
@@ -0,0 +1,191 @@
+"""
+등록권자명 → 등록권자 코드 디렉터리 서비스
+"""
+
+import threading
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core.names import jamo_ngrams, name_variants, split_names
+from app.models.schemas import PatentBasicInfo
+
+
+class HolderDirectory:
+    """
+    등록권자 코드로 검색한 특허의 출원인명으로 만든 등록권자명 → 등록권자 코드 디렉터리
+    
+    이름은 회사 형태 표기와 공백 차이를 없앤 키로 비교하고, 키가 정확히 같지 않으면
+    자모 3-gram 역색인으로 후보를 모아 다이스 계수가 holder_match_threshold 이상인 이름을 찾는다.
+    자모 단위로 비교하므로 "코스멕스"처럼 모음 하나가 틀린 이름도 찾는다.
+    특허 저장소를 사용하면 시작할 때 저장된 검색 결과로 디렉터리를 만들고, 이후 검색마다 갱신한다.
+    """
+    
+    def __init__(self, persist: bool, threshold: float):
+        """
+        Args:
+            persist: 특허 저장소에 저장된 검색 결과로 디렉터리를 만들지 여부
+            threshold: 비슷한 이름으로 인정할 최소 다이스 계수
+        """
+        self.lock = threading.Lock()
+        self.threshold = threshold
+        
+        self.keys: List[str] = []
+        self.entry_ids: Dict[str, int] = {}
+        self.displays: List[Dict[str, int]] = []
+        self.codes: List[Dict[str, int]] = []
+        self.gram_counts: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        
+        # 설정 파일의 기본 등록권자는 검색한 적이 없어도 찾을 수 있게 함
+        if settings.right_holder and settings.right_holder_code:
+            self.add_name(settings.right_holder, settings.right_holder_code, 0)
+        
+        if persist:
+            self.load()
+    
+    def load(self) -> None:
+        """특허 저장소에 저장된 검색 결과로 디렉터리 생성"""
+        from app.services.patent_store import patent_store
+        
+        with self.lock:
+            for applicant_name, right_holder_code, patents in patent_store.holder_names():
+                for name in split_names(applicant_name or ""):
+                    self.add_name(name, right_holder_code, patents)
+    
+    def entry_id(self, key: str) -> int:
+        """키의 항목 번호 (처음 보는 키는 자모 n-gram 역색인에 추가)"""
+        entry_id = self.entry_ids.get(key)
+        if entry_id is not None:
+            return entry_id
+        
+        entry_id = len(self.keys)
+        self.keys.append(key)
+        self.entry_ids[key] = entry_id
+        self.displays.append({})
+        self.codes.append({})
+        grams = jamo_ngrams(key)
+        self.gram_counts.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(entry_id)
+        return entry_id
+    
+    def add_name(self, name: str, right_holder_code: str, patents: int = 1) -> None:
+        """
+        출원인명과 등록권자 코드 연결 추가 (lock을 잡은 상태에서 호출)
+        
+        Args:
+            name: 출원인명 (괄호 안의 영문 표기 등도 같은 항목으로 연결)
+            right_holder_code: 등록권자 코드
+            patents: 이 이름으로 이 코드 검색에 나온 특허 수
+        """
+        key, variants = name_variants(name, corporate=True)
+        if not key:
+            return
+        
+        for variant in [key] + variants:
+            entry_id = self.entry_id(variant)
+            displays = self.displays[entry_id]
+            displays[name.strip()] = displays.get(name.strip(), 0) + patents
+            codes = self.codes[entry_id]
+            codes[right_holder_code] = codes.get(right_holder_code, 0) + patents
+    
+    def observe(self, patents: List[PatentBasicInfo], right_holder_code: str) -> None:
+        """
+        등록권자 코드 검색 결과의 출원인명 기록
+        
+        Args:
+            patents: 검색 결과 특허 목록
+            right_holder_code: 검색에 사용한 등록권자 코드
+        """
+        with self.lock:
+            for patent in patents:
+                for name in split_names(patent.applicant_name):
+                    self.add_name(name, right_holder_code)
+    
+    def lookup(self, name: str, limit: int = 5) -> List[Dict[str, object]]:
+        """
+        등록권자명으로 등록권자 코드 찾기
+        
+        Args:
+            name: 등록권자명 (회사 형태 표기, 공백, 오타 허용)
+            limit: 최대 결과 수
+        
+        Returns:
+            비슷한 순 항목 목록 (name: 가장 많이 나온 출원인명, right_holder_code: 특허가 가장 많은 코드,
+            codes: 코드별 특허 수, score: 다이스 계수, 키가 같으면 1.0)
+        """
+        key, variants = name_variants(name, corporate=True)
+        if not key:
+            return []
+        
+        with self.lock:
+            scores: Dict[int, float] = {}
+            for variant in [key] + variants:
+                entry_id = self.entry_ids.get(variant)
+                if entry_id is not None:
+                    scores[entry_id] = 1.0
+            
+            if not scores:
+                grams = jamo_ngrams(key)
+                shared: Dict[int, int] = {}
+                for gram in grams:
+                    for entry_id in self.postings.get(gram, ()):
+                        shared[entry_id] = shared.get(entry_id, 0) + 1
+                for entry_id, count in shared.items():
+                    score = 2 * count / (len(grams) + self.gram_counts[entry_id])
+                    if score >= self.threshold:
+                        scores[entry_id] = score
+            
+            matches = []
+            for entry_id, score in scores.items():
+                codes = self.codes[entry_id]
+                displays = self.displays[entry_id]
+                matches.append({
+                    "name": max(displays, key=displays.get),
+                    "right_holder_code": max(codes, key=codes.get),
+                    "codes": dict(codes),
+                    "patents": sum(codes.values()),
+                    "score": round(score, 4)
+                })
+        
+        matches.sort(key=lambda match: (-match["score"], -match["patents"]))
+        return matches[:limit]
+    
+    def resolve_code(self, right_holder: Optional[str], right_holder_code: Optional[str]) -> str:
+        """
+        검색에 사용할 등록권자 코드 (코드가 없고 등록권자명만 있으면 디렉터리에서 찾음, KIPRIS 요청 없음)
+        
+        Args:
+            right_holder: 등록권자명
+            right_holder_code: 등록권자 코드
+        
+        Returns:
+            등록권자 코드 (둘 다 없으면 설정 파일의 기본 코드)
+        
+        Raises:
+            ValueError: 등록권자명을 디렉터리에서 찾지 못한 경우
+        """
+        if right_holder_code:
+            return right_holder_code
+        if not right_holder:
+            return settings.right_holder_code
+        
+        matches = self.lookup(right_holder, limit=1)
+        if not matches:
+            raise ValueError(
+                f"등록권자 디렉터리에 없는 등록권자입니다: {right_holder} "
+                "(등록권자 코드로 한 번 검색하면 이후에는 이름으로 검색할 수 있습니다)"
+            )
+        return matches[0]["right_holder_code"]
+    
+    def stats(self) -> Dict[str, int]:
+        """디렉터리 통계"""
+        return {
+            "names": len(self.keys),
+            "codes": len({code for codes in self.codes for code in codes}),
+            "grams": len(self.postings)
+        }
+
+
+# 전역 등록권자 디렉터리 인스턴스 (처음 사용할 때 저장된 검색 결과로 생성)
+holder_directory = LazyProxy(lambda: HolderDirectory(settings.use_patent_store, settings.holder_match_threshold))
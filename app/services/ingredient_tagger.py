@@ -0,0 +1,208 @@
+"""
+청구항 성분 태깅 서비스
+"""
+
+import csv
+import hashlib
+import json
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple
+from app.core.aho_corasick import AhoCorasick
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import tracing
+
+# 캐시 파일 형식 버전 (오토마톤 구조가 바뀌면 올려서 이전 캐시를 무시)
+CACHE_FORMAT = 1
+
+
+def normalize_text(text: str) -> str:
+    """대소문자와 공백 차이를 없앤 검색용 텍스트"""
+    return " ".join(text.lower().split())
+
+
+def load_dictionary(path: str) -> Dict[str, List[str]]:
+    """
+    성분 사전 파일 로드
+    
+    JSON은 {"대표명": ["동의어", ...]} 또는 [{"name": 대표명, "synonyms": [...]}] 형식,
+    그 외(.csv, .tsv, .txt)는 한 줄에 "대표명,동의어,..."(탭 구분도 가능) 형식이다. 대표명도 검색 패턴에 포함된다.
+    
+    Args:
+        path: 사전 파일 경로
+    
+    Returns:
+        대표명별 동의어 목록
+    """
+    dictionary: Dict[str, List[str]] = {}
+    
+    if path.lower().endswith(".json"):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            items = [(name, synonyms) for name, synonyms in data.items()]
+        else:
+            items = [(item["name"], item.get("synonyms", [])) for item in data]
+        for name, synonyms in items:
+            dictionary.setdefault(name.strip(), []).extend(synonym.strip() for synonym in synonyms if synonym.strip())
+        return dictionary
+    
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for line in f:
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            row = next(csv.reader([line], delimiter="\t" if "\t" in line else ","))
+            names = [value.strip() for value in row if value.strip()]
+            if names:
+                dictionary.setdefault(names[0], []).extend(names[1:])
+    return dictionary
+
+
+class IngredientTagger:
+    """
+    성분 사전(INCI명, 한글 성분명, 동의어)으로 청구항에 나오는 성분을 찾는 태거
+    
+    사전의 모든 이름을 하나의 Aho–Corasick 오토마톤으로 묶어 청구항마다 한 번만 훑는다.
+    오토마톤은 사전 파일 내용의 해시로 디스크에 캐시하여 사전이 바뀔 때만 다시 만든다.
+    """
+    
+    def __init__(self, dictionary_path: str, cache_dir: str):
+        """
+        Args:
+            dictionary_path: 성분 사전 파일 경로 (빈 문자열이면 태깅하지 않음)
+            cache_dir: 오토마톤 캐시 디렉토리
+        """
+        self.dictionary_path = dictionary_path
+        self.cache_dir = cache_dir
+        self.version: Optional[str] = None
+        self.automaton: Optional[AhoCorasick] = None
+        self.canonical: List[str] = []
+        self.names: Dict[str, str] = {}
+        
+        if dictionary_path:
+            try:
+                self.load()
+            except Exception as e:
+                print(f"성분 사전 로드 실패 ({dictionary_path}), 성분 태깅을 하지 않습니다: {e}")
+                self.automaton = None
+    
+    @property
+    def enabled(self) -> bool:
+        """성분 사전이 설정되어 있는지 여부"""
+        return self.automaton is not None
+    
+    def load(self) -> None:
+        """사전 파일에 맞는 오토마톤 로드 (캐시가 없으면 생성 후 저장)"""
+        with open(self.dictionary_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.version = digest[:16]
+        cache_file = os.path.join(self.cache_dir, f"automaton_{self.version}.pkl")
+        
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get("format") == CACHE_FORMAT:
+                    self.automaton = cached["automaton"]
+                    self.canonical = cached["canonical"]
+                    self.names = cached["names"]
+                    return
+            except Exception as e:
+                print(f"성분 오토마톤 캐시 로드 실패 ({cache_file}): {e}")
+        
+        self.build(load_dictionary(self.dictionary_path))
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_file = cache_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump({
+                    "format": CACHE_FORMAT,
+                    "automaton": self.automaton,
+                    "canonical": self.canonical,
+                    "names": self.names
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            print(f"성분 오토마톤 캐시 저장 실패: {e}")
+    
+    def build(self, dictionary: Dict[str, List[str]]) -> None:
+        """
+        사전으로 오토마톤 생성
+        
+        Args:
+            dictionary: 대표명별 동의어 목록
+        """
+        patterns: List[str] = []
+        self.canonical = []
+        self.names = {}
+        for name, synonyms in dictionary.items():
+            for alias in [name] + synonyms:
+                pattern = normalize_text(alias)
+                # 같은 이름이 여러 성분에 있으면 먼저 나온 성분으로 해석
+                if pattern and pattern not in self.names:
+                    self.names[pattern] = name
+                    patterns.append(pattern)
+                    self.canonical.append(name)
+        self.automaton = AhoCorasick(patterns)
+        print(f"성분 오토마톤 생성: 성분 {len(dictionary)}개, 패턴 {len(patterns)}개, 상태 {len(self.automaton.goto)}개")
+    
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        성분 이름(동의어 포함)의 대표명
+        
+        Args:
+            name: 성분 이름
+        
+        Returns:
+            대표명 (사전에 없으면 None)
+        """
+        return self.names.get(normalize_text(name))
+    
+    def tag_claims(self, claims: List[str]) -> Dict[str, List[int]]:
+        """
+        청구항에 나오는 성분 찾기
+        
+        Args:
+            claims: 청구항 목록
+        
+        Returns:
+            대표명별 성분이 나온 청구항 번호 목록 (1부터)
+        """
+        if not self.enabled or not claims:
+            return {}
+        
+        tags: Dict[str, List[int]] = {}
+        with tracing.span("ingredient_tagging", claims=len(claims)):
+            for claim_no, claim in enumerate(claims, start=1):
+                for _, _, pattern_id in self.automaton.find_all(normalize_text(claim)):
+                    claim_numbers = tags.setdefault(self.canonical[pattern_id], [])
+                    if not claim_numbers or claim_numbers[-1] != claim_no:
+                        claim_numbers.append(claim_no)
+        return tags
+    
+    def retag_store(self) -> Tuple[int, int]:
+        """
+        특허 저장소에 청구항이 있는 특허 중 현재 사전으로 태깅하지 않은 특허를 다시 태깅
+        
+        Returns:
+            (다시 태깅한 특허 수, 성분이 하나 이상 나온 특허 수)
+        """
+        from app.services.patent_store import patent_store
+        
+        retagged = 0
+        tagged = 0
+        for application_number, claims in patent_store.iter_untagged_claims(self.version):
+            tags = self.tag_claims(claims)
+            patent_store.put_ingredients(application_number, tags, self.version)
+            retagged += 1
+            tagged += bool(tags)
+        return retagged, tagged
+
+
+# 전역 성분 태거 인스턴스 (처음 사용할 때 사전 로드/오토마톤 생성)
+ingredient_tagger = LazyProxy(lambda: IngredientTagger(
+    settings.ingredient_dictionary,
+    os.path.join(settings.output_dir, "ingredients")
+))
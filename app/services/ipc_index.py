@@ -0,0 +1,287 @@
+"""
+IPC 분류 색인 / 집계 서비스
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from app.core.config import settings
+from app.core.ipc import LEVELS, IPCTrie, ipc_levels, ipc_prefix, normalize_ipc
+from app.core.lazy import LazyProxy
+from app.core.portfolio import application_year
+from app.models.schemas import PatentDetailInfo
+
+# 연도/등록권자를 알 수 없는 특허의 집계 키
+UNKNOWN = "unknown"
+
+
+def grow(array: np.ndarray, size: int, extra: int) -> np.ndarray:
+    """배열에 extra개를 더 넣을 자리가 없으면 두 배 이상으로 늘린 배열 반환 (앞의 size개 복사)"""
+    if size + extra <= len(array):
+        return array
+    grown = np.empty((max(1024, len(array) * 2, size + extra),) + array.shape[1:], dtype=array.dtype)
+    grown[:size] = array[:size]
+    return grown
+
+
+class IPCIndex:
+    """
+    특허별 IPC 코드를 정규화하여 단계별(섹션/클래스/서브클래스/메인그룹/서브그룹)로 집계하는 색인
+    
+    코드마다 단계별 값 번호를 (코드 수, 5) 배열로 두고, 단계마다 특허 하나에 한 번씩만 나오는
+    (특허, 단계 값) 쌍을 두 개의 int32 배열로 추가할 때 미리 만들어 두므로, 단계별/연도별/등록권자별
+    특허 수는 정렬 없이 np.bincount 몇 번으로 계산한다. 서브그룹 값 번호는 코드 번호와 같다.
+    "A61Q 19/*" 같은 접두어 질의는 문자 단위 트라이로 해당 코드 번호를 찾는다.
+    특허 저장소를 사용하면 시작할 때 저장된 특허의 IPC 코드를 모두 불러온다.
+    """
+    
+    def __init__(self, persist: bool):
+        """
+        Args:
+            persist: 특허 저장소에 저장된 특허의 IPC 코드를 불러올지 여부
+        """
+        self.lock = threading.Lock()
+        self.persist = persist
+        self.trie = IPCTrie()
+        
+        self.codes: List[str] = []
+        self.code_ids: Dict[str, int] = {}
+        self.code_levels = np.empty((0, len(LEVELS)), dtype=np.int32)
+        self.level_names: List[List[str]] = [[] for _ in LEVELS]
+        self.level_ids: List[Dict[str, int]] = [{} for _ in LEVELS]
+        
+        self.patents: List[str] = []
+        self.patent_rows: Dict[str, int] = {}
+        self.years = np.empty(0, dtype=np.int16)
+        self.holders = np.empty(0, dtype=np.int32)
+        self.holder_names: List[str] = [UNKNOWN]
+        self.holder_ids: Dict[str, int] = {UNKNOWN: 0}
+        
+        # 단계별 (특허, 단계 값) 쌍 (특허 행 순서)
+        self.pair_patents = [np.empty(0, dtype=np.int32) for _ in LEVELS]
+        self.pair_values = [np.empty(0, dtype=np.int32) for _ in LEVELS]
+        self.pair_counts = [0 for _ in LEVELS]
+        
+        if persist:
+            self.load()
+    
+    def load(self) -> None:
+        """특허 저장소에 저장된 특허의 IPC 코드 로드"""
+        from app.services.patent_store import patent_store
+        
+        with self.lock:
+            for application_number, right_holder_code, ipc_codes in patent_store.iter_ipc_codes():
+                self.add_codes(application_number, right_holder_code, ipc_codes)
+    
+    def code_id(self, code: str) -> int:
+        """정규화한 코드의 번호 (처음 보는 코드는 단계별 값과 트라이에 추가)"""
+        code_id = self.code_ids.get(code)
+        if code_id is not None:
+            return code_id
+        
+        code_id = len(self.codes)
+        self.codes.append(code)
+        self.code_ids[code] = code_id
+        self.code_levels = grow(self.code_levels, code_id, 1)
+        for level, value in enumerate(ipc_levels(code)):
+            value_id = self.level_ids[level].get(value)
+            if value_id is None:
+                value_id = len(self.level_names[level])
+                self.level_names[level].append(value)
+                self.level_ids[level][value] = value_id
+            self.code_levels[code_id, level] = value_id
+        self.trie.add(code, code_id)
+        return code_id
+    
+    def holder_id(self, right_holder_code: Optional[str]) -> int:
+        """등록권자 코드 번호 (없으면 0)"""
+        if not right_holder_code:
+            return 0
+        holder_id = self.holder_ids.get(right_holder_code)
+        if holder_id is None:
+            holder_id = len(self.holder_names)
+            self.holder_names.append(right_holder_code)
+            self.holder_ids[right_holder_code] = holder_id
+        return holder_id
+    
+    def add_codes(self, application_number: str, right_holder_code: Optional[str], ipc_codes: Iterable[str]) -> None:
+        """
+        특허의 IPC 코드 추가 (lock을 잡은 상태에서 호출, 이미 있는 특허는 등록권자만 갱신)
+        
+        Args:
+            application_number: 출원번호
+            right_holder_code: 등록권자 코드 (모르면 None)
+            ipc_codes: KIPRIS IPC 코드 목록
+        """
+        row = self.patent_rows.get(application_number)
+        if row is not None:
+            if right_holder_code:
+                self.holders[row] = self.holder_id(right_holder_code)
+            return
+        
+        code_ids = sorted({
+            self.code_id(code)
+            for code in (normalize_ipc(raw) for raw in ipc_codes if raw)
+            if code is not None
+        })
+        
+        row = len(self.patents)
+        self.patents.append(application_number)
+        self.patent_rows[application_number] = row
+        self.years = grow(self.years, row, 1)
+        self.years[row] = application_year(application_number)
+        self.holders = grow(self.holders, row, 1)
+        self.holders[row] = self.holder_id(right_holder_code)
+        
+        for level in range(len(LEVELS)):
+            values = sorted({int(self.code_levels[code_id, level]) for code_id in code_ids})
+            start, count = self.pair_counts[level], len(values)
+            self.pair_patents[level] = grow(self.pair_patents[level], start, count)
+            self.pair_values[level] = grow(self.pair_values[level], start, count)
+            self.pair_patents[level][start:start + count] = row
+            self.pair_values[level][start:start + count] = values
+            self.pair_counts[level] = start + count
+    
+    def add(self, detail_info: PatentDetailInfo) -> None:
+        """
+        처리한 특허의 IPC 코드 추가
+        
+        Args:
+            detail_info: 특허 상세 정보
+        """
+        right_holder_code = None
+        if self.persist:
+            from app.services.patent_store import patent_store
+            
+            right_holder_code = patent_store.get_right_holder_code(detail_info.basic_info.application_number)
+        
+        with self.lock:
+            self.add_codes(detail_info.basic_info.application_number, right_holder_code, detail_info.ipc_codes)
+    
+    def rollup(
+        self,
+        level: str = "subclass",
+        prefix: Optional[str] = None,
+        application_numbers: Optional[List[str]] = None,
+        right_holder_code: Optional[str] = None,
+        by: Optional[str] = None,
+        limit: int = 20
+    ) -> Dict[str, object]:
+        """
+        단계별 IPC 코드의 특허 수 집계 (한 특허에 같은 단계 값이 여러 번 나와도 한 번만 셈)
+        
+        Args:
+            level: 집계 단계 (section, class, subclass, group, subgroup)
+            prefix: 이 접두어에 속한 코드만 집계 (예: "A61Q 19/*")
+            application_numbers: 이 특허들만 집계
+            right_holder_code: 이 등록권자의 특허만 집계
+            by: 코드별 특허 수를 다시 나눌 기준 ("year" 또는 "holder")
+            limit: 특허 수 상위 코드 수
+        
+        Returns:
+            집계 결과 (patents: 대상 특허 수, codes: 코드별 특허 수, by_year/by_holder: 기준별 코드별 특허 수)
+        
+        Raises:
+            ValueError: 단계/접두어/기준이 올바르지 않은 경우
+        """
+        if level not in LEVELS:
+            raise ValueError(f"IPC 단계는 {', '.join(LEVELS)} 중 하나여야 합니다: {level}")
+        if by not in (None, "year", "holder"):
+            raise ValueError(f"집계 기준은 year 또는 holder여야 합니다: {by}")
+        level_index = LEVELS.index(level)
+        
+        with self.lock:
+            count = self.pair_counts[level_index]
+            pair_patents = self.pair_patents[level_index][:count]
+            pair_values = self.pair_values[level_index][:count]
+            years = self.years[:len(self.patents)]
+            holders = self.holders[:len(self.patents)]
+            names = list(self.level_names[level_index])
+            holder_names = list(self.holder_names)
+            code_levels = self.code_levels[:len(self.codes), level_index]
+            if prefix:
+                selected = np.array(self.trie.search(ipc_prefix(prefix)), dtype=np.int64)
+                subgroup_count = self.pair_counts[-1]
+                code_patents = self.pair_patents[-1][:subgroup_count]
+                codes = self.pair_values[-1][:subgroup_count]
+            rows = None
+            if application_numbers is not None:
+                rows = [self.patent_rows[key] for key in application_numbers if key in self.patent_rows]
+            holder = self.holder_ids.get(right_holder_code, -1) if right_holder_code else None
+        
+        value_count = max(len(names), 1)
+        if prefix:
+            # 접두어가 집계 단계와 같거나 더 넓으면 접두어에 속한 단계 값을 그대로 고르고,
+            # 더 좁으면(예: 서브클래스 집계에 "A61Q 19/*") 해당 코드의 (특허, 단계 값) 쌍을 다시 만든다
+            selected_codes = np.bincount(code_levels[selected], minlength=value_count)
+            value_mask = selected_codes > 0
+            if np.array_equal(selected_codes[value_mask], np.bincount(code_levels, minlength=value_count)[value_mask]):
+                mask = value_mask[pair_values]
+            else:
+                code_mask = np.zeros(len(code_levels), dtype=bool)
+                code_mask[selected] = True
+                matched = code_mask[codes]
+                pairs = np.unique(code_patents[matched].astype(np.int64) * value_count + code_levels[codes[matched]])
+                pair_patents, pair_values = pairs // value_count, pairs % value_count
+                mask = np.ones(len(pair_patents), dtype=bool)
+        else:
+            mask = np.ones(len(pair_patents), dtype=bool)
+        if rows is not None:
+            patent_mask = np.zeros(len(years), dtype=bool)
+            patent_mask[rows] = True
+            mask &= patent_mask[pair_patents]
+        if holder is not None:
+            mask &= holders[pair_patents] == holder
+        
+        pair_patents, pair_values = pair_patents[mask], pair_values[mask]
+        counts = np.bincount(pair_values, minlength=value_count)
+        top = np.argsort(-counts, kind="stable")[:limit]
+        top = top[counts[top] > 0]
+        # 쌍은 특허 행 순서이므로 특허 수는 행이 바뀌는 횟수
+        patent_total = int(np.count_nonzero(np.diff(pair_patents))) + 1 if len(pair_patents) else 0
+        
+        result: Dict[str, object] = {
+            "level": level,
+            "prefix": prefix,
+            "patents": patent_total,
+            "codes": [{"code": names[value], "patents": int(counts[value])} for value in top.tolist()]
+        }
+        
+        if by is not None:
+            groups = years[pair_patents] if by == "year" else holders[pair_patents]
+            positions = np.full(value_count, -1, dtype=np.int64)
+            positions[top] = np.arange(len(top))
+            keep = positions[pair_values] >= 0
+            groups = groups[keep].astype(np.int64)
+            offset = int(groups.min()) if len(groups) else 0
+            group_count = int(groups.max()) - offset + 1 if len(groups) else 0
+            table = np.bincount(
+                (groups - offset) * len(top) + positions[pair_values[keep]],
+                minlength=group_count * len(top)
+            ).reshape(group_count, len(top))
+            labels = np.flatnonzero(table.any(axis=1))
+            
+            breakdown = {}
+            for label, counts_row in zip((labels + offset).tolist(), table[labels].tolist()):
+                if by == "year":
+                    key = str(label) if label else UNKNOWN
+                else:
+                    key = holder_names[label]
+                breakdown[key] = {
+                    names[value]: count for value, count in zip(top.tolist(), counts_row) if count
+                }
+            result[f"by_{by}"] = breakdown
+        
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """색인 통계"""
+        return {
+            "patents": len(self.patents),
+            "codes": len(self.codes),
+            "assignments": self.pair_counts[-1]
+        }
+
+
+# 전역 IPC 색인 인스턴스 (처음 사용할 때 저장된 특허의 IPC 코드 로드)
+ipc_index = LazyProxy(lambda: IPCIndex(settings.use_patent_store))
@@ -2,10 +2,15 @@
 KIPRIS API 서비스
 """
 
+import time
 import requests
 import xmltodict
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, List
 from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics, tracing
+from app.services.rate_limiter import rate_limiter
 
 
 class KiprisAPIService:
@@ -15,6 +20,87 @@ class KiprisAPIService:
         self.base_url = settings.base_url
         self.service_key = settings.service_key
         self.timeout = settings.timeout
+        self.max_retries = settings.max_retries
+        self.retry_backoff = settings.retry_backoff
+        self.rate_limiter = rate_limiter
+        self.session = self.create_session(settings.pool_size)
+    
+    @staticmethod
+    def create_session(pool_size: int) -> requests.Session:
+        """
+        연결을 재사용하는 HTTP 세션 생성
+        
+        모든 태스크/스레드가 하나의 세션을 공유하여 요청마다 TCP 연결을 새로 맺지 않는다.
+        
+        Args:
+            pool_size: 호스트별로 유지하는 최대 연결 수
+            
+        Returns:
+            HTTP 세션
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def request(self, endpoint: str, url: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """
+        KIPRIS HTTP 요청 (속도 제한, 지연 시간/오류/수신 바이트 메트릭 기록)
+        
+        연결 오류, 타임아웃, 429/5xx 응답은 max_retries번까지 지수 백오프로 재시도한다.
+        
+        Args:
+            endpoint: 메트릭 레이블용 엔드포인트 이름
+            url: 요청 URL
+            params: 쿼리 파라미터
+            **kwargs: session.get에 전달할 추가 인자
+            
+        Returns:
+            HTTP 응답 (4xx/5xx이면 예외 발생)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                with tracing.span("kipris_http", endpoint=endpoint):
+                    response = self.session.get(url, params=params, **kwargs)
+                    response.raise_for_status()
+                break
+            except Exception as e:
+                if attempt < self.max_retries and self.is_retryable(e):
+                    attempt += 1
+                    metrics.kipris_request_retries.inc(endpoint=endpoint)
+                    time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+                    continue
+                metrics.kipris_request_errors.inc(endpoint=endpoint)
+                raise
+            finally:
+                metrics.kipris_request_duration.observe(time.perf_counter() - start, endpoint=endpoint)
+        
+        if not kwargs.get("stream"):
+            metrics.bytes_downloaded.inc(len(response.content), endpoint=endpoint)
+        return response
+    
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """
+        재시도할 오류인지 확인
+        
+        Args:
+            error: 요청 중 발생한 예외
+            
+        Returns:
+            연결 오류, 타임아웃, 429/5xx 응답이면 True
+        """
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return False
     
     def search_patents(
         self,
@@ -63,12 +149,12 @@ class KiprisAPIService:
             print(f"특허 검색 URL: {url}")
             print(f"검색 파라미터: {params}")
             
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            response = self.request("search", url, params)
             
             print(f"요청 URL: {response.url}")
             
-            result = xmltodict.parse(response.content)
+            with tracing.span("xml_parse"):
+                result = xmltodict.parse(response.content)
             return result
             
         except requests.exceptions.RequestException as e:
@@ -116,12 +202,12 @@ class KiprisAPIService:
             print(f"대안 검색 URL: {url}")
             print(f"대안 검색 파라미터: {params}")
             
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            response = self.request("alternative", url, params)
             
             print(f"대안 검색 요청 URL: {response.url}")
             
-            result = xmltodict.parse(response.content)
+            with tracing.span("xml_parse"):
+                result = xmltodict.parse(response.content)
             return result
             
         except requests.exceptions.RequestException as e:
@@ -149,10 +235,10 @@ class KiprisAPIService:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            response = self.request("detail", url, params)
             
-            result = xmltodict.parse(response.content)
+            with tracing.span("xml_parse"):
+                result = xmltodict.parse(response.content)
             return result
             
         except requests.exceptions.RequestException as e:
@@ -180,10 +266,10 @@ class KiprisAPIService:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
+            response = self.request("pdf_url", url, params)
             
-            result = xmltodict.parse(response.content)
+            with tracing.span("xml_parse"):
+                result = xmltodict.parse(response.content)
             body = result['response']['body']
             
             if 'item' in body and body['item'] and 'path' in body['item']:
@@ -197,5 +283,5 @@ class KiprisAPIService:
             return None
 
 
-# 전역 API 서비스 인스턴스
-kipris_api = KiprisAPIService()
+# 전역 API 서비스 인스턴스 (처음 사용할 때 생성)
+kipris_api = LazyProxy(KiprisAPIService)
@@ -0,0 +1,144 @@
+"""
+유사 특허 묶음(근사 중복/패밀리) 서비스
+"""
+
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core.minhash import LSHIndex, MinHasher, shingle_hashes
+from app.core import tracing
+from app.models.schemas import PatentDetailInfo
+
+# 서명 길이와 셔글 길이 (바꾸면 저장된 서명과 비교할 수 없음)
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+
+
+class PatentClusterer:
+    """
+    청구항과 초록이 거의 같은 특허를 하나의 묶음(cluster_id)으로 모으는 서비스
+    
+    특허마다 문자 셔글의 MinHash 서명을 만들어 LSH 색인에서 후보만 비교하므로, 새 특허 하나를
+    묶는 비용은 전체 특허 수와 거의 관계없다. 묶음 ID는 묶음에서 가장 작은 출원번호이며,
+    두 묶음을 잇는 특허가 들어오면 묶음을 합친다. 특허 저장소를 사용하면 서명과 묶음 ID를
+    patents.db에 저장하여 다음 실행에서도 이어서 묶는다.
+    """
+    
+    def __init__(self, threshold: float, persist: bool):
+        """
+        Args:
+            threshold: 같은 묶음으로 볼 최소 자카드 유사도 (추정값)
+            persist: 특허 저장소에 서명/묶음 ID를 저장하고 시작할 때 불러올지 여부
+        """
+        self.lock = threading.Lock()
+        self.persist = persist
+        self.hasher = MinHasher(num_perm=NUM_PERM)
+        self.index = LSHIndex(NUM_PERM, threshold)
+        self.clusters: Dict[str, str] = {}
+        self.members: Dict[str, List[str]] = {}
+        
+        if persist:
+            self.load()
+    
+    def load(self) -> None:
+        """특허 저장소에 저장된 서명과 묶음 ID 로드"""
+        from app.services.patent_store import patent_store
+        
+        rows = list(patent_store.iter_minhashes())
+        if not rows:
+            return
+        
+        keys = [application_number for application_number, _, _ in rows]
+        signatures = np.frombuffer(b"".join(signature for _, signature, _ in rows), dtype=np.uint32)
+        self.index.add_many(keys, signatures.reshape(len(rows), NUM_PERM))
+        for application_number, _, cluster_id in rows:
+            cluster_id = cluster_id or application_number
+            self.clusters[application_number] = cluster_id
+            self.members.setdefault(cluster_id, []).append(application_number)
+    
+    def text_of(self, detail_info: PatentDetailInfo) -> str:
+        """서명을 만들 텍스트 (청구항 + 초록)"""
+        return "\n".join(detail_info.claims + [detail_info.basic_info.abstract or ""])
+    
+    def add(self, detail_info: PatentDetailInfo) -> Optional[str]:
+        """
+        특허를 색인에 넣고 묶음 ID 반환 (이미 있는 특허는 현재 묶음 ID만 반환)
+        
+        Args:
+            detail_info: 청구항이 있는 특허 상세 정보
+        
+        Returns:
+            묶음 ID (청구항이 없으면 None)
+        """
+        application_number = detail_info.basic_info.application_number
+        with self.lock:
+            if application_number in self.clusters:
+                return self.clusters[application_number]
+        if not detail_info.claims:
+            return None
+        
+        with tracing.span("minhash", claims=len(detail_info.claims)):
+            signature = self.hasher.signature(shingle_hashes(self.text_of(detail_info), SHINGLE_SIZE))
+        
+        with self.lock:
+            if application_number in self.clusters:
+                return self.clusters[application_number]
+            
+            matches = self.index.query(signature)
+            self.index.add(application_number, signature)
+            
+            # 일치한 묶음과 새 특허를 가장 작은 출원번호의 묶음으로 합침
+            merged = {self.clusters[key] for key, _ in matches}
+            target = min(merged | {application_number})
+            relabeled = [application_number]
+            members = self.members.setdefault(target, [])
+            for cluster_id in merged - {target}:
+                for member in self.members.pop(cluster_id):
+                    self.clusters[member] = target
+                    members.append(member)
+                    relabeled.append(member)
+            self.clusters[application_number] = target
+            members.append(application_number)
+            
+            if self.persist:
+                from app.services.patent_store import patent_store
+                
+                patent_store.put_minhash(application_number, signature.tobytes())
+                patent_store.set_cluster_ids(target, relabeled)
+            return target
+    
+    def cluster_of(self, application_number: str) -> Optional[str]:
+        """특허의 현재 묶음 ID"""
+        return self.clusters.get(application_number)
+    
+    def cluster_members(self, cluster_id: str) -> List[str]:
+        """묶음에 속한 출원번호 목록"""
+        return sorted(self.members.get(cluster_id, []))
+    
+    def refresh(self, patents: List[PatentDetailInfo]) -> None:
+        """
+        특허 목록의 cluster_id를 현재 묶음 ID로 갱신 (처리 중 다른 특허가 들어와 묶음이 합쳐진 경우)
+        
+        Args:
+            patents: 특허 상세 정보 목록
+        """
+        for patent in patents:
+            cluster_id = self.clusters.get(patent.basic_info.application_number)
+            if cluster_id is not None:
+                patent.cluster_id = cluster_id
+    
+    def stats(self) -> Dict[str, int]:
+        """색인 통계"""
+        return {
+            "patents": len(self.index),
+            "clusters": len(self.members),
+            "multi_member_clusters": sum(1 for members in self.members.values() if len(members) > 1),
+            "bands": self.index.bands,
+            "rows_per_band": self.index.rows
+        }
+
+
+# 전역 유사 특허 묶음 인스턴스 (처음 사용할 때 저장된 서명 로드)
+patent_clusterer = LazyProxy(lambda: PatentClusterer(settings.cluster_threshold, settings.use_patent_store))
@@ -5,12 +5,24 @@
 import os
 import json
 import time
-import requests
+import threading
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
+from app.core.claim_parser import independent_claims, is_deleted, parse_claim_dependencies
 from app.core.config import settings
-from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+from app.core.lazy import LazyProxy
+from app.core.portfolio import Facets, add_facets, build_report, format_report, patent_facets
+from app.core import metrics, tracing
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo, BatchStatus
 from app.services.kipris_api import kipris_api
+from app.services.patent_store import patent_store
+from app.services.ingredient_tagger import ingredient_tagger
+from app.services.entity_index import entity_index
+from app.services.holder_directory import holder_directory
+
+
+class DetailFetchError(Exception):
+    """KIPRIS 상세 정보 조회 실패 (process_patent_details에서 raise_on_fetch_failure일 때)"""
 
 
 class PatentProcessor:
@@ -36,6 +48,7 @@ class PatentProcessor:
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
     
+    @tracing.traced("extract")
     def extract_patent_list(self, search_result: Dict) -> List[PatentBasicInfo]:
         """
         검색 결과에서 특허 목록 추출
@@ -59,17 +72,18 @@ class PatentProcessor:
                 return []
             
             patents = []
-            for item in items:
-                patent_info = PatentBasicInfo(
-                    application_number=item.get('applicationNumber', ''),
-                    register_number=item.get('registerNumber', ''),
-                    invention_title=item.get('inventionTitle', ''),
-                    applicant_name=item.get('applicantName', ''),
-                    register_date=item.get('registerDate', ''),
-                    register_status=item.get('registerStatus', ''),
-                    abstract=item.get('astrtCont', '')
-                )
-                patents.append(patent_info)
+            with tracing.span("model_build", count=len(items)):
+                for item in items:
+                    patent_info = PatentBasicInfo(
+                        application_number=item.get('applicationNumber', ''),
+                        register_number=item.get('registerNumber', ''),
+                        invention_title=item.get('inventionTitle', ''),
+                        applicant_name=item.get('applicantName', ''),
+                        register_date=item.get('registerDate', ''),
+                        register_status=item.get('registerStatus', ''),
+                        abstract=item.get('astrtCont', '')
+                    )
+                    patents.append(patent_info)
             
             return patents
             
@@ -77,6 +91,7 @@ class PatentProcessor:
             print(f"특허 목록 추출 실패: {e}")
             return []
     
+    @tracing.traced("extract")
     def extract_claims(self, patent_details: Dict) -> List[str]:
         """
         특허 상세정보에서 청구항 추출
@@ -112,6 +127,7 @@ class PatentProcessor:
             print(f"청구항 추출 실패: {e}")
             return []
     
+    @tracing.traced("extract")
     def extract_ipc_codes(self, patent_details: Dict) -> List[str]:
         """IPC 코드 추출"""
         try:
@@ -139,6 +155,7 @@ class PatentProcessor:
             print(f"IPC 코드 추출 실패: {e}")
             return []
     
+    @tracing.traced("extract")
     def extract_inventors(self, patent_details: Dict) -> List[str]:
         """발명자 정보 추출"""
         try:
@@ -166,13 +183,31 @@ class PatentProcessor:
             print(f"발명자 정보 추출 실패: {e}")
             return []
     
-    def save_claims_to_file(self, patent_info: PatentBasicInfo, claims: List[str]) -> None:
+    @tracing.traced("extract")
+    def parse_claim_structure(self, detail_info: PatentDetailInfo) -> None:
+        """
+        청구항 인용 관계(제N항에 있어서, 제N항 내지 제M항 중 어느 한 항)와 독립항을 detail_info에 기록
+        
+        Args:
+            detail_info: 청구항이 있는 특허 상세 정보
+        """
+        detail_info.claim_dependencies = parse_claim_dependencies(detail_info.claims)
+        detail_info.independent_claims = independent_claims(detail_info.claims, detail_info.claim_dependencies)
+    
+    @tracing.traced("file_write", kind="claims")
+    def save_claims_to_file(
+        self,
+        patent_info: PatentBasicInfo,
+        claims: List[str],
+        dependencies: Optional[List[List[int]]] = None
+    ) -> None:
         """
         청구항을 파일로 저장
         
         Args:
             patent_info: 특허 기본 정보
             claims: 청구항 리스트
+            dependencies: 청구항별 인용 청구항 번호 (있으면 청구항마다 독립항/인용 청구항 표시)
         """
         if not settings.save_claims:
             return
@@ -189,32 +224,49 @@ class PatentProcessor:
                 f.write(f"출원번호: {patent_info.application_number}\n")
                 f.write(f"발명명칭: {patent_info.invention_title}\n")
                 f.write(f"청구항 수: {len(claims)}개\n")
+                if dependencies is not None:
+                    independent = independent_claims(claims, dependencies)
+                    f.write(f"독립항: {', '.join(str(claim_no) for claim_no in independent) or '없음'}\n")
                 f.write("="*80 + "\n\n")
                 
                 for i, claim in enumerate(claims, 1):
-                    f.write(f"청구항 {i}:\n")
+                    if dependencies is None:
+                        f.write(f"청구항 {i}:\n")
+                    elif dependencies[i - 1]:
+                        f.write(f"청구항 {i} (인용: {', '.join(str(claim_no) for claim_no in dependencies[i - 1])}):\n")
+                    else:
+                        f.write(f"청구항 {i}{'' if is_deleted(claim) else ' (독립항)'}:\n")
                     f.write(f"{claim}\n\n")
                     f.write("-"*60 + "\n\n")
             
+            metrics.bytes_written.inc(os.path.getsize(filepath), kind="claims")
             print(f"청구항 저장 완료: {filepath}")
             
         except Exception as e:
             print(f"청구항 저장 실패 ({patent_info.application_number}): {e}")
     
-    def download_pdf_file(self, patent_info: PatentBasicInfo, pdf_url: str) -> bool:
+    @tracing.traced("pdf_download")
+    def download_pdf_file(
+        self,
+        patent_info: PatentBasicInfo,
+        pdf_url: str,
+        cancel_event: Optional[threading.Event] = None
+    ) -> bool:
         """
         PDF 파일 다운로드
         
         Args:
             patent_info: 특허 기본 정보
             pdf_url: PDF 다운로드 URL
+            cancel_event: 설정되면 다운로드를 중단하는 취소 이벤트
             
         Returns:
             다운로드 성공 여부
         """
         if not settings.download_pdfs:
             return False
-            
+        
+        filepath = None
         try:
             safe_title = "".join(c for c in patent_info.invention_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
             if len(safe_title) > 50:
@@ -224,19 +276,25 @@ class PatentProcessor:
             filepath = os.path.join(self.output_dir, "pdf_files", filename)
             
             print(f"PDF 다운로드 중: {patent_info.application_number}")
-            response = requests.get(pdf_url, timeout=60)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            with kipris_api.request("pdf_download", pdf_url, timeout=60, stream=True) as response:
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise InterruptedError("작업이 취소되었습니다")
+                        f.write(chunk)
+                        metrics.bytes_downloaded.inc(len(chunk), endpoint="pdf_download")
+                        metrics.bytes_written.inc(len(chunk), kind="pdf")
             
             print(f"PDF 다운로드 완료: {filepath}")
             return True
             
         except Exception as e:
             print(f"PDF 다운로드 실패 ({patent_info.application_number}): {e}")
+            if filepath and os.path.exists(filepath):
+                os.remove(filepath)
             return False
     
+    @tracing.traced("file_write", kind="search_results")
     def save_search_results(self, search_result: Dict, search_keyword: str, right_holder_code: str) -> None:
         """검색 결과 저장"""
         if not settings.save_search_results:
@@ -253,11 +311,13 @@ class PatentProcessor:
             with open(result_file, 'w', encoding='utf-8') as f:
                 json.dump(search_result, f, ensure_ascii=False, indent=2)
             
+            metrics.bytes_written.inc(os.path.getsize(result_file), kind="search_results")
             print(f"검색 결과 저장: {result_file}")
             
         except Exception as e:
             print(f"검색 결과 저장 실패: {e}")
     
+    @tracing.traced("report")
     def create_summary_report(
         self,
         patents: List[PatentDetailInfo],
@@ -265,7 +325,8 @@ class PatentProcessor:
         pdfs_downloaded: int,
         search_keyword: str,
         right_holder: str,
-        right_holder_code: str
+        right_holder_code: str,
+        report_id: Optional[str] = None
     ) -> str:
         """
         요약 보고서 생성
@@ -277,13 +338,33 @@ class PatentProcessor:
             search_keyword: 검색 키워드
             right_holder: 등록권자명
             right_holder_code: 등록권자 코드
+            report_id: 파일명에 붙일 식별자 (동시에 생성되는 보고서끼리 덮어쓰지 않도록)
             
         Returns:
-            요약 보고서 파일 경로
+            요약 보고서 파일 경로 (같은 이름의 .json 파일에 분포 데이터도 저장)
         """
         try:
+            # 처리 중 다른 특허로 묶음이 합쳐졌을 수 있으므로 현재 묶음 ID로 갱신
+            if settings.clustering_enabled:
+                from app.services.patent_clusterer import patent_clusterer
+                patent_clusterer.refresh(patents)
+            
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_file = os.path.join(self.output_dir, f"summary_report_{timestamp}.txt")
+            suffix = f"_{report_id}" if report_id else ""
+            report_file = os.path.join(self.output_dir, f"summary_report_{timestamp}{suffix}.txt")
+            
+            # 분포 통계 (/patents/analytics/{holder_code}와 같은 집계/보고서 형식)
+            counts: Facets = {}
+            for patent in patents:
+                add_facets(counts, patent_facets(
+                    patent.basic_info.application_number,
+                    patent.basic_info.register_status,
+                    patent.ipc_codes,
+                    patent.ingredients,
+                    len(patent.claims) or None,
+                    len(patent.independent_claims)
+                ))
+            report = build_report(counts, top=10)
             
             with open(report_file, 'w', encoding='utf-8') as f:
                 f.write("화장품 특허 검색 결과 요약 보고서\n")
@@ -296,17 +377,22 @@ class PatentProcessor:
                 f.write(f"PDF 다운로드: {pdfs_downloaded}건\n")
                 f.write("\n")
                 
-                # 등록상태별 통계
-                status_count = {}
-                for patent in patents:
-                    status = patent.basic_info.register_status
-                    status_count[status] = status_count.get(status, 0) + 1
+                # 등록상태/출원연도/청구항 수/IPC/성분 분포 (특허 수 줄은 위에 있으므로 제외)
+                for line in format_report(report)[1:]:
+                    f.write(line + "\n")
                 
-                f.write("등록상태별 분포:\n")
-                f.write("-"*40 + "\n")
-                for status, count in status_count.items():
-                    f.write(f"{status}: {count}건\n")
-                f.write("\n")
+                # 유사 특허 묶음 (이번 결과에서 2건 이상인 묶음)
+                clusters: Dict[str, List[str]] = {}
+                for patent in patents:
+                    if patent.cluster_id:
+                        clusters.setdefault(patent.cluster_id, []).append(patent.basic_info.application_number)
+                clusters = {cluster_id: members for cluster_id, members in clusters.items() if len(members) > 1}
+                if clusters:
+                    f.write(f"유사 특허 묶음: {len(clusters)}개 (묶음에 속한 특허 {sum(len(members) for members in clusters.values())}건)\n")
+                    f.write("-"*40 + "\n")
+                    for cluster_id, members in sorted(clusters.items(), key=lambda item: len(item[1]), reverse=True):
+                        f.write(f"[{cluster_id}] {len(members)}건: {', '.join(sorted(members))}\n")
+                    f.write("\n")
                 
                 # 상세 목록
                 f.write("상세 목록:\n")
@@ -317,8 +403,27 @@ class PatentProcessor:
                     f.write(f"   출원인: {patent.basic_info.applicant_name}\n")
                     f.write(f"   등록상태: {patent.basic_info.register_status}\n")
                     f.write(f"   등록일자: {patent.basic_info.register_date}\n")
-                    f.write(f"   청구항 수: {len(patent.claims)}개\n\n")
-            
+                    f.write(f"   청구항 수: {len(patent.claims)}개")
+                    if patent.independent_claims:
+                        f.write(f" (독립항 {', '.join(str(claim_no) for claim_no in patent.independent_claims)})")
+                    f.write("\n")
+                    if patent.cluster_id and patent.cluster_id in clusters:
+                        f.write(f"   유사 특허 묶음: {patent.cluster_id}\n")
+                    f.write("\n")
+            
+            json_file = os.path.splitext(report_file)[0] + ".json"
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "search_keyword": search_keyword,
+                    "right_holder": right_holder,
+                    "right_holder_code": right_holder_code,
+                    "claims_saved": claims_saved,
+                    "pdfs_downloaded": pdfs_downloaded,
+                    **report,
+                    "clusters": clusters
+                }, f, ensure_ascii=False, indent=2)
+            
+            metrics.bytes_written.inc(os.path.getsize(report_file) + os.path.getsize(json_file), kind="report")
             print(f"요약 보고서 생성: {report_file}")
             return report_file
             
@@ -326,6 +431,79 @@ class PatentProcessor:
             print(f"요약 보고서 생성 실패: {e}")
             return ""
     
+    @tracing.traced("report")
+    def create_batch_report(self, batch: BatchStatus, queries: List[Dict]) -> str:
+        """
+        배치 종합 보고서 생성 (텍스트 보고서와 같은 이름의 JSON 파일)
+        
+        Args:
+            batch: 집계가 끝난 배치 상태
+            queries: 검색 조건별 요약 (검색 조건, 상태, 처리 수, 청구항/PDF 수, 처리 시간, 요약 보고서 경로)
+            
+        Returns:
+            종합 보고서 파일 경로
+        """
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_file = os.path.join(self.output_dir, f"batch_report_{timestamp}_{batch.batch_id[:8]}.txt")
+            elapsed = (batch.end_time - batch.start_time).total_seconds() if batch.end_time and batch.start_time else None
+            
+            # 같은 태스크에 연결된 검색 조건은 청구항/PDF 수를 한 번만 집계
+            unique_queries = {query["task_id"]: query for query in queries}.values()
+            totals = {
+                "total_queries": batch.total_queries,
+                "completed_queries": sum(1 for query in queries if query["status"] == "completed"),
+                "failed_queries": sum(1 for query in queries if query["status"] == "failed"),
+                "cancelled_queries": sum(1 for query in queries if query["status"] == "cancelled"),
+                "total_patents": batch.total_patents,
+                "unique_patents": batch.unique_patents,
+                "duplicate_patents": batch.duplicate_patents,
+                "processed_patents": batch.processed_patents,
+                "claims_saved": sum(query["claims_saved"] for query in unique_queries),
+                "pdfs_downloaded": sum(query["pdfs_downloaded"] for query in unique_queries),
+                "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None
+            }
+            
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write("화장품 특허 배치 처리 종합 보고서\n")
+                f.write("="*80 + "\n\n")
+                f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"배치 ID: {batch.batch_id}\n")
+                f.write(f"배치 상태: {batch.status}\n")
+                f.write(f"검색 조건: {totals['total_queries']}개 (완료 {totals['completed_queries']}, 실패 {totals['failed_queries']}, 취소 {totals['cancelled_queries']})\n")
+                f.write(f"검색 조건별 특허 합계: {totals['total_patents']}건\n")
+                f.write(f"중복 제외 특허: {totals['unique_patents']}건 (중복 재사용 {totals['duplicate_patents']}건)\n")
+                f.write(f"청구항 저장: {totals['claims_saved']}건\n")
+                f.write(f"PDF 다운로드: {totals['pdfs_downloaded']}건\n")
+                if elapsed is not None:
+                    f.write(f"처리 시간: {elapsed:.1f}초\n")
+                f.write("\n")
+                
+                # 검색 조건별 요약
+                f.write("검색 조건별 요약:\n")
+                f.write("-"*40 + "\n")
+                for i, query in enumerate(queries, 1):
+                    f.write(f"{i}. [{query['status']}] {query['search_keyword']} / {query['right_holder']}({query['right_holder_code']})\n")
+                    f.write(f"   처리: {query['processed_patents']}/{query['total_patents']}건, 청구항 {query['claims_saved']}건, PDF {query['pdfs_downloaded']}건\n")
+                    if query['elapsed_seconds'] is not None:
+                        f.write(f"   처리 시간: {query['elapsed_seconds']:.1f}초\n")
+                    f.write(f"   메시지: {query['message']}\n")
+                    if query['summary_report_path']:
+                        f.write(f"   요약 보고서: {query['summary_report_path']}\n")
+                    f.write("\n")
+            
+            json_file = os.path.splitext(report_file)[0] + ".json"
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump({"batch_id": batch.batch_id, "status": batch.status, **totals, "queries": queries}, f, ensure_ascii=False, indent=2)
+            
+            metrics.bytes_written.inc(os.path.getsize(report_file) + os.path.getsize(json_file), kind="report")
+            print(f"배치 종합 보고서 생성: {report_file}")
+            return report_file
+            
+        except Exception as e:
+            print(f"배치 종합 보고서 생성 실패: {e}")
+            return ""
+    
     def search_and_extract_patents(
         self,
         search_keyword: Optional[str] = None,
@@ -384,66 +562,179 @@ class PatentProcessor:
         # 최대 특허 수 제한
         patents = patents[:max_patents]
         
+        # 등록상태 갱신 작업이 등록권자별로 다시 확인할 수 있도록 등록권자 코드와 등록상태 기록
+        if settings.use_patent_store and right_holder_code:
+            patent_store.record_search(patents, right_holder_code)
+        
+        # 이후 등록권자명만으로 검색할 수 있도록 출원인명 → 등록권자 코드 기록
+        if right_holder_code:
+            holder_directory.observe(patents, right_holder_code)
+        
         return patents
     
     def process_patent_details(
         self,
         patent_info: PatentBasicInfo,
         include_claims: bool = True,
-        include_pdf: bool = False
+        include_pdf: bool = False,
+        cancel_event: Optional[threading.Event] = None,
+        raise_on_fetch_failure: bool = False
     ) -> PatentDetailInfo:
         """
         특허 상세 정보 처리
         
+        이미 처리한 출원번호는 특허 저장소의 상세 정보를 재사용하여 KIPRIS 상세 조회를 생략한다.
+        
         Args:
             patent_info: 특허 기본 정보
             include_claims: 청구항 포함 여부
             include_pdf: PDF 다운로드 여부
+            cancel_event: 설정되면 남은 PDF 조회/다운로드를 건너뛰는 취소 이벤트
+            raise_on_fetch_failure: KIPRIS 상세 조회에 실패하면 빈 상세 정보 대신 DetailFetchError 발생
             
         Returns:
-            특허 상세 정보
+            특허 상세 정보 (KIPRIS 상세 조회에 실패하면 기본 정보만 있는 상세 정보)
+        
+        Raises:
+            DetailFetchError: raise_on_fetch_failure이고 KIPRIS 상세 조회에 실패한 경우
         """
-        detail_info = PatentDetailInfo(basic_info=patent_info)
+        stored_info = patent_store.get_detail(patent_info, include_claims) if settings.use_patent_store else None
+        if stored_info is not None:
+            detail_info = stored_info
+        else:
+            with tracing.span("model_build"):
+                detail_info = PatentDetailInfo(basic_info=patent_info)
+            
+            # 상세 정보 조회
+            patent_details = kipris_api.get_patent_details(patent_info.application_number)
+            if not patent_details:
+                if raise_on_fetch_failure:
+                    raise DetailFetchError(f"KIPRIS 상세 정보 조회 실패: {patent_info.application_number}")
+                return detail_info
+            
+            # 청구항 추출
+            if include_claims:
+                claims = self.extract_claims(patent_details)
+                detail_info.claims = claims
+                self.parse_claim_structure(detail_info)
+                
+                if claims and settings.save_claims:
+                    self.save_claims_to_file(patent_info, claims, detail_info.claim_dependencies)
+            
+            # IPC 코드 추출
+            detail_info.ipc_codes = self.extract_ipc_codes(patent_details)
+            
+            # 발명자 정보 추출
+            detail_info.inventors = self.extract_inventors(patent_details)
+            
+            if settings.use_patent_store:
+                patent_store.put_detail(detail_info, claims_included=include_claims)
+                # 발명자/출원인 색인 갱신
+                entity_index.add(detail_info)
         
-        # 상세 정보 조회
-        patent_details = kipris_api.get_patent_details(patent_info.application_number)
-        if not patent_details:
-            return detail_info
+        # 청구항 성분 태깅 (성분 사전이 설정된 경우)
+        if detail_info.claims and ingredient_tagger.enabled:
+            self.tag_ingredients(detail_info)
         
-        # 청구항 추출
-        if include_claims:
-            claims = self.extract_claims(patent_details)
-            detail_info.claims = claims
-            
-            if claims and settings.save_claims:
-                self.save_claims_to_file(patent_info, claims)
+        # NumPy를 쓰는 색인은 처음 처리할 때 import (CLI/API 시작 시간에서 제외)
+        # 유사 특허 묶음 배정
+        if detail_info.claims and settings.clustering_enabled:
+            from app.services.patent_clusterer import patent_clusterer
+            detail_info.cluster_id = patent_clusterer.add(detail_info)
         
-        # IPC 코드 추출
-        detail_info.ipc_codes = self.extract_ipc_codes(patent_details)
+        # IPC 분류 색인에 추가
+        if detail_info.ipc_codes:
+            from app.services.ipc_index import ipc_index
+            ipc_index.add(detail_info)
         
-        # 발명자 정보 추출
-        detail_info.inventors = self.extract_inventors(patent_details)
+        # 유사 특허 검색 색인에 추가
+        if detail_info.claims and settings.similarity_enabled:
+            from app.services.similarity_index import similarity_index
+            similarity_index.add(detail_info)
+        
+        # 취소된 작업은 PDF 조회/다운로드를 건너뜀
+        if cancel_event is not None and cancel_event.is_set():
+            return detail_info
         
         # PDF 다운로드 (공개 상태인 경우에만 가능)
         if include_pdf:
-            # 등록 상태 확인
-            register_status = patent_info.register_status.strip()
-            
-            if register_status == '공개':
-                pdf_url = kipris_api.get_pdf_download_url(patent_info.application_number)
-                if pdf_url:
-                    detail_info.pdf_url = pdf_url
-                    if settings.download_pdfs:
-                        success = self.download_pdf_file(patent_info, pdf_url)
-                        if not success:
-                            print(f"⚠️ PDF 다운로드 실패: {patent_info.application_number}")
-                else:
-                    print(f"⚠️ PDF URL을 찾을 수 없음: {patent_info.application_number}")
-            else:
-                print(f"📝 등록된 특허는 공개 전문 PDF가 제공되지 않음: {patent_info.application_number} (상태: {register_status})")
+            detail_info.pdf_url, _ = self.fetch_patent_pdf(patent_info, cancel_event)
         
         return detail_info
+    
+    def tag_ingredients(self, detail_info: PatentDetailInfo) -> None:
+        """
+        청구항에 나온 성분을 찾아 detail_info.ingredients에 기록하고 성분→특허 포스팅 저장
+        
+        Args:
+            detail_info: 청구항이 있는 특허 상세 정보
+        """
+        tags = ingredient_tagger.tag_claims(detail_info.claims)
+        detail_info.ingredients = sorted(tags)
+        
+        application_number = detail_info.basic_info.application_number
+        if settings.use_patent_store and patent_store.ingredient_version(application_number) != ingredient_tagger.version:
+            patent_store.put_ingredients(application_number, tags, ingredient_tagger.version)
+    
+    def current_register_status(self, patent_info: PatentBasicInfo) -> str:
+        """
+        특허의 현재 등록상태
+        
+        등록상태 갱신 작업으로 저장소에 검색 때보다 최근 값이 있으면 그 값을 사용한다.
+        
+        Args:
+            patent_info: 특허 기본 정보
+            
+        Returns:
+            등록상태 (예: "공개", "등록")
+        """
+        register_status = patent_info.register_status.strip()
+        if settings.use_patent_store:
+            register_status = patent_store.get_status(patent_info.application_number) or register_status
+        return register_status
+    
+    def fetch_patent_pdf(
+        self,
+        patent_info: PatentBasicInfo,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Tuple[Optional[str], bool]:
+        """
+        공개 전문 PDF URL 조회 및 다운로드 (공개 상태인 특허만 가능)
+        
+        Args:
+            patent_info: 특허 기본 정보
+            cancel_event: 설정되면 다운로드를 중단하는 취소 이벤트
+            
+        Returns:
+            (PDF URL, 다운로드 성공 여부)
+        """
+        register_status = self.current_register_status(patent_info)
+        if register_status != '공개':
+            print(f"📝 등록된 특허는 공개 전문 PDF가 제공되지 않음: {patent_info.application_number} (상태: {register_status})")
+            return None, False
+        
+        # 이미 다운로드한 PDF는 다시 조회/다운로드하지 않음
+        if settings.use_patent_store:
+            stored_pdf = patent_store.get_pdf(patent_info.application_number)
+            if stored_pdf is not None:
+                return stored_pdf
+        
+        pdf_url = kipris_api.get_pdf_download_url(patent_info.application_number)
+        if not pdf_url:
+            print(f"⚠️ PDF URL을 찾을 수 없음: {patent_info.application_number}")
+            return None, False
+        
+        success = False
+        if settings.download_pdfs:
+            success = self.download_pdf_file(patent_info, pdf_url, cancel_event)
+            if not success:
+                print(f"⚠️ PDF 다운로드 실패: {patent_info.application_number}")
+        
+        if settings.use_patent_store:
+            patent_store.put_pdf(patent_info, pdf_url, success)
+        
+        return pdf_url, success
 
 
-# 전역 특허 처리기 인스턴스
-patent_processor = PatentProcessor()
+# 전역 특허 처리기 인스턴스 (처음 사용할 때 생성, 출력 디렉토리도 이때 생성)
+patent_processor = LazyProxy(PatentProcessor)
@@ -0,0 +1,1165 @@
+"""
+특허 저장소 서비스 (출원번호 기준 중복 제거)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from app.core.claim_parser import independent_claims, parse_claim_dependencies
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics
+from app.core.portfolio import Facets, patent_facets
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+
+
+class SeenSet:
+    """
+    출원번호 집합 (정렬된 int64 배열)
+    
+    출원번호 하나를 8바이트로 저장하므로 수백만 건도 수십 MB 안에 들어간다.
+    새로 추가된 번호는 set에 모았다가 배열 크기에 비례하는 양이 쌓이면 한 번에 병합한다.
+    숫자가 아닌 출원번호는 별도 set에 그대로 저장한다.
+    """
+    
+    def __init__(self, merge_threshold: int = 4096):
+        """
+        Args:
+            merge_threshold: 정렬 배열에 병합하기 전까지 모아 두는 최소 번호 수
+        """
+        self.numbers = array("q")
+        self.pending = set()
+        self.others = set()
+        self.merge_threshold = merge_threshold
+    
+    @staticmethod
+    def to_key(application_number: str) -> Optional[int]:
+        """출원번호를 정수 키로 변환 (숫자가 아니면 None)"""
+        digits = application_number.replace("-", "").strip()
+        if digits.isdigit() and len(digits) <= 18:
+            return int(digits)
+        return None
+    
+    def add(self, application_number: str) -> None:
+        """출원번호 추가"""
+        key = self.to_key(application_number)
+        if key is None:
+            self.others.add(application_number)
+            return
+        
+        if key in self.pending or self.contains_key(key):
+            return
+        self.pending.add(key)
+        if len(self.pending) >= max(self.merge_threshold, len(self.numbers) // 8):
+            self.merge()
+    
+    def update(self, application_numbers: Iterable[str]) -> None:
+        """출원번호 여러 개 추가 (한 번만 정렬하므로 DB 전체 로드에 사용)"""
+        keys = list(self.pending)
+        for application_number in application_numbers:
+            key = self.to_key(application_number)
+            if key is None:
+                self.others.add(application_number)
+            else:
+                keys.append(key)
+        
+        keys.extend(self.numbers)
+        keys.sort()
+        self.numbers = array("q", dict.fromkeys(keys))
+        self.pending.clear()
+    
+    def merge(self) -> None:
+        """모아 둔 번호를 정렬 배열에 병합"""
+        if not self.pending:
+            return
+        # 정렬된 두 구간을 이어 붙여 정렬하면 Timsort가 선형 시간 병합으로 처리한다
+        self.numbers = array("q", sorted(self.numbers + array("q", sorted(self.pending))))
+        self.pending.clear()
+    
+    def contains_key(self, key: int) -> bool:
+        index = bisect_left(self.numbers, key)
+        return index < len(self.numbers) and self.numbers[index] == key
+    
+    def contains(self, application_number: str) -> bool:
+        """출원번호 포함 여부"""
+        key = self.to_key(application_number)
+        if key is None:
+            return application_number in self.others
+        return key in self.pending or self.contains_key(key)
+    
+    def __len__(self) -> int:
+        return len(self.numbers) + len(self.pending) + len(self.others)
+
+
+class PatentStore:
+    """
+    처리한 특허의 상세 정보와 PDF 다운로드 결과를 출원번호 기준으로 저장하는 SQLite 저장소
+    
+    메모리의 SeenSet으로 처음 보는 출원번호는 DB 조회 없이 걸러내고, 이미 처리한
+    출원번호는 DB에 저장된 상세 정보를 재사용하여 KIPRIS 상세 조회/PDF 다운로드를 건너뛴다.
+    여러 스레드가 하나의 인스턴스를 공유한다.
+    """
+    
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS patents (
+                application_number TEXT PRIMARY KEY,
+                register_status TEXT NOT NULL DEFAULT '',
+                basic_info TEXT NOT NULL,
+                detail TEXT,
+                claims_included INTEGER NOT NULL DEFAULT 0,
+                pdf_url TEXT,
+                pdf_downloaded INTEGER NOT NULL DEFAULT 0,
+                fetched_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self.ensure_column("patents", "right_holder_code", "TEXT")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS patents_right_holder_code ON patents (right_holder_code)")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS holder_refresh (
+                right_holder_code TEXT PRIMARY KEY,
+                refreshed_at TEXT NOT NULL,
+                patents INTEGER NOT NULL DEFAULT 0,
+                changed INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self.ensure_column("patents", "ingredient_version", "TEXT")
+        self.ensure_column("patents", "minhash", "BLOB")
+        self.ensure_column("patents", "cluster_id", "TEXT")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ingredient_postings (
+                ingredient TEXT NOT NULL,
+                application_number TEXT NOT NULL,
+                claims TEXT NOT NULL,
+                PRIMARY KEY (ingredient, application_number)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS ingredient_postings_application_number ON ingredient_postings (application_number)"
+        )
+        self.ensure_column("patents", "entities_indexed", "INTEGER")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_postings (
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                application_number TEXT NOT NULL,
+                display TEXT NOT NULL,
+                PRIMARY KEY (kind, name, application_number)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS entity_postings_application_number ON entity_postings (application_number, kind, name)"
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_aliases (
+                kind TEXT NOT NULL,
+                alias TEXT NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (kind, alias)
+            ) WITHOUT ROWID
+            """
+        )
+        self.ensure_column("patents", "facets", "TEXT")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS holder_facets (
+                right_holder_code TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                value TEXT NOT NULL,
+                patents INTEGER NOT NULL,
+                PRIMARY KEY (right_holder_code, dimension, value)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.commit()
+        
+        self.seen = SeenSet()
+        self.seen.update(row[0] for row in self.connection.execute("SELECT application_number FROM patents"))
+    
+    def ensure_column(self, table: str, column: str, ddl: str) -> None:
+        """이전 버전 DB에 없는 컬럼 추가"""
+        columns = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    
+    def contains(self, application_number: str) -> bool:
+        """저장된 출원번호인지 확인"""
+        return self.seen.contains(application_number)
+    
+    def count(self) -> int:
+        """저장된 특허 수"""
+        return len(self.seen)
+    
+    def get_detail(
+        self,
+        patent_info: PatentBasicInfo,
+        include_claims: bool = True
+    ) -> Optional[PatentDetailInfo]:
+        """
+        저장된 상세 정보 조회
+        
+        기본 정보는 저장된 값이 아니라 현재 검색 결과(patent_info)를 사용하므로
+        검색 조건마다 결과 목록이 올바르게 귀속된다.
+        
+        Args:
+            patent_info: 현재 검색 결과의 특허 기본 정보
+            include_claims: 청구항이 필요한지 여부 (청구항 없이 저장되었으면 None 반환)
+        
+        Returns:
+            특허 상세 정보 (없으면 None)
+        """
+        row = None
+        if self.contains(patent_info.application_number):
+            with self.lock:
+                row = self.connection.execute(
+                    "SELECT detail, claims_included FROM patents WHERE application_number = ?",
+                    (patent_info.application_number,)
+                ).fetchone()
+        
+        if row is None or row[0] is None or (include_claims and not row[1]):
+            metrics.patent_store_lookups.inc(kind="detail", result="miss")
+            return None
+        
+        metrics.patent_store_lookups.inc(kind="detail", result="hit")
+        return self.detail_from_json(patent_info, row[0], include_claims)
+    
+    def detail_from_json(self, basic_info: PatentBasicInfo, detail_json: str, include_claims: bool = True) -> PatentDetailInfo:
+        """
+        저장된 상세 정보 JSON으로 특허 상세 정보 생성
+        
+        청구항 인용 관계가 저장되기 전에 저장된 특허는 청구항에서 다시 파싱한다.
+        
+        Args:
+            basic_info: 특허 기본 정보
+            detail_json: patents.detail 열의 JSON
+            include_claims: 청구항과 인용 관계를 포함할지 여부
+            
+        Returns:
+            특허 상세 정보
+        """
+        detail = json.loads(detail_json)
+        detail_info = PatentDetailInfo(
+            basic_info=basic_info,
+            ipc_codes=detail.get("ipc_codes", []),
+            inventors=detail.get("inventors", [])
+        )
+        if include_claims:
+            detail_info.claims = detail.get("claims", [])
+            dependencies = detail.get("claim_dependencies")
+            if dependencies is None or len(dependencies) != len(detail_info.claims):
+                dependencies = parse_claim_dependencies(detail_info.claims)
+            detail_info.claim_dependencies = dependencies
+            detail_info.independent_claims = independent_claims(detail_info.claims, dependencies)
+        return detail_info
+    
+    def get_pdf(self, application_number: str) -> Optional[Tuple[Optional[str], bool]]:
+        """
+        저장된 PDF 조회 결과
+        
+        Args:
+            application_number: 출원번호
+        
+        Returns:
+            (PDF URL, 다운로드 여부) (PDF를 조회한 적이 없으면 None)
+        """
+        row = None
+        if self.contains(application_number):
+            with self.lock:
+                row = self.connection.execute(
+                    "SELECT pdf_url, pdf_downloaded FROM patents WHERE application_number = ?",
+                    (application_number,)
+                ).fetchone()
+        
+        # 다운로드까지 끝난 경우만 재사용 (URL만 있으면 다운로드를 다시 시도)
+        if row is None or row[0] is None or (settings.download_pdfs and not row[1]):
+            metrics.patent_store_lookups.inc(kind="pdf", result="miss")
+            return None
+        
+        metrics.patent_store_lookups.inc(kind="pdf", result="hit")
+        return row[0], bool(row[1])
+    
+    def put_detail(self, detail_info: PatentDetailInfo, claims_included: bool) -> None:
+        """
+        상세 정보 저장 (PDF 정보는 유지)
+        
+        등록상태가 빈 기본 정보(출원번호만 아는 상세 조회)로는 이미 저장된 기본 정보와 등록상태를 덮어쓰지 않는다.
+        
+        Args:
+            detail_info: 특허 상세 정보
+            claims_included: 청구항을 조회했는지 여부
+        """
+        basic_info = detail_info.basic_info
+        detail = {
+            "claims": detail_info.claims,
+            "claim_dependencies": detail_info.claim_dependencies,
+            "ipc_codes": detail_info.ipc_codes,
+            "inventors": detail_info.inventors
+        }
+        now = datetime.now().isoformat(timespec="seconds")
+        
+        with self.lock:
+            self.connection.execute(
+                """
+                INSERT INTO patents (application_number, register_status, basic_info, detail, claims_included, fetched_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(application_number) DO UPDATE SET
+                    register_status = CASE WHEN excluded.register_status != '' THEN excluded.register_status ELSE patents.register_status END,
+                    basic_info = CASE WHEN excluded.register_status != '' THEN excluded.basic_info ELSE patents.basic_info END,
+                    detail = excluded.detail,
+                    claims_included = excluded.claims_included,
+                    ingredient_version = NULL,
+                    fetched_at = excluded.fetched_at,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    basic_info.application_number,
+                    basic_info.register_status.strip(),
+                    basic_info.model_dump_json(),
+                    json.dumps(detail, ensure_ascii=False),
+                    int(claims_included),
+                    now,
+                    now
+                )
+            )
+            self.update_facets([basic_info.application_number])
+            self.connection.commit()
+            self.seen.add(basic_info.application_number)
+    
+    def put_pdf(self, patent_info: PatentBasicInfo, pdf_url: Optional[str], downloaded: bool) -> None:
+        """
+        PDF 조회/다운로드 결과 저장
+        
+        Args:
+            patent_info: 특허 기본 정보
+            pdf_url: PDF URL
+            downloaded: 다운로드 성공 여부
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        
+        with self.lock:
+            self.connection.execute(
+                """
+                INSERT INTO patents (application_number, register_status, basic_info, pdf_url, pdf_downloaded, fetched_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(application_number) DO UPDATE SET
+                    pdf_url = excluded.pdf_url,
+                    pdf_downloaded = excluded.pdf_downloaded,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    patent_info.application_number,
+                    patent_info.register_status.strip(),
+                    patent_info.model_dump_json(),
+                    pdf_url,
+                    int(downloaded),
+                    now,
+                    now
+                )
+            )
+            self.connection.commit()
+            self.seen.add(patent_info.application_number)
+    
+    def record_search(self, patents: List[PatentBasicInfo], right_holder_code: Optional[str]) -> int:
+        """
+        검색 결과의 등록권자 코드와 등록상태 기록 (등록상태 갱신 작업의 대상 목록)
+        
+        처음 보는 특허는 기본 정보만 저장하고, 이미 있는 특허는 등록권자 코드나 등록상태가
+        달라진 경우에만 갱신한다.
+        
+        Args:
+            patents: 검색 결과 특허 목록
+            right_holder_code: 검색에 사용한 등록권자 코드
+            
+        Returns:
+            추가/갱신된 행 수
+        """
+        if not patents:
+            return 0
+        
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (
+                patent.application_number,
+                patent.register_status.strip(),
+                patent.model_dump_json(),
+                right_holder_code or None,
+                now,
+                now
+            )
+            for patent in patents
+        ]
+        
+        with self.lock:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                """
+                INSERT INTO patents (application_number, register_status, basic_info, right_holder_code, fetched_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(application_number) DO UPDATE SET
+                    register_status = excluded.register_status,
+                    basic_info = excluded.basic_info,
+                    right_holder_code = COALESCE(excluded.right_holder_code, patents.right_holder_code),
+                    updated_at = excluded.updated_at
+                WHERE patents.register_status != excluded.register_status
+                    OR (excluded.right_holder_code IS NOT NULL AND patents.right_holder_code IS NOT excluded.right_holder_code)
+                """,
+                rows
+            )
+            changed = self.connection.total_changes - before
+            if changed:
+                self.update_facets([patent.application_number for patent in patents])
+            self.connection.commit()
+            for patent in patents:
+                self.seen.add(patent.application_number)
+        return changed
+    
+    def get_status(self, application_number: str) -> Optional[str]:
+        """
+        저장된 등록상태
+        
+        Args:
+            application_number: 출원번호
+            
+        Returns:
+            등록상태 (저장되지 않은 특허이면 None)
+        """
+        if not self.contains(application_number):
+            return None
+        
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT register_status FROM patents WHERE application_number = ?",
+                (application_number,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def get_right_holder_code(self, application_number: str) -> Optional[str]:
+        """
+        특허를 찾은 등록권자 검색의 등록권자 코드
+        
+        Args:
+            application_number: 출원번호
+            
+        Returns:
+            등록권자 코드 (저장되지 않았거나 등록권자 코드 없이 검색한 특허이면 None)
+        """
+        if not self.contains(application_number):
+            return None
+        
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT right_holder_code FROM patents WHERE application_number = ?",
+                (application_number,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def holder_summaries(self) -> List[Dict[str, object]]:
+        """
+        등록권자 코드별 저장 특허 요약 (등록상태 갱신 우선순위 계산용)
+        
+        Returns:
+            등록권자 코드, 등록상태별 특허 수, 마지막 갱신 시간, 가장 오래된 저장 시간 목록
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT p.right_holder_code, p.register_status, COUNT(*), MIN(p.fetched_at), h.refreshed_at
+                FROM patents p LEFT JOIN holder_refresh h ON h.right_holder_code = p.right_holder_code
+                WHERE p.right_holder_code IS NOT NULL
+                GROUP BY p.right_holder_code, p.register_status
+                """
+            ).fetchall()
+        
+        summaries: Dict[str, Dict[str, object]] = {}
+        for code, status, count, fetched_at, refreshed_at in rows:
+            summary = summaries.setdefault(code, {
+                "right_holder_code": code,
+                "statuses": {},
+                "refreshed_at": refreshed_at,
+                "oldest_fetched_at": fetched_at
+            })
+            summary["statuses"][status] = count
+            summary["oldest_fetched_at"] = min(summary["oldest_fetched_at"], fetched_at)
+        return list(summaries.values())
+    
+    def holder_names(self) -> List[Tuple[str, str, int]]:
+        """
+        등록권자 코드로 검색한 특허의 출원인명 (등록권자 디렉터리용)
+        
+        Returns:
+            (출원인명, 등록권자 코드, 특허 수) 목록
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+                SELECT json_extract(basic_info, '$.applicant_name') AS applicant_name, right_holder_code, COUNT(*)
+                FROM patents WHERE right_holder_code IS NOT NULL
+                GROUP BY applicant_name, right_holder_code
+                """
+            ).fetchall()
+    
+    def holder_statuses(self, right_holder_code: str) -> Dict[str, str]:
+        """
+        등록권자 코드의 저장 특허별 등록상태
+        
+        Args:
+            right_holder_code: 등록권자 코드
+            
+        Returns:
+            출원번호별 등록상태
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT application_number, register_status FROM patents WHERE right_holder_code = ?",
+                (right_holder_code,)
+            ).fetchall()
+        return dict(rows)
+    
+    def update_statuses(self, patents: List[PatentBasicInfo]) -> None:
+        """
+        등록상태가 바뀐 특허만 갱신
+        
+        Args:
+            patents: 새 등록상태를 담은 특허 기본 정보 목록
+        """
+        if not patents:
+            return
+        
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.lock:
+            self.connection.executemany(
+                "UPDATE patents SET register_status = ?, basic_info = ?, updated_at = ? WHERE application_number = ?",
+                [
+                    (patent.register_status.strip(), patent.model_dump_json(), now, patent.application_number)
+                    for patent in patents
+                ]
+            )
+            self.update_facets([patent.application_number for patent in patents])
+            self.connection.commit()
+    
+    def mark_holder_refreshed(self, right_holder_code: str, patents: int, changed: int) -> None:
+        """
+        등록권자 코드의 등록상태 갱신 완료 기록
+        
+        Args:
+            right_holder_code: 등록권자 코드
+            patents: 확인한 저장 특허 수
+            changed: 등록상태가 바뀐 특허 수
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.lock:
+            self.connection.execute(
+                """
+                INSERT INTO holder_refresh (right_holder_code, refreshed_at, patents, changed)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(right_holder_code) DO UPDATE SET
+                    refreshed_at = excluded.refreshed_at,
+                    patents = excluded.patents,
+                    changed = excluded.changed
+                """,
+                (right_holder_code, now, patents, changed)
+            )
+            self.connection.commit()
+    
+    def ingredient_version(self, application_number: str) -> Optional[str]:
+        """
+        특허를 태깅한 성분 사전 버전
+        
+        Args:
+            application_number: 출원번호
+            
+        Returns:
+            성분 사전 버전 (태깅하지 않았으면 None)
+        """
+        if not self.contains(application_number):
+            return None
+        
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT ingredient_version FROM patents WHERE application_number = ?",
+                (application_number,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put_ingredients(self, application_number: str, tags: Dict[str, List[int]], version: str) -> None:
+        """
+        특허의 성분 태깅 결과로 성분→특허 포스팅 교체
+        
+        Args:
+            application_number: 출원번호 (저장소에 있는 특허)
+            tags: 성분 대표명별 청구항 번호 목록
+            version: 성분 사전 버전
+        """
+        with self.lock:
+            self.connection.execute("DELETE FROM ingredient_postings WHERE application_number = ?", (application_number,))
+            self.connection.executemany(
+                "INSERT INTO ingredient_postings (ingredient, application_number, claims) VALUES (?, ?, ?)",
+                [
+                    (ingredient, application_number, json.dumps(claim_numbers))
+                    for ingredient, claim_numbers in tags.items()
+                ]
+            )
+            self.connection.execute(
+                "UPDATE patents SET ingredient_version = ? WHERE application_number = ?",
+                (version, application_number)
+            )
+            self.update_facets([application_number])
+            self.connection.commit()
+    
+    def patent_ingredients(self, application_number: str) -> Dict[str, List[int]]:
+        """
+        특허에 나온 성분
+        
+        Args:
+            application_number: 출원번호
+            
+        Returns:
+            성분 대표명별 청구항 번호 목록
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT ingredient, claims FROM ingredient_postings WHERE application_number = ? ORDER BY ingredient",
+                (application_number,)
+            ).fetchall()
+        return {ingredient: json.loads(claims) for ingredient, claims in rows}
+    
+    def ingredient_patents(self, ingredient: str) -> List[Dict[str, object]]:
+        """
+        성분이 나온 특허 목록
+        
+        Args:
+            ingredient: 성분 대표명
+            
+        Returns:
+            특허 기본 정보와 성분이 나온 청구항 번호 목록 (출원번호 내림차순)
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT p.basic_info, i.claims
+                FROM ingredient_postings i JOIN patents p ON p.application_number = i.application_number
+                WHERE i.ingredient = ?
+                ORDER BY i.application_number DESC
+                """,
+                (ingredient,)
+            ).fetchall()
+        return [
+            {"patent": json.loads(basic_info), "claims": json.loads(claims)}
+            for basic_info, claims in rows
+        ]
+    
+    def ingredient_counts(self, limit: int = 50) -> List[Tuple[str, int]]:
+        """
+        성분별 특허 수 (많은 순)
+        
+        Args:
+            limit: 최대 성분 수
+            
+        Returns:
+            (성분 대표명, 특허 수) 목록
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+                SELECT ingredient, COUNT(*) AS patents FROM ingredient_postings
+                GROUP BY ingredient ORDER BY patents DESC, ingredient LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+    
+    def iter_untagged_claims(self, version: str, chunk_size: int = 500) -> Iterator[Tuple[str, List[str]]]:
+        """
+        청구항이 저장되어 있지만 해당 성분 사전 버전으로 태깅하지 않은 특허
+        
+        Args:
+            version: 성분 사전 버전
+            chunk_size: 한 번에 읽는 행 수
+            
+        Yields:
+            (출원번호, 청구항 목록)
+        """
+        last = ""
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    """
+                    SELECT application_number, detail FROM patents
+                    WHERE application_number > ? AND claims_included = 1 AND detail IS NOT NULL
+                        AND (ingredient_version IS NULL OR ingredient_version != ?)
+                    ORDER BY application_number LIMIT ?
+                    """,
+                    (last, version, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            for application_number, detail in rows:
+                yield application_number, json.loads(detail).get("claims", [])
+            last = rows[-1][0]
+    
+    def put_entities(
+        self,
+        application_number: str,
+        postings: List[Tuple[str, str, str]],
+        aliases: List[Tuple[str, str, str]]
+    ) -> None:
+        """
+        특허의 발명자/출원인 포스팅 교체
+        
+        처음 보는 다른 표기는 대표 키에 연결하고, 이전에 그 표기로 저장된 포스팅도 대표 키로 옮긴다.
+        
+        Args:
+            application_number: 출원번호
+            postings: (종류, 정규화한 이름, 원래 이름) 목록
+            aliases: (종류, 다른 표기 키, 대표 키) 목록
+        """
+        with self.lock:
+            for kind, alias, name in aliases:
+                inserted = self.connection.execute(
+                    "INSERT OR IGNORE INTO entity_aliases (kind, alias, name) VALUES (?, ?, ?)",
+                    (kind, alias, name)
+                ).rowcount
+                if inserted:
+                    self.connection.execute(
+                        "UPDATE OR IGNORE entity_postings SET name = ? WHERE kind = ? AND name = ?",
+                        (name, kind, alias)
+                    )
+                    self.connection.execute("DELETE FROM entity_postings WHERE kind = ? AND name = ?", (kind, alias))
+            self.connection.execute("DELETE FROM entity_postings WHERE application_number = ?", (application_number,))
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO entity_postings (kind, name, application_number, display) VALUES (?, ?, ?, ?)",
+                [(kind, name, application_number, display) for kind, name, display in postings]
+            )
+            self.connection.execute(
+                "UPDATE patents SET entities_indexed = 1 WHERE application_number = ?",
+                (application_number,)
+            )
+            self.connection.commit()
+    
+    def entity_alias(self, kind: str, alias: str) -> Optional[str]:
+        """
+        다른 표기 키의 대표 키
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            alias: 정규화한 다른 표기 (예: "洪吉童")
+            
+        Returns:
+            대표 키 (연결된 표기가 없으면 None)
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT name FROM entity_aliases WHERE kind = ? AND alias = ?",
+                (kind, alias)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def entity_count(self, kind: str, name: str) -> int:
+        """정규화한 이름의 특허 수 (색인에 없으면 0)"""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM entity_postings WHERE kind = ? AND name = ?",
+                (kind, name)
+            ).fetchone()[0]
+    
+    def entity_patents(self, kind: str, name: str) -> List[Dict[str, object]]:
+        """
+        발명자/출원인의 특허 목록
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            name: 정규화한 이름
+            
+        Returns:
+            특허 기본 정보, 특허에 적힌 이름, 등록권자 코드 (출원번호 내림차순)
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT p.basic_info, e.display, p.right_holder_code
+                FROM entity_postings e JOIN patents p ON p.application_number = e.application_number
+                WHERE e.kind = ? AND e.name = ?
+                ORDER BY e.application_number DESC
+                """,
+                (kind, name)
+            ).fetchall()
+        return [
+            {"patent": json.loads(basic_info), "name": display, "right_holder_code": right_holder_code}
+            for basic_info, display, right_holder_code in rows
+        ]
+    
+    def co_entities(self, kind: str, name: str, limit: int = 20) -> List[Tuple[str, str, int]]:
+        """
+        같은 특허에 함께 나온 발명자/출원인 (공동 특허 수 많은 순)
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            name: 정규화한 이름
+            limit: 최대 개수
+            
+        Returns:
+            (정규화한 이름, 원래 이름, 공동 특허 수) 목록
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+                SELECT b.name, MIN(b.display), COUNT(*) AS patents
+                FROM entity_postings a JOIN entity_postings b
+                    ON b.application_number = a.application_number AND b.kind = a.kind AND b.name != a.name
+                WHERE a.kind = ? AND a.name = ?
+                GROUP BY b.name ORDER BY patents DESC, b.name LIMIT ?
+                """,
+                (kind, name, limit)
+            ).fetchall()
+    
+    def entity_edges(self, kind: str, names: List[str]) -> List[Tuple[str, str, int]]:
+        """
+        이름 목록 안에서 같은 특허에 함께 나온 쌍
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            names: 정규화한 이름 목록
+            
+        Returns:
+            (이름, 이름, 공동 특허 수) 목록 (쌍마다 한 번, 앞 이름이 더 작음)
+        """
+        if not names:
+            return []
+        
+        placeholders = ",".join("?" * len(names))
+        with self.lock:
+            return self.connection.execute(
+                f"""
+                SELECT a.name, b.name, COUNT(*)
+                FROM entity_postings a JOIN entity_postings b
+                    ON b.application_number = a.application_number AND b.kind = a.kind AND b.name > a.name
+                WHERE a.kind = ? AND a.name IN ({placeholders}) AND b.name IN ({placeholders})
+                GROUP BY a.name, b.name
+                """,
+                [kind] + list(names) + list(names)
+            ).fetchall()
+    
+    def entity_counts(self, kind: str, limit: int = 50) -> List[Tuple[str, str, int]]:
+        """
+        발명자/출원인별 특허 수 (많은 순)
+        
+        Args:
+            kind: 종류 (inventor, applicant)
+            limit: 최대 개수
+            
+        Returns:
+            (정규화한 이름, 원래 이름, 특허 수) 목록
+        """
+        with self.lock:
+            return self.connection.execute(
+                """
+                SELECT name, MIN(display), COUNT(*) AS patents FROM entity_postings WHERE kind = ?
+                GROUP BY name ORDER BY patents DESC, name LIMIT ?
+                """,
+                (kind, limit)
+            ).fetchall()
+    
+    def iter_unindexed_entities(self, chunk_size: int = 500) -> Iterator[Tuple[str, str, List[str]]]:
+        """
+        발명자/출원인 포스팅을 만들지 않은 특허
+        
+        Args:
+            chunk_size: 한 번에 읽는 행 수
+            
+        Yields:
+            (출원번호, 출원인명, 발명자 목록 (상세 정보가 없으면 빈 목록))
+        """
+        last = ""
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    """
+                    SELECT application_number, json_extract(basic_info, '$.applicant_name'), json_extract(detail, '$.inventors')
+                    FROM patents WHERE application_number > ? AND entities_indexed IS NULL
+                    ORDER BY application_number LIMIT ?
+                    """,
+                    (last, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            for application_number, applicant_name, inventors in rows:
+                yield application_number, applicant_name or "", json.loads(inventors) if inventors else []
+            last = rows[-1][0]
+    
+    def update_facets(self, application_numbers: List[str]) -> int:
+        """
+        특허들의 등록권자 포트폴리오 집계 갱신 (lock을 잡은 상태에서 호출)
+        
+        특허마다 마지막으로 더한 기여분을 patents.facets에 남겨 두고, 현재 행으로 다시 계산한
+        기여분과의 차이만 holder_facets에 반영하므로 집계를 처음부터 다시 계산하지 않는다.
+        등록권자 코드 없이 검색한 특허는 기여분만 기록하고 집계에는 넣지 않는다.
+        
+        Args:
+            application_numbers: 출원번호 목록 (저장소에 없는 특허는 무시)
+            
+        Returns:
+            집계가 바뀐 특허 수
+        """
+        deltas: Dict[Tuple[str, str, str], int] = {}
+        updates = []
+        for application_number in dict.fromkeys(application_numbers):
+            row = self.connection.execute(
+                """
+                SELECT register_status, right_holder_code, detail, claims_included, facets
+                FROM patents WHERE application_number = ?
+                """,
+                (application_number,)
+            ).fetchone()
+            if row is None:
+                continue
+            register_status, right_holder_code, detail_json, claims_included, stored = row
+            
+            ingredients = [
+                ingredient for (ingredient,) in self.connection.execute(
+                    "SELECT ingredient FROM ingredient_postings WHERE application_number = ?",
+                    (application_number,)
+                )
+            ]
+            detail = json.loads(detail_json) if detail_json else {}
+            claim_count = independent_count = None
+            if claims_included and detail.get("claims"):
+                claims = detail["claims"]
+                dependencies = detail.get("claim_dependencies")
+                if dependencies is None or len(dependencies) != len(claims):
+                    dependencies = parse_claim_dependencies(claims)
+                claim_count = len(claims)
+                independent_count = len(independent_claims(claims, dependencies))
+            facets = patent_facets(
+                application_number,
+                register_status,
+                detail.get("ipc_codes", []),
+                ingredients,
+                claim_count,
+                independent_count
+            )
+            
+            previous = json.loads(stored) if stored else {"holder": None, "facets": []}
+            if previous["holder"] == right_holder_code and {
+                (dimension, value): count for dimension, value, count in previous["facets"]
+            } == facets:
+                continue
+            if previous["holder"]:
+                for dimension, value, count in previous["facets"]:
+                    key = (previous["holder"], dimension, value)
+                    deltas[key] = deltas.get(key, 0) - count
+            if right_holder_code:
+                for (dimension, value), count in facets.items():
+                    key = (right_holder_code, dimension, value)
+                    deltas[key] = deltas.get(key, 0) + count
+            stored = {"holder": right_holder_code, "facets": [[dimension, value, count] for (dimension, value), count in facets.items()]}
+            updates.append((json.dumps(stored, ensure_ascii=False), application_number))
+        
+        self.connection.executemany(
+            """
+            INSERT INTO holder_facets (right_holder_code, dimension, value, patents) VALUES (?, ?, ?, ?)
+            ON CONFLICT(right_holder_code, dimension, value) DO UPDATE SET patents = patents + excluded.patents
+            """,
+            [(code, dimension, value, delta) for (code, dimension, value), delta in deltas.items() if delta]
+        )
+        self.connection.executemany(
+            "DELETE FROM holder_facets WHERE right_holder_code = ? AND dimension = ? AND value = ? AND patents = 0",
+            [key for key, delta in deltas.items() if delta < 0]
+        )
+        self.connection.executemany("UPDATE patents SET facets = ? WHERE application_number = ?", updates)
+        return len(updates)
+    
+    def aggregate_unaggregated(self, chunk_size: int = 500) -> int:
+        """
+        포트폴리오 집계에 넣지 않은 특허 집계 (이 기능 전에 저장된 특허)
+        
+        Args:
+            chunk_size: 한 번에 집계하는 특허 수
+            
+        Returns:
+            집계한 특허 수
+        """
+        aggregated = 0
+        while True:
+            with self.lock:
+                application_numbers = [
+                    application_number for (application_number,) in self.connection.execute(
+                        "SELECT application_number FROM patents WHERE facets IS NULL LIMIT ?",
+                        (chunk_size,)
+                    )
+                ]
+                if not application_numbers:
+                    return aggregated
+                self.update_facets(application_numbers)
+                self.connection.commit()
+            aggregated += len(application_numbers)
+    
+    def holder_facets(self, right_holder_code: str) -> Facets:
+        """
+        등록권자 코드의 포트폴리오 집계 (저장 특허 수와 무관하게 값 종류 수만큼만 읽음)
+        
+        Args:
+            right_holder_code: 등록권자 코드
+            
+        Returns:
+            (분포, 값) → 특허 수 (totals는 합계, 집계가 없으면 빈 dict)
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT dimension, value, patents FROM holder_facets WHERE right_holder_code = ?",
+                (right_holder_code,)
+            ).fetchall()
+        return {(dimension, value): patents for dimension, value, patents in rows}
+    
+    def put_minhash(self, application_number: str, signature: bytes) -> None:
+        """
+        특허의 MinHash 서명 저장
+        
+        Args:
+            application_number: 출원번호 (저장소에 있는 특허)
+            signature: uint32 서명 바이트
+        """
+        with self.lock:
+            self.connection.execute(
+                "UPDATE patents SET minhash = ? WHERE application_number = ?",
+                (signature, application_number)
+            )
+            self.connection.commit()
+    
+    def set_cluster_ids(self, cluster_id: str, application_numbers: List[str]) -> None:
+        """
+        특허들의 유사 특허 묶음 ID 변경
+        
+        Args:
+            cluster_id: 묶음 ID
+            application_numbers: 출원번호 목록
+        """
+        with self.lock:
+            self.connection.executemany(
+                "UPDATE patents SET cluster_id = ? WHERE application_number = ?",
+                [(cluster_id, application_number) for application_number in application_numbers]
+            )
+            self.connection.commit()
+    
+    def iter_minhashes(self) -> Iterator[Tuple[str, bytes, Optional[str]]]:
+        """
+        저장된 MinHash 서명 (출원번호순)
+        
+        Yields:
+            (출원번호, 서명 바이트, 묶음 ID)
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT application_number, minhash, cluster_id FROM patents WHERE minhash IS NOT NULL ORDER BY application_number"
+            ).fetchall()
+        yield from rows
+    
+    def iter_ipc_codes(self) -> Iterator[Tuple[str, Optional[str], List[str]]]:
+        """
+        상세 정보가 저장된 특허의 IPC 코드 (출원번호순, 청구항은 읽지 않음)
+        
+        Yields:
+            (출원번호, 등록권자 코드, IPC 코드 목록)
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT application_number, right_holder_code, json_extract(detail, '$.ipc_codes')
+                FROM patents WHERE detail IS NOT NULL ORDER BY application_number
+                """
+            ).fetchall()
+        for application_number, right_holder_code, ipc_codes in rows:
+            yield application_number, right_holder_code, json.loads(ipc_codes) if ipc_codes else []
+    
+    def iter_details(self, chunk_size: int = 500) -> Iterator[PatentDetailInfo]:
+        """
+        청구항까지 저장된 특허의 상세 정보 (출원번호순, 저장된 기본 정보 사용)
+        
+        Args:
+            chunk_size: 한 번에 읽는 행 수
+            
+        Yields:
+            특허 상세 정보
+        """
+        last = ""
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    """
+                    SELECT application_number, basic_info, detail FROM patents
+                    WHERE application_number > ? AND claims_included = 1 AND detail IS NOT NULL
+                    ORDER BY application_number LIMIT ?
+                    """,
+                    (last, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            for _, basic_info, detail in rows:
+                yield self.detail_from_json(PatentBasicInfo.model_validate_json(basic_info), detail)
+            last = rows[-1][0]
+    
+    def get_basic_infos(self, application_numbers: List[str]) -> Dict[str, PatentBasicInfo]:
+        """
+        저장된 특허 기본 정보 여러 건 조회
+        
+        Args:
+            application_numbers: 출원번호 목록
+            
+        Returns:
+            출원번호별 특허 기본 정보 (저장되지 않은 특허는 제외)
+        """
+        if not application_numbers:
+            return {}
+        
+        placeholders = ",".join("?" * len(application_numbers))
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT application_number, basic_info FROM patents WHERE application_number IN ({placeholders})",
+                list(application_numbers)
+            ).fetchall()
+        return {application_number: PatentBasicInfo.model_validate_json(basic_info) for application_number, basic_info in rows}
+    
+    def stats(self) -> Dict[str, object]:
+        """저장소 통계"""
+        with self.lock:
+            total, with_detail, with_pdf = self.connection.execute(
+                "SELECT COUNT(*), COUNT(detail), SUM(pdf_downloaded) FROM patents"
+            ).fetchone()
+        return {
+            "db_path": self.db_path,
+            "patents": total,
+            "with_detail": with_detail,
+            "pdfs_downloaded": with_pdf or 0,
+            "seen_set_bytes": self.seen.numbers.itemsize * len(self.seen.numbers)
+        }
+    
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self.lock:
+            self.connection.close()
+
+
+# 전역 특허 저장소 인스턴스 (처음 사용할 때 결과 디렉토리에 DB 생성)
+patent_store = LazyProxy(lambda: PatentStore(os.path.join(settings.output_dir, "patents.db")))
@@ -0,0 +1,71 @@
+"""
+KIPRIS 요청 속도 제한 서비스
+"""
+
+import threading
+import time
+from typing import Optional
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기
+    
+    여러 태스크/스레드가 하나의 인스턴스를 공유하여 KIPRIS 호출량을
+    전역적으로 제한한다. acquire()는 블로킹 호출이므로 스레드 풀에서 사용한다.
+    """
+    
+    def __init__(self, rate: Optional[float] = None, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (None 또는 0 이하이면 제한 없음)
+            burst: 한 번에 연속으로 허용하는 최대 요청 수
+        """
+        self.lock = threading.Lock()
+        self.burst = max(1, burst)
+        self.rate = None
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.set_rate(rate)
+    
+    def set_rate(self, rate: Optional[float]) -> None:
+        """
+        초당 허용 요청 수 변경
+        
+        Args:
+            rate: 초당 허용 요청 수 (None 또는 0 이하이면 제한 없음)
+        """
+        with self.lock:
+            self.rate = rate if rate and rate > 0 else None
+    
+    def acquire(self) -> float:
+        """
+        요청 1건을 보낼 수 있을 때까지 대기
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                if self.rate is None:
+                    return waited
+                
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+# 전역 속도 제한기 인스턴스 (요청 간 지연 시간 설정을 초당 요청 수로 환산)
+rate_limiter = LazyProxy(lambda: RateLimiter(rate=1.0 / settings.delay if settings.delay > 0 else None))
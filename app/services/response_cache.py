@@ -0,0 +1,181 @@
+"""
+API 응답 캐시 서비스
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics
+
+
+class CacheEntry:
+    """직렬화된 응답 본문과 검증자(ETag, Last-Modified)"""
+    
+    __slots__ = ("body", "etag", "last_modified", "created_at")
+    
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.last_modified = time.time()
+        self.created_at = time.monotonic()
+    
+    def age(self) -> float:
+        """저장 후 경과 시간 (초)"""
+        return time.monotonic() - self.created_at
+
+
+class ResponseCache:
+    """
+    정규화된 요청 키 기반의 LRU 응답 캐시
+    
+    TTL 안의 항목은 그대로(fresh) 반환하고, TTL이 지났지만 stale 기간 안이면
+    기존 항목을 반환하면서 백그라운드에서 다시 계산한다(stale-while-revalidate).
+    응답 본문은 직렬화된 bytes로 저장하므로 캐시 적중 시 다시 직렬화하지 않는다.
+    """
+    
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int, name: str = "response"):
+        """
+        Args:
+            ttl: 항목이 fresh로 취급되는 시간 (초)
+            stale_ttl: TTL 이후 stale 항목을 반환하며 재검증하는 추가 시간 (초)
+            max_entries: 최대 항목 수
+            name: 메트릭 레이블용 캐시 이름
+        """
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.refreshing: Set[asyncio.Task] = set()
+    
+    @staticmethod
+    def make_key(namespace: str, payload: dict) -> str:
+        """
+        정규화된 요청으로 캐시 키 생성
+        
+        Args:
+            namespace: 엔드포인트 구분자
+            payload: 기본값이 채워진 요청 파라미터
+        
+        Returns:
+            캐시 키
+        """
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return f"{namespace}:{hashlib.sha256(encoded).hexdigest()}"
+    
+    def get(self, key: str) -> Tuple[Optional[CacheEntry], str]:
+        """
+        캐시 항목 조회
+        
+        Args:
+            key: 캐시 키
+        
+        Returns:
+            (캐시 항목, 상태) - 상태는 "fresh", "stale", "miss" 중 하나
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, "miss"
+        
+        age = entry.age()
+        if age < self.ttl:
+            self.entries.move_to_end(key)
+            return entry, "fresh"
+        if age < self.ttl + self.stale_ttl:
+            self.entries.move_to_end(key)
+            return entry, "stale"
+        
+        del self.entries[key]
+        return None, "miss"
+    
+    def set(self, key: str, body: bytes) -> CacheEntry:
+        """
+        캐시 항목 저장
+        
+        Args:
+            key: 캐시 키
+            body: 직렬화된 응답 본문
+        
+        Returns:
+            저장된 캐시 항목
+        """
+        entry = CacheEntry(body)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        
+        return entry
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self.entries.clear()
+    
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> CacheEntry:
+        """동일한 키의 동시 계산을 하나로 합쳐 계산 후 저장"""
+        future = self.inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            entry = self.set(key, await compute())
+            future.set_result(entry)
+            return entry
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고가 출력되지 않도록 예외를 조회 처리
+            raise
+        finally:
+            self.inflight.pop(key, None)
+    
+    async def _refresh(self, key: str, compute: Callable[[], Awaitable[bytes]]) -> None:
+        """stale 항목 백그라운드 재계산"""
+        try:
+            await self._compute(key, compute)
+        except Exception as e:
+            print(f"캐시 재검증 실패 ({key}): {e}")
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]]
+    ) -> Tuple[CacheEntry, str]:
+        """
+        캐시 조회 후 없으면 계산
+        
+        Args:
+            key: 캐시 키
+            compute: 직렬화된 응답 본문을 반환하는 코루틴 함수
+        
+        Returns:
+            (캐시 항목, 상태) - 상태는 "fresh", "stale", "miss" 중 하나
+        """
+        entry, state = self.get(key)
+        metrics.cache_requests.inc(cache=self.name, result="hit" if state == "fresh" else state)
+        
+        if state == "stale" and key not in self.inflight:
+            refresh = asyncio.create_task(self._refresh(key, compute))
+            self.refreshing.add(refresh)
+            refresh.add_done_callback(self.refreshing.discard)
+        
+        if entry is not None:
+            return entry, state
+        
+        return await self._compute(key, compute), "miss"
+
+
+# 전역 응답 캐시 인스턴스 (처음 사용할 때 생성)
+response_cache = LazyProxy(lambda: ResponseCache(
+    ttl=settings.cache_ttl_seconds,
+    stale_ttl=settings.cache_stale_seconds,
+    max_entries=settings.cache_max_entries
+))
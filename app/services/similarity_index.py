@@ -0,0 +1,510 @@
+"""
+청구항 유사 특허 검색 서비스 (문자 n-gram TF-IDF 희소 색인)
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core.minhash import ngram_hashes
+from app.core import tracing
+from app.models.schemas import PatentDetailInfo
+
+# 특징 공간 크기 (해시한 n-gram을 이 범위로 접음)와 n-gram 길이
+NUM_FEATURES = 1 << 20
+NGRAM_SIZES = (2, 3)
+
+# n-gram당 읽을 최대 역색인 항목 수와 정확한 코사인으로 다시 계산할 후보 수
+POSTINGS_PER_TERM = 4096
+RERANK_CANDIDATES = 200
+
+
+def term_vector(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    텍스트의 n-gram 빈도 벡터
+    
+    Args:
+        text: 텍스트
+    
+    Returns:
+        (정렬된 특징 번호 uint32 배열, 로그 빈도 1 + log(tf) float32 배열)
+    """
+    hashes = [
+        (ngram_hashes(text, size) ^ np.uint64(size)) % np.uint64(NUM_FEATURES)
+        for size in NGRAM_SIZES
+    ]
+    terms, counts = np.unique(np.concatenate(hashes).astype(np.uint32), return_counts=True)
+    return terms, (1.0 + np.log(counts)).astype(np.float32)
+
+
+def gather(indptr: np.ndarray, positions: np.ndarray, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSR/CSC 행 여러 개의 원소 위치를 한 번에 계산
+    
+    Args:
+        indptr: 행 시작 위치 배열
+        positions: 읽을 행 번호
+        limit: 행마다 앞에서부터 읽을 최대 원소 수 (None이면 전체)
+    
+    Returns:
+        (원소별 행 순서(positions 기준), 원소 위치) 배열
+    """
+    starts = np.asarray(indptr[positions], dtype=np.int64)
+    lengths = np.asarray(indptr[positions + 1], dtype=np.int64) - starts
+    if limit is not None:
+        np.minimum(lengths, limit, out=lengths)
+    owners = np.repeat(np.arange(len(positions)), lengths)
+    offsets = np.arange(int(lengths.sum()), dtype=np.int64) - np.repeat(np.cumsum(lengths) - lengths - starts, lengths)
+    return owners, offsets
+
+
+class Segment:
+    """
+    특허-n-gram 희소 행렬 (CSR)과 n-gram-특허 역색인 (CSC)
+    
+    역색인은 n-gram마다 빈도 / 특허 벡터 크기가 큰 특허부터 정렬(impact order)하여, 흔한 n-gram은 앞부분만 읽어도
+    점수에 크게 기여하는 특허를 찾을 수 있게 한다. 디스크의 기본 세그먼트는 .npy 파일을 메모리 매핑하여
+    필요한 부분만 읽는다.
+    """
+    
+    ARRAYS = ("doc_indptr", "doc_terms", "doc_tf", "doc_norm", "term_indptr", "term_docs", "term_tf")
+    
+    def __init__(self, keys: List[str], arrays: Dict[str, np.ndarray]):
+        self.keys = keys
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @property
+    def inverted(self) -> bool:
+        """역색인이 있는지 여부"""
+        return len(self.term_indptr) > 0
+    
+    @classmethod
+    def build(
+        cls,
+        keys: List[str],
+        vectors: List[Tuple[np.ndarray, np.ndarray]],
+        idf: Callable[[np.ndarray], np.ndarray],
+        inverted: bool = True
+    ) -> "Segment":
+        """
+        특허별 벡터로 세그먼트 생성
+        
+        Args:
+            keys: 출원번호 목록
+            vectors: 출원번호별 (특징 번호, 로그 빈도)
+            idf: 특징 번호 배열의 IDF를 돌려주는 함수 (특허 벡터 크기 계산용)
+            inverted: 역색인 생성 여부 (작은 추가 세그먼트는 모든 특허와 바로 비교하므로 생략)
+        
+        Returns:
+            세그먼트
+        """
+        lengths = np.array([len(terms) for terms, _ in vectors], dtype=np.int64)
+        doc_indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=doc_indptr[1:])
+        doc_terms = np.concatenate([terms for terms, _ in vectors]) if vectors else np.empty(0, dtype=np.uint32)
+        doc_tf = np.concatenate([tf for _, tf in vectors]) if vectors else np.empty(0, dtype=np.float32)
+        doc_ids = np.repeat(np.arange(len(vectors), dtype=np.int32), lengths)
+        
+        weights = doc_tf * idf(doc_terms)
+        doc_norm = np.sqrt(np.bincount(doc_ids, weights=weights * weights, minlength=len(vectors))).astype(np.float32)
+        
+        arrays = {
+            "doc_indptr": doc_indptr,
+            "doc_terms": doc_terms,
+            "doc_tf": doc_tf,
+            "doc_norm": doc_norm,
+            "term_indptr": np.empty(0, dtype=np.int64),
+            "term_docs": np.empty(0, dtype=np.int32),
+            "term_tf": np.empty(0, dtype=np.float32)
+        }
+        if inverted:
+            order = np.lexsort((-doc_tf / np.maximum(doc_norm[doc_ids], 1e-9), doc_terms))
+            arrays["term_indptr"] = np.zeros(NUM_FEATURES + 1, dtype=np.int64)
+            np.cumsum(np.bincount(doc_terms, minlength=NUM_FEATURES), out=arrays["term_indptr"][1:])
+            arrays["term_docs"] = doc_ids[order]
+            arrays["term_tf"] = doc_tf[order]
+        return cls(keys, arrays)
+    
+    @classmethod
+    def load(cls, directory: str) -> "Segment":
+        """디스크의 세그먼트를 메모리 매핑으로 로드"""
+        with open(os.path.join(directory, "keys.json"), 'r', encoding='utf-8') as f:
+            keys = json.load(f)
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in cls.ARRAYS}
+        return cls(keys, arrays)
+    
+    def save(self, directory: str) -> None:
+        """세그먼트를 디렉토리에 저장"""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "keys.json"), 'w', encoding='utf-8') as f:
+            json.dump(self.keys, f)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+    
+    def vector(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        """특허 하나의 (특징 번호, 로그 빈도)"""
+        start, end = self.doc_indptr[row], self.doc_indptr[row + 1]
+        return np.asarray(self.doc_terms[start:end]), np.asarray(self.doc_tf[start:end])
+    
+    def vectors(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """모든 특허의 (특징 번호, 로그 빈도)"""
+        return [self.vector(row) for row in range(len(self.keys))]
+    
+    def scores(self, terms: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        역색인으로 계산한 질의 n-gram 기준 근사 코사인 유사도 (n-gram당 기여도 상위 POSTINGS_PER_TERM개만 읽음)
+        
+        Args:
+            terms: 질의 특징 번호
+            weights: 질의 가중치 (질의 tf × idf × idf / |질의|)
+        
+        Returns:
+            특허별 점수
+        """
+        owners, offsets = gather(self.term_indptr, terms.astype(np.int64), POSTINGS_PER_TERM)
+        contributions = self.term_tf[offsets] * weights[owners]
+        totals = np.bincount(self.term_docs[offsets], weights=contributions, minlength=len(self.keys))
+        return totals / np.maximum(self.doc_norm, 1e-9)
+    
+    def cosine(self, rows: np.ndarray, terms: np.ndarray, query: np.ndarray, idf: np.ndarray) -> np.ndarray:
+        """
+        저장된 n-gram 전체로 계산한 정확한 코사인 유사도
+        
+        Args:
+            rows: 계산할 특허 행 번호
+            terms: 질의 특징 번호 (정렬됨)
+            query: 질의 가중치 (질의 tf × idf / |질의|)
+            idf: 질의 특징별 IDF
+        
+        Returns:
+            rows 순서의 코사인 유사도
+        """
+        owners, offsets = gather(self.doc_indptr, rows)
+        doc_terms = self.doc_terms[offsets]
+        positions = np.minimum(np.searchsorted(terms, doc_terms), len(terms) - 1)
+        matched = terms[positions] == doc_terms
+        positions = positions[matched]
+        contributions = query[positions] * self.doc_tf[offsets[matched]] * idf[positions]
+        dots = np.bincount(owners[matched], weights=contributions, minlength=len(rows))
+        return dots / np.maximum(self.doc_norm[rows], 1e-9)
+
+
+class SimilarityIndex:
+    """
+    청구항/초록 내용 기준 유사 특허 색인
+    
+    특허마다 청구항(설정에 따라 독립항만)과 초록에서 공백을 없앤 문자 2/3-gram을 해시하여 TF-IDF 벡터를 만들고, 가중치가 큰
+    terms_per_patent개만 남겨 희소 행렬로 저장한다. 질의는 질의 특허 n-gram의 역색인에서
+    기여도가 큰 앞부분만 읽어 후보 점수를 모은 뒤 상위 후보를 정확한 코사인 유사도로 다시 정렬한다.
+    
+    디스크의 기본 세그먼트(.npy 메모리 매핑)는 바꾸지 않고, 새 특허는 메모리의 추가 세그먼트와
+    delta.jsonl에 쌓았다가 compact_every건마다 기본 세그먼트와 합쳐 새 세대로 저장한다.
+    n-gram별 문서 빈도(df)는 메모리 매핑한 파일에 바로 더한다.
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        terms_per_patent: int = 256,
+        compact_every: int = 2000,
+        independent_only: bool = False
+    ):
+        """
+        Args:
+            directory: 색인 디렉토리
+            terms_per_patent: 특허당 저장할 n-gram 수
+            compact_every: 추가 세그먼트를 기본 세그먼트와 합치는 특허 수
+            independent_only: 종속항을 빼고 독립항(과 초록)만 색인할지 여부
+        """
+        self.directory = directory
+        self.terms_per_patent = terms_per_patent
+        self.compact_every = compact_every
+        self.independent_only = independent_only
+        self.lock = threading.RLock()
+        self.meta_file = os.path.join(directory, "meta.json")
+        self.delta_file = os.path.join(directory, "delta.jsonl")
+        self.load()
+    
+    def load(self) -> None:
+        """
+        디스크 색인 로드
+        
+        색인할 때의 설정(independent_only)이 현재 설정과 다르면 점수를 비교할 수 없으므로 디스크 색인은
+        건드리지 않고 빈 색인으로 시작하며, 새 특허도 추가하지 않는다 (outdated, run.py similar --rebuild로 다시 색인).
+        """
+        meta = {}
+        if os.path.exists(self.meta_file):
+            with open(self.meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        self.outdated = bool(meta or os.path.exists(self.delta_file)) and meta.get("independent_only", False) != self.independent_only
+        
+        self.base_rows: Dict[str, int] = {}
+        self.delta_keys: List[str] = []
+        self.delta_vectors: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.delta_rows: Dict[str, int] = {}
+        self.delta_segment: Optional[Segment] = None
+        
+        if self.outdated:
+            print(
+                "유사 특허 색인 설정(similarity_independent_claims_only)이 색인을 만들 때와 달라 기존 색인을 사용하지 않습니다. "
+                "python run.py similar --rebuild로 다시 색인하세요."
+            )
+            self.df = np.zeros(NUM_FEATURES, dtype=np.int32)
+            self.generation = 0
+            self.base = Segment.build([], [], self.idf)
+            return
+        
+        os.makedirs(self.directory, exist_ok=True)
+        df_file = os.path.join(self.directory, "df.npy")
+        if not os.path.exists(df_file):
+            np.save(df_file, np.zeros(NUM_FEATURES, dtype=np.int32))
+        self.df = np.load(df_file, mmap_mode="r+")
+        
+        self.generation = meta.get("generation", 0)
+        if not meta:
+            self.write_meta(0, 0)
+        if self.generation:
+            self.base = Segment.load(self.segment_dir(self.generation))
+        else:
+            self.base = Segment.build([], [], self.idf)
+        self.base_rows = {key: row for row, key in enumerate(self.base.keys)}
+        self.load_delta()
+    
+    def reset(self) -> None:
+        """디스크 색인을 지우고 빈 색인으로 다시 시작 (run.py similar --rebuild에서 설정이 바뀐 색인을 버릴 때)"""
+        with self.lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.load()
+    
+    def write_meta(self, generation: int, patents: int) -> None:
+        """현재 세대와 색인 설정 저장"""
+        temp_file = self.meta_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "generation": generation,
+                "patents": patents,
+                "terms_per_patent": self.terms_per_patent,
+                "independent_only": self.independent_only
+            }, f)
+        os.replace(temp_file, self.meta_file)
+    
+    def segment_dir(self, generation: int) -> str:
+        """세대별 기본 세그먼트 디렉토리"""
+        return os.path.join(self.directory, f"base_{generation}")
+    
+    def load_delta(self) -> None:
+        """아직 합치지 않은 추가 특허 로드"""
+        if not os.path.exists(self.delta_file):
+            return
+        
+        with open(self.delta_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 저장 중 끊긴 마지막 줄
+                key = item["key"]
+                if key in self.base_rows or key in self.delta_rows:
+                    continue
+                self.delta_rows[key] = len(self.delta_keys)
+                self.delta_keys.append(key)
+                self.delta_vectors.append((
+                    np.array(item["terms"], dtype=np.uint32),
+                    np.array(item["tf"], dtype=np.float32)
+                ))
+    
+    def __len__(self) -> int:
+        return len(self.base_rows) + len(self.delta_rows)
+    
+    def contains(self, application_number: str) -> bool:
+        """색인에 있는 특허인지 확인"""
+        return application_number in self.base_rows or application_number in self.delta_rows
+    
+    def idf(self, terms: np.ndarray) -> np.ndarray:
+        """특징별 IDF (smooth idf: log((N + 1) / (df + 1)) + 1)"""
+        count = len(self.base_rows) + len(self.delta_rows)
+        return (np.log((count + 1.0) / (self.df[terms].astype(np.float32) + 1.0)) + 1.0).astype(np.float32)
+    
+    def text_of(self, detail_info: PatentDetailInfo) -> str:
+        """색인할 텍스트 (청구항(independent_only면 독립항만) + 초록)"""
+        claims = detail_info.claims
+        if self.independent_only and detail_info.independent_claims:
+            claims = [claims[claim_no - 1] for claim_no in detail_info.independent_claims]
+        return "\n".join(claims + [detail_info.basic_info.abstract or ""])
+    
+    def add(self, detail_info: PatentDetailInfo, compact: bool = True) -> bool:
+        """
+        특허를 색인에 추가 (이미 있거나 청구항이 없으면 무시)
+        
+        Args:
+            detail_info: 특허 상세 정보
+            compact: 추가 세그먼트가 compact_every건이 되면 병합할지 여부 (대량 추가 후 한 번에 병합할 때 False)
+        
+        Returns:
+            추가 여부
+        """
+        application_number = detail_info.basic_info.application_number
+        if self.outdated or not detail_info.claims or self.contains(application_number):
+            return False
+        
+        with tracing.span("tfidf_index"):
+            terms, tf = term_vector(self.text_of(detail_info))
+        
+        with self.lock:
+            if self.contains(application_number):
+                return False
+            
+            # 문서 빈도는 잘라내기 전의 모든 n-gram으로 계산
+            np.add.at(self.df, terms, 1)
+            if len(terms) > self.terms_per_patent:
+                keep = np.argpartition(tf * self.idf(terms), -self.terms_per_patent)[-self.terms_per_patent:]
+                keep.sort()
+                terms, tf = terms[keep], tf[keep]
+            
+            self.delta_rows[application_number] = len(self.delta_keys)
+            self.delta_keys.append(application_number)
+            self.delta_vectors.append((terms, tf))
+            self.delta_segment = None
+            with open(self.delta_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    "key": application_number,
+                    "terms": terms.tolist(),
+                    "tf": [round(value, 4) for value in tf.tolist()]
+                }) + "\n")
+            
+            if compact and len(self.delta_keys) >= self.compact_every:
+                self.compact()
+        return True
+    
+    def compact(self) -> None:
+        """추가 세그먼트를 기본 세그먼트와 합쳐 새 세대로 저장 (특허 벡터 크기도 현재 IDF로 다시 계산)"""
+        with self.lock:
+            started = time.perf_counter()
+            keys = list(self.base.keys) + self.delta_keys
+            segment = Segment.build(keys, self.base.vectors() + self.delta_vectors, self.idf)
+            
+            generation = self.generation + 1
+            segment.save(self.segment_dir(generation))
+            self.df.flush()
+            self.write_meta(generation, len(keys))
+            if os.path.exists(self.delta_file):
+                os.remove(self.delta_file)
+            
+            old_dir = self.segment_dir(self.generation)
+            self.generation = generation
+            self.base = Segment.load(self.segment_dir(generation))
+            self.base_rows = {key: row for row, key in enumerate(self.base.keys)}
+            self.delta_keys, self.delta_vectors, self.delta_rows = [], [], {}
+            self.delta_segment = None
+            shutil.rmtree(old_dir, ignore_errors=True)
+            print(f"유사 특허 색인 병합: {len(keys)}건, {time.perf_counter() - started:.2f}초")
+    
+    def vector_of(self, application_number: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """색인된 특허의 (특징 번호, 로그 빈도)"""
+        if application_number in self.base_rows:
+            return self.base.vector(self.base_rows[application_number])
+        if application_number in self.delta_rows:
+            return self.delta_vectors[self.delta_rows[application_number]]
+        return None
+    
+    def similar(self, application_number: str, limit: int = 20) -> Optional[List[Tuple[str, float]]]:
+        """
+        내용이 비슷한 특허
+        
+        Args:
+            application_number: 기준 출원번호
+            limit: 최대 결과 수
+        
+        Returns:
+            (출원번호, 코사인 유사도) 목록 (유사도 내림차순, 색인에 없는 특허면 None)
+        
+        Raises:
+            RuntimeError: 색인 설정이 바뀌어 다시 색인해야 하는 경우
+        """
+        if self.outdated:
+            raise RuntimeError("유사 특허 색인 설정이 바뀌었습니다. python run.py similar --rebuild로 다시 색인하세요.")
+        
+        with self.lock:
+            vector = self.vector_of(application_number)
+            if vector is None:
+                return None
+            if self.delta_segment is None:
+                self.delta_segment = Segment.build(self.delta_keys, self.delta_vectors, self.idf, inverted=False)
+            segments = [self.base, self.delta_segment]
+            terms, tf = vector
+            idf = self.idf(terms)
+        
+        query = tf * idf
+        query /= max(float(np.linalg.norm(query)), 1e-9)
+        
+        results: List[Tuple[float, str]] = []
+        for segment in segments:
+            if not len(segment):
+                continue
+            
+            # 역색인으로 후보 점수를 계산하고 (흔한 n-gram은 앞부분만 읽으므로 근사값),
+            # 상위 후보는 저장된 n-gram 전체로 정확한 코사인 유사도 계산
+            if segment.inverted:
+                scores = segment.scores(terms, query * idf)
+                count = min(RERANK_CANDIDATES, len(scores))
+                rows = np.argpartition(scores, -count)[-count:]
+                rows = rows[scores[rows] > 0]
+            else:
+                rows = np.arange(len(segment))
+            exact = segment.cosine(rows, terms, query, idf)
+            results.extend(
+                (float(score), segment.keys[row]) for row, score in zip(rows.tolist(), exact.tolist()) if score > 0
+            )
+        
+        results.sort(reverse=True)
+        return [(key, score) for score, key in results if key != application_number][:limit]
+    
+    def rebuild_from_store(self) -> int:
+        """
+        특허 저장소에 청구항이 저장된 특허 중 색인에 없는 특허를 모두 추가하고 병합
+        
+        색인 설정이 바뀐 색인(outdated)은 지우고 처음부터 다시 색인한다.
+        
+        Returns:
+            추가한 특허 수
+        """
+        from app.services.patent_store import patent_store
+        
+        if self.outdated:
+            self.reset()
+        added = 0
+        for detail_info in patent_store.iter_details():
+            added += self.add(detail_info, compact=False)
+        if self.delta_keys:
+            self.compact()
+        return added
+    
+    def stats(self) -> Dict[str, object]:
+        """색인 통계"""
+        return {
+            "patents": len(self),
+            "base_patents": len(self.base_rows),
+            "delta_patents": len(self.delta_rows),
+            "generation": self.generation,
+            "terms_per_patent": self.terms_per_patent,
+            "independent_only": self.independent_only,
+            "outdated": self.outdated
+        }
+
+
+# 전역 유사 특허 색인 인스턴스 (처음 사용할 때 디스크 색인 로드)
+similarity_index = LazyProxy(lambda: SimilarityIndex(
+    os.path.join(settings.output_dir, "similarity"),
+    terms_per_patent=settings.similarity_terms_per_patent,
+    compact_every=settings.similarity_compact_every,
+    independent_only=settings.similarity_independent_claims_only
+))
@@ -0,0 +1,251 @@
+"""
+저장된 특허 등록상태 일괄 갱신 서비스
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics
+from app.services.kipris_api import kipris_api
+from app.services.patent_processor import patent_processor
+from app.services.patent_store import patent_store
+
+# 한 번의 검색 요청으로 받을 수 있는 최대 결과 수 (KIPRIS numOfRows 상한)
+PAGE_SIZE = 500
+
+# 등록상태별 변경 가능성 가중치 (공개 → 등록/거절 전환이 가장 잦고, 소멸/거절 등은 바뀌지 않음)
+STATUS_WEIGHTS = {
+    "공개": 3.0,
+    "등록": 1.0,
+    "소멸": 0.0,
+    "거절": 0.0,
+    "취하": 0.0,
+    "포기": 0.0,
+    "무효": 0.0
+}
+DEFAULT_STATUS_WEIGHT = 1.0
+
+
+class StatusRefresher:
+    """
+    저장된 특허의 등록상태(register_status)를 다시 확인하는 갱신 작업
+    
+    특허마다 상세 조회를 하지 않고, 등록권자 코드별 getAdvancedSearch를 500건 단위로
+    페이지 조회하여 그 등록권자의 저장 특허 등록상태를 한꺼번에 확인한다. 등록권자는
+    마지막 확인 후 지난 시간 × 등록상태별 변경 가능성으로 우선순위를 매기고, 등록상태가
+    바뀐 행만 갱신한다.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = False
+        self.last_report: Optional[Dict[str, object]] = None
+    
+    def holder_priority(self, summary: Dict[str, object], now: datetime) -> float:
+        """
+        등록권자 갱신 우선순위 (클수록 먼저)
+        
+        Args:
+            summary: PatentStore.holder_summaries 항목
+            now: 기준 시간
+        
+        Returns:
+            우선순위 점수
+        """
+        checked_at = summary["refreshed_at"] or summary["oldest_fetched_at"]
+        hours = max((now - datetime.fromisoformat(checked_at)).total_seconds() / 3600, 0.0)
+        weight = sum(
+            STATUS_WEIGHTS.get(status, DEFAULT_STATUS_WEIGHT) * count
+            for status, count in summary["statuses"].items()
+        )
+        return weight * hours
+    
+    def plan(self, holder_codes: Optional[List[str]] = None) -> List[str]:
+        """
+        갱신할 등록권자 코드 목록 (우선순위순)
+        
+        Args:
+            holder_codes: 이 등록권자 코드만 갱신 (없으면 저장된 모든 등록권자)
+        
+        Returns:
+            등록권자 코드 목록
+        """
+        now = datetime.now()
+        summaries = patent_store.holder_summaries()
+        if holder_codes:
+            wanted = set(holder_codes)
+            summaries = [summary for summary in summaries if summary["right_holder_code"] in wanted]
+        else:
+            # 바뀔 수 있는 등록상태가 없는 등록권자는 제외
+            summaries = [summary for summary in summaries if self.holder_priority(summary, now) > 0]
+        
+        summaries.sort(key=lambda summary: self.holder_priority(summary, now), reverse=True)
+        return [summary["right_holder_code"] for summary in summaries]
+    
+    def run(self, max_requests: Optional[int] = None, holder_codes: Optional[List[str]] = None) -> Dict[str, object]:
+        """
+        등록상태 갱신 실행 (블로킹, KIPRIS 요청 포함)
+        
+        Args:
+            max_requests: 이번 실행의 최대 KIPRIS 검색 요청 수 (기본값: 설정값)
+            holder_codes: 이 등록권자 코드만 갱신
+        
+        Returns:
+            갱신 보고서 (요청 수, 확인/변경 특허 수, 등록상태 전환별 건수)
+        """
+        with self.lock:
+            if self.running:
+                raise RuntimeError("등록상태 갱신이 이미 실행 중입니다.")
+            self.running = True
+        
+        if max_requests is None:
+            max_requests = settings.status_refresh_max_requests
+        
+        started_at = datetime.now()
+        transitions: Counter = Counter()
+        report: Dict[str, object] = {
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "kipris_requests": 0,
+            "holders_refreshed": 0,
+            "holders_pending": 0,
+            "checked": 0,
+            "changed": 0,
+            "missing": 0,
+            "errors": []
+        }
+        
+        try:
+            queue = self.plan(holder_codes)
+            for index, code in enumerate(queue):
+                if report["kipris_requests"] >= max_requests:
+                    report["holders_pending"] = len(queue) - index
+                    break
+                
+                try:
+                    complete = self.refresh_holder(code, max_requests, report, transitions)
+                except Exception as e:
+                    print(f"등록상태 갱신 실패 ({code}): {e}")
+                    report["errors"].append({"right_holder_code": code, "error": str(e)})
+                    continue
+                
+                if complete:
+                    report["holders_refreshed"] += 1
+                else:
+                    report["holders_pending"] = len(queue) - index
+                    break
+        finally:
+            report["transitions"] = dict(transitions.most_common())
+            report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+            report["duration_seconds"] = round((datetime.now() - started_at).total_seconds(), 3)
+            with self.lock:
+                self.running = False
+                self.last_report = report
+        
+        print(
+            f"등록상태 갱신 완료: 요청 {report['kipris_requests']}건, 확인 {report['checked']}건, "
+            f"변경 {report['changed']}건"
+        )
+        return report
+    
+    def refresh_holder(
+        self,
+        right_holder_code: str,
+        max_requests: int,
+        report: Dict[str, object],
+        transitions: Counter
+    ) -> bool:
+        """
+        등록권자 한 곳의 저장 특허 등록상태 확인
+        
+        저장된 특허를 모두 확인했거나 마지막 페이지에 도달하면 끝난다. 요청 수 한도에 걸려
+        중간에 멈추거나 요청이 실패해도 그때까지 확인한 변경은 반영하고, 완료로는 기록하지 않는다.
+        
+        Args:
+            right_holder_code: 등록권자 코드
+            max_requests: 최대 KIPRIS 검색 요청 수
+            report: 갱신 보고서 (요청/확인/변경 수 누적)
+            transitions: 등록상태 전환별 건수 (누적)
+        
+        Returns:
+            등록권자 확인 완료 여부
+        """
+        stored = patent_store.holder_statuses(right_holder_code)
+        remaining = set(stored)
+        changed: List = []
+        complete = False
+        page_no = 1
+        
+        try:
+            while report["kipris_requests"] < max_requests:
+                search_result = kipris_api.search_patents(right_holder_code=right_holder_code, page_no=page_no, num_rows=PAGE_SIZE)
+                report["kipris_requests"] += 1
+                if search_result is None:
+                    raise RuntimeError("KIPRIS 검색 요청에 실패했습니다.")
+                
+                patents = patent_processor.extract_patent_list(search_result)
+                for patent in patents:
+                    application_number = patent.application_number
+                    if application_number not in remaining:
+                        continue
+                    remaining.discard(application_number)
+                    report["checked"] += 1
+                
+                    previous = stored[application_number]
+                    current = patent.register_status.strip()
+                    if current != previous:
+                        changed.append(patent)
+                        transitions[f"{previous or '(없음)'}→{current or '(없음)'}"] += 1
+                        metrics.patent_status_changes.inc(previous=previous, current=current)
+                
+                if not remaining or len(patents) < PAGE_SIZE:
+                    complete = True
+                    break
+                page_no += 1
+        finally:
+            # 실패한 페이지 전까지 확인한 변경도 반영 (이미 사용한 요청을 버리지 않음)
+            patent_store.update_statuses(changed)
+            report["changed"] += len(changed)
+        
+        if complete:
+            # 마지막 페이지까지 나오지 않은 특허는 검색 결과에서 빠진 것 (등록권자 변경 등)
+            report["missing"] += len(remaining)
+            patent_store.mark_holder_refreshed(right_holder_code, len(stored), len(changed))
+        return complete
+    
+    def last_refreshed_at(self) -> Optional[str]:
+        """특허 저장소에 기록된 가장 최근 등록권자 갱신 시간 (서버를 다시 시작해도 유지)"""
+        refreshed = [summary["refreshed_at"] for summary in patent_store.holder_summaries() if summary["refreshed_at"]]
+        return max(refreshed) if refreshed else None
+    
+    async def run_scheduler(self, interval_hours: float, tick_seconds: float = 60.0) -> None:
+        """
+        주기마다 등록상태 갱신을 실행하는 스케줄러 (취소될 때까지 실행)
+        
+        서버를 시작할 때마다 바로 실행하지 않도록, 저장소에 기록된 마지막 갱신 시간부터 주기를 세고
+        기록이 없으면 시작 시간부터 한 주기를 기다린다.
+        
+        Args:
+            interval_hours: 갱신 주기 (시간)
+            tick_seconds: 다음 실행 시간을 확인하는 간격 (초)
+        """
+        loop = asyncio.get_running_loop()
+        persisted = await loop.run_in_executor(None, self.last_refreshed_at)
+        started_at = persisted or datetime.now().isoformat(timespec="seconds")
+        while True:
+            last_run = self.last_report["started_at"] if self.last_report else started_at
+            due = (datetime.now() - datetime.fromisoformat(last_run)).total_seconds() >= interval_hours * 3600
+            
+            if due and not self.running:
+                try:
+                    await loop.run_in_executor(None, self.run)
+                except Exception as e:
+                    print(f"등록상태 갱신 스케줄러 오류: {e}")
+            await asyncio.sleep(tick_seconds)
+
+
+# 전역 등록상태 갱신 작업 인스턴스
+status_refresher = LazyProxy(StatusRefresher)
@@ -3,13 +3,25 @@
 """
 
 import uuid
+import json
 import asyncio
+import contextvars
+import hashlib
+import functools
+import os
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Optional
-from app.models.schemas import ProcessStatus, ProcessResult, PatentDetailInfo, ProcessRequest
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.models.schemas import (
+    ProcessStatus, ProcessResult, PatentBasicInfo, PatentDetailInfo, ProcessRequest,
+    BatchProcessRequest, BatchStatus
+)
 from app.services.patent_processor import patent_processor
+from app.services.holder_directory import holder_directory
 from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics, profiling, tracing
 
 
 class TaskManager:
@@ -18,6 +30,92 @@ class TaskManager:
     def __init__(self):
         self.tasks: Dict[str, ProcessStatus] = {}
         self.results: Dict[str, ProcessResult] = {}
+        self.fingerprints: Dict[str, str] = {}
+        self.handles: Dict[str, asyncio.Task] = {}
+        self.cancel_events: Dict[str, threading.Event] = {}
+        self.cancel_reasons: Dict[str, str] = {}
+        self.requests: Dict[str, ProcessRequest] = {}
+        self.batches: Dict[str, BatchStatus] = {}
+        self.batch_tasks: Dict[str, List[str]] = {}
+        self.batch_owned: Dict[str, List[str]] = {}
+        self.batch_details: Dict[str, Dict[str, asyncio.Future]] = {}
+        self.batch_handles: Dict[str, asyncio.Task] = {}
+    
+    def get_request_fingerprint(self, request: ProcessRequest) -> str:
+        """
+        처리 요청 지문 계산 (기본값을 채운 뒤 검색 결과에 영향을 주는 값만 사용)
+        
+        Args:
+            request: 처리 요청
+            
+        Returns:
+            요청 지문 (SHA-256 hex)
+        """
+        payload = {
+            "search_keyword": (request.search_keyword or settings.search_keyword).strip(),
+            "right_holder_code": (request.right_holder_code or settings.right_holder_code).strip(),
+            "max_patents": request.max_patents or settings.max_patents,
+            "save_claims": request.save_claims,
+            "download_pdfs": request.download_pdfs,
+            "profile": request.profile
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def resolve_holder(self, request: ProcessRequest) -> ProcessRequest:
+        """
+        등록권자명만 주어진 요청에 등록권자 디렉터리에서 찾은 등록권자 코드 채우기
+        
+        Args:
+            request: 처리 요청
+            
+        Returns:
+            등록권자 코드가 채워진 요청 (코드가 있거나 등록권자명도 없으면 그대로)
+            
+        Raises:
+            ValueError: 등록권자명을 디렉터리에서 찾지 못한 경우
+        """
+        if request.right_holder_code or not request.right_holder:
+            return request
+        right_holder_code = holder_directory.resolve_code(request.right_holder, None)
+        return request.model_copy(update={"right_holder_code": right_holder_code})
+    
+    def submit_task(self, request: ProcessRequest) -> Tuple[str, str]:
+        """
+        중복 요청을 확인한 뒤 태스크 생성
+        
+        동일한 요청이 처리 중이면 기존 태스크에 연결하고, 유효 기간 안에
+        완료된 결과가 있으면 그 결과를 재사용한다.
+        
+        Args:
+            request: 처리 요청
+            
+        Returns:
+            (태스크 ID, 처리 방식) - 처리 방식은 "created", "attached", "cached" 중 하나
+            
+        Raises:
+            ValueError: 등록권자명만 주어졌는데 등록권자 디렉터리에서 찾지 못한 경우
+        """
+        request = self.resolve_holder(request)
+        fingerprint = self.get_request_fingerprint(request)
+        existing_id = self.fingerprints.get(fingerprint)
+        existing = self.tasks.get(existing_id) if existing_id else None
+        
+        if existing:
+            if existing.status in ("pending", "processing"):
+                return existing_id, "attached"
+            
+            if (
+                existing.status == "completed"
+                and existing_id in self.results
+                and existing.end_time
+                and (datetime.now() - existing.end_time).total_seconds() <= settings.dedup_window_seconds
+            ):
+                return existing_id, "cached"
+        
+        task_id = self.create_task(request)
+        self.fingerprints[fingerprint] = task_id
+        return task_id, "created"
     
     def create_task(self, request: ProcessRequest) -> str:
         """
@@ -42,6 +140,7 @@ class TaskManager:
         )
         
         self.tasks[task_id] = task_status
+        self.requests[task_id] = request
         return task_id
     
     def get_task_status(self, task_id: str) -> Optional[ProcessStatus]:
@@ -92,6 +191,8 @@ class TaskManager:
             return
         
         task = self.tasks[task_id]
+        if status in ("completed", "failed", "cancelled") and task.status != status:
+            metrics.tasks_finished.inc(status=status)
         task.status = status
         
         if progress is not None:
@@ -103,17 +204,166 @@ class TaskManager:
         if processed_patents is not None:
             task.processed_patents = processed_patents
         
-        if status == "completed" or status == "failed":
+        if status in ("completed", "failed", "cancelled"):
             task.end_time = datetime.now()
     
-    async def process_patents_async(self, task_id: str, request: ProcessRequest) -> None:
+    def cancel_task(self, task_id: str) -> bool:
+        """
+        태스크 취소 요청
+        
+        대기 중인 태스크는 즉시 취소 상태가 되고, 처리 중인 태스크는 진행 중인
+        상세 정보 조회/PDF 다운로드를 중단한 뒤 부분 결과와 함께 취소 상태가 된다.
+        
+        Args:
+            task_id: 태스크 ID
+            
+        Returns:
+            취소 요청 성공 여부 (이미 종료된 태스크이면 False)
+        """
+        task = self.tasks.get(task_id)
+        if not task or task.status not in ("pending", "processing"):
+            return False
+        
+        self.cancel_reasons[task_id] = "사용자 요청으로 태스크가 취소되었습니다."
+        cancel_event = self.cancel_events.get(task_id)
+        if cancel_event is not None:
+            cancel_event.set()
+        
+        handle = self.handles.get(task_id)
+        if handle is not None and not handle.done():
+            handle.cancel()
+        else:
+            self.update_task_status(task_id, "cancelled", message=self.cancel_reasons.pop(task_id))
+        
+        return True
+    
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        블로킹 함수를 스레드 풀에서 실행 (이벤트 루프를 막지 않고 취소 가능하게 대기)
+        
+        현재 컨텍스트(트레이스/프로파일링 세션)를 복사하여 스레드에서도 같은 태스크로 기록한다.
+        
+        Args:
+            func: 실행할 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+            
+        Returns:
+            함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(context.run, profiling.wrap(func), *args, **kwargs)
+        )
+    
+    def store_partial_result(
+        self,
+        task_id: str,
+        processed_patents: List[PatentDetailInfo],
+        claims_saved: int,
+        pdfs_downloaded: int
+    ) -> None:
+        """
+        취소된 태스크의 부분 결과 저장
+        
+        Args:
+            task_id: 태스크 ID
+            processed_patents: 취소 전까지 처리된 특허 목록
+            claims_saved: 저장된 청구항 수
+            pdfs_downloaded: 다운로드된 PDF 수
+        """
+        self.results[task_id] = ProcessResult(
+            task_id=task_id,
+            patents=list(processed_patents),
+            claims_saved=claims_saved,
+            pdfs_downloaded=pdfs_downloaded,
+            output_directory=patent_processor.output_dir
+        )
+    
+    async def fetch_patent_detail(
+        self,
+        patent_info: PatentBasicInfo,
+        request: ProcessRequest,
+        cancel_event: threading.Event,
+        shared_details: Optional[Dict[str, asyncio.Future]] = None
+    ) -> PatentDetailInfo:
+        """
+        특허 상세 정보 조회 (공유 맵이 있으면 같은 출원번호를 한 번만 조회)
+        
+        Args:
+            patent_info: 특허 기본 정보
+            request: 처리 요청
+            cancel_event: 태스크 취소 이벤트
+            shared_details: 출원번호별 상세 정보 Future 맵 (배치 단위로 공유)
+            
+        Returns:
+            특허 상세 정보
+        """
+        key = patent_info.application_number
+        
+        while shared_details is not None and key in shared_details:
+            future = shared_details[key]
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 조회를 맡은 태스크가 취소된 경우 이 태스크가 다시 조회
+                if not future.cancelled():
+                    raise
+        
+        future = None
+        if shared_details is not None:
+            future = asyncio.get_running_loop().create_future()
+            shared_details[key] = future
+        
+        try:
+            detail_info = await self.run_blocking(
+                patent_processor.process_patent_details,
+                patent_info=patent_info,
+                include_claims=request.save_claims,
+                include_pdf=request.download_pdfs,
+                cancel_event=cancel_event
+            )
+        except BaseException:
+            if future is not None:
+                shared_details.pop(key, None)
+                future.cancel()
+            raise
+        
+        if future is not None:
+            future.set_result(detail_info)
+        return detail_info
+    
+    async def process_patents_async(
+        self,
+        task_id: str,
+        request: ProcessRequest,
+        shared_details: Optional[Dict[str, asyncio.Future]] = None
+    ) -> None:
         """
         비동기 특허 처리
         
         Args:
             task_id: 태스크 ID
             request: 처리 요청
+            shared_details: 배치 내에서 공유하는 출원번호별 상세 정보 Future 맵
         """
+        cancel_event = self.cancel_events.setdefault(task_id, threading.Event())
+        processed_patents: List[PatentDetailInfo] = []
+        claims_saved = 0
+        pdfs_downloaded = 0
+        
+        # 프로파일링 요청 시 이 태스크의 스레드 풀 작업을 하나의 세션으로 수집
+        profile_session = None
+        if request.profile:
+            profile_session = profiling.ProfileSession(profiling.new_profile_name("task", task_id))
+            profiling.current_session.set(profile_session)
+        
+        # 단계별 처리 시간 수집 (태스크마다 별도 컨텍스트이므로 다른 태스크와 섞이지 않음)
+        trace = tracing.Trace(f"task_{task_id}")
+        tracing.current_trace.set(trace)
+        
         try:
             self.update_task_status(task_id, "processing", 0, "특허 검색을 시작합니다...")
             
@@ -124,7 +374,8 @@ class TaskManager:
             max_patents = request.max_patents or settings.max_patents
             
             # 1. 특허 검색
-            patents = patent_processor.search_and_extract_patents(
+            patents = await self.run_blocking(
+                patent_processor.search_and_extract_patents,
                 search_keyword=search_keyword,
                 right_holder=right_holder,
                 right_holder_code=right_holder_code,
@@ -144,19 +395,15 @@ class TaskManager:
             )
             
             # 2. 상세 정보 처리
-            processed_patents = []
-            claims_saved = 0
-            pdfs_downloaded = 0
-            
             for i, patent_info in enumerate(patents):
-                # 상세 정보 처리
-                detail_info = patent_processor.process_patent_details(
-                    patent_info=patent_info,
-                    include_claims=request.save_claims,
-                    include_pdf=request.download_pdfs
+                # 상세 정보 처리 (배치에서는 다른 검색 조건과 중복된 특허를 재사용)
+                detail_info = await self.fetch_patent_detail(
+                    patent_info, request, cancel_event, shared_details
                 )
                 
                 processed_patents.append(detail_info)
+                metrics.patents_processed.inc()
+                metrics.patents_rate_meter.mark()
                 
                 # 통계 업데이트
                 if detail_info.claims:
@@ -165,6 +412,7 @@ class TaskManager:
                     pdfs_downloaded += 1
                 
                 # 진행률 업데이트
+                self.tasks[task_id].stage_timings = trace.stage_timings()
                 progress = int(10 + (i + 1) / len(patents) * 80)
                 self.update_task_status(
                     task_id,
@@ -173,21 +421,18 @@ class TaskManager:
                     f"특허 처리 중... ({i + 1}/{len(patents)})",
                     processed_patents=i + 1
                 )
-                
-                # API 호출 제한을 위한 지연
-                if i < len(patents) - 1:
-                    await asyncio.sleep(settings.delay)
             
             # 3. 요약 보고서 생성
             self.update_task_status(task_id, "processing", 95, "요약 보고서를 생성합니다...")
             
-            summary_report_path = patent_processor.create_summary_report(
+            summary_report_path = profiling.wrap(patent_processor.create_summary_report)(
                 patents=processed_patents,
                 claims_saved=claims_saved,
                 pdfs_downloaded=pdfs_downloaded,
                 search_keyword=search_keyword,
                 right_holder=right_holder,
-                right_holder_code=right_holder_code
+                right_holder_code=right_holder_code,
+                report_id=task_id[:8]
             )
             
             # 4. 결과 저장
@@ -209,6 +454,19 @@ class TaskManager:
                 f"처리 완료! 총 {len(processed_patents)}건의 특허를 처리했습니다."
             )
             
+        except asyncio.CancelledError:
+            # 진행 중인 스레드 작업(PDF 다운로드 등)도 중단하고 부분 결과 보존
+            cancel_event.set()
+            reason = self.cancel_reasons.pop(task_id, "처리 제한 시간을 초과하여 태스크가 취소되었습니다.")
+            self.store_partial_result(task_id, processed_patents, claims_saved, pdfs_downloaded)
+            self.update_task_status(
+                task_id,
+                "cancelled",
+                message=f"{reason} (부분 결과 {len(processed_patents)}건 보존)"
+            )
+            print(f"태스크 {task_id} 취소: {reason}")
+            raise
+            
         except Exception as e:
             self.update_task_status(
                 task_id,
@@ -216,18 +474,342 @@ class TaskManager:
                 message=f"처리 중 오류가 발생했습니다: {str(e)}"
             )
             print(f"태스크 {task_id} 처리 실패: {e}")
+        
+        finally:
+            self.cancel_events.pop(task_id, None)
+            self.finish_trace(task_id, trace)
+            if profile_session is not None:
+                profile_path = profile_session.dump(os.path.join(patent_processor.output_dir, "profiles"))
+                if task_id in self.tasks:
+                    self.tasks[task_id].profile_path = profile_path
+    
+    def finish_trace(self, task_id: str, trace: tracing.Trace) -> None:
+        """
+        태스크 종료 시 단계별 시간 저장 및 트레이스 파일 내보내기
+        
+        Args:
+            task_id: 태스크 ID
+            trace: 태스크 트레이스
+        """
+        task = self.tasks.get(task_id)
+        if task is None:
+            return
+        
+        task.stage_timings = trace.stage_timings()
+        if settings.save_traces:
+            try:
+                task.trace_path = trace.export(os.path.join(patent_processor.output_dir, "traces"))
+            except Exception as e:
+                print(f"트레이스 저장 실패 ({task_id}): {e}")
+    
+    async def run_task_with_deadline(
+        self,
+        task_id: str,
+        request: ProcessRequest,
+        shared_details: Optional[Dict[str, asyncio.Future]] = None
+    ) -> None:
+        """
+        제한 시간을 적용하여 태스크 실행
+        
+        Args:
+            task_id: 태스크 ID
+            request: 처리 요청
+            shared_details: 배치 내에서 공유하는 출원번호별 상세 정보 Future 맵
+        """
+        try:
+            await asyncio.wait_for(
+                self.process_patents_async(task_id, request, shared_details),
+                timeout=request.deadline_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
     
-    def start_background_task(self, task_id: str, request: ProcessRequest) -> None:
+    def launch_task(
+        self,
+        task_id: str,
+        request: ProcessRequest,
+        shared_details: Optional[Dict[str, asyncio.Future]] = None
+    ) -> Optional[asyncio.Task]:
         """
-        백그라운드 태스크 시작
+        실행 중인 이벤트 루프에 태스크 등록
+        
+        Args:
+            task_id: 태스크 ID
+            request: 처리 요청
+            shared_details: 배치 내에서 공유하는 출원번호별 상세 정보 Future 맵
+            
+        Returns:
+            asyncio 태스크 (이미 취소되었거나 없는 태스크이면 None)
+        """
+        task = self.tasks.get(task_id)
+        if task is None or task.status == "cancelled":
+            return None
+        
+        self.cancel_events[task_id] = threading.Event()
+        handle = asyncio.create_task(self.run_task_with_deadline(task_id, request, shared_details))
+        self.handles[task_id] = handle
+        handle.add_done_callback(lambda _: self.handles.pop(task_id, None))
+        return handle
+    
+    async def start_background_task(self, task_id: str, request: ProcessRequest) -> None:
+        """
+        백그라운드 태스크 시작 (이벤트 루프에서 호출되도록 코루틴으로 정의)
         
         Args:
             task_id: 태스크 ID
             request: 처리 요청
         """
         # 이벤트 루프에서 비동기 태스크 실행
-        asyncio.create_task(self.process_patents_async(task_id, request))
+        self.launch_task(task_id, request)
+    
+    def create_batch(self, request: BatchProcessRequest) -> str:
+        """
+        배치 생성 (검색 조건마다 하위 태스크 생성)
+        
+        동일한 검색 조건이 이미 처리 중이거나 최근에 완료되었으면 새로 처리하지 않고
+        기존 태스크를 배치에 연결한다.
+        
+        Args:
+            request: 배치 처리 요청
+            
+        Returns:
+            배치 ID
+        """
+        batch_id = str(uuid.uuid4())
+        task_ids: List[str] = []
+        owned: List[str] = []
+        
+        # 등록권자명을 모두 먼저 확인하여 찾지 못한 이름이 있으면 태스크를 만들기 전에 실패
+        process_requests = [
+            self.resolve_holder(ProcessRequest(
+                search_keyword=query.search_keyword,
+                right_holder=query.right_holder,
+                right_holder_code=query.right_holder_code,
+                max_patents=query.max_patents,
+                save_claims=request.save_claims,
+                download_pdfs=request.download_pdfs,
+                deadline_seconds=request.deadline_seconds
+            ))
+            for query in request.queries
+        ]
+        
+        for process_request in process_requests:
+            task_id, dedup = self.submit_task(process_request)
+            task_ids.append(task_id)
+            if dedup == "created":
+                owned.append(task_id)
+        
+        self.batches[batch_id] = BatchStatus(
+            batch_id=batch_id,
+            status="pending",
+            total_queries=len(task_ids),
+            message="배치가 생성되었습니다.",
+            start_time=datetime.now()
+        )
+        self.batch_tasks[batch_id] = task_ids
+        self.batch_owned[batch_id] = owned
+        self.batch_details[batch_id] = {}
+        return batch_id
+    
+    def get_batch_status(self, batch_id: str) -> Optional[BatchStatus]:
+        """
+        배치 상태 조회 (하위 태스크 상태를 집계)
+        
+        Args:
+            batch_id: 배치 ID
+            
+        Returns:
+            배치 상태
+        """
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            return None
+        
+        tasks = [self.tasks[task_id] for task_id in self.batch_tasks[batch_id] if task_id in self.tasks]
+        terminal = [task for task in tasks if task.status in ("completed", "failed", "cancelled")]
+        
+        # 같은 태스크에 연결된 검색 조건은 한 번만 집계
+        unique_tasks = {task.task_id: task for task in tasks}.values()
+        total_patents = sum(task.total_patents for task in unique_tasks)
+        unique_patents = len(self.batch_details.get(batch_id, {}))
+        
+        batch.tasks = tasks
+        batch.completed_queries = len(terminal)
+        batch.progress = int(sum(task.progress for task in tasks) / len(tasks)) if tasks else 100
+        batch.total_patents = total_patents
+        batch.processed_patents = sum(task.processed_patents for task in unique_tasks)
+        batch.unique_patents = unique_patents
+        
+        # 배치가 직접 실행한 태스크만 공유 맵을 사용하므로 그 처리 수로 중복 수 계산
+        owned_processed = sum(
+            self.tasks[task_id].processed_patents for task_id in self.batch_owned[batch_id]
+            if task_id in self.tasks
+        )
+        batch.duplicate_patents = max(0, owned_processed - unique_patents)
+        
+        if batch.status == "processing":
+            batch.message = f"배치 처리 중... ({batch.completed_queries}/{batch.total_queries})"
+        
+        return batch
+    
+    async def process_batch_async(self, batch_id: str) -> None:
+        """
+        배치 비동기 처리
+        
+        하위 태스크들을 동시에 실행하되 동시 실행 수는 batch_concurrency로 제한하고,
+        KIPRIS 호출 속도는 전역 속도 제한기가 관리한다.
+        
+        Args:
+            batch_id: 배치 ID
+        """
+        batch = self.batches[batch_id]
+        shared_details = self.batch_details[batch_id]
+        semaphore = asyncio.Semaphore(max(1, settings.batch_concurrency))
+        
+        async def run_child(task_id: str) -> None:
+            async with semaphore:
+                handle = self.launch_task(task_id, self.requests[task_id], shared_details)
+                if handle is not None:
+                    await asyncio.wait({handle})
+        
+        batch.status = "processing"
+        try:
+            await asyncio.gather(*(run_child(task_id) for task_id in self.batch_owned[batch_id]))
+            
+            # 다른 요청에 연결된 하위 태스크가 끝날 때까지 대기
+            attached = [
+                self.handles[task_id] for task_id in self.batch_tasks[batch_id]
+                if task_id in self.handles
+            ]
+            if attached:
+                await asyncio.wait(set(attached))
+            
+            batch.status = "completed"
+            batch.message = f"배치 처리 완료! {batch.total_queries}개 검색 조건을 처리했습니다."
+            
+        except asyncio.CancelledError:
+            for task_id in self.batch_owned[batch_id]:
+                self.cancel_task(task_id)
+            batch.status = "cancelled"
+            batch.message = "배치가 취소되었습니다. 처리된 부분 결과는 보존됩니다."
+            raise
+            
+        finally:
+            batch.end_time = datetime.now()
+            batch.report_path = self.write_batch_report(batch_id) or None
+    
+    def write_batch_report(self, batch_id: str) -> str:
+        """
+        검색 조건별 요약과 전체 집계를 배치 종합 보고서로 저장
+        
+        Args:
+            batch_id: 배치 ID
+            
+        Returns:
+            종합 보고서 파일 경로 (실패 시 빈 문자열)
+        """
+        batch = self.get_batch_status(batch_id)
+        queries = []
+        for task_id in self.batch_tasks[batch_id]:
+            request = self.requests.get(task_id)
+            task = self.tasks.get(task_id)
+            if request is None or task is None:
+                continue
+            
+            result = self.results.get(task_id)
+            elapsed = (task.end_time - task.start_time).total_seconds() if task.end_time and task.start_time else None
+            queries.append({
+                "task_id": task_id,
+                "search_keyword": request.search_keyword or settings.search_keyword,
+                "right_holder": request.right_holder or settings.right_holder,
+                "right_holder_code": request.right_holder_code or settings.right_holder_code,
+                "max_patents": request.max_patents or settings.max_patents,
+                "status": task.status,
+                "message": task.message,
+                "total_patents": task.total_patents,
+                "processed_patents": task.processed_patents,
+                "claims_saved": result.claims_saved if result else 0,
+                "pdfs_downloaded": result.pdfs_downloaded if result else 0,
+                "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+                "stage_timings": task.stage_timings,
+                "summary_report_path": result.summary_report_path if result else None
+            })
+        
+        return patent_processor.create_batch_report(batch, queries)
+    
+    def launch_batch(self, batch_id: str) -> asyncio.Task:
+        """
+        실행 중인 이벤트 루프에 배치 등록
+        
+        Args:
+            batch_id: 배치 ID
+            
+        Returns:
+            asyncio 태스크
+        """
+        handle = asyncio.create_task(self.process_batch_async(batch_id))
+        self.batch_handles[batch_id] = handle
+        handle.add_done_callback(lambda _: self.batch_handles.pop(batch_id, None))
+        return handle
+    
+    async def start_background_batch(self, batch_id: str) -> None:
+        """
+        백그라운드 배치 시작
+        
+        Args:
+            batch_id: 배치 ID
+        """
+        batch = self.batches.get(batch_id)
+        if batch is None or batch.status != "pending":
+            return
+        
+        self.launch_batch(batch_id)
+    
+    def cancel_batch(self, batch_id: str) -> bool:
+        """
+        배치 취소 요청
+        
+        Args:
+            batch_id: 배치 ID
+            
+        Returns:
+            취소 요청 성공 여부 (이미 종료된 배치이면 False)
+        """
+        batch = self.batches.get(batch_id)
+        if batch is None or batch.status not in ("pending", "processing"):
+            return False
+        
+        handle = self.batch_handles.get(batch_id)
+        if handle is not None and not handle.done():
+            handle.cancel()
+        else:
+            for task_id in self.batch_owned[batch_id]:
+                self.cancel_task(task_id)
+            batch.status = "cancelled"
+            batch.message = "배치가 취소되었습니다."
+            batch.end_time = datetime.now()
+        
+        return True
+
+
+# 전역 태스크 매니저 인스턴스 (처음 사용할 때 생성)
+task_manager = LazyProxy(TaskManager)
+
+
+def count_tasks(status: str) -> dict:
+    """메트릭용 상태별 태스크 수 (태스크 매니저가 생성되지 않았으면 0)"""
+    if not task_manager.is_initialized():
+        return {(): 0}
+    return {(): sum(1 for task in list(task_manager.tasks.values()) if task.status == status)}
 
 
-# 전역 태스크 매니저 인스턴스
-task_manager = TaskManager()
+metrics.registry.register(metrics.Gauge(
+    "task_queue_depth",
+    "시작을 기다리는 태스크 수",
+    callback=lambda: count_tasks("pending")
+))
+metrics.registry.register(metrics.Gauge(
+    "tasks_active",
+    "처리 중인 태스크 수",
+    callback=lambda: count_tasks("processing")
+))
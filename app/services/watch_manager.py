@@ -0,0 +1,345 @@
+"""
+신규 특허 구독 서비스
+"""
+
+import asyncio
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import requests
+from app.core.config import settings
+from app.core.lazy import LazyProxy
+from app.core import metrics
+from app.models.schemas import WatchEvent, WatchRequest, WatchSubscription
+from app.services.kipris_api import kipris_api
+from app.services.patent_processor import patent_processor
+
+SINKS = ("file", "webhook", "sse")
+
+
+class WatchManager:
+    """
+    등록권자별 신규 특허 구독 관리자
+    
+    구독마다 getAdvancedSearch 첫 페이지(공개일 PD 내림차순)만 조회하여 지난번 맨 위 출원번호까지
+    훑고, 저장된 상태와 비교해 새로 나온 특허(new)와 등록상태가 바뀐 특허(changed)를 알린다.
+    변경이 없으면 구독당 KIPRIS 요청은 1건이며, 지난번 맨 위 출원번호가 첫 페이지에 없을 때만
+    다음 페이지를 max_pages까지 조회한다. 구독 상태는 JSON 파일에 저장한다.
+    """
+    
+    def __init__(self, state_dir: str):
+        """
+        Args:
+            state_dir: 구독 상태와 이벤트 파일을 저장할 디렉토리
+        """
+        self.state_dir = state_dir
+        self.state_file = os.path.join(state_dir, "subscriptions.json")
+        self.events_file = os.path.join(state_dir, "events.jsonl")
+        self.lock = threading.RLock()
+        self.subscriptions: Dict[str, WatchSubscription] = {}
+        self.listeners: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        os.makedirs(state_dir, exist_ok=True)
+        self.load_state()
+    
+    def load_state(self) -> None:
+        """구독 상태 파일 로드"""
+        if not os.path.exists(self.state_file):
+            return
+        
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for item in data.get("subscriptions", []):
+                subscription = WatchSubscription(**item)
+                self.subscriptions[subscription.subscription_id] = subscription
+        except Exception as e:
+            print(f"구독 상태 로드 실패: {e}")
+    
+    def save_state(self) -> None:
+        """구독 상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self.lock:
+            data = {"subscriptions": [
+                json.loads(subscription.model_dump_json()) for subscription in self.subscriptions.values()
+            ]}
+            temp_file = self.state_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.state_file)
+    
+    def add_subscription(self, request: WatchRequest) -> WatchSubscription:
+        """
+        구독 등록
+        
+        Args:
+            request: 구독 요청
+        
+        Returns:
+            등록된 구독
+        """
+        unknown = set(request.sinks) - set(SINKS)
+        if unknown:
+            raise ValueError(f"알 수 없는 알림 대상입니다: {', '.join(sorted(unknown))}")
+        if "webhook" in request.sinks and not request.webhook_url:
+            raise ValueError("webhook 알림에는 webhook_url이 필요합니다.")
+        
+        subscription = WatchSubscription(
+            subscription_id=str(uuid.uuid4()),
+            search_keyword=request.search_keyword,
+            right_holder=request.right_holder,
+            right_holder_code=request.right_holder_code,
+            interval_seconds=request.interval_seconds or settings.watch_interval_seconds,
+            sinks=request.sinks,
+            webhook_url=request.webhook_url
+        )
+        with self.lock:
+            self.subscriptions[subscription.subscription_id] = subscription
+            self.save_state()
+        return subscription
+    
+    def remove_subscription(self, subscription_id: str) -> bool:
+        """
+        구독 삭제
+        
+        Args:
+            subscription_id: 구독 ID
+        
+        Returns:
+            삭제 여부
+        """
+        with self.lock:
+            if self.subscriptions.pop(subscription_id, None) is None:
+                return False
+            self.save_state()
+        return True
+    
+    def get_subscription(self, subscription_id: str) -> Optional[WatchSubscription]:
+        """구독 조회"""
+        return self.subscriptions.get(subscription_id)
+    
+    def list_subscriptions(self) -> List[WatchSubscription]:
+        """구독 목록 (생성순)"""
+        return sorted(self.subscriptions.values(), key=lambda subscription: subscription.created_at)
+    
+    def due_subscriptions(self, now: Optional[datetime] = None) -> List[WatchSubscription]:
+        """확인 주기가 지난 구독 목록"""
+        now = now or datetime.now()
+        return [
+            subscription for subscription in self.list_subscriptions()
+            if subscription.last_checked is None
+            or now - subscription.last_checked >= timedelta(seconds=subscription.interval_seconds)
+        ]
+    
+    def poll_subscription(self, subscription_id: str) -> List[WatchEvent]:
+        """
+        구독 확인 (블로킹, KIPRIS 요청 포함)
+        
+        첫 확인은 현재 상태를 기준점으로 저장만 하고 이벤트를 만들지 않는다.
+        
+        Args:
+            subscription_id: 구독 ID
+        
+        Returns:
+            새로 알린 이벤트 목록
+        """
+        subscription = self.subscriptions.get(subscription_id)
+        if subscription is None:
+            raise KeyError(subscription_id)
+        
+        last_seen = subscription.last_seen_application_number
+        known = subscription.known_statuses
+        baseline = last_seen is None
+        events: List[WatchEvent] = []
+        statuses: Dict[str, str] = {}
+        requests_used = 0
+        top = None
+        reached = baseline
+        
+        try:
+            for page_no in range(1, max(1, settings.watch_max_pages) + 1):
+                search_result = kipris_api.search_patents(
+                    search_keyword=subscription.search_keyword,
+                    right_holder=subscription.right_holder,
+                    right_holder_code=subscription.right_holder_code,
+                    page_no=page_no,
+                    num_rows=settings.watch_page_size
+                )
+                requests_used += 1
+                if search_result is None:
+                    raise RuntimeError("KIPRIS 검색 요청에 실패했습니다.")
+                
+                patents = patent_processor.extract_patent_list(search_result)
+                if page_no == 1 and patents:
+                    top = patents[0].application_number
+                
+                for patent in patents:
+                    status = patent.register_status.strip()
+                    statuses[patent.application_number] = status
+                    if baseline:
+                        continue
+                    if patent.application_number == last_seen:
+                        reached = True
+                    
+                    # 지난번 맨 위 출원번호 아래는 이미 확인한 범위이므로 상태 변경만 확인
+                    previous = known.get(patent.application_number)
+                    if previous is None:
+                        if not reached:
+                            events.append(WatchEvent(subscription_id=subscription_id, event_type="new", patent=patent))
+                    elif previous != status:
+                        events.append(WatchEvent(
+                            subscription_id=subscription_id,
+                            event_type="changed",
+                            patent=patent,
+                            previous_status=previous
+                        ))
+                
+                # 지난번 맨 위 출원번호까지 확인했거나 마지막 페이지이면 종료
+                if reached or len(patents) < settings.watch_page_size:
+                    break
+        
+        except Exception as e:
+            with self.lock:
+                subscription.last_checked = datetime.now()
+                subscription.polls += 1
+                subscription.kipris_requests += requests_used
+                subscription.last_error = str(e)
+                self.save_state()
+            metrics.watch_polls.inc(result="error")
+            raise
+        
+        # 같은 특허가 여러 번 나오면 첫 이벤트만 사용
+        unique_events: Dict[str, WatchEvent] = {}
+        for event in events:
+            unique_events.setdefault(event.patent.application_number, event)
+        events = list(unique_events.values())
+        
+        with self.lock:
+            subscription.last_checked = datetime.now()
+            subscription.polls += 1
+            subscription.kipris_requests += requests_used
+            subscription.last_error = None
+            if top is not None:
+                subscription.last_seen_application_number = top
+            # 이번에 확인하지 않은 범위의 이전 상태는 유지 (첫 페이지 밖으로 밀려난 특허)
+            subscription.known_statuses = {**known, **statuses} if not baseline else statuses
+            self.trim_known(subscription)
+            subscription.events_emitted += len(events)
+            self.save_state()
+        
+        metrics.watch_polls.inc(result="changed" if events else "unchanged")
+        for event in events:
+            metrics.watch_events.inc(type=event.event_type)
+        
+        if events:
+            self.emit(subscription, events)
+        return events
+    
+    def trim_known(self, subscription: WatchSubscription) -> None:
+        """저장할 이전 상태를 최근 max_pages 페이지 분량으로 제한"""
+        limit = settings.watch_page_size * max(1, settings.watch_max_pages)
+        if len(subscription.known_statuses) > limit:
+            items = list(subscription.known_statuses.items())
+            subscription.known_statuses = dict(items[-limit:])
+    
+    def poll_due(self) -> Dict[str, int]:
+        """
+        주기가 지난 구독을 모두 확인 (블로킹)
+        
+        Returns:
+            구독 ID별 이벤트 수 (실패한 구독은 -1)
+        """
+        results = {}
+        for subscription in self.due_subscriptions():
+            try:
+                results[subscription.subscription_id] = len(self.poll_subscription(subscription.subscription_id))
+            except Exception as e:
+                print(f"구독 확인 실패 ({subscription.subscription_id}): {e}")
+                results[subscription.subscription_id] = -1
+        return results
+    
+    def emit(self, subscription: WatchSubscription, events: List[WatchEvent]) -> None:
+        """
+        구독의 알림 대상으로 이벤트 전달
+        
+        Args:
+            subscription: 구독
+            events: 이벤트 목록
+        """
+        payloads = [json.loads(event.model_dump_json()) for event in events]
+        
+        if "file" in subscription.sinks:
+            try:
+                with self.lock, open(self.events_file, 'a', encoding='utf-8') as f:
+                    for payload in payloads:
+                        f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            except Exception as e:
+                print(f"구독 이벤트 파일 저장 실패: {e}")
+        
+        if "webhook" in subscription.sinks and subscription.webhook_url:
+            try:
+                response = requests.post(
+                    subscription.webhook_url,
+                    json={"subscription_id": subscription.subscription_id, "events": payloads},
+                    timeout=settings.timeout
+                )
+                response.raise_for_status()
+            except Exception as e:
+                print(f"webhook 전송 실패 ({subscription.webhook_url}): {e}")
+        
+        if "sse" in subscription.sinks:
+            for payload in payloads:
+                self.publish(payload)
+    
+    def listen(self, max_queue: int = 1000) -> asyncio.Queue:
+        """
+        SSE 구독자 등록 (이벤트 루프에서 호출)
+        
+        Returns:
+            이벤트를 받을 큐
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        with self.lock:
+            self.listeners.append((asyncio.get_running_loop(), queue))
+        return queue
+    
+    def unlisten(self, queue: asyncio.Queue) -> None:
+        """SSE 구독자 해제"""
+        with self.lock:
+            self.listeners = [(loop, listener) for loop, listener in self.listeners if listener is not queue]
+    
+    def publish(self, payload: Dict) -> None:
+        """모든 SSE 구독자에게 이벤트 전달 (어느 스레드에서나 호출 가능)"""
+        def put(queue: asyncio.Queue) -> None:
+            # 읽지 않는 구독자 때문에 메모리가 늘지 않도록 가득 차면 버림
+            if not queue.full():
+                queue.put_nowait(payload)
+        
+        with self.lock:
+            listeners = list(self.listeners)
+        for loop, queue in listeners:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(put, queue)
+    
+    async def run_scheduler(self, tick_seconds: float = 30.0) -> None:
+        """
+        주기가 지난 구독을 계속 확인하는 스케줄러 (취소될 때까지 실행)
+        
+        구독은 스레드 풀에서 하나씩 확인하므로 KIPRIS 호출은 전역 속도 제한기를 따른다.
+        
+        Args:
+            tick_seconds: 확인할 구독을 찾는 간격 (초)
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                if self.due_subscriptions():
+                    await loop.run_in_executor(None, self.poll_due)
+            except Exception as e:
+                print(f"구독 스케줄러 오류: {e}")
+            await asyncio.sleep(tick_seconds)
+
+
+# 전역 구독 관리자 인스턴스 (처음 사용할 때 상태 파일 로드)
+watch_manager = LazyProxy(lambda: WatchManager(os.path.join(settings.output_dir, "watch")))
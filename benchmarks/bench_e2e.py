@@ -0,0 +1,355 @@
+"""
+CLI/API 종단간 처리량 벤치마크
+
+로컬 KIPRIS 대체 서버(benchmarks.fake_kipris)에 지연 시간을 주입하고, 임시 작업 디렉토리에서
+`run.py cli`, `POST /patents/search`, `POST /patents/process`를 실제 프로세스로 실행하여
+초당 처리 특허 수, p50/p95/p99 지연 시간, 최대 RSS, 특허당 KIPRIS 호출 수를 측정한다.
+결과를 JSON으로 저장하고 --baseline으로 이전 커밋의 결과와 비교할 수 있다.
+
+사용법:
+    python -m benchmarks.bench_e2e --patents 50 --latency-ms 20 --output e2e.json
+    python -m benchmarks.bench_e2e --scenarios search process --baseline e2e.json
+"""
+
+import argparse
+import json
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_kipris import FakeKiprisServer
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RUN_PY = str(PROJECT_ROOT / "run.py")
+SCENARIOS = ["cli", "search", "process"]
+
+# 비교 시 표시할 지표 (이름, 클수록 좋은지 여부)
+COMPARE_METRICS = [
+    ("patents_per_sec", True),
+    ("latency_p50_s", False),
+    ("latency_p95_s", False),
+    ("latency_p99_s", False),
+    ("peak_rss_mb", False),
+    ("kipris_calls_per_patent", False)
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 방식 백분위수"""
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """지연 시간 요약 (초)"""
+    return {
+        "latency_p50_s": round(percentile(latencies, 50), 4),
+        "latency_p95_s": round(percentile(latencies, 95), 4),
+        "latency_p99_s": round(percentile(latencies, 99), 4),
+        "latency_mean_s": round(statistics.mean(latencies), 4)
+    }
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 해시"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def write_config(workdir: str, base_url: str, args: argparse.Namespace) -> None:
+    """벤치마크용 config.json 생성 (대체 서버 주소, 요청 간 지연 없음, 반복 실행끼리 특허 저장소를 재사용하지 않음)"""
+    config = {
+        "api_settings": {"service_key": "benchmark", "base_url": base_url, "timeout": 30},
+        "search_settings": {
+            "search_keyword": "조성물",
+            "right_holder": "벤치마크",
+            "right_holder_code": "120000000000",
+            "max_patents_per_search": args.patents,
+            "delay_between_requests": args.delay
+        },
+        "output_settings": {
+            "output_directory": "patent_results",
+            "save_search_results": True,
+            "save_claims": True,
+            "download_pdfs": args.pdfs,
+            "use_patent_store": False
+        }
+    }
+    with open(os.path.join(workdir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+
+def subprocess_env() -> Dict[str, str]:
+    return dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), PYTHONDONTWRITEBYTECODE="1")
+
+
+def run_with_rusage(command: List[str], cwd: str) -> Dict[str, float]:
+    """프로세스를 실행하고 실행 시간과 최대 RSS 측정"""
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, env=subprocess_env(), stdout=subprocess.DEVNULL, stderr=stderr)
+        _, status, rusage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - start
+        process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        
+        if process.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", "replace")[-2000:]
+            raise RuntimeError(f"{' '.join(command)} 실패 ({process.returncode}): {message}")
+    
+    # Linux의 ru_maxrss 단위는 KB
+    return {"wall_s": wall, "peak_rss_mb": rusage.ru_maxrss / 1024}
+
+
+def read_peak_rss_mb(pid: int) -> Optional[float]:
+    """실행 중인 프로세스의 최대 RSS (/proc/<pid>/status의 VmHWM)"""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def kipris_calls(server: FakeKiprisServer) -> int:
+    return sum(server.stats().values())
+
+
+def bench_cli(server: FakeKiprisServer, workdir: str, args: argparse.Namespace) -> dict:
+    """run.py cli 실행 벤치마크"""
+    runs = []
+    calls = 0
+    for repeat in range(args.repeat):
+        server.reset()
+        runs.append(run_with_rusage(
+            [sys.executable, RUN_PY, "cli", "--keyword", f"cli{repeat}", "--max-patents", str(args.patents)],
+            workdir
+        ))
+        calls += kipris_calls(server)
+    
+    walls = [run["wall_s"] for run in runs]
+    return {
+        "runs": args.repeat,
+        "patents_per_run": args.patents,
+        "patents_per_sec": round(args.patents / statistics.median(walls), 2),
+        **latency_summary(walls),
+        "peak_rss_mb": round(max(run["peak_rss_mb"] for run in runs), 1),
+        "kipris_calls_per_patent": round(calls / (args.patents * args.repeat), 3)
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def http_json(method: str, url: str, payload: Optional[dict] = None, timeout: float = 300) -> dict:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+class APIServer:
+    """run.py api 서버 프로세스"""
+    
+    def __init__(self, workdir: str):
+        self.port = free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.process = subprocess.Popen(
+            [sys.executable, RUN_PY, "api", "--host", "127.0.0.1", "--port", str(self.port)],
+            cwd=workdir, env=subprocess_env(),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    
+    def wait_ready(self, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("API 서버가 시작 중 종료되었습니다.")
+            try:
+                http_json("GET", f"{self.url}/health", timeout=1)
+                return
+            except OSError:
+                time.sleep(0.1)
+        raise RuntimeError("API 서버 시작 대기 시간 초과")
+    
+    def peak_rss_mb(self) -> Optional[float]:
+        peak = read_peak_rss_mb(self.process.pid)
+        return round(peak, 1) if peak is not None else None
+    
+    def stop(self) -> None:
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def bench_search(server: FakeKiprisServer, api: APIServer, args: argparse.Namespace) -> dict:
+    """POST /patents/search 벤치마크 (요청마다 다른 키워드로 응답 캐시를 피함)"""
+    def search(index: int):
+        start = time.perf_counter()
+        body = http_json("POST", f"{api.url}/patents/search", {
+            "search_keyword": f"search{index}",
+            "max_patents": args.patents
+        })
+        return time.perf_counter() - start, len(body["patents"])
+    
+    server.reset()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(search, range(args.requests)))
+    wall = time.perf_counter() - start
+    
+    total_patents = sum(count for _, count in results)
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "requests_per_sec": round(args.requests / wall, 2),
+        "patents_per_sec": round(total_patents / wall, 2),
+        **latency_summary([latency for latency, _ in results]),
+        "peak_rss_mb": api.peak_rss_mb(),
+        "kipris_calls_per_patent": round(kipris_calls(server) / max(1, total_patents), 3)
+    }
+
+
+def bench_process(server: FakeKiprisServer, api: APIServer, args: argparse.Namespace) -> dict:
+    """POST /patents/process 후 완료까지 걸린 시간 벤치마크"""
+    latencies = []
+    processed = 0
+    calls = 0
+    for repeat in range(args.repeat):
+        server.reset()
+        start = time.perf_counter()
+        response = http_json("POST", f"{api.url}/patents/process", {
+            "search_keyword": f"process{repeat}",
+            "max_patents": args.patents,
+            "download_pdfs": args.pdfs
+        })
+        task_id = response["data"]["task_id"]
+        
+        while True:
+            status = http_json("GET", f"{api.url}/patents/process/{task_id}/status")
+            if status["status"] in ("completed", "failed", "cancelled"):
+                break
+            time.sleep(0.02)
+        
+        latencies.append(time.perf_counter() - start)
+        if status["status"] != "completed":
+            raise RuntimeError(f"처리 실패: {status['message']}")
+        processed += status["processed_patents"]
+        calls += kipris_calls(server)
+    
+    return {
+        "runs": args.repeat,
+        "patents_per_run": args.patents,
+        "patents_per_sec": round(processed / sum(latencies), 2),
+        **latency_summary(latencies),
+        "peak_rss_mb": api.peak_rss_mb(),
+        "kipris_calls_per_patent": round(calls / max(1, processed), 3)
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """기준 결과 대비 변화율 출력"""
+    print(f"\n기준 커밋 {baseline.get('commit')} → 현재 커밋 {report.get('commit')}")
+    for scenario, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if not previous:
+            continue
+        print(f"[{scenario}]")
+        for metric, higher_is_better in COMPARE_METRICS:
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            improved = change > 0 if higher_is_better else change < 0
+            marker = "유지" if abs(change) < 5 else ("개선" if improved else "악화")
+            print(f"  {metric:<26} {before:>10} → {after:>10} ({change:+.1f}%, {marker})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI/API 종단간 처리량 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS, help="실행할 시나리오")
+    parser.add_argument("--patents", type=int, default=50, help="실행당 특허 수")
+    parser.add_argument("--repeat", type=int, default=3, help="cli/process 반복 횟수")
+    parser.add_argument("--requests", type=int, default=50, help="search 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="search 동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="KIPRIS 요청별 주입 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="KIPRIS 추가 지연 최대값 (ms)")
+    parser.add_argument("--claims", type=int, default=15, help="특허당 청구항 수")
+    parser.add_argument("--delay", type=float, default=0.0, help="요청 간 지연 설정 (delay_between_requests)")
+    parser.add_argument("--pdfs", action="store_true", help="PDF 다운로드 포함")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+    
+    server = FakeKiprisServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        total_patents=max(args.patents, 500),
+        claims=args.claims
+    ).start()
+    
+    report = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "scenarios": {}
+    }
+    
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            write_config(workdir, server.base_url, args)
+            
+            if "cli" in args.scenarios:
+                report["scenarios"]["cli"] = bench_cli(server, workdir, args)
+            
+            api_scenarios = [scenario for scenario in args.scenarios if scenario != "cli"]
+            if api_scenarios:
+                api = APIServer(workdir)
+                try:
+                    api.wait_ready()
+                    if "search" in api_scenarios:
+                        report["scenarios"]["search"] = bench_search(server, api, args)
+                    if "process" in api_scenarios:
+                        report["scenarios"]["process"] = bench_process(server, api, args)
+                finally:
+                    api.stop()
+    finally:
+        server.stop()
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+등록권자 디렉터리 조회 벤치마크
+
+임의의 한글 회사명을 디렉터리에 넣고, 정확한 이름(회사 형태 표기만 다름)과
+자모 하나를 바꾼 오타 이름으로 등록권자 코드를 찾는 시간과 정확도를 측정한다.
+
+사용법:
+    python -m benchmarks.bench_holders --holders 20000 --queries 2000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.holder_directory import HolderDirectory
+
+
+# 회사명 앞뒤에 붙일 회사 형태 표기
+FORMS = ["주식회사 {}", "{} 주식회사", "(주){}", "{}(주)"]
+
+
+def random_name(rng: random.Random) -> str:
+    """임의의 2~6음절 한글 이름"""
+    return "".join(chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(rng.randint(2, 6)))
+
+
+def typo(rng: random.Random, name: str) -> str:
+    """음절 하나의 중성(모음)을 바꾼 이름"""
+    position = rng.randrange(len(name))
+    offset = ord(name[position]) - 0xAC00
+    vowel = (offset % 588 // 28 + rng.randint(1, 20)) % 21
+    changed = chr(0xAC00 + offset // 588 * 588 + vowel * 28 + offset % 28)
+    return name[:position] + changed + name[position + 1:]
+
+
+def measure(directory: HolderDirectory, queries, expected):
+    """조회 시간(ms)과 첫 결과의 코드가 맞은 비율"""
+    timings = []
+    correct = 0
+    for query, code in zip(queries, expected):
+        start = time.perf_counter()
+        matches = directory.lookup(query, limit=1)
+        timings.append((time.perf_counter() - start) * 1000)
+        correct += bool(matches) and matches[0]["right_holder_code"] == code
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "p99_ms": round(timings[int(len(timings) * 0.99)], 4),
+        "accuracy": round(correct / len(queries), 4)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등록권자 디렉터리 조회 벤치마크")
+    parser.add_argument("--holders", type=int, default=20000, help="등록권자 수")
+    parser.add_argument("--queries", type=int, default=2000, help="질의 수")
+    parser.add_argument("--threshold", type=float, default=0.6, help="최소 다이스 계수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    rng = random.Random(3)
+    directory = HolderDirectory(persist=False, threshold=args.threshold)
+    names = list({random_name(rng) for _ in range(args.holders)})
+    codes = [f"1{i:011d}" for i in range(len(names))]
+    
+    start = time.perf_counter()
+    with directory.lock:
+        for name, code in zip(names, codes):
+            directory.add_name(rng.choice(FORMS).format(name), code, rng.randint(1, 500))
+    build_ms = (time.perf_counter() - start) * 1000
+    
+    picks = [rng.randrange(len(names)) for _ in range(args.queries)]
+    exact = [rng.choice(FORMS).format(names[i]) for i in picks]
+    typos = [typo(rng, names[i]) for i in picks if len(names[i]) >= 4]
+    typo_codes = [codes[i] for i in picks if len(names[i]) >= 4]
+    
+    report = {
+        "holders": len(names),
+        **directory.stats(),
+        "build_ms": round(build_ms, 1),
+        "exact": measure(directory, exact, [codes[i] for i in picks]),
+        "typo_4plus_syllables": measure(directory, typos, typo_codes)
+    }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
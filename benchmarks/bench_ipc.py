@@ -0,0 +1,103 @@
+"""
+IPC 분류 색인 집계 벤치마크
+
+임의의 IPC 코드(서브클래스/메인그룹/서브그룹 분포가 치우친), 출원 연도, 등록권자를 가진 특허를
+색인에 넣고 단계별/접두어/등록권자/연도별 집계 시간을 측정한다.
+
+사용법:
+    python -m benchmarks.bench_ipc --patents 100000 --repeat 50
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.ipc_index import IPCIndex
+
+
+# 화장품 특허에 많은 서브클래스 (앞쪽일수록 자주 나옴)
+SUBCLASSES = ["A61K", "A61Q", "C11D", "A61P", "C07K", "C12N", "A23L", "B65D", "C08L", "D06M"]
+HOLDERS = 200
+
+# 측정할 집계 (이름, rollup 인자)
+QUERIES = [
+    ("subclass", {"level": "subclass"}),
+    ("subgroup", {"level": "subgroup"}),
+    ("prefix_A61Q_19", {"level": "subgroup", "prefix": "A61Q 19/*"}),
+    ("prefix_A61K_by_year", {"level": "group", "prefix": "A61K", "by": "year"}),
+    ("holder", {"level": "group", "right_holder_code": "120000000007"}),
+    ("subclass_by_holder", {"level": "subclass", "by": "holder"}),
+]
+
+
+def build_codes(rng: random.Random):
+    """특허 하나의 KIPRIS 형식 IPC 코드 목록 (1~6개)"""
+    codes = []
+    for _ in range(rng.randint(1, 6)):
+        subclass = SUBCLASSES[min(int(rng.expovariate(0.6)), len(SUBCLASSES) - 1)]
+        group = min(int(rng.expovariate(0.15)) + 1, 99)
+        subgroup = rng.choice(["00", "02", "04", "06", "08", "10", "14", "22", "34", "97"])
+        codes.append(f"{subclass} {group}/{subgroup}(2006.01)")
+    return codes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IPC 분류 색인 집계 벤치마크")
+    parser.add_argument("--patents", type=int, default=100000, help="특허 수")
+    parser.add_argument("--repeat", type=int, default=50, help="집계당 반복 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    index = IPCIndex(persist=False)
+    
+    start = time.perf_counter()
+    with index.lock:
+        for i in range(args.patents):
+            year = rng.randint(2005, 2024)
+            index.add_codes(
+                f"10{year}{i:07d}",
+                f"12{rng.randrange(HOLDERS):010d}",
+                build_codes(rng)
+            )
+    add_seconds = time.perf_counter() - start
+    
+    queries = {}
+    for name, kwargs in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            index.rollup(**kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries[name] = {"median_ms": round(statistics.median(timings), 2), "max_ms": round(max(timings), 2)}
+    
+    # 요약 보고서처럼 일부 특허(한 등록권자 검색 결과 크기)만 집계
+    sample = [index.patents[row] for row in rng.sample(range(len(index.patents)), min(500, len(index.patents)))]
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        index.rollup("subclass", application_numbers=sample, limit=10)
+        timings.append((time.perf_counter() - start) * 1000)
+    queries["report_500"] = {"median_ms": round(statistics.median(timings), 2), "max_ms": round(max(timings), 2)}
+    
+    report = {
+        "patents": args.patents,
+        **index.stats(),
+        "add_us_per_patent": round(add_seconds / args.patents * 1e6, 2),
+        "rollup": queries
+    }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
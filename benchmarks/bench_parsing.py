@@ -0,0 +1,214 @@
+"""
+XML 파싱/추출 마이크로벤치마크
+
+특허 1건당 CPU 경로(xmltodict.parse → extract_* → pydantic 모델 생성 → 검색 결과 json.dump(indent=2))를
+단계별로 따로 측정하고, tracemalloc으로 특허당 할당 블록 수와 최대 할당 크기를 구한다.
+
+기본 입력은 benchmarks.fixtures로 만든 응답(검색 1/100/500건, 청구항 5/50/200개)이며,
+--fixtures-dir에 실제 KIPRIS 응답을 search_*.xml / detail_*.xml로 저장해 두면 그 파일로 측정한다.
+
+사용법:
+    python -m benchmarks.bench_parsing --output parsing.json
+    python -m benchmarks.bench_parsing --save-fixtures fixtures/   # 생성한 응답을 파일로 저장
+    python -m benchmarks.bench_parsing --fixtures-dir fixtures/     # 저장된 응답으로 측정
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import xmltodict
+from app.core.claim_parser import parse_claim_dependencies
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+from app.services.ingredient_tagger import IngredientTagger, load_dictionary
+from app.services.patent_processor import PatentProcessor
+from benchmarks.fixtures import build_detail_xml, build_search_xml
+
+SEARCH_SIZES = [1, 100, 500]
+CLAIM_SIZES = [5, 50, 200]
+INGREDIENT_DICTIONARY = Path(__file__).resolve().parent.parent / "ingredients_example.json"
+
+
+def load_fixtures(fixtures_dir: str = None) -> List[Tuple[str, str, bytes]]:
+    """
+    측정할 응답 목록
+    
+    Returns:
+        (케이스 이름, 종류("search"/"detail"), XML bytes) 목록
+    """
+    if fixtures_dir:
+        fixtures = []
+        for path in sorted(Path(fixtures_dir).glob("*.xml")):
+            kind = "search" if path.name.startswith("search") else "detail"
+            fixtures.append((path.stem, kind, path.read_bytes()))
+        return fixtures
+    
+    fixtures = [(f"search_{size}", "search", build_search_xml(size)) for size in SEARCH_SIZES]
+    fixtures += [(f"detail_{size}", "detail", build_detail_xml(0, claim_count=size)) for size in CLAIM_SIZES]
+    return fixtures
+
+
+def time_call(func: Callable[[], Any], repeat: int, min_sample_seconds: float = 0.02) -> float:
+    """
+    함수 1회 실행 시간 중앙값 (초)
+    
+    짧은 함수는 한 샘플에서 여러 번 실행하여 타이머 해상도의 영향을 줄인다.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_seconds or number >= 1 << 20:
+            break
+        number *= 2
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def measure_allocations(func: Callable[[], Any]) -> Dict[str, float]:
+    """tracemalloc으로 1회 실행의 할당 블록 수와 최대 할당 크기 측정"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    
+    diff = after.compare_to(before, "filename")
+    del result
+    return {
+        "retained_blocks": sum(stat.count_diff for stat in diff),
+        "retained_bytes": sum(stat.size_diff for stat in diff),
+        "peak_bytes": peak - baseline
+    }
+
+
+def step_report(func: Callable[[], Any], patents: int, repeat: int) -> Dict[str, float]:
+    """단계 하나의 시간/할당 측정 결과 (특허당 값 포함)"""
+    seconds = time_call(func, repeat)
+    allocations = measure_allocations(func)
+    return {
+        "per_call_us": round(seconds * 1e6, 1),
+        "per_patent_us": round(seconds * 1e6 / patents, 2),
+        "retained_blocks_per_patent": round(allocations["retained_blocks"] / patents, 1),
+        "retained_kb_per_patent": round(allocations["retained_bytes"] / patents / 1024, 2),
+        "peak_kb_per_patent": round(allocations["peak_bytes"] / patents / 1024, 2)
+    }
+
+
+def search_steps(processor: PatentProcessor, xml: bytes) -> Tuple[int, Dict[str, Callable[[], Any]]]:
+    """검색 응답 처리 단계"""
+    parsed = xmltodict.parse(xml)
+    patents = processor.extract_patent_list(parsed)
+    fields = [patent.model_dump() for patent in patents]
+    
+    def dump_search_result():
+        buffer = io.StringIO()
+        json.dump(parsed, buffer, ensure_ascii=False, indent=2)
+        return buffer
+    
+    return max(1, len(patents)), {
+        "xml_parse": lambda: xmltodict.parse(xml),
+        "extract_patent_list": lambda: processor.extract_patent_list(parsed),
+        "model_build": lambda: [PatentBasicInfo(**values) for values in fields],
+        "json_dump_indent": dump_search_result
+    }
+
+
+def detail_steps(processor: PatentProcessor, xml: bytes) -> Tuple[int, Dict[str, Callable[[], Any]]]:
+    """서지 상세 응답 처리 단계 (특허 1건)"""
+    parsed = xmltodict.parse(xml)
+    basic_info = PatentBasicInfo(
+        application_number="1020200000000",
+        invention_title="벤치마크",
+        applicant_name="벤치마크",
+        register_status="등록"
+    )
+    claims = processor.extract_claims(parsed)
+    ipc_codes = processor.extract_ipc_codes(parsed)
+    inventors = processor.extract_inventors(parsed)
+    
+    tagger = IngredientTagger("", "")
+    tagger.build(load_dictionary(str(INGREDIENT_DICTIONARY)))
+    
+    return 1, {
+        "xml_parse": lambda: xmltodict.parse(xml),
+        "extract_claims": lambda: processor.extract_claims(parsed),
+        "extract_ipc_inventors": lambda: (processor.extract_ipc_codes(parsed), processor.extract_inventors(parsed)),
+        "claim_dependencies": lambda: parse_claim_dependencies(claims),
+        "tag_ingredients": lambda: tagger.tag_claims(claims),
+        "model_build": lambda: PatentDetailInfo(
+            basic_info=basic_info, claims=claims, ipc_codes=ipc_codes, inventors=inventors
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="XML 파싱/추출 마이크로벤치마크")
+    parser.add_argument("--repeat", type=int, default=7, help="샘플 수")
+    parser.add_argument("--fixtures-dir", help="측정할 응답 XML 디렉토리 (search_*.xml, detail_*.xml)")
+    parser.add_argument("--save-fixtures", help="생성한 응답 XML을 저장할 디렉토리")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    fixtures = load_fixtures(args.fixtures_dir)
+    
+    if args.save_fixtures:
+        os.makedirs(args.save_fixtures, exist_ok=True)
+        for name, _, xml in fixtures:
+            Path(args.save_fixtures, f"{name}.xml").write_bytes(xml)
+        print(f"{len(fixtures)}개 응답 저장: {args.save_fixtures}")
+        return
+    
+    report = {"python": sys.version.split()[0], "repeat": args.repeat, "cases": {}}
+    
+    # 설정 파일/출력 디렉토리가 현재 위치에 생기지 않도록 임시 디렉토리에서 처리기 생성
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            processor = PatentProcessor()
+        finally:
+            os.chdir(cwd)
+        
+        for name, kind, xml in fixtures:
+            build_steps = search_steps if kind == "search" else detail_steps
+            patents, steps = build_steps(processor, xml)
+            report["cases"][name] = {
+                "kind": kind,
+                "xml_bytes": len(xml),
+                "patents": patents,
+                "steps": {step: step_report(func, patents, args.repeat) for step, func in steps.items()}
+            }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
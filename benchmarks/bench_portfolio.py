@@ -0,0 +1,134 @@
+"""
+등록권자 포트폴리오 집계 벤치마크
+
+임시 특허 저장소에 한 등록권자의 특허(검색 결과 + 청구항/IPC 상세 정보)를 저장하면서 집계 갱신을
+포함한 저장 시간을 재고, 저장된 집계로 만든 보고서와 저장된 특허를 모두 읽어 다시 집계한
+보고서의 시간과 결과를 비교한다.
+
+사용법:
+    python -m benchmarks.bench_portfolio --patents 20000 --repeat 20
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.claim_parser import independent_claims
+from app.core.portfolio import add_facets, build_report, patent_facets
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+from app.services.patent_store import PatentStore
+
+
+HOLDER_CODE = "120140131250"
+STATUSES = ["등록", "공개", "소멸", "거절"]
+SUBCLASSES = ["A61K", "A61Q", "C11D", "A61P", "C07K"]
+
+
+def build_detail(rng: random.Random, index: int) -> PatentDetailInfo:
+    """임의의 특허 상세 정보 (청구항 3~40개, 종속항은 앞선 청구항 하나를 인용)"""
+    basic_info = PatentBasicInfo(
+        application_number=f"10{rng.randint(2005, 2024)}{index:07d}",
+        invention_title="화장료 조성물",
+        applicant_name="코스맥스 주식회사",
+        register_status=rng.choice(STATUSES)
+    )
+    claims = []
+    dependencies = []
+    for claim_no in range(1, rng.randint(3, 40) + 1):
+        if claim_no == 1 or rng.random() < 0.15:
+            claims.append(f"화장료 조성물 {claim_no}.")
+            dependencies.append([])
+        else:
+            cited = rng.randrange(1, claim_no)
+            claims.append(f"제{cited}항에 있어서, 조성물 {claim_no}.")
+            dependencies.append([cited])
+    ipc_codes = [
+        f"{rng.choice(SUBCLASSES)} {rng.randint(1, 40)}/{rng.choice(['00', '02', '34'])}(2006.01)"
+        for _ in range(rng.randint(1, 4))
+    ]
+    return PatentDetailInfo(
+        basic_info=basic_info,
+        claims=claims,
+        claim_dependencies=dependencies,
+        independent_claims=independent_claims(claims, dependencies),
+        ipc_codes=ipc_codes
+    )
+
+
+def scan_report(store: PatentStore) -> dict:
+    """저장된 특허를 모두 읽어 다시 만든 보고서 (집계 테이블이 없을 때의 방식)"""
+    counts = {}
+    with store.lock:
+        rows = store.connection.execute(
+            "SELECT basic_info, detail FROM patents WHERE right_holder_code = ?",
+            (HOLDER_CODE,)
+        ).fetchall()
+    for basic_info, detail in rows:
+        detail_info = store.detail_from_json(PatentBasicInfo.model_validate_json(basic_info), detail)
+        add_facets(counts, patent_facets(
+            detail_info.basic_info.application_number,
+            detail_info.basic_info.register_status,
+            detail_info.ipc_codes,
+            (),
+            len(detail_info.claims) or None,
+            len(detail_info.independent_claims)
+        ))
+    return build_report(counts)
+
+
+def measure(function, repeat: int) -> dict:
+    """함수 실행 시간(ms)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(timings), 2), "max_ms": round(max(timings), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="등록권자 포트폴리오 집계 벤치마크")
+    parser.add_argument("--patents", type=int, default=20000, help="특허 수")
+    parser.add_argument("--repeat", type=int, default=20, help="보고서당 반복 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    rng = random.Random(5)
+    details = [build_detail(rng, i) for i in range(args.patents)]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        store = PatentStore(str(Path(directory) / "patents.db"))
+        
+        start = time.perf_counter()
+        for offset in range(0, len(details), 500):
+            chunk = details[offset:offset + 500]
+            store.record_search([detail_info.basic_info for detail_info in chunk], HOLDER_CODE)
+            for detail_info in chunk:
+                store.put_detail(detail_info, claims_included=True)
+        write_seconds = time.perf_counter() - start
+        
+        aggregated = build_report(store.holder_facets(HOLDER_CODE))
+        report = {
+            "patents": args.patents,
+            "write_us_per_patent": round(write_seconds / args.patents * 1e6, 1),
+            "aggregates": measure(lambda: build_report(store.holder_facets(HOLDER_CODE)), args.repeat),
+            "full_scan": measure(lambda: scan_report(store), max(1, args.repeat // 10)),
+            "identical": aggregated == scan_report(store)
+        }
+        store.close()
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+처리 결과 직렬화/압축 벤치마크
+
+500건 규모의 ProcessResult를 만들어 FastAPI 기본 직렬화 경로와
+FastJSONResponse 경로의 직렬화 시간, 그리고 gzip/deflate 압축 후 전송 크기를 비교한다.
+
+사용법:
+    python -m benchmarks.bench_serialization --patents 500 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+from app.core.middleware import COMPRESSION_WBITS
+from app.core.responses import FastJSONResponse, orjson
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo, ProcessResult, ProcessResultPage
+from benchmarks.fixtures import INGREDIENTS, PURPOSES, build_claim
+
+
+def build_result(patent_count: int, claims_per_patent: int = 15, seed: int = 42) -> ProcessResult:
+    """벤치마크용 처리 결과 생성"""
+    rng = random.Random(seed)
+    patents = []
+    for i in range(patent_count):
+        basic_info = PatentBasicInfo(
+            application_number=f"10202000{i:05d}",
+            register_number=f"10{i:07d}",
+            invention_title=f"{rng.choice(INGREDIENTS)}을 포함하는 {rng.choice(PURPOSES)} 화장료 조성물",
+            applicant_name="코스맥스 주식회사",
+            register_date="20210315",
+            register_status="등록" if i % 3 else "공개",
+            abstract=" ".join(build_claim(rng, 1) for _ in range(3))
+        )
+        patents.append(PatentDetailInfo(
+            basic_info=basic_info,
+            claims=[build_claim(rng, c + 1) for c in range(claims_per_patent)],
+            ipc_codes=["A61K 8/97", "A61Q 19/02", "A61K 8/67"],
+            inventors=["홍길동", "김철수", "이영희"]
+        ))
+    
+    return ProcessResult(
+        task_id="benchmark",
+        patents=patents,
+        claims_saved=patent_count,
+        output_directory="patent_results"
+    )
+
+
+def serialize_default(result: ProcessResult) -> bytes:
+    """FastAPI 기본 경로: response_model 검증 → dict 변환 → JSONResponse"""
+    validated = ProcessResult.model_validate(result.model_dump())
+    return JSONResponse(content=jsonable_encoder(validated)).body
+
+
+def serialize_fast(result: ProcessResult) -> bytes:
+    """FastJSONResponse 경로: pydantic-core로 한 번에 직렬화"""
+    return FastJSONResponse(result).body
+
+
+def serialize_page(result: ProcessResult) -> bytes:
+    """결과 조회 API의 페이지 경로 (필드 선택 없는 전체 페이지)"""
+    page = ProcessResultPage.model_construct(
+        task_id=result.task_id,
+        patents=[patent.model_dump(mode="json") for patent in result.patents],
+        total_count=len(result.patents),
+        next_cursor=None,
+        claims_saved=result.claims_saved,
+        pdfs_downloaded=result.pdfs_downloaded,
+        summary_report_path=result.summary_report_path,
+        output_directory=result.output_directory
+    )
+    return FastJSONResponse(page).body
+
+
+def measure(func, result: ProcessResult, repeat: int) -> dict:
+    """함수 실행 시간 측정 (ms)"""
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func(result)
+        timings.append((time.perf_counter() - start) * 1000)
+    
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "bytes": len(body)
+    }
+
+
+def measure_compression(body: bytes, level: int, repeat: int) -> dict:
+    """압축 방식별 크기/시간 측정"""
+    report = {}
+    for encoding, wbits in COMPRESSION_WBITS.items():
+        timings = []
+        compressed = b""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+            compressed = compressor.compress(body) + compressor.flush()
+            timings.append((time.perf_counter() - start) * 1000)
+        report[encoding] = {
+            "median_ms": round(statistics.median(timings), 2),
+            "bytes": len(compressed),
+            "ratio": round(len(compressed) / len(body), 3)
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="처리 결과 직렬화/압축 벤치마크")
+    parser.add_argument("--patents", type=int, default=500, help="특허 수")
+    parser.add_argument("--claims", type=int, default=15, help="특허당 청구항 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--level", type=int, default=6, help="압축 레벨")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    result = build_result(args.patents, args.claims)
+    
+    report = {
+        "patents": args.patents,
+        "claims_per_patent": args.claims,
+        "orjson": orjson is not None,
+        "serialization": {
+            "fastapi_default": measure(serialize_default, result, args.repeat),
+            "fast_json_response": measure(serialize_fast, result, args.repeat),
+            "result_page": measure(serialize_page, result, args.repeat)
+        },
+        "compression": measure_compression(serialize_fast(result), args.level, args.repeat)
+    }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
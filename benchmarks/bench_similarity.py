@@ -0,0 +1,196 @@
+"""
+유사 특허 색인 벤치마크
+
+임의의 청구항으로 만든 특허를 색인에 넣고 병합한 뒤, 메모리 매핑으로 다시 연 색인에서
+유사 특허 질의 시간과 질의하면서 추가할 때(미병합 추가 세그먼트가 있을 때)의 질의 시간을 측정한다.
+특허마다 Zipf 분포로 고른 임의 용어를 청구항에 섞고, FAMILY_EVERY건마다 앞선 특허의 청구항 일부만
+바꾼 변형 특허를 넣어, 질의 결과에 변형 특허가 들어오는 비율(패밀리 재현율)과
+전체 특허를 정확히 비교한 상위 결과와의 겹침(재현율)도 측정한다.
+
+사용법:
+    python -m benchmarks.bench_similarity --patents 100000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.claim_parser import independent_claims, parse_claim_dependencies
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+from app.services.similarity_index import SimilarityIndex
+from benchmarks.fixtures import INGREDIENTS, PURPOSES, application_number, build_claim
+
+
+# 임의 용어 수와 변형 특허 비율
+VOCABULARY_SIZE = 20000
+FAMILY_EVERY = 10
+VOCABULARY = [
+    "".join(chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(rng.randint(2, 4)))
+    for rng in [random.Random(5)] for _ in range(VOCABULARY_SIZE)
+]
+WORD_WEIGHTS = np.cumsum(1.0 / np.arange(1, VOCABULARY_SIZE + 1))
+
+
+def build_claims(rng: random.Random, claims_per_patent: int) -> list:
+    """임의 용어를 섞은 청구항 목록"""
+    claims = []
+    for c in range(claims_per_patent):
+        picks = np.searchsorted(WORD_WEIGHTS, [rng.random() * WORD_WEIGHTS[-1] for _ in range(12)])
+        terms = " ".join(VOCABULARY[min(pick, VOCABULARY_SIZE - 1)] for pick in picks)
+        claims.append(f"{build_claim(rng, c + 1)} {terms}")
+    return claims
+
+
+def build_patent(index: int, claims_per_patent: int, seed: int = 42) -> PatentDetailInfo:
+    """
+    벤치마크용 특허 상세 정보 생성 (FAMILY_EVERY건마다 family_of(index) 특허의 변형)
+    """
+    rng = random.Random(seed * 1000003 + index)
+    claims = build_claims(rng, claims_per_patent)
+    family = family_of(index)
+    if family is not None:
+        claims = build_patent(family, claims_per_patent, seed).claims
+        for c in rng.sample(range(claims_per_patent), max(1, claims_per_patent // 5)):
+            claims[c] = build_claims(rng, 1)[0]
+    
+    basic_info = PatentBasicInfo(
+        application_number=application_number(index),
+        invention_title=f"{rng.choice(INGREDIENTS)}을 포함하는 {rng.choice(PURPOSES)} 화장료 조성물",
+        applicant_name="코스맥스 주식회사",
+        register_status="등록",
+        abstract=build_claim(rng, 1)
+    )
+    dependencies = parse_claim_dependencies(claims)
+    return PatentDetailInfo(
+        basic_info=basic_info,
+        claims=claims,
+        claim_dependencies=dependencies,
+        independent_claims=independent_claims(claims, dependencies)
+    )
+
+
+def family_of(index: int):
+    """변형 특허면 원본 특허 번호, 아니면 None"""
+    if index % FAMILY_EVERY == FAMILY_EVERY - 1:
+        return index - FAMILY_EVERY // 2
+    return None
+
+
+def measure_recall(index: SimilarityIndex, patent_count: int, limit: int, queries: int = 20) -> dict:
+    """
+    재현율 측정
+    
+    family: 원본 특허로 질의했을 때 변형 특허가 결과에 들어온 비율
+    exhaustive: 기본 세그먼트 전체를 정확한 코사인으로 비교한 상위 limit개와 질의 결과의 겹침
+    """
+    rng = random.Random(11)
+    originals = [i for i in (rng.randrange(patent_count) for _ in range(queries * 10)) if family_of(i) is not None][:queries]
+    found = []
+    overlap = []
+    segment = index.base
+    all_rows = np.arange(len(segment))
+    for variant in originals:
+        key = application_number(family_of(variant))
+        matches = [match for match, _ in index.similar(key, limit)]
+        found.append(application_number(variant) in matches)
+        
+        terms, tf = index.vector_of(key)
+        idf = index.idf(terms)
+        query = tf * idf
+        query /= np.linalg.norm(query)
+        exact = segment.cosine(all_rows, terms, query, idf)
+        exact[index.base_rows[key]] = -1
+        expected = {segment.keys[row] for row in np.argsort(exact)[::-1][:limit]}
+        overlap.append(len(expected & set(matches)) / limit)
+    return {
+        "family": round(statistics.mean(found), 3),
+        "exhaustive": round(statistics.mean(overlap), 3)
+    }
+
+
+def measure_queries(index: SimilarityIndex, keys, limit: int) -> dict:
+    """질의 시간 측정 (ms)"""
+    timings = []
+    for key in keys:
+        start = time.perf_counter()
+        index.similar(key, limit)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+        "max_ms": round(timings[-1], 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 특허 색인 벤치마크")
+    parser.add_argument("--patents", type=int, default=20000, help="특허 수")
+    parser.add_argument("--claims", type=int, default=15, help="특허당 청구항 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 수")
+    parser.add_argument("--limit", type=int, default=20, help="질의당 결과 수")
+    parser.add_argument("--terms", type=int, default=256, help="특허당 저장할 n-gram 수")
+    parser.add_argument("--independent-only", action="store_true", help="독립항(과 초록)만 색인")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        index = SimilarityIndex(directory, terms_per_patent=args.terms, independent_only=args.independent_only)
+        
+        start = time.perf_counter()
+        for i in range(args.patents):
+            index.add(build_patent(i, args.claims), compact=False)
+        add_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        index.compact()
+        compact_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        index = SimilarityIndex(directory, terms_per_patent=args.terms, independent_only=args.independent_only)
+        load_ms = (time.perf_counter() - start) * 1000
+        
+        rng = random.Random(7)
+        keys = [application_number(rng.randrange(args.patents)) for _ in range(args.queries)]
+        index.similar(keys[0], args.limit)
+        base_queries = measure_queries(index, keys, args.limit)
+        recall = measure_recall(index, args.patents, args.limit)
+        
+        # 새 특허를 추가하면서 질의 (추가 세그먼트를 매번 다시 만듦)
+        timings = []
+        for i, key in enumerate(keys):
+            index.add(build_patent(args.patents + i, args.claims), compact=False)
+            start = time.perf_counter()
+            index.similar(key, args.limit)
+            timings.append((time.perf_counter() - start) * 1000)
+        
+        report = {
+            "patents": args.patents,
+            "terms_per_patent": args.terms,
+            "independent_only": args.independent_only,
+            "add_ms_per_patent": round(add_seconds / args.patents * 1000, 3),
+            "compact_seconds": round(compact_seconds, 2),
+            "load_ms": round(load_ms, 2),
+            "stored_terms_per_patent": round(len(index.base.doc_terms) / max(len(index.base), 1), 1),
+            "query": base_queries,
+            "recall": recall,
+            "query_after_add_median_ms": round(statistics.median(timings), 2)
+        }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+실행 모드별 시작 시간 벤치마크
+
+`python -X importtime`으로 run.py의 실행 모드(cli, api)가 첫 작업 직전까지
+import/초기화하는 시간을 측정한다. 임시 디렉토리에서 실행하므로 설정 파일과
+출력 디렉토리 생성 비용도 포함된다.
+
+사용법:
+    python -m benchmarks.bench_startup --repeat 5 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 실행 모드별로 첫 작업 직전까지 수행되는 코드
+MODES = {
+    "import": "import run",
+    "cli": (
+        "import run\n"
+        "from app.services.patent_processor import patent_processor\n"
+        "patent_processor.output_dir"
+    ),
+    "batch": (
+        "import run\n"
+        "from app.services.task_manager import task_manager\n"
+        "from app.services.patent_processor import patent_processor\n"
+        "task_manager.tasks, patent_processor.output_dir"
+    ),
+    "api": (
+        "import run\n"
+        "import uvicorn\n"
+        "from app.main import app"
+    ),
+}
+
+
+def parse_importtime(stderr: str) -> list:
+    """-X importtime 출력 파싱 (모듈, self us, cumulative us)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us)
+        })
+    return entries
+
+
+def run_mode(code: str, workdir: str) -> dict:
+    """모드 코드를 새 인터프리터에서 한 번 실행"""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    
+    entries = parse_importtime(completed.stderr)
+    import_us = sum(entry["cumulative_us"] for entry in entries if entry["depth"] == 0)
+    return {"wall_ms": wall_ms, "import_ms": import_us / 1000, "entries": entries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실행 모드별 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--top", type=int, default=10, help="출력할 느린 모듈 수")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES), help="측정할 모드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    
+    report = {"python": sys.version.split()[0], "repeat": args.repeat, "modes": {}}
+    
+    for mode in args.modes:
+        runs = []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as workdir:
+                runs.append(run_mode(MODES[mode], workdir))
+        
+        # 가장 빠른 실행 기준으로 느린 최상위 모듈 집계
+        fastest = min(runs, key=lambda run: run["wall_ms"])
+        top_modules = sorted(
+            (entry for entry in fastest["entries"] if entry["depth"] <= 1),
+            key=lambda entry: entry["cumulative_us"],
+            reverse=True
+        )[:args.top]
+        
+        report["modes"][mode] = {
+            "wall_ms_median": round(statistics.median(run["wall_ms"] for run in runs), 1),
+            "wall_ms_min": round(fastest["wall_ms"], 1),
+            "import_ms_median": round(statistics.median(run["import_ms"] for run in runs), 1),
+            "modules_imported": len(fastest["entries"]),
+            "top_modules": [
+                {"module": entry["module"], "cumulative_ms": round(entry["cumulative_us"] / 1000, 1)}
+                for entry in top_modules
+            ]
+        }
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
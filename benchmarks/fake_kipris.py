@@ -0,0 +1,216 @@
+"""
+로컬 KIPRIS 대체 서버
+
+벤치마크에서 실제 KIPRIS 대신 사용하는 HTTP 서버. 검색/서지 상세/공개 전문/PDF 요청에
+benchmarks.fixtures로 만든 고정 응답을 주고, 지정한 지연 시간을 주입하며, 엔드포인트별
+호출 수를 센다. 호출 수는 GET /_stats로 조회하고 POST /_reset으로 초기화한다.
+
+사용법:
+    python -m benchmarks.fake_kipris --port 8900 --latency-ms 50 --jitter-ms 20
+    # config.json의 api_settings.base_url을 http://127.0.0.1:8900/kipo-api/kipi/patUtiModInfoSearchSevice 로 설정
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fixtures import build_detail_xml, build_pdf_url_xml, build_search_xml
+
+SERVICE_PATH = "/kipo-api/kipi/patUtiModInfoSearchSevice"
+
+ENDPOINTS = {
+    "getAdvancedSearch": "search",
+    "getBibliographyDetailInfoSearch": "detail",
+    "getPubFullTextInfoSearch": "pdf_url"
+}
+
+
+class FakeKiprisServer:
+    """지연 시간을 주입하는 KIPRIS 대체 서버"""
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 0.0,
+        total_patents: int = 500,
+        claims: int = 15,
+        pdf_kb: int = 256,
+        seed: int = 42
+    ):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            latency_ms: 요청마다 주입하는 기본 지연 시간 (ms)
+            jitter_ms: 기본 지연에 더하는 균등 분포 지연의 최대값 (ms)
+            total_patents: 검색 결과 전체 특허 수
+            claims: 특허당 청구항 수
+            pdf_kb: PDF 응답 크기 (KB)
+            seed: 응답 생성 시드
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.total_patents = total_patents
+        self.claims = claims
+        self.pdf_body = b"%PDF-1.4\n" + b"0" * (pdf_kb * 1024)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        self.detail_cache: Dict[int, bytes] = {}
+        self.httpd = ThreadingHTTPServer((host, port), self.make_handler())
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """서버 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @property
+    def base_url(self) -> str:
+        """config.json의 api_settings.base_url에 넣을 주소"""
+        return self.url + SERVICE_PATH
+    
+    def start(self) -> "FakeKiprisServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-kipris", daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def stats(self) -> Dict[str, int]:
+        """엔드포인트별 호출 수"""
+        with self.lock:
+            return dict(self.counts)
+    
+    def reset(self) -> None:
+        """호출 수 초기화"""
+        with self.lock:
+            self.counts.clear()
+    
+    def count(self, endpoint: str) -> None:
+        with self.lock:
+            self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+    
+    def delay(self) -> None:
+        """지연 시간 주입"""
+        with self.lock:
+            jitter = self.rng.uniform(0, self.jitter_ms) if self.jitter_ms > 0 else 0.0
+        time.sleep((self.latency_ms + jitter) / 1000)
+    
+    def search_body(self, query: Dict[str, str]) -> bytes:
+        num_rows = int(query.get("numOfRows", 100))
+        page_no = int(query.get("pageNo", 1))
+        start = (page_no - 1) * num_rows
+        item_count = max(0, min(num_rows, self.total_patents - start))
+        return build_search_xml(item_count, total_count=self.total_patents, start=start, seed=self.seed)
+    
+    def detail_body(self, query: Dict[str, str]) -> bytes:
+        index = int(query.get("applicationNumber", "0")[-5:])
+        body = self.detail_cache.get(index)
+        if body is None:
+            body = self.detail_cache[index] = build_detail_xml(index, self.claims, seed=self.seed)
+        return body
+    
+    def make_handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def send_body(self, body: bytes, content_type: str, status: int = 200) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_POST(self):
+                if self.path == "/_reset":
+                    server.reset()
+                    self.send_body(b"{}", "application/json")
+                else:
+                    self.send_body(b"not found", "text/plain", 404)
+            
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                
+                if parsed.path == "/_stats":
+                    self.send_body(json.dumps(server.stats()).encode("utf-8"), "application/json")
+                    return
+                
+                if parsed.path.startswith("/pdf/"):
+                    server.count("pdf_download")
+                    server.delay()
+                    self.send_body(server.pdf_body, "application/pdf")
+                    return
+                
+                endpoint = ENDPOINTS.get(parsed.path.rsplit("/", 1)[-1])
+                if endpoint is None:
+                    self.send_body(b"not found", "text/plain", 404)
+                    return
+                
+                server.count(endpoint)
+                server.delay()
+                
+                if endpoint == "search":
+                    body = server.search_body(query)
+                elif endpoint == "detail":
+                    body = server.detail_body(query)
+                else:
+                    body = build_pdf_url_xml(f"{server.url}/pdf/{query.get('applicationNumber', '')}.pdf")
+                self.send_body(body, "application/xml;charset=UTF-8")
+        
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 KIPRIS 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8900, help="포트")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="요청별 지연 시간 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="추가 지연 최대값 (ms)")
+    parser.add_argument("--patents", type=int, default=500, help="검색 결과 전체 특허 수")
+    parser.add_argument("--claims", type=int, default=15, help="특허당 청구항 수")
+    parser.add_argument("--pdf-kb", type=int, default=256, help="PDF 크기 (KB)")
+    args = parser.parse_args()
+    
+    server = FakeKiprisServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        total_patents=args.patents,
+        claims=args.claims,
+        pdf_kb=args.pdf_kb
+    )
+    print(f"KIPRIS 대체 서버: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
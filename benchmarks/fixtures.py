@@ -0,0 +1,123 @@
+"""
+벤치마크용 KIPRIS 응답 생성 모듈
+
+시드를 고정한 난수로 실제 KIPRIS 응답과 같은 구조의 XML(검색 결과, 서지 상세, 공개 전문)을
+만든다. 같은 인자로 호출하면 항상 같은 응답이 나오므로 커밋 간 결과를 비교할 수 있다.
+"""
+
+import random
+from xml.sax.saxutils import escape
+
+INGREDIENTS = [
+    "나이아신아마이드", "알부틴", "병풀 추출물", "히알루론산", "세라마이드", "판테놀", "아데노신",
+    "레티놀", "토코페롤", "글리세린", "부틸렌글라이콜", "녹차 추출물", "마데카소사이드", "스쿠알란"
+]
+PURPOSES = ["피부 미백용", "주름 개선용", "피부 보습용", "항염증용", "피부 장벽 강화용", "자외선 차단용"]
+IPC_CODES = ["A61K 8/97", "A61Q 19/02", "A61K 8/67", "A61Q 19/08", "A61K 8/64", "A61Q 17/04", "A61K 36/185"]
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민준", "서연", "도윤", "하은", "지호", "수아", "예준", "지유", "시우", "채원"]
+
+
+def build_claim(rng: random.Random, number: int) -> str:
+    """임의의 성분/함량으로 청구항 문장 생성"""
+    parts = [
+        f"{rng.choice(INGREDIENTS)} {rng.randint(1, 20) / 10} 내지 {rng.randint(21, 90) / 10} 중량%"
+        for _ in range(rng.randint(3, 8))
+    ]
+    if number > 1 and rng.random() < 0.8:
+        return f"제{rng.randint(1, number - 1)}항에 있어서, 상기 조성물은 " + ", ".join(parts) + "를 더 포함하는 것을 특징으로 하는 화장료 조성물."
+    return f"{rng.choice(PURPOSES)} 화장료 조성물로서, " + ", ".join(parts) + " 및 잔량의 정제수를 포함하는 것을 특징으로 하는 화장료 조성물."
+
+
+def application_number(index: int) -> str:
+    """index번째 특허의 출원번호"""
+    return f"10202000{index:05d}"
+
+
+def register_status(index: int) -> str:
+    """index번째 특허의 등록상태 (3건 중 1건은 공개)"""
+    return "공개" if index % 3 == 0 else "등록"
+
+
+def _wrap_response(body: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        f"<body>{body}</body></response>"
+    ).encode("utf-8")
+
+
+def build_search_xml(item_count: int, total_count: int = None, start: int = 0, seed: int = 42) -> bytes:
+    """
+    getAdvancedSearch 응답 생성
+    
+    Args:
+        item_count: 응답에 포함할 특허 수
+        total_count: 전체 검색 결과 수 (기본값: item_count)
+        start: 첫 특허의 index (페이지 조회용)
+        seed: 난수 시드
+    
+    Returns:
+        UTF-8 XML bytes
+    """
+    items = []
+    for index in range(start, start + item_count):
+        rng = random.Random(seed * 1000003 + index)
+        items.append(
+            "<item>"
+            f"<applicationNumber>{application_number(index)}</applicationNumber>"
+            f"<registerNumber>10{index:07d}</registerNumber>"
+            f"<inventionTitle>{escape(rng.choice(INGREDIENTS))}을 포함하는 {escape(rng.choice(PURPOSES))} 화장료 조성물</inventionTitle>"
+            "<applicantName>코스맥스 주식회사</applicantName>"
+            "<registerDate>20210315</registerDate>"
+            f"<registerStatus>{register_status(index)}</registerStatus>"
+            f"<astrtCont>{escape(' '.join(build_claim(rng, 1) for _ in range(3)))}</astrtCont>"
+            "</item>"
+        )
+    
+    body = f"<items>{''.join(items)}</items>" if items else "<items/>"
+    body += f"<count><totalCount>{item_count if total_count is None else total_count}</totalCount></count>"
+    return _wrap_response(body)
+
+
+def build_detail_xml(index: int, claim_count: int = 15, seed: int = 42) -> bytes:
+    """
+    getBibliographyDetailInfoSearch 응답 생성
+    
+    Args:
+        index: 특허 index
+        claim_count: 청구항 수
+        seed: 난수 시드
+    
+    Returns:
+        UTF-8 XML bytes
+    """
+    rng = random.Random(seed * 1000003 + index)
+    claims = "".join(
+        f"<claimInfo><claim>{escape(build_claim(rng, number))}</claim></claimInfo>"
+        for number in range(1, claim_count + 1)
+    )
+    ipcs = "".join(
+        f"<ipcInfo><ipcDate>20200101</ipcDate><ipcNumber>{code}</ipcNumber></ipcInfo>"
+        for code in rng.sample(IPC_CODES, 3)
+    )
+    inventors = "".join(
+        f"<inventorInfo><name>{rng.choice(SURNAMES)}{rng.choice(GIVEN_NAMES)}</name><country>KR</country></inventorInfo>"
+        for _ in range(rng.randint(1, 4))
+    )
+    return _wrap_response(
+        "<item>"
+        "<biblioSummaryInfoArray><biblioSummaryInfo>"
+        f"<applicationNumber>{application_number(index)}</applicationNumber>"
+        f"<registerStatus>{register_status(index)}</registerStatus>"
+        "</biblioSummaryInfo></biblioSummaryInfoArray>"
+        f"<claimInfoArray>{claims}</claimInfoArray>"
+        f"<ipcInfoArray>{ipcs}</ipcInfoArray>"
+        f"<inventorInfoArray>{inventors}</inventorInfoArray>"
+        "</item>"
+    )
+
+
+def build_pdf_url_xml(pdf_url: str) -> bytes:
+    """getPubFullTextInfoSearch 응답 생성"""
+    return _wrap_response(f"<item><docName>{escape(pdf_url.rsplit('/', 1)[-1])}</docName><path>{escape(pdf_url)}</path></item>")
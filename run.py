@@ -4,21 +4,22 @@
 
 import sys
 import os
+import json
 import argparse
-import uvicorn
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from app.main import app
+# 무거운 모듈(FastAPI, uvicorn, 서비스)은 실행 모드별 함수 안에서 import
 from app.core.config import settings
-from app.services.patent_processor import patent_processor
 
 
 def run_api_server():
     """FastAPI 서버 실행"""
+    import uvicorn
+    
     print(f"🚀 {settings.app_name} 시작")
     print(f"📍 서버 주소: http://{settings.host}:{settings.port}")
     print(f"📖 API 문서: http://{settings.host}:{settings.port}/docs")
@@ -37,92 +38,666 @@ def run_cli_search(
     search_keyword: str = None,
     right_holder: str = None,
     right_holder_code: str = None,
-    max_patents: int = None
+    max_patents: int = None,
+    workers: int = 1,
+    rate: float = None,
+    include_pdf: bool = None,
+    pdf_workers: int = 1,
+    stats_file: str = None,
+    verbose: bool = False
 ):
-    """CLI로 특허 검색 실행"""
+    """
+    CLI로 특허 검색 실행
+    
+    상세 정보는 workers개 스레드로, PDF는 pdf_workers개 스레드로 나누어 처리하고
+    KIPRIS 요청 속도는 rate를 준 경우에만 공용 속도 제한기로 맞춘다. 서비스 로그는 파일로 보내고
+    화면에는 한 줄 진행 상황만 표시한다 (verbose이면 로그를 그대로 출력).
+    
+    Args:
+        search_keyword: 검색 키워드
+        right_holder: 등록권자명
+        right_holder_code: 등록권자 코드
+        max_patents: 최대 특허 수
+        workers: 상세 정보 처리 스레드 수
+        rate: 초당 KIPRIS 요청 수 (None이면 제한 없음)
+        include_pdf: PDF 다운로드 여부 (None이면 설정 파일 값 사용)
+        pdf_workers: PDF 다운로드 스레드 수
+        stats_file: 실행 통계 JSON 저장 경로 (None이면 결과 디렉토리에 저장)
+        verbose: 서비스 로그를 화면에 출력
+    """
+    import contextlib
+    import contextvars
+    import time
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+    from datetime import datetime
+    from app.core import metrics, tracing
+    from app.core.progress import ProgressDisplay
+    from app.services.holder_directory import holder_directory
+    from app.services.patent_processor import patent_processor
+    from app.services.rate_limiter import rate_limiter
+    
     print("🔍 CLI 모드로 특허 검색을 시작합니다.")
     print("-" * 50)
     
+    log_file = None
     try:
         # 기본값 설정
         if search_keyword is None:
             search_keyword = settings.search_keyword
+        if right_holder_code is None:
+            # 등록권자명만 주어지면 등록권자 디렉터리에서 코드 찾기 (KIPRIS 요청 없음)
+            right_holder_code = holder_directory.resolve_code(right_holder, None)
         if right_holder is None:
             right_holder = settings.right_holder
-        if right_holder_code is None:
-            right_holder_code = settings.right_holder_code
         if max_patents is None:
             max_patents = settings.max_patents
+        if include_pdf is None:
+            include_pdf = settings.download_pdfs
+        workers = max(1, workers)
+        pdf_workers = max(1, pdf_workers)
+        # CLI는 --rate를 준 경우에만 요청 속도를 제한 (설정 파일의 요청 간 지연은 API 서버/배치 모드용)
+        rate_limiter.set_rate(rate)
         
         print(f"검색 키워드: {search_keyword}")
         print(f"등록권자: {right_holder}({right_holder_code})")
         print(f"최대 특허 수: {max_patents}")
-        print("-" * 50)
+        print(f"작업 스레드: 상세 {workers}개" + (f", PDF {pdf_workers}개" if include_pdf else " (PDF 제외)"))
+        print(f"요청 속도: {f'초당 {rate_limiter.rate:g}건' if rate_limiter.rate else '제한 없음'}")
         
-        # 검색 실행
-        patents = patent_processor.search_and_extract_patents(
-            search_keyword=search_keyword,
-            right_holder=right_holder,
-            right_holder_code=right_holder_code,
-            max_patents=max_patents
-        )
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_path = None
+        if verbose:
+            log_context = contextlib.nullcontext()
+        else:
+            log_path = os.path.join(patent_processor.output_dir, "logs", f"cli_{timestamp}.log")
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            log_file = open(log_path, 'w', encoding='utf-8')
+            log_context = contextlib.redirect_stdout(log_file)
+            print(f"상세 로그: {log_path}")
+        print("-" * 50)
         
-        if not patents:
-            print("❌ 검색된 특허가 없습니다.")
-            return
+        # 단계별 처리 시간 수집 (작업 스레드에는 컨텍스트를 복사하여 전달)
+        trace = tracing.Trace(f"cli_{timestamp}")
+        tracing.current_trace.set(trace)
         
-        print(f"✅ {len(patents)}건의 특허를 찾았습니다.")
+        def submit(executor, func, *args, **kwargs):
+            return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
         
-        # 상세 정보 처리
-        claims_saved = 0
+        console = sys.stdout
+        start_time = time.perf_counter()
+        detail_failures = []
+        pdf_failures = []
         pdfs_downloaded = 0
-        processed_patents = []
         
-        for i, patent_info in enumerate(patents, 1):
-            print(f"\n[{i}/{len(patents)}] 처리 중: {patent_info.application_number}")
-            print(f"  📄 발명명칭: {patent_info.invention_title}")
-            
-            detail_info = patent_processor.process_patent_details(
-                patent_info=patent_info,
-                include_claims=settings.save_claims,
-                include_pdf=settings.download_pdfs
+        with log_context:
+            # 검색 실행
+            patents = patent_processor.search_and_extract_patents(
+                search_keyword=search_keyword,
+                right_holder=right_holder,
+                right_holder_code=right_holder_code,
+                max_patents=max_patents
             )
             
-            processed_patents.append(detail_info)
+            if not patents:
+                print("❌ 검색된 특허가 없습니다.", file=console)
+                return
             
-            if detail_info.claims:
-                claims_saved += 1
-            if detail_info.pdf_url and settings.download_pdfs:
-                pdfs_downloaded += 1
-        
-        # 요약 보고서 생성
-        summary_report = patent_processor.create_summary_report(
-            patents=processed_patents,
-            claims_saved=claims_saved,
-            pdfs_downloaded=pdfs_downloaded,
-            search_keyword=search_keyword,
-            right_holder=right_holder,
-            right_holder_code=right_holder_code
-        )
+            print(f"✅ {len(patents)}건의 특허를 찾았습니다.", file=console)
+            
+            results = [None] * len(patents)
+            progress = ProgressDisplay(len(patents), stream=console)
+            
+            # 상세 정보 처리 → (공개 특허) PDF 다운로드 순서로 파이프라인 처리
+            detail_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detail")
+            pdf_pool = ThreadPoolExecutor(max_workers=pdf_workers, thread_name_prefix="pdf") if include_pdf else None
+            try:
+                pending = {}
+                for index, patent_info in enumerate(patents):
+                    future = submit(
+                        detail_pool,
+                        patent_processor.process_patent_details,
+                        patent_info=patent_info,
+                        include_claims=settings.save_claims,
+                        include_pdf=False,
+                        raise_on_fetch_failure=True
+                    )
+                    pending[future] = ("detail", index)
+                
+                finished = 0
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stage, index = pending.pop(future)
+                        patent_info = patents[index]
+                        
+                        if stage == "detail":
+                            try:
+                                results[index] = future.result()
+                            except Exception as e:
+                                detail_failures.append({"application_number": patent_info.application_number, "error": str(e)})
+                                results[index] = None
+                            
+                            if pdf_pool is not None and results[index] is not None and patent_processor.current_register_status(patent_info) == '공개':
+                                pending[submit(pdf_pool, patent_processor.fetch_patent_pdf, patent_info)] = ("pdf", index)
+                                continue
+                        else:
+                            try:
+                                pdf_url, downloaded = future.result()
+                            except Exception as e:
+                                pdf_url, downloaded = None, False
+                                print(f"PDF 처리 실패 ({patent_info.application_number}): {e}")
+                            results[index].pdf_url = pdf_url
+                            if downloaded:
+                                pdfs_downloaded += 1
+                            elif pdf_url is None or settings.download_pdfs:
+                                # PDF 작업이 실행된 특허 중 URL을 찾지 못했거나 다운로드에 실패한 특허
+                                pdf_failures.append(patent_info.application_number)
+                        
+                        finished += 1
+                        extra = {"실패": len(detail_failures)}
+                        if pdf_pool is not None:
+                            extra["PDF"] = pdfs_downloaded
+                        progress.update(finished, **extra)
+            finally:
+                detail_pool.shutdown(wait=True)
+                if pdf_pool is not None:
+                    pdf_pool.shutdown(wait=True)
+                progress.close()
+            
+            processed_patents = [detail for detail in results if detail is not None]
+            claims_saved = sum(1 for detail in processed_patents if detail.claims)
+            
+            # 요약 보고서 생성
+            summary_report = patent_processor.create_summary_report(
+                patents=processed_patents,
+                claims_saved=claims_saved,
+                pdfs_downloaded=pdfs_downloaded,
+                search_keyword=search_keyword,
+                right_holder=right_holder,
+                right_holder_code=right_holder_code
+            )
+        
+        elapsed = time.perf_counter() - start_time
+        
+        # 실행 통계 저장
+        stats = {
+            "search_keyword": search_keyword,
+            "right_holder": right_holder,
+            "right_holder_code": right_holder_code,
+            "workers": workers,
+            "pdf_workers": pdf_workers if include_pdf else 0,
+            "rate_per_second": rate_limiter.rate,
+            "total_patents": len(patents),
+            "processed_patents": len(processed_patents),
+            "claims_saved": claims_saved,
+            "pdfs_downloaded": pdfs_downloaded,
+            "elapsed_seconds": round(elapsed, 3),
+            "patents_per_second": round(len(processed_patents) / elapsed, 3) if elapsed > 0 else None,
+            "stage_seconds": trace.stage_timings(),
+            "kipris_requests": metrics.kipris_request_duration.snapshot(),
+            "retries": metrics.kipris_request_retries.snapshot(),
+            "failures": {
+                "details": detail_failures,
+                "pdfs": pdf_failures,
+                "kipris_errors": metrics.kipris_request_errors.snapshot()
+            },
+            "summary_report": summary_report,
+            "log_file": log_path
+        }
+        if stats_file is None:
+            stats_file = os.path.join(patent_processor.output_dir, f"cli_stats_{timestamp}.json")
+        with open(stats_file, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
         
         # 결과 출력
         print("\n" + "="*60)
         print("✅ 처리 완료!")
-        print(f"📊 총 처리된 특허: {len(processed_patents)}건")
+        print(f"📊 총 처리된 특허: {len(processed_patents)}건 ({elapsed:.1f}초, 초당 {stats['patents_per_second']}건)")
         if settings.save_claims:
             print(f"📝 청구항 저장: {claims_saved}건")
-        if settings.download_pdfs:
-            print(f"📁 PDF 다운로드: {pdfs_downloaded}건")
+        if include_pdf:
+            print(f"📁 PDF 다운로드: {pdfs_downloaded}건 (실패 {len(pdf_failures)}건)")
+        if detail_failures:
+            print(f"⚠️ 상세 정보 처리 실패: {len(detail_failures)}건")
+        print(f"🔁 KIPRIS 재시도: {int(sum(stats['retries'].values()))}회")
         print(f"📂 결과 저장 위치: {os.path.abspath(patent_processor.output_dir)}")
         if summary_report:
             print(f"📋 요약 보고서: {summary_report}")
+        print(f"📈 실행 통계: {stats_file}")
         print("="*60)
+    
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        # 검색 결과가 없거나 오류로 끝난 경우에도 로그 파일 닫기
+        if log_file is not None:
+            log_file.close()
+
+
+def load_batch_queries(query_file: str) -> list:
+    """
+    배치 검색 조건 파일(JSONL) 로드
+    
+    Args:
+        query_file: 한 줄에 검색 조건 하나인 JSONL 파일 경로
+    
+    Returns:
+        BatchQuery 목록
+    """
+    from app.models.schemas import BatchQuery
+    
+    queries = []
+    with open(query_file, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{query_file}:{line_no} JSON 형식 오류: {e}")
+            
+            queries.append(BatchQuery(
+                search_keyword=entry.get('search_keyword', entry.get('keyword')),
+                right_holder=entry.get('right_holder'),
+                right_holder_code=entry.get('right_holder_code'),
+                max_patents=entry.get('max_patents')
+            ))
+    
+    return queries
+
+
+async def run_batch_async(batch_id: str, interval: float = 2.0):
+    """배치를 실행하면서 전체 진행 상황을 주기적으로 출력"""
+    import asyncio
+    from app.services.task_manager import task_manager
+    
+    handle = task_manager.launch_batch(batch_id)
+    while not handle.done():
+        await asyncio.wait({handle}, timeout=interval)
+        status = task_manager.get_batch_status(batch_id)
+        print(
+            f"⏳ 진행률 {status.progress}% | 검색 조건 {status.completed_queries}/{status.total_queries} | "
+            f"특허 {status.processed_patents}/{status.total_patents} (중복 재사용 {status.duplicate_patents}건)"
+        )
+    
+    return task_manager.get_batch_status(batch_id)
+
+
+def run_cli_batch(
+    query_file: str,
+    concurrency: int = None,
+    rate: float = None,
+    include_pdf: bool = None
+):
+    """
+    CLI로 여러 등록권자 배치 처리 실행
+    
+    모든 검색 조건을 한 프로세스에서 동시에 처리하며 HTTP 연결 풀, 요청 속도 제한기,
+    중복 특허 상세 정보를 공유한다.
+    
+    Args:
+        query_file: 검색 조건 JSONL 파일 경로
+        concurrency: 동시에 처리할 검색 조건 수 (None이면 설정 파일 값 사용)
+        rate: 초당 KIPRIS 요청 수 (None이면 설정 파일의 요청 간 지연 사용)
+        include_pdf: PDF 다운로드 여부 (None이면 설정 파일 값 사용)
+    """
+    import asyncio
+    from app.models.schemas import BatchProcessRequest
+    from app.services.patent_processor import patent_processor
+    from app.services.rate_limiter import rate_limiter
+    from app.services.task_manager import task_manager
+    
+    print("📦 배치 모드로 특허 처리를 시작합니다.")
+    print("-" * 50)
+    
+    try:
+        queries = load_batch_queries(query_file)
+        if not queries:
+            print("❌ 검색 조건이 없습니다.")
+            return
+        
+        if concurrency is not None:
+            settings.batch_concurrency = max(1, concurrency)
+        if rate is not None:
+            rate_limiter.set_rate(rate)
+        if include_pdf is None:
+            include_pdf = settings.download_pdfs
+        
+        batch_id = task_manager.create_batch(BatchProcessRequest(
+            queries=queries,
+            save_claims=settings.save_claims,
+            download_pdfs=include_pdf
+        ))
+        print(f"검색 조건 수: {len(queries)} (동시 처리 {settings.batch_concurrency}개)")
+        print(f"요청 속도: {f'초당 {rate_limiter.rate:g}건' if rate_limiter.rate else '제한 없음'}")
+        print("-" * 50)
+        
+        status = asyncio.run(run_batch_async(batch_id))
         
+        # 결과 출력
+        print("\n" + "="*60)
+        print("✅ 배치 처리 완료!")
+        for query, task in zip(queries, status.tasks):
+            keyword = query.search_keyword or settings.search_keyword
+            # 등록권자명만 준 검색 조건은 태스크 요청에 디렉터리에서 찾은 코드가 들어 있음
+            holder_code = task_manager.requests[task.task_id].right_holder_code or settings.right_holder_code
+            print(f"  [{task.status}] {keyword} / {holder_code}: {task.processed_patents}/{task.total_patents}건 - {task.message}")
+        print("-" * 60)
+        print(f"📊 검색 조건별 특허 합계: {status.total_patents}건")
+        print(f"🔁 중복 제외 특허: {status.unique_patents}건 (중복 재사용 {status.duplicate_patents}건)")
+        if status.start_time and status.end_time:
+            print(f"⏱️ 처리 시간: {(status.end_time - status.start_time).total_seconds():.1f}초")
+        print(f"📂 결과 저장 위치: {os.path.abspath(patent_processor.output_dir)}")
+        if status.report_path:
+            print(f"📋 종합 보고서: {status.report_path}")
+        print("="*60)
+    
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         sys.exit(1)
 
 
+def run_cli_watch(args):
+    """
+    CLI로 신규 특허 구독 관리/실행
+    
+    Args:
+        args: watch 하위 명령 인자 (action: add, list, remove, poll, run)
+    """
+    import time
+    from app.models.schemas import WatchRequest
+    from app.services.watch_manager import watch_manager
+    
+    try:
+        if args.action == 'add':
+            sinks = args.sink or ["file"]
+            if args.webhook and "webhook" not in sinks:
+                sinks.append("webhook")
+            subscription = watch_manager.add_subscription(WatchRequest(
+                search_keyword=args.keyword,
+                right_holder=args.right_holder,
+                right_holder_code=args.right_holder_code,
+                interval_seconds=args.interval,
+                sinks=sinks,
+                webhook_url=args.webhook
+            ))
+            print(f"✅ 구독 등록: {subscription.subscription_id}")
+            print(f"   {subscription.search_keyword or '-'} / {subscription.right_holder_code}, {subscription.interval_seconds}초마다 확인, 알림: {', '.join(subscription.sinks)}")
+        
+        elif args.action == 'list':
+            subscriptions = watch_manager.list_subscriptions()
+            if not subscriptions:
+                print("등록된 구독이 없습니다.")
+            for subscription in subscriptions:
+                last_checked = subscription.last_checked.strftime('%Y-%m-%d %H:%M:%S') if subscription.last_checked else "-"
+                print(
+                    f"{subscription.subscription_id} | {subscription.search_keyword or '-'} / {subscription.right_holder_code} | "
+                    f"{subscription.interval_seconds}초 | 마지막 확인 {last_checked} | 확인 {subscription.polls}회, "
+                    f"KIPRIS 요청 {subscription.kipris_requests}건, 이벤트 {subscription.events_emitted}건"
+                )
+        
+        elif args.action == 'remove':
+            if not args.subscription_id or not watch_manager.remove_subscription(args.subscription_id):
+                print("❌ 구독을 찾을 수 없습니다.")
+                sys.exit(1)
+            print(f"✅ 구독 삭제: {args.subscription_id}")
+        
+        elif args.action == 'poll':
+            # 확인 주기와 관계없이 지정한 구독(없으면 전체)을 한 번 확인
+            subscription_ids = [args.subscription_id] if args.subscription_id else [
+                subscription.subscription_id for subscription in watch_manager.list_subscriptions()
+            ]
+            for subscription_id in subscription_ids:
+                events = watch_manager.poll_subscription(subscription_id)
+                print(f"🔔 {subscription_id}: {len(events)}건")
+                for event in events:
+                    status = f"{event.previous_status} → {event.patent.register_status}" if event.event_type == "changed" else event.patent.register_status
+                    print(f"   [{event.event_type}] {event.patent.application_number} {event.patent.invention_title} ({status})")
+        
+        elif args.action == 'run':
+            print(f"👀 구독 {len(watch_manager.list_subscriptions())}개를 확인합니다. (Ctrl+C로 종료)")
+            while True:
+                for subscription_id, count in watch_manager.poll_due().items():
+                    print(f"🔔 {subscription_id}: {'확인 실패' if count < 0 else f'{count}건'}")
+                time.sleep(args.tick)
+    
+    except KeyboardInterrupt:
+        print("\n구독 확인을 종료합니다.")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+
+
+def run_cli_refresh_status(max_requests=None, holder_codes=None, output_file=None):
+    """
+    CLI로 저장된 특허 등록상태 갱신
+    
+    Args:
+        max_requests: 최대 KIPRIS 검색 요청 수
+        holder_codes: 갱신할 등록권자 코드 목록
+        output_file: 갱신 보고서 JSON 저장 경로
+    """
+    from app.services.status_refresh import status_refresher
+    
+    if not settings.use_patent_store:
+        print("❌ 특허 저장소를 사용하지 않도록 설정되어 있습니다. (output_settings.use_patent_store)")
+        sys.exit(1)
+    
+    try:
+        report = status_refresher.run(max_requests=max_requests, holder_codes=holder_codes)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    
+    print(f"🔄 등록권자 {report['holders_refreshed']}곳 확인 완료, {report['holders_pending']}곳 다음 실행으로 연기")
+    print(f"   KIPRIS 요청 {report['kipris_requests']}건, 확인 {report['checked']}건, 변경 {report['changed']}건, 검색 결과에서 빠짐 {report['missing']}건")
+    for transition, count in report["transitions"].items():
+        print(f"   {transition}: {count}건")
+    for error in report["errors"]:
+        print(f"   ⚠️ {error['right_holder_code']}: {error['error']}")
+    
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📄 갱신 보고서 저장: {output_file}")
+
+
+def run_cli_ingredients(name=None, retag=False, top=30):
+    """
+    CLI로 청구항 성분 조회/태깅
+    
+    Args:
+        name: 조회할 성분 이름 (없으면 많이 나온 성분 목록)
+        retag: 저장된 특허 중 현재 성분 사전으로 태깅하지 않은 특허를 먼저 태깅
+        top: 성분 목록 개수
+    """
+    from app.services.ingredient_tagger import ingredient_tagger
+    from app.services.patent_store import patent_store
+    
+    if not ingredient_tagger.enabled:
+        print("❌ 성분 사전이 설정되지 않았습니다. (analysis_settings.ingredient_dictionary)")
+        sys.exit(1)
+    
+    if retag:
+        retagged, tagged = ingredient_tagger.retag_store()
+        print(f"🏷️ {retagged}건 태깅 (성분이 나온 특허 {tagged}건)")
+    
+    if name:
+        ingredient = ingredient_tagger.resolve(name)
+        if ingredient is None:
+            print(f"❌ 성분 사전에 없는 성분입니다: {name}")
+            sys.exit(1)
+        
+        patents = patent_store.ingredient_patents(ingredient)
+        print(f"🧪 {ingredient}: {len(patents)}건")
+        for item in patents:
+            patent = item["patent"]
+            claims = ", ".join(str(claim_no) for claim_no in item["claims"])
+            print(f"   {patent['application_number']} {patent['invention_title']} (청구항 {claims})")
+        return
+    
+    for ingredient, count in patent_store.ingredient_counts(top):
+        print(f"   {ingredient}: {count}건")
+
+
+def run_cli_similar(application_number=None, limit=10, rebuild=False):
+    """
+    CLI로 유사 특허 조회
+    
+    Args:
+        application_number: 기준 출원번호 (없으면 색인 통계만 출력)
+        limit: 최대 결과 수
+        rebuild: 특허 저장소에 청구항이 있는 특허 중 색인에 없는 특허를 먼저 색인
+    """
+    import time
+    from app.services.similarity_index import similarity_index
+    from app.services.patent_store import patent_store
+    
+    if rebuild:
+        started = time.perf_counter()
+        added = similarity_index.rebuild_from_store()
+        print(f"🔎 {added}건 색인 ({time.perf_counter() - started:.1f}초)")
+    
+    if not application_number:
+        stats = similarity_index.stats()
+        print(f"🔎 유사 특허 색인: {stats['patents']}건 (세대 {stats['generation']}, 미병합 {stats['delta_patents']}건)")
+        return
+    
+    started = time.perf_counter()
+    try:
+        matches = similarity_index.similar(application_number, limit)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if matches is None:
+        print(f"❌ 유사 특허 색인에 없는 특허입니다: {application_number}")
+        sys.exit(1)
+    
+    took_ms = (time.perf_counter() - started) * 1000
+    basic_infos = patent_store.get_basic_infos([key for key, _ in matches]) if settings.use_patent_store else {}
+    print(f"🔎 {application_number}와 비슷한 특허 {len(matches)}건 ({took_ms:.1f}ms)")
+    for key, score in matches:
+        basic_info = basic_infos.get(key)
+        title = basic_info.invention_title if basic_info else ""
+        print(f"   {score:.3f} {key} {title}")
+
+
+def run_cli_inventors(name=None, applicant=False, graph=False, rebuild=False, top=30):
+    """
+    CLI로 발명자/출원인 특허 조회
+    
+    Args:
+        name: 조회할 이름 (없으면 특허가 많은 이름 목록)
+        applicant: 발명자 대신 출원인으로 조회
+        graph: 특허 목록 대신 공동 발명자(공동 출원인) 목록 출력
+        rebuild: 특허 저장소의 특허 중 색인하지 않은 특허를 먼저 색인
+        top: 이름 목록 개수
+    """
+    from app.services.entity_index import entity_index
+    from app.services.patent_store import patent_store
+    
+    if not settings.use_patent_store:
+        print("❌ 특허 저장소를 사용하지 않도록 설정되어 있습니다.")
+        sys.exit(1)
+    
+    kind = "applicant" if applicant else "inventor"
+    label = "출원인" if applicant else "발명자"
+    
+    if rebuild:
+        indexed = entity_index.rebuild_store()
+        print(f"👤 {indexed}건 색인")
+    
+    if not name:
+        for _, display, count in patent_store.entity_counts(kind, top):
+            print(f"   {display}: {count}건")
+        return
+    
+    if graph:
+        result = entity_index.graph(kind, name, top)
+        if result is None:
+            print(f"❌ {label} 색인에 없는 이름입니다: {name}")
+            sys.exit(1)
+        print(f"👥 {name}과 함께 나온 {label} {len(result['nodes']) - 1}명")
+        for node in result["nodes"][1:]:
+            print(f"   {node['name']}: 공동 특허 {node['patents']}건")
+        return
+    
+    result = entity_index.patents(kind, name)
+    if result is None:
+        print(f"❌ {label} 색인에 없는 이름입니다: {name}")
+        sys.exit(1)
+    print(f"👤 {', '.join(result['names'])}: {len(result['patents'])}건 (등록권자 {len(result['right_holders'])}곳)")
+    for item in result["patents"]:
+        patent = item["patent"]
+        print(f"   {patent['application_number']} {patent['invention_title']} ({patent['applicant_name']})")
+
+
+def run_cli_holders(name=None, limit=5):
+    """
+    CLI로 등록권자명의 등록권자 코드 조회 (이전 검색 결과로 만든 등록권자 디렉터리)
+    
+    Args:
+        name: 등록권자명 (없으면 디렉터리 통계만 출력)
+        limit: 최대 결과 수
+    """
+    import time
+    from app.services.holder_directory import holder_directory
+    
+    stats = holder_directory.stats()
+    if not name:
+        print(f"🏢 등록권자 디렉터리: 이름 {stats['names']}개, 등록권자 코드 {stats['codes']}개")
+        return
+    
+    started = time.perf_counter()
+    matches = holder_directory.lookup(name, limit)
+    took_ms = (time.perf_counter() - started) * 1000
+    if not matches:
+        print(f"❌ 등록권자 디렉터리에 없는 등록권자입니다: {name}")
+        sys.exit(1)
+    
+    print(f"🏢 {name}: {len(matches)}곳 ({took_ms:.3f}ms)")
+    for match in matches:
+        print(f"   {match['score']:.2f} {match['name']} → {match['right_holder_code']} (특허 {match['patents']}건)")
+
+
+def run_cli_portfolio(right_holder_code, rebuild=False, top=20, as_json=False):
+    """
+    CLI로 등록권자 포트폴리오 집계 조회
+    
+    Args:
+        right_holder_code: 등록권자 코드
+        rebuild: 특허 저장소의 특허 중 집계하지 않은 특허를 먼저 집계
+        top: IPC/성분 분포의 상위 값 수
+        as_json: 텍스트 대신 JSON 출력
+    """
+    from app.core.portfolio import build_report, format_report
+    from app.services.patent_store import patent_store
+    
+    if not settings.use_patent_store:
+        print("❌ 특허 저장소를 사용하지 않도록 설정되어 있습니다.")
+        sys.exit(1)
+    
+    if rebuild:
+        aggregated = patent_store.aggregate_unaggregated()
+        print(f"📊 {aggregated}건 집계")
+    
+    counts = patent_store.holder_facets(right_holder_code)
+    if not counts:
+        print(f"❌ 저장된 특허가 없는 등록권자 코드입니다: {right_holder_code}")
+        sys.exit(1)
+    
+    report = build_report(counts, top)
+    if as_json:
+        print(json.dumps({"right_holder_code": right_holder_code, **report}, ensure_ascii=False, indent=2))
+        return
+    print(f"📊 등록권자 코드: {right_holder_code}")
+    for line in format_report(report):
+        print(f"   {line}" if line else "")
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(
@@ -141,6 +716,35 @@ def main():
   
   # CLI로 특정 등록권자 검색
   python run.py cli --right-holder "코스맥스 주식회사" --right-holder-code "120140131250"
+  
+  # CLI로 500건을 8개 스레드, 초당 5건 요청으로 처리 (PDF 제외)
+  python run.py cli --max-patents 500 --workers 8 --rate 5 --no-pdf
+  
+  # 여러 등록권자 배치 처리 (한 줄에 {"search_keyword": ..., "right_holder_code": ...})
+  python run.py batch queries.jsonl
+  
+  # 등록권자 신규 특허 구독 등록 후 주기적으로 확인
+  python run.py watch add --right-holder-code "120140131250" --keyword "조성물" --interval 3600
+  python run.py watch run
+  
+  # 저장된 특허 등록상태 갱신 (KIPRIS 검색 요청 최대 20건)
+  python run.py refresh-status --max-requests 20
+  
+  # 청구항에 글리세린이 나온 특허 조회 (동의어로도 조회 가능)
+  python run.py ingredients Glycerin
+  
+  # 청구항 내용이 비슷한 특허 조회 (--rebuild: 저장된 특허로 색인 보충)
+  python run.py similar 1020200012345 --limit 10
+  
+  # 발명자의 특허와 공동 발명자 조회 (--rebuild: 저장된 특허로 색인 보충)
+  python run.py inventors 홍길동
+  python run.py inventors 홍길동 --graph
+  
+  # 등록권자명으로 등록권자 코드 조회 (이전 검색 결과 기준, 오타 허용)
+  python run.py holders 코스멕스
+  
+  # 등록권자 포트폴리오 집계 (--rebuild: 이전에 저장된 특허 집계)
+  python run.py portfolio 120140131250
         """
     )
     
@@ -148,8 +752,8 @@ def main():
     
     # API 서버 모드
     api_parser = subparsers.add_parser('api', help='FastAPI 서버 실행')
-    api_parser.add_argument('--host', default=settings.host, help='서버 호스트')
-    api_parser.add_argument('--port', type=int, default=settings.port, help='서버 포트')
+    api_parser.add_argument('--host', help='서버 호스트 (기본값: 설정 파일)')
+    api_parser.add_argument('--port', type=int, help='서버 포트 (기본값: 설정 파일)')
     api_parser.add_argument('--debug', action='store_true', help='디버그 모드')
     
     # CLI 모드
@@ -158,6 +762,69 @@ def main():
     cli_parser.add_argument('--right-holder', '-r', help='등록권자명')
     cli_parser.add_argument('--right-holder-code', '-c', help='등록권자 코드')
     cli_parser.add_argument('--max-patents', '-m', type=int, help='최대 특허 수')
+    cli_parser.add_argument('--workers', '-w', type=int, default=1, help='상세 정보 처리 스레드 수 (기본값: 1)')
+    cli_parser.add_argument('--rate', type=float, help='초당 KIPRIS 요청 수 (기본값: 제한 없음)')
+    cli_parser.add_argument('--no-pdf', action='store_true', help='PDF 다운로드 제외')
+    cli_parser.add_argument('--pdf-workers', type=int, default=1, help='PDF 다운로드 스레드 수 (기본값: 1)')
+    cli_parser.add_argument('--stats-file', help='실행 통계 JSON 저장 경로 (기본값: 결과 디렉토리)')
+    cli_parser.add_argument('--verbose', '-v', action='store_true', help='진행 표시 대신 상세 로그 출력')
+    
+    # 배치 모드
+    batch_parser = subparsers.add_parser('batch', help='검색 조건 파일(JSONL)로 배치 처리 실행')
+    batch_parser.add_argument('query_file', help='검색 조건 JSONL 파일 경로')
+    batch_parser.add_argument('--concurrency', '-c', type=int, help='동시에 처리할 검색 조건 수 (기본값: batch_concurrency 설정)')
+    batch_parser.add_argument('--rate', type=float, help='초당 KIPRIS 요청 수 (기본값: 설정 파일의 요청 간 지연)')
+    batch_parser.add_argument('--no-pdf', action='store_true', help='PDF 다운로드 제외')
+    
+    # 구독 모드
+    watch_parser = subparsers.add_parser('watch', help='등록권자별 신규 특허 구독 관리/실행')
+    watch_parser.add_argument('action', choices=['add', 'list', 'remove', 'poll', 'run'], help='구독 명령')
+    watch_parser.add_argument('subscription_id', nargs='?', help='구독 ID (remove, poll)')
+    watch_parser.add_argument('--keyword', '-k', help='검색 키워드 (add)')
+    watch_parser.add_argument('--right-holder', '-r', help='등록권자명 (add)')
+    watch_parser.add_argument('--right-holder-code', '-c', help='등록권자 코드 (add)')
+    watch_parser.add_argument('--interval', type=int, help='확인 주기 (초, add)')
+    watch_parser.add_argument('--sink', action='append', choices=['file', 'webhook', 'sse'], help='알림 대상 (add, 여러 번 지정 가능, 기본값: file)')
+    watch_parser.add_argument('--webhook', help='webhook URL (add)')
+    watch_parser.add_argument('--tick', type=float, default=30.0, help='확인할 구독을 찾는 간격 (초, run)')
+    
+    # 등록상태 갱신 모드
+    refresh_parser = subparsers.add_parser('refresh-status', help='저장된 특허 등록상태 갱신')
+    refresh_parser.add_argument('--max-requests', type=int, help='최대 KIPRIS 검색 요청 수 (기본값: 설정값)')
+    refresh_parser.add_argument('--holder-code', action='append', help='이 등록권자 코드만 갱신 (여러 번 지정 가능)')
+    refresh_parser.add_argument('--output', '-o', help='갱신 보고서 JSON 저장 경로')
+    
+    # 성분 조회 모드
+    ingredients_parser = subparsers.add_parser('ingredients', help='청구항 성분 조회/태깅')
+    ingredients_parser.add_argument('name', nargs='?', help='조회할 성분 이름 (없으면 많이 나온 성분 목록)')
+    ingredients_parser.add_argument('--retag', action='store_true', help='저장된 특허를 현재 성분 사전으로 다시 태깅')
+    ingredients_parser.add_argument('--top', type=int, default=30, help='성분 목록 개수')
+    
+    # 유사 특허 조회 모드
+    similar_parser = subparsers.add_parser('similar', help='청구항 내용이 비슷한 특허 조회')
+    similar_parser.add_argument('application_number', nargs='?', help='기준 출원번호 (없으면 색인 통계)')
+    similar_parser.add_argument('--limit', '-n', type=int, default=10, help='최대 결과 수')
+    similar_parser.add_argument('--rebuild', action='store_true', help='특허 저장소의 특허 중 색인에 없는 특허를 먼저 색인')
+    
+    # 발명자/출원인 조회 모드
+    inventors_parser = subparsers.add_parser('inventors', help='발명자/출원인 특허 조회')
+    inventors_parser.add_argument('name', nargs='?', help='조회할 이름 (없으면 특허가 많은 이름 목록)')
+    inventors_parser.add_argument('--applicant', action='store_true', help='발명자 대신 출원인으로 조회')
+    inventors_parser.add_argument('--graph', action='store_true', help='공동 발명자(공동 출원인) 목록 출력')
+    inventors_parser.add_argument('--rebuild', action='store_true', help='특허 저장소의 특허 중 색인하지 않은 특허를 먼저 색인')
+    inventors_parser.add_argument('--top', type=int, default=30, help='목록 개수')
+    
+    # 등록권자 코드 조회 모드
+    holders_parser = subparsers.add_parser('holders', help='등록권자명으로 등록권자 코드 조회')
+    holders_parser.add_argument('name', nargs='?', help='등록권자명 (없으면 디렉터리 통계)')
+    holders_parser.add_argument('--limit', '-n', type=int, default=5, help='최대 결과 수')
+    
+    # 포트폴리오 집계 모드
+    portfolio_parser = subparsers.add_parser('portfolio', help='등록권자 포트폴리오 집계 조회')
+    portfolio_parser.add_argument('right_holder_code', help='등록권자 코드')
+    portfolio_parser.add_argument('--rebuild', action='store_true', help='특허 저장소의 특허 중 집계하지 않은 특허를 먼저 집계')
+    portfolio_parser.add_argument('--top', type=int, default=20, help='IPC/성분 분포의 상위 값 수')
+    portfolio_parser.add_argument('--json', action='store_true', help='JSON으로 출력')
     
     args = parser.parse_args()
     
@@ -171,16 +838,65 @@ def main():
             settings.port = args.port
         
         run_api_server()
-        
+    
     elif args.mode == 'cli':
         # CLI 모드 실행
         run_cli_search(
             search_keyword=args.keyword,
             right_holder=args.right_holder,
             right_holder_code=args.right_holder_code,
-            max_patents=args.max_patents
+            max_patents=args.max_patents,
+            workers=args.workers,
+            rate=args.rate,
+            include_pdf=False if args.no_pdf else None,
+            pdf_workers=args.pdf_workers,
+            stats_file=args.stats_file,
+            verbose=args.verbose
         )
-        
+    
+    elif args.mode == 'batch':
+        # 배치 모드 실행
+        run_cli_batch(
+            args.query_file,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            include_pdf=False if args.no_pdf else None
+        )
+    
+    elif args.mode == 'watch':
+        # 구독 모드 실행
+        if args.action == 'add' and not args.right_holder_code:
+            parser.error("watch add에는 --right-holder-code가 필요합니다.")
+        run_cli_watch(args)
+    
+    elif args.mode == 'refresh-status':
+        # 등록상태 갱신 모드 실행
+        run_cli_refresh_status(
+            max_requests=args.max_requests,
+            holder_codes=args.holder_code,
+            output_file=args.output
+        )
+    
+    elif args.mode == 'ingredients':
+        # 성분 조회 모드 실행
+        run_cli_ingredients(args.name, retag=args.retag, top=args.top)
+    
+    elif args.mode == 'similar':
+        # 유사 특허 조회 모드 실행
+        run_cli_similar(args.application_number, limit=args.limit, rebuild=args.rebuild)
+    
+    elif args.mode == 'inventors':
+        # 발명자/출원인 조회 모드 실행
+        run_cli_inventors(args.name, applicant=args.applicant, graph=args.graph, rebuild=args.rebuild, top=args.top)
+    
+    elif args.mode == 'holders':
+        # 등록권자 코드 조회 모드 실행
+        run_cli_holders(args.name, limit=args.limit)
+    
+    elif args.mode == 'portfolio':
+        # 포트폴리오 집계 모드 실행
+        run_cli_portfolio(args.right_holder_code, rebuild=args.rebuild, top=args.top, as_json=args.json)
+    
     else:
         # 모드가 지정되지 않은 경우 도움말 표시
         parser.print_help()
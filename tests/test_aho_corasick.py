@@ -0,0 +1,57 @@
+"""
+Aho–Corasick 다중 패턴 검색 테스트
+"""
+
+import pickle
+
+import pytest
+
+from app.core.aho_corasick import AhoCorasick
+
+PATTERNS = ["oil", "glycerin", "polyglycerin", "히알루론산", "히알루론산나트륨", "he", "she", "hers", "", "vitamin C"]
+
+
+@pytest.fixture(scope="module")
+def automaton():
+    return AhoCorasick(PATTERNS)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", []),
+    ("jojoba oil", [(7, 10, 0)]),
+    ("oil.", [(0, 3, 0)]),
+    # 영문 패턴은 단어 경계에서만
+    ("toil", []),
+    ("oils", []),
+    ("ushers", []),
+    ("vitamin C와", [(0, 9, 9)]),
+    ("vitamin Cs", []),
+    # 한글은 조사가 붙어도 일치
+    ("히알루론산을", [(0, 5, 3)]),
+    # 더 긴 일치 안에 포함된 일치 제외
+    ("히알루론산나트륨을 포함", [(0, 8, 4)]),
+    ("polyglycerin-10", [(0, 12, 2)]),
+    ("glycerin, polyglycerin", [(0, 8, 1), (10, 22, 2)]),
+])
+def test_find_all(automaton, text, expected):
+    assert automaton.find_all(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("toil", [(1, 4, 0)]),
+    ("ushers", [(1, 4, 6), (2, 4, 5), (2, 6, 7)]),
+    ("히알루론산나트륨을 포함", [(0, 5, 3), (0, 8, 4)]),
+    ("glycerin, polyglycerin", [(0, 8, 1), (10, 22, 2), (14, 22, 1)]),
+])
+def test_find_all_overlapping(automaton, text, expected):
+    assert automaton.find_all(text, word_boundary=False, longest=False) == expected
+
+
+def test_duplicate_patterns():
+    assert AhoCorasick(["ab", "ab"]).find_all("ab") == [(0, 2, 0), (0, 2, 1)]
+
+
+def test_pickle(automaton):
+    restored = pickle.loads(pickle.dumps(automaton))
+    assert len(restored) == len(PATTERNS)
+    assert restored.find_all("jojoba oil, 히알루론산나트륨") == automaton.find_all("jojoba oil, 히알루론산나트륨")
@@ -0,0 +1,59 @@
+"""
+청구항 인용 관계 파싱 테스트
+"""
+
+import pytest
+
+from app.core.claim_parser import claim_references, independent_claims, is_deleted, parse_claim_dependencies
+
+
+@pytest.mark.parametrize("claim, claim_no, expected", [
+    ("화장료 조성물.", 1, []),
+    ("제1항에 있어서, 보습제를 더 포함하는 조성물.", 2, [1]),
+    ("청구항 2항에 있어서", 3, [2]),
+    # 범위 ("내지", "~")
+    ("제1항 내지 제3항 중 어느 한 항에 있어서", 5, [1, 2, 3]),
+    ("제 1 항 내지 제 3 항 중 어느 한 항에 있어서", 4, [1, 2, 3]),
+    ("제1항 ~ 제4항 중 어느 한 항", 3, [1, 2]),
+    # 나열 (",", "및", "또는")
+    ("청구항 1 또는 2에 있어서", 3, [1, 2]),
+    ("제1항, 제3항 및 제5항 중 어느 한 항에 있어서", 6, [1, 3, 5]),
+    # 함량은 인용이 아님
+    ("제1항에 있어서, 성분을 10 중량% 포함", 3, [1]),
+    ("제1항 또는 10 중량%", 12, [1]),
+    ("제1항 및 2 wt%", 5, [1]),
+    # 앞선 청구항만 인용 (자기 자신/뒤 청구항 무시)
+    ("제3항에 있어서", 3, []),
+    ("제5항에 있어서", 3, []),
+])
+def test_claim_references(claim, claim_no, expected):
+    assert claim_references(claim, claim_no) == expected
+
+
+@pytest.mark.parametrize("claim, expected", [
+    ("삭제", True),
+    ("(삭제)", True),
+    ("[삭 제]", True),
+    ("청구항 3 삭제", True),
+    ("삭제된 성분을 포함하는 조성물", False),
+    ("화장료 조성물.", False),
+])
+def test_is_deleted(claim, expected):
+    assert is_deleted(claim) is expected
+
+
+@pytest.mark.parametrize("claims, dependencies, independent", [
+    ([], [], []),
+    (["조성물.", "제1항에 있어서"], [[], [1]], [1]),
+    # 삭제된 청구항은 독립항이 아님
+    (
+        ["조성물.", "제1항에 있어서", "삭제", "조성물 제조 방법.", "제4항에 있어서"],
+        [[], [1], [], [], [4]],
+        [1, 4]
+    ),
+    # 삭제된 청구항이 인용 구절을 포함해도 인용 관계 없음
+    (["조성물.", "청구항 2 삭제"], [[], []], [1]),
+])
+def test_parse_claim_dependencies(claims, dependencies, independent):
+    assert parse_claim_dependencies(claims) == dependencies
+    assert independent_claims(claims, dependencies) == independent
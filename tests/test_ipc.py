@@ -0,0 +1,67 @@
+"""
+IPC 코드 정규화 / 접두어 질의 테스트
+"""
+
+import pytest
+
+from app.core.ipc import IPCTrie, ipc_levels, ipc_prefix, normalize_ipc
+
+
+@pytest.mark.parametrize("code, expected", [
+    ("A61K 8/97", "A61K 8/97"),
+    ("A61K 008/970 (2006.01)", "A61K 8/97"),
+    ("A61K8/97", "A61K 8/97"),
+    ("a61k 8/97", "A61K 8/97"),
+    ("A61K-8/97", "A61K 8/97"),
+    ("A61Q 19/00", "A61Q 19/00"),
+    ("A61Q 19/02", "A61Q 19/02"),
+    ("A61K 8/9789", "A61K 8/9789"),
+    ("XYZ", None),
+    ("", None),
+])
+def test_normalize_ipc(code, expected):
+    assert normalize_ipc(code) == expected
+
+
+def test_ipc_levels():
+    assert ipc_levels("A61K 8/97") == ("A", "A61", "A61K", "A61K 8", "A61K 8/97")
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("A", "A"),
+    ("A61", "A61"),
+    ("A61Q", "A61Q "),
+    ("A61Q*", "A61Q "),
+    # 메인그룹은 "/"까지 맞춰 19가 190을, 1이 19를 가리키지 않도록
+    ("A61Q 19", "A61Q 19/"),
+    ("A61Q 19/*", "A61Q 19/"),
+    ("A61Q 1", "A61Q 1/"),
+    ("A61Q 19/0*", "A61Q 19/0"),
+    # "*" 없는 완전한 코드는 그 코드만
+    ("A61Q 19/02", "A61Q 19/02$"),
+    ("a61q 019/020", "A61Q 19/02$"),
+])
+def test_ipc_prefix(pattern, expected):
+    assert ipc_prefix(pattern) == expected
+
+
+@pytest.mark.parametrize("pattern", ["", "61Q", "Z61", "A61Q 19/02/3"])
+def test_ipc_prefix_invalid(pattern):
+    with pytest.raises(ValueError):
+        ipc_prefix(pattern)
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("A61Q 19/*", [0, 1, 2]),
+    ("A61Q 19/0*", [0, 1, 2]),
+    ("A61Q 19/02", [1]),
+    ("A61Q 1", [3]),
+    ("A61Q", [0, 1, 2, 3]),
+    ("A61", [0, 1, 2, 3, 4]),
+    ("B", []),
+])
+def test_trie_search(pattern, expected):
+    trie = IPCTrie()
+    for code_id, code in enumerate(["A61Q 19/00", "A61Q 19/02", "A61Q 19/021", "A61Q 1/02", "A61K 8/97"]):
+        trie.add(code, code_id)
+    assert trie.search(ipc_prefix(pattern)) == expected
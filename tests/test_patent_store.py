@@ -0,0 +1,285 @@
+"""
+특허 저장소(출원번호 기준 중복 제거) 테스트
+"""
+
+import importlib
+import json
+
+import pytest
+
+from app.core.claim_parser import independent_claims, parse_claim_dependencies
+from app.core.config import settings
+from app.core.portfolio import add_facets, patent_facets
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo
+from app.services.patent_processor import DetailFetchError, PatentProcessor
+from app.services.patent_store import PatentStore, SeenSet
+
+# app.services가 같은 이름의 전역 인스턴스를 내보내므로 모듈은 import_module로 가져옴
+patent_processor_module = importlib.import_module("app.services.patent_processor")
+
+
+def basic_info(application_number: str = "1020200000001", register_status: str = "공개", **fields) -> PatentBasicInfo:
+    values = {"invention_title": "화장료 조성물", "applicant_name": "코스맥스 주식회사"}
+    values.update(fields)
+    return PatentBasicInfo(application_number=application_number, register_status=register_status, **values)
+
+
+def detail_info(patent_info: PatentBasicInfo, claims=("화장료 조성물.", "제1항에 있어서, 조성물.")) -> PatentDetailInfo:
+    return PatentDetailInfo(basic_info=patent_info, claims=list(claims), inventors=["홍길동"])
+
+
+@pytest.fixture
+def store(tmp_path):
+    patent_store = PatentStore(str(tmp_path / "patents.db"))
+    yield patent_store
+    patent_store.close()
+
+
+@pytest.mark.parametrize("application_number, expected", [
+    ("1020200012345", 1020200012345),
+    ("10-2020-0012345", 1020200012345),
+    (" 1020200012345 ", 1020200012345),
+    ("KR1020200012345", None),
+    ("10-2020-001234A", None),
+    ("", None),
+    ("1" * 19, None),
+])
+def test_seen_set_to_key(application_number, expected):
+    assert SeenSet.to_key(application_number) == expected
+
+
+def test_seen_set_merge_threshold():
+    seen = SeenSet(merge_threshold=4)
+    for number in ("1020200000003", "1020200000001", "1020200000002"):
+        seen.add(number)
+    assert len(seen.numbers) == 0 and len(seen.pending) == 3
+    
+    # 중복 추가는 모아 두지 않음
+    seen.add("10-2020-0000001")
+    assert len(seen.pending) == 3
+    
+    # merge_threshold에 도달하면 정렬 배열로 병합
+    seen.add("1020200000000")
+    assert list(seen.numbers) == [1020200000000, 1020200000001, 1020200000002, 1020200000003]
+    assert not seen.pending
+    
+    # 병합 후 추가한 번호는 다시 모아 두고, 배열과 모아 둔 번호 모두에서 찾음
+    seen.add("1020190000009")
+    seen.add("KR-TEST")
+    for number in ("1020200000000", "1020200000003", "1020190000009", "KR-TEST"):
+        assert seen.contains(number)
+    assert not seen.contains("1020200000004")
+    assert not seen.contains("KR-OTHER")
+    assert len(seen) == 6
+    
+    seen.merge()
+    assert list(seen.numbers) == sorted(seen.numbers)
+    assert len(seen.numbers) == 5 and seen.contains("1020190000009")
+
+
+def test_seen_set_update():
+    seen = SeenSet(merge_threshold=100)
+    seen.add("1020200000005")
+    seen.update(["1020200000002", "1020200000005", "bad-number", "1020200000001"])
+    assert list(seen.numbers) == [1020200000001, 1020200000002, 1020200000005]
+    assert not seen.pending
+    assert seen.contains("bad-number")
+    assert len(seen) == 4
+
+
+def test_store_loads_seen_numbers(tmp_path):
+    path = str(tmp_path / "patents.db")
+    first = PatentStore(path)
+    first.put_detail(detail_info(basic_info()), claims_included=True)
+    first.close()
+    
+    second = PatentStore(path)
+    assert second.contains("1020200000001")
+    assert not second.contains("1020200000002")
+    assert second.count() == 1
+    second.close()
+
+
+def test_get_detail(store):
+    patent_info = basic_info()
+    assert store.get_detail(patent_info) is None
+    
+    store.put_detail(detail_info(patent_info), claims_included=True)
+    stored = store.get_detail(basic_info(invention_title="다른 검색 결과의 제목"))
+    assert stored.claims == ["화장료 조성물.", "제1항에 있어서, 조성물."]
+    assert stored.claim_dependencies == [[], [1]]
+    assert stored.independent_claims == [1]
+    assert stored.inventors == ["홍길동"]
+    # 기본 정보는 현재 검색 결과 사용
+    assert stored.basic_info.invention_title == "다른 검색 결과의 제목"
+
+
+def test_get_detail_without_claims(store):
+    patent_info = basic_info()
+    store.put_detail(PatentDetailInfo(basic_info=patent_info, inventors=["홍길동"]), claims_included=False)
+    
+    # 청구항 없이 저장된 상세 정보는 청구항이 필요한 조회에 재사용하지 않음
+    assert store.get_detail(patent_info, include_claims=True) is None
+    assert store.get_detail(patent_info, include_claims=False).inventors == ["홍길동"]
+
+
+def test_put_detail_keeps_stored_basic_info(store):
+    store.record_search([basic_info(register_status="공개")], "120140131250")
+    
+    # 출원번호만 아는 상세 조회(등록상태가 빈 기본 정보)는 저장된 기본 정보를 덮어쓰지 않음
+    placeholder = basic_info(register_status="", invention_title="상세 조회", applicant_name="")
+    store.put_detail(detail_info(placeholder), claims_included=True)
+    assert store.get_status("1020200000001") == "공개"
+    assert store.get_basic_infos(["1020200000001"])["1020200000001"].invention_title == "화장료 조성물"
+    assert store.get_detail(placeholder).claims
+    
+    # 등록상태가 있는 기본 정보는 덮어씀
+    store.put_detail(detail_info(basic_info(register_status="등록", invention_title="새 제목")), claims_included=True)
+    assert store.get_status("1020200000001") == "등록"
+    assert store.get_basic_infos(["1020200000001"])["1020200000001"].invention_title == "새 제목"
+
+
+@pytest.mark.parametrize("download_pdfs, pdf_url, downloaded, expected", [
+    (True, "http://pdf/1", True, ("http://pdf/1", True)),
+    # URL만 찾고 다운로드하지 못한 경우 다시 시도
+    (True, "http://pdf/1", False, None),
+    (False, "http://pdf/1", False, ("http://pdf/1", False)),
+    (True, None, False, None),
+])
+def test_get_pdf(store, monkeypatch, download_pdfs, pdf_url, downloaded, expected):
+    monkeypatch.setattr(settings, "download_pdfs", download_pdfs)
+    patent_info = basic_info()
+    assert store.get_pdf(patent_info.application_number) is None
+    
+    store.put_pdf(patent_info, pdf_url, downloaded)
+    assert store.get_pdf(patent_info.application_number) == expected
+
+
+class CountingKiprisApi:
+    """상세 조회 호출 수를 세는 KIPRIS API 대역"""
+    
+    def __init__(self, response):
+        self.response = response
+        self.detail_calls = []
+    
+    def get_patent_details(self, application_number):
+        self.detail_calls.append(application_number)
+        return self.response
+
+
+class DisabledTagger:
+    enabled = False
+
+
+@pytest.fixture
+def processor(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", str(tmp_path / "results"))
+    monkeypatch.setattr(settings, "use_patent_store", True)
+    monkeypatch.setattr(settings, "save_claims", False)
+    monkeypatch.setattr(settings, "clustering_enabled", False)
+    monkeypatch.setattr(settings, "similarity_enabled", False)
+    monkeypatch.setattr(patent_processor_module, "patent_store", store)
+    monkeypatch.setattr(patent_processor_module, "ingredient_tagger", DisabledTagger())
+    return PatentProcessor()
+
+
+def test_store_hit_skips_kipris(processor, store, monkeypatch):
+    kipris_api = CountingKiprisApi(None)
+    monkeypatch.setattr(patent_processor_module, "kipris_api", kipris_api)
+    patent_info = basic_info()
+    store.put_detail(detail_info(patent_info), claims_included=True)
+    
+    result = processor.process_patent_details(patent_info, include_claims=True)
+    assert kipris_api.detail_calls == []
+    assert result.claims == ["화장료 조성물.", "제1항에 있어서, 조성물."]
+    assert result.independent_claims == [1]
+
+
+def test_store_miss_calls_kipris(processor, monkeypatch):
+    kipris_api = CountingKiprisApi(None)
+    monkeypatch.setattr(patent_processor_module, "kipris_api", kipris_api)
+    
+    result = processor.process_patent_details(basic_info(), include_claims=True)
+    assert kipris_api.detail_calls == ["1020200000001"]
+    assert result.claims == []
+    
+    with pytest.raises(DetailFetchError):
+        processor.process_patent_details(basic_info(), include_claims=True, raise_on_fetch_failure=True)
+
+
+def recomputed_facets(store: PatentStore, right_holder_code: str) -> dict:
+    """저장된 특허를 모두 읽어 처음부터 다시 계산한 등록권자 집계"""
+    counts = {}
+    with store.lock:
+        rows = store.connection.execute(
+            "SELECT application_number, register_status, detail, claims_included FROM patents WHERE right_holder_code = ?",
+            (right_holder_code,)
+        ).fetchall()
+    for application_number, register_status, detail_json, claims_included in rows:
+        detail = json.loads(detail_json) if detail_json else {}
+        claims = detail.get("claims", []) if claims_included else []
+        add_facets(counts, patent_facets(
+            application_number,
+            register_status,
+            detail.get("ipc_codes", []),
+            store.patent_ingredients(application_number),
+            len(claims) or None,
+            len(independent_claims(claims, parse_claim_dependencies(claims)))
+        ))
+    return {key: count for key, count in counts.items() if count}
+
+
+def assert_facets_consistent(store: PatentStore, *right_holder_codes: str) -> None:
+    for right_holder_code in right_holder_codes:
+        assert store.holder_facets(right_holder_code) == recomputed_facets(store, right_holder_code)
+    # 0이 된 집계 행은 남기지 않음
+    assert store.connection.execute("SELECT COUNT(*) FROM holder_facets WHERE patents <= 0").fetchone()[0] == 0
+
+
+def test_holder_facets_incremental(store):
+    first = basic_info("1020200000001", "공개")
+    second = basic_info("1020210000002", "등록")
+    store.record_search([first, second], "H1")
+    assert_facets_consistent(store, "H1")
+    assert store.holder_facets("H1")[("totals", "patents")] == 2
+    
+    detail = detail_info(first)
+    detail.ipc_codes = ["A61K 8/97(2006.01)", "A61Q 19/00(2006.01)"]
+    store.put_detail(detail, claims_included=True)
+    assert_facets_consistent(store, "H1")
+    before = store.holder_facets("H1")
+    
+    # 같은 내용을 다시 저장해도 기여분을 두 번 더하지 않음
+    store.put_detail(detail, claims_included=True)
+    assert store.record_search([first, second], "H1") == 0
+    with store.lock:
+        assert store.update_facets([first.application_number, second.application_number]) == 0
+    assert store.holder_facets("H1") == before
+    
+    # 등록상태 변경
+    store.update_statuses([basic_info("1020200000001", "등록")])
+    assert_facets_consistent(store, "H1")
+    assert ("status", "공개") not in store.holder_facets("H1")
+    
+    # 성분 태깅 결과 교체
+    store.put_ingredients(first.application_number, {"글리세린": [1], "나이아신아마이드": [1, 2]}, "v1")
+    assert_facets_consistent(store, "H1")
+    store.put_ingredients(first.application_number, {"글리세린": [2]}, "v2")
+    assert_facets_consistent(store, "H1")
+    assert ("ingredient", "나이아신아마이드") not in store.holder_facets("H1")
+    
+    # 등록권자 변경 (이전 등록권자 집계에서 빠지고 새 등록권자 집계에 들어감)
+    store.record_search([basic_info("1020200000001", "등록")], "H2")
+    assert_facets_consistent(store, "H1", "H2")
+    assert store.holder_facets("H1")[("totals", "patents")] == 1
+    assert store.holder_facets("H2")[("ingredient", "글리세린")] == 1
+    
+    # 등록권자 코드 없이 다시 검색해도 등록권자는 유지
+    store.record_search([basic_info("1020200000001", "소멸")], None)
+    assert_facets_consistent(store, "H1", "H2")
+    assert store.holder_facets("H2")[("status", "소멸")] == 1
+    
+    # 마지막 특허가 빠진 등록권자는 집계 행이 남지 않음
+    store.record_search([basic_info("1020210000002", "등록")], "H2")
+    assert_facets_consistent(store, "H1", "H2")
+    assert store.holder_facets("H1") == {}
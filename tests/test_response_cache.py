@@ -0,0 +1,227 @@
+"""
+API 응답 캐시 테스트 (fresh/stale/miss, 동시 계산 합치기, 조건부 요청)
+"""
+
+import asyncio
+import importlib
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.models.schemas import PatentDetailInfo
+from app.services.response_cache import ResponseCache
+
+# app.api가 라우터를 내보내므로 모듈은 import_module로 가져옴
+patents_module = importlib.import_module("app.api.patents")
+
+
+class Computation:
+    """호출 수를 세고 호출마다 다른 본문을 반환하는 계산 함수"""
+    
+    def __init__(self, delay: float = 0, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+    
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f'{{"call": {self.calls}}}'.encode()
+
+
+def test_fresh_and_miss():
+    async def scenario():
+        cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=8)
+        compute = Computation()
+        
+        entry, state = await cache.get_or_compute("key", compute)
+        assert (entry.body, state) == (b'{"call": 1}', "miss")
+        
+        again, state = await cache.get_or_compute("key", compute)
+        assert (again, state) == (entry, "fresh")
+        assert compute.calls == 1
+    
+    asyncio.run(scenario())
+
+
+def test_stale_served_while_refreshing():
+    async def scenario():
+        cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=8)
+        compute = Computation(delay=0.01)
+        first, _ = await cache.get_or_compute("key", compute)
+        
+        cache.ttl = 0
+        entry, state = await cache.get_or_compute("key", compute)
+        assert (entry, state) == (first, "stale")
+        
+        # 재계산 중에 다시 요청해도 재계산을 하나 더 시작하지 않음
+        entry, state = await cache.get_or_compute("key", compute)
+        assert (entry, state) == (first, "stale")
+        
+        await asyncio.gather(*cache.refreshing)
+        assert compute.calls == 2
+        assert cache.entries["key"].body == b'{"call": 2}'
+    
+    asyncio.run(scenario())
+
+
+def test_expired_entry_is_recomputed():
+    async def scenario():
+        cache = ResponseCache(ttl=0, stale_ttl=0, max_entries=8)
+        compute = Computation()
+        await cache.get_or_compute("key", compute)
+        
+        entry, state = await cache.get_or_compute("key", compute)
+        assert (entry.body, state) == (b'{"call": 2}', "miss")
+        assert not cache.refreshing
+    
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_compute_once():
+    async def scenario():
+        cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=8)
+        compute = Computation(delay=0.05)
+        
+        results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(5)))
+        assert compute.calls == 1
+        assert len({id(entry) for entry, _ in results}) == 1
+        assert not cache.inflight
+    
+    asyncio.run(scenario())
+
+
+def test_failed_computation_is_not_cached():
+    async def scenario():
+        cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=8)
+        failing = Computation(delay=0.01, error=RuntimeError("KIPRIS 오류"))
+        
+        # 같은 계산을 기다리던 요청도 같은 오류를 받음
+        results = await asyncio.gather(
+            cache.get_or_compute("key", failing),
+            cache.get_or_compute("key", failing),
+            return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert failing.calls == 1
+        assert "key" not in cache.entries and not cache.inflight
+        
+        entry, state = await cache.get_or_compute("key", Computation())
+        assert (entry.body, state) == (b'{"call": 1}', "miss")
+    
+    asyncio.run(scenario())
+
+
+def test_lru_eviction():
+    cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a")[1] == "fresh"
+    cache.set("c", b"3")
+    assert list(cache.entries) == ["a", "c"]
+
+
+class DetailProcessor:
+    """상세 정보 조회 대역 (claims가 없으면 KIPRIS 조회 실패와 같은 빈 상세 정보 반환)"""
+    
+    def __init__(self, claims=("화장료 조성물.",)):
+        self.claims = list(claims)
+        self.calls = 0
+    
+    def process_patent_details(self, patent_info, include_claims=True, include_pdf=False):
+        self.calls += 1
+        return PatentDetailInfo(basic_info=patent_info, claims=self.claims)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "use_patent_store", False)
+    cache = ResponseCache(ttl=60, stale_ttl=60, max_entries=8, name="test")
+    monkeypatch.setattr(patents_module, "response_cache", cache)
+    # 스케줄러를 시작하지 않도록 특허 라우터만 올린 앱 사용 (with 안에서는 요청 사이에도 이벤트 루프가 유지되어
+    # stale 항목의 백그라운드 재계산이 끝까지 실행됨)
+    app = FastAPI()
+    app.include_router(patents_module.router)
+    with TestClient(app) as http:
+        yield http, cache
+
+
+def use_processor(monkeypatch, processor: DetailProcessor) -> DetailProcessor:
+    monkeypatch.setattr(patents_module, "patent_processor", processor)
+    return processor
+
+
+def test_detail_conditional_requests(client, monkeypatch):
+    http, _ = client
+    processor = use_processor(monkeypatch, DetailProcessor())
+    
+    response = http.get("/patents/search/1020200000001")
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["claims"] == ["화장료 조성물."]
+    etag = response.headers["etag"]
+    
+    for headers in (
+        {"If-None-Match": etag},
+        {"If-None-Match": f'W/{etag}, "other"'},
+        {"If-None-Match": "*"},
+        {"If-Modified-Since": response.headers["last-modified"]},
+    ):
+        not_modified = http.get("/patents/search/1020200000001", headers=headers)
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+    
+    # 다른 ETag는 본문과 함께 응답
+    modified = http.get("/patents/search/1020200000001", headers={"If-None-Match": '"other"'})
+    assert modified.status_code == 200
+    assert modified.headers["x-cache"] == "FRESH"
+    assert modified.content == response.content
+    assert processor.calls == 1
+
+
+def test_detail_stale_served_while_refreshing(client, monkeypatch):
+    http, cache = client
+    processor = use_processor(monkeypatch, DetailProcessor())
+    first = http.get("/patents/search/1020200000001")
+    
+    cache.ttl = 0
+    processor.claims = ["새 청구항."]
+    stale = http.get("/patents/search/1020200000001")
+    assert stale.status_code == 200
+    assert stale.headers["x-cache"] == "STALE"
+    assert stale.content == first.content
+    
+    # 백그라운드 재계산이 끝나면 새 본문으로 교체
+    for _ in range(200):
+        if processor.calls == 2 and not cache.inflight:
+            break
+        time.sleep(0.01)
+    assert processor.calls == 2
+    cache.ttl = 60
+    fresh = http.get("/patents/search/1020200000001")
+    assert fresh.headers["x-cache"] == "FRESH"
+    assert fresh.json()["claims"] == ["새 청구항."]
+    assert fresh.headers["etag"] != first.headers["etag"]
+
+
+def test_detail_fetch_failure_is_not_cached(client, monkeypatch):
+    http, cache = client
+    processor = use_processor(monkeypatch, DetailProcessor(claims=()))
+    
+    for calls in (1, 2):
+        response = http.get("/patents/search/1020200000001")
+        assert response.status_code == 502
+        assert processor.calls == calls
+    assert not cache.entries
+    
+    # KIPRIS가 회복되면 다음 요청에서 계산하여 캐시
+    processor.claims = ["화장료 조성물."]
+    assert http.get("/patents/search/1020200000001").status_code == 200
+    assert http.get("/patents/search/1020200000001").headers["x-cache"] == "FRESH"
+    assert processor.calls == 3
@@ -0,0 +1,242 @@
+"""
+태스크 관리자 테스트 (중복 요청/취소/제한 시간)
+"""
+
+import asyncio
+import importlib
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.models.schemas import PatentBasicInfo, PatentDetailInfo, ProcessRequest, ProcessResult
+from app.services.patent_processor import PatentProcessor
+from app.services.patent_store import PatentStore
+from app.services.task_manager import TaskManager
+
+# app.services가 같은 이름의 전역 인스턴스를 내보내므로 모듈은 import_module로 가져옴
+task_manager_module = importlib.import_module("app.services.task_manager")
+patent_processor_module = importlib.import_module("app.services.patent_processor")
+
+
+def basic_info(index: int) -> PatentBasicInfo:
+    return PatentBasicInfo(
+        application_number=f"10202000{index:05d}",
+        invention_title="화장료 조성물",
+        applicant_name="코스맥스 주식회사",
+        register_status="공개"
+    )
+
+
+class BlockingProcessor:
+    """
+    patent_processor 대역
+    
+    block_at번째 상세 정보 조회는 취소 이벤트가 설정될 때까지 멈춘다.
+    """
+    
+    def __init__(self, output_dir: str, patents: int = 5, block_at: int = 3):
+        self.output_dir = output_dir
+        self.patents = [basic_info(i) for i in range(patents)]
+        self.block_at = block_at
+        self.detail_calls = []
+        self.blocked = threading.Event()
+        self.cancelled_while_blocked = None
+    
+    def search_and_extract_patents(self, **kwargs):
+        return list(self.patents)
+    
+    def process_patent_details(self, patent_info, include_claims=True, include_pdf=False, cancel_event=None):
+        self.detail_calls.append(patent_info.application_number)
+        if len(self.detail_calls) == self.block_at:
+            self.blocked.set()
+            # 실제 처리기는 이 이벤트를 보고 남은 PDF 조회/다운로드를 건너뜀
+            self.cancelled_while_blocked = cancel_event.wait(timeout=5)
+        return PatentDetailInfo(basic_info=patent_info, claims=["화장료 조성물."])
+    
+    def create_summary_report(self, **kwargs):
+        return None
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "save_traces", False)
+    stub = BlockingProcessor(str(tmp_path))
+    monkeypatch.setattr(task_manager_module, "patent_processor", stub)
+    return stub
+
+
+def make_request(**fields) -> ProcessRequest:
+    values = {"search_keyword": "조성물", "right_holder_code": "120140131250", "max_patents": 5}
+    values.update(fields)
+    return ProcessRequest(**values)
+
+
+async def wait_until_blocked(processor: BlockingProcessor) -> None:
+    for _ in range(500):
+        if processor.blocked.is_set():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("상세 정보 조회가 멈추지 않았습니다.")
+
+
+def assert_partial_result(manager: TaskManager, task_id: str, processor: BlockingProcessor) -> None:
+    # 취소 전에 끝난 두 건만 부분 결과로 남고, 멈춘 조회 뒤로는 상세 조회를 더 하지 않음
+    # (asyncio.run이 스레드 풀 종료까지 기다리므로 멈춘 조회도 이미 끝난 상태)
+    result = manager.get_task_result(task_id)
+    assert [patent.basic_info.application_number for patent in result.patents] == processor.detail_calls[:2]
+    assert result.claims_saved == 2
+    assert len(processor.detail_calls) == 3
+    assert processor.cancelled_while_blocked is True
+    assert task_id not in manager.cancel_events
+
+
+def test_cancel_processing_task(processor):
+    manager = TaskManager()
+    request = make_request()
+    task_id = manager.create_task(request)
+    
+    async def scenario():
+        handle = manager.launch_task(task_id, request)
+        await wait_until_blocked(processor)
+        assert manager.cancel_task(task_id) is True
+        with pytest.raises(asyncio.CancelledError):
+            await handle
+    
+    asyncio.run(scenario())
+    
+    status = manager.get_task_status(task_id)
+    assert status.status == "cancelled"
+    assert status.message.startswith("사용자 요청으로 태스크가 취소되었습니다.")
+    assert "부분 결과 2건" in status.message
+    assert status.end_time is not None
+    assert_partial_result(manager, task_id, processor)
+    
+    # 이미 종료된 태스크는 다시 취소할 수 없음
+    assert manager.cancel_task(task_id) is False
+
+
+def test_deadline_cancels_task(processor):
+    manager = TaskManager()
+    request = make_request(deadline_seconds=0.2)
+    task_id = manager.create_task(request)
+    
+    async def scenario():
+        handle = manager.launch_task(task_id, request)
+        # 제한 시간 초과는 오류 없이 끝남
+        await asyncio.wait_for(handle, timeout=5)
+    
+    asyncio.run(scenario())
+    
+    status = manager.get_task_status(task_id)
+    assert status.status == "cancelled"
+    assert "처리 제한 시간을 초과" in status.message
+    assert_partial_result(manager, task_id, processor)
+
+
+def test_cancel_pending_task(processor):
+    manager = TaskManager()
+    request = make_request()
+    task_id = manager.create_task(request)
+    
+    assert manager.cancel_task(task_id) is True
+    assert manager.get_task_status(task_id).status == "cancelled"
+    assert manager.get_task_result(task_id) is None
+    assert manager.cancel_task("없는 태스크") is False
+    
+    async def scenario():
+        # 취소된 태스크는 실행하지 않음
+        assert manager.launch_task(task_id, request) is None
+    
+    asyncio.run(scenario())
+    assert processor.detail_calls == []
+
+
+@pytest.mark.parametrize("cancelled, pdf_calls", [(False, 1), (True, 0)])
+def test_cancel_event_skips_pdf(tmp_path, monkeypatch, cancelled, pdf_calls):
+    store = PatentStore(str(tmp_path / "patents.db"))
+    monkeypatch.setattr(settings, "output_dir", str(tmp_path / "results"))
+    monkeypatch.setattr(settings, "use_patent_store", True)
+    monkeypatch.setattr(settings, "clustering_enabled", False)
+    monkeypatch.setattr(settings, "similarity_enabled", False)
+    monkeypatch.setattr(patent_processor_module, "patent_store", store)
+    
+    patent_info = basic_info(1)
+    store.put_detail(PatentDetailInfo(basic_info=patent_info, inventors=["홍길동"]), claims_included=False)
+    processor = PatentProcessor()
+    calls = []
+    monkeypatch.setattr(processor, "fetch_patent_pdf", lambda *args: calls.append(args) or ("http://pdf/1", True))
+    
+    cancel_event = threading.Event()
+    if cancelled:
+        cancel_event.set()
+    detail_info = processor.process_patent_details(patent_info, include_claims=False, include_pdf=True, cancel_event=cancel_event)
+    assert len(calls) == pdf_calls
+    assert detail_info.pdf_url == ("http://pdf/1" if pdf_calls else None)
+    store.close()
+
+
+def complete_task(manager: TaskManager, task_id: str, status: str = "completed", seconds_ago: float = 0) -> None:
+    manager.results[task_id] = ProcessResult(task_id=task_id, patents=[], output_directory="patent_results")
+    manager.update_task_status(task_id, status)
+    manager.tasks[task_id].end_time = datetime.now() - timedelta(seconds=seconds_ago)
+
+
+def test_submit_task_outcomes(monkeypatch):
+    monkeypatch.setattr(settings, "dedup_window_seconds", 600)
+    manager = TaskManager()
+    
+    task_id, dedup = manager.submit_task(make_request())
+    assert dedup == "created"
+    
+    # 처리 중인 같은 요청은 기존 태스크에 연결
+    assert manager.submit_task(make_request()) == (task_id, "attached")
+    manager.update_task_status(task_id, "processing")
+    assert manager.submit_task(make_request()) == (task_id, "attached")
+    
+    # 유효 기간 안에 완료된 결과는 재사용
+    complete_task(manager, task_id, seconds_ago=599)
+    assert manager.submit_task(make_request()) == (task_id, "cached")
+    
+    # 유효 기간이 지나면 새로 처리하고, 이후 같은 요청은 새 태스크에 연결
+    complete_task(manager, task_id, seconds_ago=601)
+    new_id, dedup = manager.submit_task(make_request())
+    assert dedup == "created" and new_id != task_id
+    assert manager.submit_task(make_request()) == (new_id, "attached")
+
+
+@pytest.mark.parametrize("status", ["failed", "cancelled"])
+def test_submit_task_does_not_reuse_unfinished_result(status):
+    manager = TaskManager()
+    task_id, _ = manager.submit_task(make_request())
+    complete_task(manager, task_id, status=status)
+    
+    new_id, dedup = manager.submit_task(make_request())
+    assert dedup == "created" and new_id != task_id
+
+
+@pytest.mark.parametrize("first, second, same", [
+    # 기본값을 채운 뒤 비교
+    ({"search_keyword": None, "right_holder_code": None, "max_patents": None}, {}, True),
+    ({"search_keyword": " 조성물 "}, {"search_keyword": "조성물"}, True),
+    # 제한 시간은 결과에 영향을 주지 않으므로 지문에 포함하지 않음
+    ({"deadline_seconds": 30}, {"deadline_seconds": None}, True),
+    # 표시용 등록권자명은 코드가 같으면 무시
+    ({"right_holder": "코스맥스"}, {"right_holder": "코스맥스 주식회사"}, True),
+    ({"profile": True}, {"profile": False}, False),
+    ({"max_patents": 10}, {"max_patents": 20}, False),
+    ({"save_claims": False}, {"save_claims": True}, False),
+    ({"download_pdfs": True}, {"download_pdfs": False}, False),
+    ({"right_holder_code": "120140131250"}, {"right_holder_code": "119980045698"}, False),
+])
+def test_submit_task_fingerprint(monkeypatch, first, second, same):
+    monkeypatch.setattr(settings, "search_keyword", "조성물")
+    monkeypatch.setattr(settings, "right_holder_code", "120140131250")
+    monkeypatch.setattr(settings, "max_patents", 5)
+    manager = TaskManager()
+    
+    first_id, _ = manager.submit_task(make_request(**first))
+    second_id, dedup = manager.submit_task(make_request(**second))
+    assert (second_id == first_id) is same
+    assert dedup == ("attached" if same else "created")